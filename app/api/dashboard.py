@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from datetime import datetime, timedelta
 import time
 import asyncio
@@ -17,7 +18,13 @@ from app.utils.auth import verify_web_password
 from app.utils.maintenance import api_call_stats_clean
 from app.utils.logging import log, vertex_log_manager
 from app.config.persistence import save_settings
-from app.utils.stats import api_stats_manager
+from app.utils.stats import api_stats_manager, HISTORY_RANGES
+from app.utils.http_client import http_client_manager
+from app.utils.hedging import concurrency_controller
+from app.utils.slow_requests import slow_request_recorder
+from app.utils.recent_calls import recent_calls_store
+from app.utils.profiler import process_profiler, ProfilerBusyError
+from app.utils.dashboard_state import DashboardState, DashboardFeed, format_sse
 from typing import List
 import json
 
@@ -87,16 +94,10 @@ async def run_blocking_init_vertex():
     except Exception as e:
         log('error', f"执行 run_blocking_init_vertex 时出错: {e}")
 
-@dashboard_router.get("/dashboard-data")
-async def get_dashboard_data():
-    """获取仪表盘数据的API端点，用于动态刷新"""
-    # 先清理过期数据，确保统计数据是最新的
-    await api_stats_manager.maybe_cleanup()
-    await response_cache_manager.clean_expired()  # 使用管理器清理缓存
-    active_requests_manager.clean_completed()  # 使用管理器清理活跃请求
-    
-    # 获取当前统计数据
-    now = datetime.now()
+def build_dashboard_state():
+    """生成仪表盘的状态数据（不含日志与当前时间），由 dashboard_state 按需调用"""
+    # 过期数据的清理由定时任务完成，读取路径上不再做维护工作
+    now = time.time()
     
     # 使用新的统计系统获取调用数据
     last_24h_calls = api_stats_manager.get_calls_last_24h()
@@ -108,12 +109,10 @@ async def get_dashboard_data():
     
     # 获取API密钥使用统计
     api_key_stats = api_stats_manager.get_api_key_stats(key_manager.api_keys)
-    
-    # 根据ENABLE_VERTEX设置决定返回哪种日志
-    if settings.ENABLE_VERTEX:
-        recent_logs = vertex_log_manager.get_recent_logs(500)  # 获取最近500条Vertex日志
-    else:
-        recent_logs = log_manager.get_recent_logs(500)  # 获取最近500条普通日志
+    # 附加每个密钥的健康（熔断）状态
+    key_states = {key[:8]: key_manager.get_key_state(key) for key in key_manager.api_keys}
+    for stat in api_key_stats:
+        stat['health'] = key_states.get(stat['api_key'], 'healthy')
     
     # 获取缓存统计
     total_cache = response_cache_manager.cur_cache_num
@@ -128,9 +127,9 @@ async def get_dashboard_data():
     if credential_manager is not None:
         credentials_count = credential_manager.get_total_credentials()
     
-    # 返回JSON格式的数据
     return {
         "key_count": len(key_manager.api_keys),
+        "key_health": key_manager.get_health_summary(),
         "model_count": len(GeminiClient.AVAILABLE_MODELS),
         "retry_count": settings.MAX_RETRY_NUM,
         "credentials_count": credentials_count,  # 添加凭证数量
@@ -139,8 +138,6 @@ async def get_dashboard_data():
         "minute_calls": minute_calls,
         "calls_time_series": time_series_data,      # 添加API调用时间序列
         "tokens_time_series": tokens_time_series,   # 添加Token使用时间序列
-        "current_time": datetime.now().strftime('%H:%M:%S'),
-        "logs": recent_logs,
         "api_key_stats": api_key_stats,
         # 添加配置信息
         "max_requests_per_minute": settings.MAX_REQUESTS_PER_MINUTE,
@@ -162,6 +159,11 @@ async def get_dashboard_data():
         "cache_entries": total_cache,
         "cache_expiry_time": settings.CACHE_EXPIRY_TIME,
         "max_cache_entries": settings.MAX_CACHE_ENTRIES,
+        "cache_bytes": response_cache_manager.cur_cache_bytes,
+        "max_cache_bytes": response_cache_manager.max_bytes,
+        "disk_cache_enabled": response_cache_manager.disk is not None,
+        "disk_cache_entries": response_cache_manager.disk.entries if response_cache_manager.disk else 0,
+        "disk_cache_bytes": response_cache_manager.disk.bytes if response_cache_manager.disk else 0,
         # 添加活跃请求池信息
         "active_count": active_count,
         "active_done": active_done,
@@ -170,6 +172,12 @@ async def get_dashboard_data():
         "concurrent_requests": settings.CONCURRENT_REQUESTS,
         "increase_concurrent_on_failure": settings.INCREASE_CONCURRENT_ON_FAILURE,
         "max_concurrent_requests": settings.MAX_CONCURRENT_REQUESTS,
+        "hedge_cancel_losers": settings.HEDGE_CANCEL_LOSERS,
+        # 添加自适应并发信息（各模型当前的并发数）
+        "adaptive_concurrency": settings.ADAPTIVE_CONCURRENCY,
+        "concurrency_fanout": concurrency_controller.get_status(key_manager),
+        # 添加并发请求取消统计（节省的配额）
+        "hedge_stats": api_stats_manager.get_hedge_stats(),
         # 启用vertex
         "enable_vertex": settings.ENABLE_VERTEX,
         # 添加Vertex Express配置
@@ -180,8 +188,222 @@ async def get_dashboard_data():
         "max_retry_num": settings.MAX_RETRY_NUM,
         # 添加空响应重试次数限制
         "max_empty_responses": settings.MAX_EMPTY_RESPONSES,
+        # 添加上游连接池指标
+        "upstream_pool": http_client_manager.get_pool_stats(),
+    }
+
+
+# 仪表盘状态快照：多个轮询共用，最多每秒重建一次
+dashboard_state = DashboardState(build_dashboard_state)
+
+def _parse_cursor(cursor):
+    """解析 since 游标：<状态版本>-<日志来源>-<日志序号>，无法解析时返回 (None, None, None)"""
+    try:
+        version, source, seq = cursor.split("-")
+        return int(version), source, int(seq)
+    except (AttributeError, ValueError):
+        return None, None, None
+
+def _log_source():
+    """根据ENABLE_VERTEX设置决定返回哪种日志"""
+    if settings.ENABLE_VERTEX:
+        return "vertex", vertex_log_manager
+    return "gemini", log_manager
+
+def build_dashboard_payload(since=None):
+    """
+    生成仪表盘数据。
+
+    不带 since 时返回完整数据；带上次返回的 cursor 时只返回变化的字段与新增的日志
+    （full 为 true 表示游标已失效，返回的是完整数据）。轮询接口与推送接口共用。
+    """
+    version = dashboard_state.refresh()
+    source, logs_manager = _log_source()
+    
+    since_version, since_source, since_seq = _parse_cursor(since)
+    if since_version is None:
+        full, data = True, dict(dashboard_state.state)
+    else:
+        full, data = dashboard_state.changes_since(since_version)
+    
+    # 日志来源未切换时只返回新增的日志（最多500条）
+    logs_full = full or since_source != source
+    if logs_full:
+        recent_logs = logs_manager.get_recent_logs(500)
+    else:
+        recent_logs = logs_manager.get_logs_since(since_seq, 500)
+    last_seq = recent_logs[-1]["seq"] if recent_logs else (0 if logs_full else since_seq)
+    
+    data["full"] = full
+    data["logs"] = recent_logs
+    data["logs_full"] = logs_full
+    data["current_time"] = datetime.now().strftime('%H:%M:%S')
+    data["cursor"] = f"{version}-{source}-{last_seq}"
+    return data
+
+@dashboard_router.get("/dashboard-data")
+async def get_dashboard_data(request: Request, since: str = None):
+    """
+    获取仪表盘数据的API端点，用于动态刷新。
+
+    响应带有 ETag，If-None-Match 与当前状态一致时返回 304。
+    """
+    version = dashboard_state.refresh()
+    source, logs_manager = _log_source()
+    etag = f'W/"{version}-{source}-{logs_manager.last_seq}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return JSONResponse(content=build_dashboard_payload(since), headers={"ETag": etag})
+
+_PAYLOAD_META_FIELDS = ("full", "logs", "logs_full", "current_time", "cursor")
+
+def _dashboard_stream_update(cursor):
+    """推送任务每个周期调用一次：返回 (需要推送的数据或 None, 新游标)"""
+    data = build_dashboard_payload(cursor)
+    if data["full"] or data["logs_full"] or data["logs"] or len(data) > len(_PAYLOAD_META_FIELDS):
+        return data, data["cursor"]
+    return None, cursor
+
+# 仪表盘推送：所有连接共用一个推送任务
+dashboard_feed = DashboardFeed(_dashboard_stream_update)
+
+@dashboard_router.get("/dashboard-stream")
+async def dashboard_stream():
+    """
+    仪表盘数据推送（SSE）。
+
+    连接建立后先发送一次完整数据，之后每 DASHBOARD_STREAM_INTERVAL 秒批量推送变化的字段与新增的日志；
+    数据格式与 /api/dashboard-data 的增量响应相同。
+    """
+    initial = build_dashboard_payload()
+    queue = dashboard_feed.subscribe(initial["cursor"])
+    
+    async def event_stream():
+        try:
+            yield format_sse(initial)
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"  # 保持连接，避免被代理断开
+                    continue
+                if message is None:
+                    break  # 客户端消费过慢被断开，浏览器重连后会重新获取完整数据
+                yield message
+        finally:
+            dashboard_feed.unsubscribe(queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@dashboard_router.get("/stats-history")
+async def get_stats_history(range_name: str = Query("7d", alias="range")):
+    """
+    获取较长时间范围的调用历史（24h / 7d 按小时，30d 按天）
+    
+    Returns:
+        dict: 调用次数与token使用量的时间序列
+    """
+    if range_name not in HISTORY_RANGES:
+        raise HTTPException(status_code=400, detail=f"不支持的时间范围：{range_name}，可选值为 {', '.join(HISTORY_RANGES)}")
+    calls_series, tokens_series = api_stats_manager.get_history(range_name)
+    return {
+        "range": range_name,
+        "calls_time_series": calls_series,
+        "tokens_time_series": tokens_series,
+    }
+
+@dashboard_router.get("/slow-requests")
+async def get_slow_requests(limit: int = Query(50, ge=1, le=1000), model: str = None):
+    """
+    获取最近的慢请求记录（总耗时超过 SLOW_REQUEST_THRESHOLD 秒的聊天请求）
+    
+    Returns:
+        dict: 阈值与从新到旧排列的慢请求记录
+    """
+    return {
+        "threshold": settings.SLOW_REQUEST_THRESHOLD,
+        "capacity": slow_request_recorder.records.maxlen,
+        "records": slow_request_recorder.get_records(limit, model),
+    }
+
+@dashboard_router.get("/recent-calls")
+async def get_recent_calls(
+    key: str = None,
+    model: str = None,
+    outcome: str = Query(None, pattern="^(success|empty|error)$"),
+    limit: int = Query(50, ge=1, le=500),
+    before: int = Query(None, ge=0),
+):
+    """
+    按密钥前缀、模型与结果查询最近的上游调用记录（从新到旧）
+    
+    翻页时把上一页返回的 next_before 作为 before 传入，新记录的写入不会打乱分页。
+    
+    Returns:
+        dict: 符合条件的记录总数、本页记录与下一页的游标
+    """
+    records, total, next_before = recent_calls_store.query(key, model, outcome, limit, before)
+    return {
+        "capacity": recent_calls_store.capacity,
+        "total": total,
+        "records": records,
+        "next_before": next_before,
     }
 
+@dashboard_router.post("/profile")
+async def run_profiler(profile_data: dict):
+    """
+    对当前进程运行一次剖析（用于排查线上 CPU 飙高）
+    
+    Args:
+        profile_data (dict): password，mode（sample 采样 / cprofile），seconds 时长，
+            sample 模式可选 interval 采样间隔与 thread 线程名过滤，cprofile 模式可选 sort 与 limit
+        
+    Returns:
+        sample 模式返回 collapsed 格式的调用栈文本（可用 flamegraph.pl / speedscope 生成火焰图），
+        cprofile 模式返回按 sort 排序的函数统计文本
+    """
+    password = profile_data.get("password")
+    if not password:
+        raise HTTPException(status_code=400, detail="缺少密码参数")
+    if not isinstance(password, str):
+        raise HTTPException(status_code=422, detail="密码参数类型错误：应为字符串")
+    if not verify_web_password(password):
+        raise HTTPException(status_code=401, detail="密码错误")
+    
+    mode = profile_data.get("mode", "sample")
+    if mode not in ("sample", "cprofile"):
+        raise HTTPException(status_code=400, detail=f"不支持的剖析模式：{mode}")
+    try:
+        seconds = float(profile_data.get("seconds", 10 if mode == "sample" else 5))
+        interval = float(profile_data.get("interval", 0.01))
+        limit = int(profile_data.get("limit", 100))
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=422, detail="参数类型错误：seconds / interval / limit 应为数字")
+    sort = profile_data.get("sort", "cumulative")
+    if sort not in ("cumulative", "tottime", "calls"):
+        raise HTTPException(status_code=400, detail=f"不支持的排序方式：{sort}")
+    
+    log('info', f"开始剖析: 模式 {mode}, 时长 {seconds} 秒")
+    headers = {}
+    try:
+        if mode == "sample":
+            output, samples = await process_profiler.sample(seconds, max(interval, 0.001), profile_data.get("thread"))
+            filename = f"hajimi-{int(time.time())}.collapsed"
+            headers["X-Profile-Samples"] = str(samples)
+        else:
+            output = await process_profiler.cprofile(seconds, sort, limit)
+            filename = f"hajimi-{int(time.time())}.pstats.txt"
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    log('info', f"剖析完成: 模式 {mode}")
+    headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return PlainTextResponse(output, headers=headers)
+
 @dashboard_router.post("/reset-stats")
 async def reset_stats(password_data: dict):
     """
@@ -209,6 +431,10 @@ async def reset_stats(password_data: dict):
         
         # 调用重置函数
         await api_stats_manager.reset()
+        concurrency_controller.reset()
+        slow_request_recorder.clear()
+        recent_calls_store.clear()
+        dashboard_state.invalidate()
         
         return {"status": "success", "message": "API调用统计数据已重置"}
     except HTTPException:
@@ -401,6 +627,18 @@ async def update_config(config_data: dict):
             except ValueError as e:
                 raise HTTPException(status_code=422, detail=f"参数类型错误：{str(e)}")
                 
+        elif config_key == "hedge_cancel_losers":
+            if not isinstance(config_value, bool):
+                raise HTTPException(status_code=422, detail="参数类型错误：应为布尔值")
+            settings.HEDGE_CANCEL_LOSERS = config_value
+            log('info', f"并发请求胜出后取消其余请求已更新为：{config_value}")
+
+        elif config_key == "adaptive_concurrency":
+            if not isinstance(config_value, bool):
+                raise HTTPException(status_code=422, detail="参数类型错误：应为布尔值")
+            settings.ADAPTIVE_CONCURRENCY = config_value
+            log('info', f"自适应并发已更新为：{config_value}")
+                
         elif config_key == "enable_vertex":
             if not isinstance(config_value, bool):
                 raise HTTPException(status_code=422, detail="参数类型错误：应为布尔值")
@@ -581,6 +819,7 @@ async def update_config(config_data: dict):
         else:
             raise HTTPException(status_code=400, detail=f"不支持的配置项：{config_key}")
         save_settings()
+        dashboard_state.invalidate()
         return {"status": "success", "message": f"配置项 {config_key} 已更新"}
     except HTTPException:
         raise
@@ -1,14 +1,16 @@
 import asyncio
+import time
 from fastapi import HTTPException, Request
 from app.models.schemas import ChatCompletionRequest
 from app.services import GeminiClient
 from app.utils import update_api_call_stats
-from app.utils.error_handling import handle_gemini_error
+from app.utils.error_handling import handle_gemini_error, is_upstream_failure
 from app.utils.logging import log
 import app.config.settings as settings
 from typing import Literal
 from app.utils.response import gemini_from_text, openAI_from_Gemini, openAI_from_text
-from app.utils.stats import get_api_key_usage
+from app.utils.hedging import cancel_pending_tasks, deliver_response, concurrency_controller
+from app.utils.request_timing import current_timing, PHASE_CONVERT, PHASE_KEY_SELECT, PHASE_FIRST_TOKEN
 
 
 # 非流式请求处理函数
@@ -20,10 +22,14 @@ async def process_nonstream_request(
     response_cache_manager,
     safety_settings,
     safety_settings_g2,
-    cache_key: str
+    cache_key: str,
+    result_future: asyncio.Future,
+    key_manager
 ):
-    """处理非流式API请求"""
+    """处理非流式API请求，成功的响应通过 result_future 交给协调者"""
+    timing = current_timing()
     gemini_client = GeminiClient(current_api_key)
+    start_time = time.time()
     # 创建调用 Gemini API 的主任务
     gemini_task = asyncio.create_task(
         gemini_client.complete_chat(
@@ -33,31 +39,53 @@ async def process_nonstream_request(
             system_instruction
         )
     )
-    # 使用 shield 保护任务不被外部轻易取消
-    shielded_gemini_task = asyncio.shield(gemini_task)
+    if settings.HEDGE_CANCEL_LOSERS:
+        # 取消模式下不使用 shield，其他请求胜出后可以直接中断上游调用
+        awaitable_gemini_task = gemini_task
+    else:
+        # 使用 shield 保护任务不被外部轻易取消
+        awaitable_gemini_task = asyncio.shield(gemini_task)
 
     try:
-        # 等待受保护的 API 调用任务完成
-        response_content = await shielded_gemini_task
+        # 等待 API 调用任务完成
+        response_content = await awaitable_gemini_task
         response_content.set_model(chat_request.model)
         
+        # 密钥本身可用（空响应通常与提示词有关）
+        key_manager.record_success(current_api_key)
+        
         # 检查响应内容是否为空
         if not response_content or not response_content.text:
             log('warning', f"API密钥 {current_api_key[:8]}... 返回空响应",
                 extra={'key': current_api_key[:8], 'request_type': 'non-stream', 'model': chat_request.model})
+            concurrency_controller.record_outcome(chat_request.model, "empty", time.time() - start_time)
+            if timing:
+                timing.record_attempt(current_api_key, "empty", time.time() - start_time)
             return "empty"
         
-        # 缓存响应结果
-        await response_cache_manager.store(cache_key, response_content)
-        # 更新 API 调用统计
+        concurrency_controller.record_outcome(chat_request.model, "success", time.time() - start_time)
+        if timing:
+            timing.record_attempt(current_api_key, "success", time.time() - start_time,
+                                  tokens=response_content.total_token_count)
+        # 更新 API 调用统计（在交付之前完成，交付后协调者可能取消其余任务）
         await update_api_call_stats(settings.api_call_stats, endpoint=current_api_key, model=chat_request.model,token=response_content.total_token_count)
+        # 交付响应结果（落选的成功响应写入缓存）
+        await deliver_response(result_future, current_api_key, response_content, response_cache_manager, cache_key)
         
         return "success"
 
     except Exception as e:
         # 处理 API 调用过程中可能发生的任何异常
-        handle_gemini_error(e, current_api_key) 
+        error_detail = handle_gemini_error(e, current_api_key, key_manager)
+        concurrency_controller.record_outcome(chat_request.model,
+                                              "error" if is_upstream_failure(e) else "client_error",
+                                              time.time() - start_time)
+        if timing:
+            timing.record_attempt(current_api_key, "error", time.time() - start_time, error_detail)
         return "error" 
+    finally:
+        # 没有记录成功或失败就结束（客户端错误、被取消）时释放半开密钥的探测名额
+        key_manager.release_probe(current_api_key)
     
     
 # 处理 route 中发起请求的函数
@@ -71,6 +99,7 @@ async def process_request(
 ):
     """处理非流式请求"""
     global current_api_key
+    timing = current_timing()
 
     format_type = getattr(chat_request, 'format_type', None)
     if format_type and (format_type == "gemini"):
@@ -79,10 +108,16 @@ async def process_request(
     else:
         is_gemini = False
         # 转换消息格式
+        convert_started = time.perf_counter()
         contents, system_instruction = GeminiClient.convert_messages(GeminiClient, chat_request.messages,model=chat_request.model)
+        if timing:
+            timing.add_since(PHASE_CONVERT, convert_started)
 
     # 设置初始并发数
-    current_concurrent = settings.CONCURRENT_REQUESTS
+    if settings.ADAPTIVE_CONCURRENCY:
+        current_concurrent = concurrency_controller.get_fanout(chat_request.model, key_manager)
+    else:
+        current_concurrent = settings.CONCURRENT_REQUESTS
     max_retry_num = settings.MAX_RETRY_NUM
     
     # 当前请求次数
@@ -91,46 +126,27 @@ async def process_request(
     # 空响应计数
     empty_response_count = 0
     
+    # 胜出的响应由工作任务直接交付，不经过缓存
+    result_future = asyncio.get_running_loop().create_future()
+    
     # 尝试使用不同API密钥，直到达到最大重试次数或空响应限制
     while (current_try_num < max_retry_num) and (empty_response_count < settings.MAX_EMPTY_RESPONSES):
         # 获取当前批次的密钥数量
         batch_num = min(max_retry_num - current_try_num, current_concurrent)
         
-        # 获取当前批次的密钥
+        # 获取当前批次的密钥（密钥管理器只返回未达到调用限制且未熔断的密钥）
+        key_select_started = time.perf_counter()
         valid_keys = []
-        checked_keys = set()  # 用于记录已检查过的密钥
-        all_keys_checked = False  # 标记是否已检查所有密钥
-        
-        # 尝试获取足够数量的有效密钥
         while len(valid_keys) < batch_num:
             api_key = await key_manager.get_available_key()
-            if not api_key:
-                break
-                
-            # 如果这个密钥已经检查过，说明已经检查了所有密钥
-            if api_key in checked_keys:
-                all_keys_checked = True
+            # 可用密钥少于批次数量时会重复返回同一密钥
+            if not api_key or api_key in valid_keys:
                 break
-            
-            checked_keys.add(api_key)
-            # 获取API密钥的调用次数
-            usage = await get_api_key_usage(settings.api_call_stats, api_key)
-            # 如果调用次数小于限制，则添加到有效密钥列表
-            if usage < settings.API_KEY_DAILY_LIMIT:
-                valid_keys.append(api_key)
-            else:
-                log('warning', f"API密钥 {api_key[:8]}... 已达到每日调用限制 ({usage}/{settings.API_KEY_DAILY_LIMIT})",
-                    extra={'key': api_key[:8], 'request_type': 'non-stream', 'model': chat_request.model})
-        
-        # 如果已经检查了所有密钥且没有找到有效密钥，则重置密钥栈
-        if all_keys_checked and not valid_keys:
-            log('warning', "所有API密钥已达到每日调用限制，重置密钥栈",
-                extra={'request_type': 'non-stream', 'model': chat_request.model})
-            key_manager._reset_key_stack()
-            # 重置后重新获取一个密钥
-            api_key = await key_manager.get_available_key()
-            if api_key:
-                valid_keys = [api_key]
+            valid_keys.append(api_key)
+        if timing:
+            timing.add_since(PHASE_KEY_SELECT, key_select_started)
+            if valid_keys:
+                timing.fanouts.append(len(valid_keys))
         
         # 如果没有获取到任何有效密钥，跳出循环
         if not valid_keys:
@@ -157,7 +173,9 @@ async def process_request(
                     response_cache_manager,
                     safety_settings,
                     safety_settings_g2,
-                    cache_key
+                    cache_key,
+                    result_future,
+                    key_manager
                 )
             )
             tasks.append((api_key, task))
@@ -179,13 +197,19 @@ async def process_request(
                     # 如果有成功响应内容
                     if status == "success" :  
                         success = True
+                        # 胜者是第一个交付响应的请求，不一定是最先结束的任务
+                        winner_key, response_content = result_future.result()
                         log('info', f"非流式请求成功", 
-                            extra={'key': api_key[:8],'request_type': 'non-stream', 'model': chat_request.model})
-                        cached_response, cache_hit = await  response_cache_manager.get_and_remove(cache_key)
+                            extra={'key': winner_key[:8],'request_type': 'non-stream', 'model': chat_request.model})
+                        if settings.HEDGE_CANCEL_LOSERS:
+                            cancel_pending_tasks(tasks, chat_request.model, 'non-stream', winner_key)
+                        if timing:
+                            timing.mark(PHASE_FIRST_TOKEN)
+                            timing.key = winner_key
                         if is_gemini :
-                            return cached_response.data
+                            return response_content.data
                         else:
-                            return openAI_from_Gemini(cached_response,stream=False)
+                            return openAI_from_Gemini(response_content,stream=False)
                     elif status == "empty":
                         # 增加空响应计数
                         empty_response_count += 1
@@ -193,16 +217,20 @@ async def process_request(
                             extra={'key': api_key[:8], 'request_type': 'non-stream', 'model': chat_request.model})
                 
                 except Exception as e:
-                    handle_gemini_error(e, api_key)
+                    handle_gemini_error(e, api_key, key_manager)
                 
                 # 更新任务列表，移除已完成的任务
                 tasks = [(k, t) for k, t in tasks if not t.done()]
                 
         # 如果当前批次没有成功响应，并且还有密钥可用，则继续尝试
         if not success and valid_keys:
-            # 增加并发数，但不超过最大并发数
-            current_concurrent = min(current_concurrent + settings.INCREASE_CONCURRENT_ON_FAILURE, settings.MAX_CONCURRENT_REQUESTS)
-            log('info', f"所有并发请求失败或返回空响应，增加并发数至: {current_concurrent}", 
+            if settings.ADAPTIVE_CONCURRENCY:
+                # 由控制器根据刚记录的失败结果给出新的并发数
+                current_concurrent = concurrency_controller.get_fanout(chat_request.model, key_manager)
+            else:
+                # 增加并发数，但不超过最大并发数
+                current_concurrent = min(current_concurrent + settings.INCREASE_CONCURRENT_ON_FAILURE, settings.MAX_CONCURRENT_REQUESTS)
+            log('info', f"所有并发请求失败或返回空响应，并发数调整为: {current_concurrent}", 
                 extra={'request_type': 'non-stream', 'model': chat_request.model})
         
         # 如果空响应次数达到限制，跳出循环，并返回酒馆正常响应(包含错误信息)
@@ -215,6 +243,15 @@ async def process_request(
             else:
                 return openAI_from_text(model=chat_request.model,content="空响应次数达到上限\n请修改输入提示词",finish_reason="stop",stream=False)
     
+    # 没有任何可用密钥时，返回最早恢复时间
+    if current_try_num == 0:
+        content = key_manager.unavailable_message()
+        log('error', content, extra={'request_type': 'non-stream', 'model': chat_request.model})
+        if is_gemini:
+            return gemini_from_text(content=content,finish_reason="STOP",stream=False)
+        else:
+            return openAI_from_text(model=chat_request.model,content=content,finish_reason="stop",stream=False)
+    
     # 如果所有尝试都失败
     log('error', "API key 替换失败，所有API key都已尝试，请重新配置或稍后重试", extra={'request_type': 'switch_key'})
     
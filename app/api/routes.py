@@ -1,16 +1,19 @@
 import json
 from typing import Optional, Union
 from fastapi import APIRouter, Body, HTTPException, Path, Query, Request, Depends, status, Header
-from fastapi.responses import StreamingResponse
+from fastapi.responses import StreamingResponse, PlainTextResponse
 from app.services import GeminiClient
 from app.utils import protect_from_abuse,generate_cache_key,openAI_from_text,log
 from app.utils.response import openAI_from_Gemini
 from app.utils.auth import custom_verify_password
+from app.utils.metrics import metrics_registry, active_requests, CONTENT_TYPE_LATEST
+from app.utils.request_timing import current_timing, PHASE_DEDUP_WAIT
 from .stream_handlers import process_stream_request
 from .nonstream_handlers import process_request
 from app.models.schemas import ChatCompletionRequest, ChatCompletionResponse, ModelList, AIRequest, ChatRequestGemini
 import app.config.settings as settings
 import asyncio
+import time
 from app.vertex.routes import chat_api, models_api
 from app.vertex.models import OpenAIRequest, OpenAIMessage
 
@@ -60,6 +63,8 @@ def init_router(
     PASSWORD = _password
     MAX_REQUESTS_PER_MINUTE = _max_requests_per_minute
     MAX_REQUESTS_PER_DAY_PER_IP = _max_requests_per_day_per_ip
+    # 活跃请求数在抓取时从活跃请求池读取
+    active_requests.set_function(lambda: len(active_requests_manager.active_requests))
 
 async def verify_user_agent(request: Request):
     if not settings.WHITELIST_USER_AGENT:
@@ -108,6 +113,11 @@ async def vertex_list_models(request: Request,
     # 使用vertex/routes/models_api的实现
     return await models_api.list_models(request, current_api_key)
 
+# Prometheus 指标
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(_ = Depends(custom_verify_password)):
+    return PlainTextResponse(metrics_registry.render(), media_type=CONTENT_TYPE_LATEST)
+
 # API路由
 @router.get("/v1/models",response_model=ModelList)
 @router.get("/models",response_model=ModelList)
@@ -131,6 +141,15 @@ async def aistudio_chat_completions(
     else:
         is_gemini = False
     
+    timing = current_timing()
+    if timing:
+        timing.model = request.model
+        timing.stream = request.stream
+        if is_gemini:
+            timing.message_count = len(request.payload.contents) if request.payload else 0
+        else:
+            timing.message_count = len(request.messages)
+    
     # 生成缓存键 - 用于匹配请求内容对应缓存
     if settings.PRECISE_CACHE:
         cache_key = generate_cache_key(request, is_gemini = is_gemini)
@@ -170,9 +189,12 @@ async def aistudio_chat_completions(
                 extra={'request_type': 'stream' if request.stream else "non-stream", 'model': request.model})
             
             # 等待已有任务完成
+            wait_started = time.perf_counter()
             try:
                 # 设置超时，避免无限等待
                 await asyncio.wait_for(active_task, timeout=240)
+                if timing:
+                    timing.add_since(PHASE_DEDUP_WAIT, wait_started)
                 
                 # 使用任务结果
                 if active_task.done() and not active_task.cancelled():
@@ -183,6 +205,8 @@ async def aistudio_chat_completions(
                         return result
             
             except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                if timing:
+                    timing.add_since(PHASE_DEDUP_WAIT, wait_started)
                 # 任务超时或被取消的情况下，记录日志然后让代码继续执行
                 error_type = "超时" if isinstance(e, asyncio.TimeoutError) else "被取消"
                 log('warning', f"等待已有任务{error_type}: {pool_key}", 
@@ -1,11 +1,14 @@
 import asyncio
+import time
 import json
 from fastapi.responses import StreamingResponse
 from app.models.schemas import ChatCompletionRequest
 from app.services import GeminiClient
 from app.utils import handle_gemini_error, update_api_call_stats,log,openAI_from_text
 from app.utils.response import openAI_from_Gemini,gemini_from_text
-from app.utils.stats import get_api_key_usage
+from app.utils.error_handling import is_upstream_failure
+from app.utils.hedging import cancel_pending_tasks, deliver_response, concurrency_controller
+from app.utils.request_timing import current_timing, PHASE_CONVERT, PHASE_KEY_SELECT, PHASE_FIRST_TOKEN
 import app.config.settings as settings
 
 async def stream_response_generator(
@@ -16,6 +19,7 @@ async def stream_response_generator(
     safety_settings_g2,
     cache_key: str
 ):
+    timing = current_timing()
     format_type = getattr(chat_request, 'format_type', None)
     if format_type and (format_type == "gemini"):
         is_gemini = True
@@ -23,9 +27,15 @@ async def stream_response_generator(
     else:
         is_gemini = False
         # 转换消息格式
+        convert_started = time.perf_counter()
         contents, system_instruction = GeminiClient.convert_messages(GeminiClient, chat_request.messages,model=chat_request.model)
+        if timing:
+            timing.add_since(PHASE_CONVERT, convert_started)
     # 设置初始并发数
-    current_concurrent = settings.CONCURRENT_REQUESTS
+    if settings.ADAPTIVE_CONCURRENCY:
+        current_concurrent = concurrency_controller.get_fanout(chat_request.model, key_manager)
+    else:
+        current_concurrent = settings.CONCURRENT_REQUESTS
     max_retry_num = settings.MAX_RETRY_NUM
     
     # 当前请求次数
@@ -34,46 +44,27 @@ async def stream_response_generator(
     # 空响应计数
     empty_response_count = 0
     
+    # (假流式) 胜出的响应由工作任务直接交付，不经过缓存
+    result_future = asyncio.get_running_loop().create_future()
+    
     # (假流式) 尝试使用不同API密钥，直到达到最大重试次数或空响应限制
     while (settings.FAKE_STREAMING and (current_try_num < max_retry_num) and (empty_response_count < settings.MAX_EMPTY_RESPONSES)):
         # 获取当前批次的密钥数量
         batch_num = min(max_retry_num - current_try_num, current_concurrent)
         
-        # 获取当前批次的密钥
+        # 获取当前批次的密钥（密钥管理器只返回未达到调用限制且未熔断的密钥）
+        key_select_started = time.perf_counter()
         valid_keys = []
-        checked_keys = set()  # 用于记录已检查过的密钥
-        all_keys_checked = False  # 标记是否已检查所有密钥
-        
-        # 尝试获取足够数量的有效密钥
         while len(valid_keys) < batch_num:
             api_key = await key_manager.get_available_key()
-            if not api_key:
+            # 可用密钥少于批次数量时会重复返回同一密钥
+            if not api_key or api_key in valid_keys:
                 break
-                
-            # 如果这个密钥已经检查过，说明已经检查了所有密钥
-            if api_key in checked_keys:
-                all_keys_checked = True
-                break
-            
-            checked_keys.add(api_key)
-            # 获取API密钥的调用次数
-            usage = await get_api_key_usage(settings.api_call_stats, api_key)
-            # 如果调用次数小于限制，则添加到有效密钥列表
-            if usage < settings.API_KEY_DAILY_LIMIT:
-                valid_keys.append(api_key)
-            else:
-                log('warning', f"API密钥 {api_key[:8]}... 已达到每日调用限制 ({usage}/{settings.API_KEY_DAILY_LIMIT})",
-                    extra={'key': api_key[:8], 'request_type': 'stream', 'model': chat_request.model})
-        
-        # 如果已经检查了所有密钥且没有找到有效密钥，则重置密钥栈
-        if all_keys_checked and not valid_keys:
-            log('warning', "所有API密钥已达到每日调用限制，重置密钥栈",
-                extra={'request_type': 'stream', 'model': chat_request.model})
-            key_manager._reset_key_stack()
-            # 重置后重新获取一个密钥
-            api_key = await key_manager.get_available_key()
-            if api_key:
-                valid_keys = [api_key]
+            valid_keys.append(api_key)
+        if timing:
+            timing.add_since(PHASE_KEY_SELECT, key_select_started)
+            if valid_keys:
+                timing.fanouts.append(len(valid_keys))
         
         # 如果没有获取到任何有效密钥，跳出循环
         if not valid_keys:
@@ -99,7 +90,9 @@ async def stream_response_generator(
                     system_instruction, 
                     safety_settings, 
                     safety_settings_g2,
-                    cache_key
+                    cache_key,
+                    result_future,
+                    key_manager
                 )
             )
             
@@ -133,18 +126,21 @@ async def stream_response_generator(
                         # 如果有成功响应内容
                         if status == "success" :  
                             success = True
+                            # 胜者是第一个交付响应的请求，不一定是最先结束的任务
+                            winner_key, response_content = result_future.result()
                             log('info', f"假流式请求成功", 
-                                extra={'key': api_key[:8],'request_type': "fake-stream", 'model': chat_request.model})
-                            cached_response, cache_hit = await response_cache_manager.get_and_remove(cache_key)
-                            if cache_hit and cached_response: 
-                                if is_gemini :
-                                    json_payload = json.dumps(cached_response.data, ensure_ascii=False)
-                                    data_to_yield = f"data: {json_payload}\n\n"
-                                    yield data_to_yield
-                                else:
-                                    yield openAI_from_Gemini(cached_response,stream=True)
+                                extra={'key': winner_key[:8],'request_type': "fake-stream", 'model': chat_request.model})
+                            if settings.HEDGE_CANCEL_LOSERS:
+                                cancel_pending_tasks(tasks, chat_request.model, 'fake-stream', winner_key)
+                            if timing:
+                                timing.mark(PHASE_FIRST_TOKEN)
+                                timing.key = winner_key
+                            if is_gemini :
+                                json_payload = json.dumps(response_content.data, ensure_ascii=False)
+                                data_to_yield = f"data: {json_payload}\n\n"
+                                yield data_to_yield
                             else:
-                                success = False
+                                yield openAI_from_Gemini(response_content,stream=True)
                             break
                         elif status == "empty":
                             # 增加空响应计数
@@ -153,7 +149,7 @@ async def stream_response_generator(
                                 extra={'key': api_key[:8], 'request_type': 'stream', 'model': chat_request.model})
                         
                     except Exception as e:
-                        error_detail = handle_gemini_error(e, api_key)
+                        error_detail = handle_gemini_error(e, api_key, key_manager)
                         log('error', f"请求失败: {error_detail}",
                             extra={'key': api_key[:8], 'request_type': 'stream', 'model': chat_request.model})
 
@@ -177,48 +173,27 @@ async def stream_response_generator(
         
         # 如果所有请求都失败，增加并发数并继续尝试
         if not success and valid_keys:
-            # 增加并发数，但不超过最大并发数
-            current_concurrent = min(current_concurrent + settings.INCREASE_CONCURRENT_ON_FAILURE, settings.MAX_CONCURRENT_REQUESTS)
-            log('info', f"所有假流式请求失败，增加并发数至: {current_concurrent}", 
+            if settings.ADAPTIVE_CONCURRENCY:
+                # 由控制器根据刚记录的失败结果给出新的并发数
+                current_concurrent = concurrency_controller.get_fanout(chat_request.model, key_manager)
+            else:
+                # 增加并发数，但不超过最大并发数
+                current_concurrent = min(current_concurrent + settings.INCREASE_CONCURRENT_ON_FAILURE, settings.MAX_CONCURRENT_REQUESTS)
+            log('info', f"所有假流式请求失败，并发数调整为: {current_concurrent}", 
                 extra={'request_type': 'stream', 'model': chat_request.model})
 
     # (真流式) 尝试使用不同API密钥，直到达到最大重试次数或空响应限制
     while (not settings.FAKE_STREAMING and (current_try_num < max_retry_num) and (empty_response_count < settings.MAX_EMPTY_RESPONSES)):
-        # 获取当前批次的密钥
+        # 获取一个有效密钥（密钥管理器只返回未达到调用限制且未熔断的密钥）
+        key_select_started = time.perf_counter()
         valid_keys = []
-        checked_keys = set()  # 用于记录已检查过的密钥
-        all_keys_checked = False  # 标记是否已检查所有密钥
-        
-        # 尝试获取一个有效密钥
-        while len(valid_keys) < 1:
-            api_key = await key_manager.get_available_key()
-            if not api_key:
-                break
-                
-            # 如果这个密钥已经检查过，说明已经检查了所有密钥
-            if api_key in checked_keys:
-                all_keys_checked = True
-                break
-            
-            checked_keys.add(api_key)
-            # 获取API密钥的调用次数
-            usage = await get_api_key_usage(settings.api_call_stats, api_key)
-            # 如果调用次数小于限制，则添加到有效密钥列表
-            if usage < settings.API_KEY_DAILY_LIMIT:
-                valid_keys.append(api_key)
-            else:
-                log('warning', f"API密钥 {api_key[:8]}... 已达到每日调用限制 ({usage}/{settings.API_KEY_DAILY_LIMIT})",
-                    extra={'key': api_key[:8], 'request_type': 'stream', 'model': chat_request.model})
-        
-        # 如果已经检查了所有密钥且没有找到有效密钥，则重置密钥栈
-        if all_keys_checked and not valid_keys:
-            log('warning', "所有API密钥已达到每日调用限制，重置密钥栈",
-                extra={'request_type': 'stream', 'model': chat_request.model})
-            key_manager._reset_key_stack()
-            # 重置后重新获取一个密钥
-            api_key = await key_manager.get_available_key()
-            if api_key:
-                valid_keys = [api_key]
+        api_key = await key_manager.get_available_key()
+        if api_key:
+            valid_keys.append(api_key)
+        if timing:
+            timing.add_since(PHASE_KEY_SELECT, key_select_started)
+            if valid_keys:
+                timing.fanouts.append(1)
         
         # 如果没有获取到任何有效密钥，跳出循环
         if not valid_keys:
@@ -231,6 +206,8 @@ async def stream_response_generator(
         api_key = valid_keys[0]
         
         success = False
+        attempt_started = time.time()
+        attempt_outcome, error_detail = "error", None
         try:            
             client = GeminiClient(api_key)
             
@@ -249,6 +226,9 @@ async def stream_response_generator(
                     if chunk.total_token_count:
                         token = int(chunk.total_token_count)
                     success = True
+                    if timing:
+                        timing.mark(PHASE_FIRST_TOKEN)
+                        timing.key = api_key
                     
                     if is_gemini:
                         json_payload = json.dumps(chunk.data, ensure_ascii=False)
@@ -264,6 +244,7 @@ async def stream_response_generator(
                         extra={'key': api_key[:8], 'request_type': 'stream', 'model': chat_request.model})
                     # 增加空响应计数
                     empty_response_count += 1
+                    attempt_outcome = "empty"
                     await update_api_call_stats(
                         settings.api_call_stats, 
                         endpoint=api_key, 
@@ -273,12 +254,18 @@ async def stream_response_generator(
                     break
         
         except Exception as e:
-            error_detail = handle_gemini_error(e, api_key)
+            error_detail = handle_gemini_error(e, api_key, key_manager)
             log('error', f"流式响应: API密钥 {api_key[:8]}... 请求失败: {error_detail}",
                 extra={'key': api_key[:8], 'request_type': 'stream', 'model': chat_request.model})
         finally: 
+            # 没有记录成功或失败就结束（客户端错误、连接断开）时释放半开密钥的探测名额
+            key_manager.release_probe(api_key)
+            if timing:
+                timing.record_attempt(api_key, "success" if success else attempt_outcome,
+                                      time.time() - attempt_started, error_detail, token if success else 0)
             # 如果成功获取相应，更新API调用统计
             if success:
+                key_manager.record_success(api_key)
                 await update_api_call_stats(
                     settings.api_call_stats, 
                     endpoint=api_key, 
@@ -300,6 +287,16 @@ async def stream_response_generator(
                 
                 return
     
+    # 没有任何可用密钥时，返回最早恢复时间
+    if current_try_num == 0:
+        content = key_manager.unavailable_message()
+        log('error', content, extra={'request_type': 'stream', 'model': chat_request.model})
+        if is_gemini:
+            yield gemini_from_text(content=content,finish_reason="STOP",stream=True)
+        else:
+            yield openAI_from_text(model=chat_request.model,content=content,finish_reason="stop")
+        return
+    
     # 所有API密钥都尝试失败的处理
     log('error', "所有 API 密钥均请求失败，请稍后重试",
         extra={'key': 'ALL', 'request_type': 'stream', 'model': chat_request.model})
@@ -310,10 +307,12 @@ async def stream_response_generator(
         yield openAI_from_text(model=chat_request.model,content="所有API密钥均请求失败\n具体错误请查看轮询日志",finish_reason="stop")
 
 # 处理假流式模式
-async def handle_fake_streaming(api_key,chat_request, contents, response_cache_manager,system_instruction, safety_settings, safety_settings_g2, cache_key):
+async def handle_fake_streaming(api_key,chat_request, contents, response_cache_manager,system_instruction, safety_settings, safety_settings_g2, cache_key, result_future, key_manager):
     
     # 使用非流式请求内容
+    timing = current_timing()
     gemini_client = GeminiClient(api_key)
+    start_time = time.time()
     
     gemini_task = asyncio.create_task(
         gemini_client.complete_chat( 
@@ -323,14 +322,17 @@ async def handle_fake_streaming(api_key,chat_request, contents, response_cache_m
             system_instruction
         )
     )
-    gemini_task = asyncio.shield(gemini_task)
+    if not settings.HEDGE_CANCEL_LOSERS:
+        # 使用 shield 保护任务不被外部轻易取消；取消模式下其他请求胜出后可直接中断上游调用
+        gemini_task = asyncio.shield(gemini_task)
     
     try:
         # 获取响应内容
         response_content = await gemini_task
         response_content.set_model(chat_request.model)
-        log('info', f"假流式成功获取响应，进行缓存",
+        log('info', f"假流式成功获取响应",
             extra={'key': api_key[:8], 'request_type': 'fake-stream', 'model': chat_request.model})
+        key_manager.record_success(api_key)
 
         # 更新API调用统计
         await update_api_call_stats(settings.api_call_stats, endpoint=api_key, model=chat_request.model,token=response_content.total_token_count)
@@ -339,17 +341,33 @@ async def handle_fake_streaming(api_key,chat_request, contents, response_cache_m
         if not response_content or not response_content.text:
             log('warning', f"请求返回空响应",
                 extra={'key': api_key[:8], 'request_type': 'fake-stream', 'model': chat_request.model})        
+            concurrency_controller.record_outcome(chat_request.model, "empty", time.time() - start_time)
+            if timing:
+                timing.record_attempt(api_key, "empty", time.time() - start_time)
             return "empty"
 
-        # 缓存
-        await response_cache_manager.store(cache_key, response_content)
+        concurrency_controller.record_outcome(chat_request.model, "success", time.time() - start_time)
+        if timing:
+            timing.record_attempt(api_key, "success", time.time() - start_time,
+                                  tokens=response_content.total_token_count)
+
+        # 交付响应结果（落选的成功响应写入缓存）
+        await deliver_response(result_future, api_key, response_content, response_cache_manager, cache_key)
         return "success"
     
     except Exception as e:
-        handle_gemini_error(e, api_key)
+        error_detail = handle_gemini_error(e, api_key, key_manager)
+        concurrency_controller.record_outcome(chat_request.model,
+                                              "error" if is_upstream_failure(e) else "client_error",
+                                              time.time() - start_time)
+        if timing:
+            timing.record_attempt(api_key, "error", time.time() - start_time, error_detail)
         # log('error', f"假流式模式: API密钥 {api_key[:8]}... 请求失败: {error_detail}",
         #     extra={'key': api_key[:8], 'request_type': 'fake-stream', 'model': chat_request.model})
         return "error"
+    finally:
+        # 没有记录成功或失败就结束（客户端错误、被取消）时释放半开密钥的探测名额
+        key_manager.release_probe(api_key)
         
 
 
@@ -50,10 +50,46 @@ RETRY_DELAY = 1
 MAX_RETRY_DELAY = 16 # 网络错误 5xx 重试时的最大等待时间
 MAX_RETRY_NUM = int(os.environ.get("MAX_RETRY_NUM", "15")) # 请求时的最大总轮询 key 数
 
+# 上游连接池配置
+UPSTREAM_HTTP2 = os.environ.get("UPSTREAM_HTTP2", "true").lower() in ["true", "1", "yes"]  # 是否启用 HTTP/2 多路复用
+UPSTREAM_MAX_CONNECTIONS = int(os.environ.get("UPSTREAM_MAX_CONNECTIONS", "100"))  # 连接池最大连接数
+UPSTREAM_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("UPSTREAM_MAX_KEEPALIVE_CONNECTIONS", "20"))  # 最大保活连接数
+UPSTREAM_KEEPALIVE_EXPIRY = float(os.environ.get("UPSTREAM_KEEPALIVE_EXPIRY", "30"))  # 空闲连接保活时间（秒）
+
 # 并发请求配置
 CONCURRENT_REQUESTS = int(os.environ.get("CONCURRENT_REQUESTS", "1"))  # 默认并发请求数
 INCREASE_CONCURRENT_ON_FAILURE = int(os.environ.get("INCREASE_CONCURRENT_ON_FAILURE", "0"))  # 失败时增加的并发数
 MAX_CONCURRENT_REQUESTS = int(os.environ.get("MAX_CONCURRENT_REQUESTS", "3"))  # 最大并发请求数
+# 并发请求中出现成功响应后，是否取消其余仍在进行的请求（开启后额外的成功响应不会再被缓存）
+HEDGE_CANCEL_LOSERS = os.environ.get("HEDGE_CANCEL_LOSERS", "false").lower() in ["true", "1", "yes"]
+# 自适应并发：根据近期成功率、空响应率、p95 耗时与剩余配额，按模型在 CONCURRENT_REQUESTS 与 MAX_CONCURRENT_REQUESTS 之间调整并发数
+ADAPTIVE_CONCURRENCY = os.environ.get("ADAPTIVE_CONCURRENCY", "false").lower() in ["true", "1", "yes"]
+ADAPTIVE_SUCCESS_TARGET = float(os.environ.get("ADAPTIVE_SUCCESS_TARGET", "0.9"))  # 成功率高于该值视为健康
+ADAPTIVE_LATENCY_TARGET = float(os.environ.get("ADAPTIVE_LATENCY_TARGET", "60"))  # p95 耗时（秒）低于该值视为健康
+
+# API密钥熔断：连续失败达到阈值的密钥暂时不参与轮询，熔断期结束后先放行一个探测请求
+KEY_BREAKER_FAILURE_THRESHOLD = int(os.environ.get("KEY_BREAKER_FAILURE_THRESHOLD", "3"))  # 触发熔断的连续失败次数
+KEY_BREAKER_OPEN_SECONDS = int(os.environ.get("KEY_BREAKER_OPEN_SECONDS", "60"))  # 服务端错误等失败的熔断时长（秒）
+KEY_BREAKER_HARD_OPEN_SECONDS = int(os.environ.get("KEY_BREAKER_HARD_OPEN_SECONDS", "600"))  # 无效密钥、权限被拒绝的熔断时长（秒）
+# 429 限流冷却：按指数退避计算冷却时长，上游返回 Retry-After / retryDelay 时以其为准
+KEY_COOLDOWN_BASE_SECONDS = int(os.environ.get("KEY_COOLDOWN_BASE_SECONDS", "60"))  # 首次冷却时长（秒）
+KEY_COOLDOWN_MAX_SECONDS = int(os.environ.get("KEY_COOLDOWN_MAX_SECONDS", "3600"))  # 最长冷却时长（秒）
+
+# 在聊天请求的响应中附加 Server-Timing 响应头（各阶段耗时，流式请求只包含响应开始前的阶段）
+ENABLE_SERVER_TIMING = os.environ.get("ENABLE_SERVER_TIMING", "false").lower() in ["true", "1", "yes"]
+
+# 慢请求记录：总耗时超过阈值（秒）的聊天请求会被记录，可在仪表盘中查询；阈值为 0 时关闭
+SLOW_REQUEST_THRESHOLD = float(os.environ.get("SLOW_REQUEST_THRESHOLD", "30"))
+SLOW_REQUEST_LOG_SIZE = int(os.environ.get("SLOW_REQUEST_LOG_SIZE", "100"))  # 最多保留的慢请求记录数
+
+# 调用统计持久化（仅在 ENABLE_STORAGE 时生效）：统计数据批量写入 STORAGE_DIR 下的 SQLite 数据库，重启后恢复
+STATS_PERSIST_INTERVAL = float(os.environ.get("STATS_PERSIST_INTERVAL", "10"))  # 批量写入间隔（秒）
+
+# 最近上游调用记录（/api/recent-calls）最多保留的条数
+RECENT_CALLS_SIZE = int(os.environ.get("RECENT_CALLS_SIZE", "1000"))
+
+# 仪表盘推送（/api/dashboard-stream）的批量推送间隔（秒）
+DASHBOARD_STREAM_INTERVAL = float(os.environ.get("DASHBOARD_STREAM_INTERVAL", "1"))
 
 # API密钥使用限制
 # 默认每个API密钥每24小时可使用次数
@@ -62,6 +98,15 @@ API_KEY_DAILY_LIMIT = int(os.environ.get("API_KEY_DAILY_LIMIT", "100"))
 # 缓存配置
 CACHE_EXPIRY_TIME = int(os.environ.get("CACHE_EXPIRY_TIME", "21600"))  # 默认缓存 6 小时 (21600 秒)
 MAX_CACHE_ENTRIES = int(os.environ.get("MAX_CACHE_ENTRIES", "500"))  # 默认最多缓存500条响应
+CACHE_SHARDS = int(os.environ.get("CACHE_SHARDS", "16"))  # 缓存分片数，每个分片有独立的锁与容量
+MAX_CACHE_BYTES = int(os.environ.get("MAX_CACHE_BYTES", "0"))  # 缓存占用的最大字节数（估算值），0 表示只按条目数限制
+# 紧凑存储：缓存的响应序列化为 JSON 字节串，超过阈值时压缩（zstd 需要安装 zstandard，否则使用 zlib）
+CACHE_COMPACT_STORAGE = os.environ.get("CACHE_COMPACT_STORAGE", "false").lower() in ["true", "1", "yes"]
+CACHE_COMPRESSION = os.environ.get("CACHE_COMPRESSION", "")  # zstd / zlib，留空时有 zstandard 则用 zstd
+CACHE_COMPRESS_THRESHOLD = int(os.environ.get("CACHE_COMPRESS_THRESHOLD", "1024"))  # 超过该字节数才压缩
+# 磁盘二级缓存（仅在 ENABLE_STORAGE 时生效）：内存中被淘汰或过期的缓存项降级到 STORAGE_DIR 下的 SQLite 数据库
+DISK_CACHE_EXPIRY_TIME = int(os.environ.get("DISK_CACHE_EXPIRY_TIME", "86400"))  # 从缓存项创建时算起的有效期（秒）
+DISK_CACHE_MAX_BYTES = int(os.environ.get("DISK_CACHE_MAX_BYTES", "268435456"))  # 磁盘缓存的最大字节数，默认 256MB
 PRECISE_CACHE = os.environ.get("PRECISE_CACHE", "false").lower() in ["true", "1", "yes"] #是否取所有消息来算缓存键
 CALCULATE_CACHE_ENTRIES = int(os.environ.get("CALCULATE_CACHE_ENTRIES", "6"))  # 默认取最后 6 条消息算缓存键
 
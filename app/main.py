@@ -4,7 +4,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from app.models.schemas import ErrorResponse
-from app.services import GeminiClient
+from app.services import GeminiClient, GeminiResponseWrapper
 from app.utils import (
     APIKeyManager, 
     test_api_key, 
@@ -13,9 +13,14 @@ from app.utils import (
     check_version,
     schedule_cache_cleanup,
     handle_exception,
+    http_client_manager,
     log
 )
 from app.config.persistence import save_settings, load_settings
+from app.utils.stats import api_stats_manager
+from app.utils.stats_store import StatsStore
+from app.utils.cache_store import DiskCacheStore
+from app.utils.request_timing import RequestTimingMiddleware
 from app.api import router, init_router, dashboard_router, init_dashboard_router
 from app.vertex.vertex_ai_init import init_vertex_ai
 from app.vertex.credentials_manager import CredentialManager
@@ -42,6 +47,9 @@ if settings.ALLOWED_ORIGINS:
         allow_headers=["*"],
     )
 
+# --------------- 请求耗时记录 ---------------
+app.add_middleware(RequestTimingMiddleware)
+
 # --------------- 全局实例 ---------------
 load_settings()
 # 初始化API密钥管理器
@@ -130,6 +138,23 @@ sys.excepthook = handle_exception
 @app.on_event("startup")
 async def startup_event():
     
+    # 创建共享的上游连接池
+    await http_client_manager.start()
+    
+    # 恢复持久化的调用统计，避免重启后把已耗尽配额的密钥当作可用
+    if settings.ENABLE_STORAGE:
+        try:
+            await api_stats_manager.enable_persistence(
+                StatsStore(os.path.join(settings.STORAGE_DIR, "stats.db")))
+        except Exception as e:
+            log('error', f"加载调用统计数据库失败: {str(e)}")
+        # 启用磁盘二级缓存，重启后仍可命中之前的响应
+        try:
+            await response_cache_manager.enable_disk_tier(DiskCacheStore(
+                os.path.join(settings.STORAGE_DIR, "response_cache.db"), GeminiResponseWrapper))
+        except Exception as e:
+            log('error', f"打开磁盘缓存数据库失败: {str(e)}")
+    
     # 初始化CredentialManager
     credential_manager_instance = CredentialManager()
     # 添加到应用程序状态
@@ -218,6 +243,15 @@ async def startup_event():
         credential_manager_instance
     )
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    # 合并尚未处理的调用统计并写入持久化存储
+    await api_stats_manager.close()
+    # 将内存中的缓存项写入磁盘二级缓存
+    await response_cache_manager.close()
+    # 关闭共享的上游连接池
+    await http_client_manager.close()
+
 # --------------- 异常处理 ---------------
 
 @app.exception_handler(Exception)
@@ -1,15 +1,19 @@
 import json
+import time
 import os
-import httpx 
 from app.models.schemas import ChatCompletionRequest
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
-import httpx
 import secrets
 import string
 import app.config.settings as settings
 
 from app.utils.logging import log
+from app.utils.http_client import http_client_manager
+from app.utils.sse import aiter_sse_json
+from app.utils.metrics import (stream_chunks_total, upstream_inflight,
+                               upstream_latency_seconds, time_to_first_byte_seconds)
+from app.utils.request_timing import current_timing, PHASE_TTFB
 
 def generate_secure_random_string(length):
     all_characters = string.ascii_letters + string.digits
@@ -22,18 +26,30 @@ class GeneratedText:
     finish_reason: Optional[str] = None
 
 
+# 标记尚未计算的惰性字段
+_UNSET = object()
+
 class GeminiResponseWrapper:
-    def __init__(self, data: Dict[Any, Any]):  
+    """
+    Gemini 响应包装器。
+
+    各字段在首次读取时才从原始数据中提取并缓存，json_dumps 每次读取时现场序列化，
+    不在对象上保留第二份数据副本。raw_size 为上游响应体的字节数（未知时为 None），供缓存统计内存占用。
+    """
+    __slots__ = ('_data', '_raw_size', '_model', '_text', '_finish_reason', '_prompt_token_count',
+                 '_candidates_token_count', '_total_token_count', '_thoughts', '_function_call')
+
+    def __init__(self, data: Dict[Any, Any], raw_size: Optional[int] = None):  
         self._data = data
-        self._text = self._extract_text()
-        self._finish_reason = self._extract_finish_reason()
-        self._prompt_token_count = self._extract_prompt_token_count()
-        self._candidates_token_count = self._extract_candidates_token_count()
-        self._total_token_count = self._extract_total_token_count()
-        self._thoughts = self._extract_thoughts()
-        self._function_call = self._extract_function_call()
-        self._json_dumps = json.dumps(self._data, indent=4, ensure_ascii=False)
+        self._raw_size = raw_size
         self._model = "gemini"
+        self._text = _UNSET
+        self._finish_reason = _UNSET
+        self._prompt_token_count = _UNSET
+        self._candidates_token_count = _UNSET
+        self._total_token_count = _UNSET
+        self._thoughts = _UNSET
+        self._function_call = _UNSET
 
     def _extract_thoughts(self) -> Optional[str]:
         try:
@@ -99,33 +115,50 @@ class GeminiResponseWrapper:
     def data(self) -> Dict[Any, Any]:
         return self._data
 
+    @property
+    def raw_size(self) -> Optional[int]:
+        return self._raw_size
+
     @property
     def text(self) -> str:
+        if self._text is _UNSET:
+            self._text = self._extract_text()
         return self._text
 
     @property
     def finish_reason(self) -> Optional[str]:
+        if self._finish_reason is _UNSET:
+            self._finish_reason = self._extract_finish_reason()
         return self._finish_reason
 
     @property
     def prompt_token_count(self) -> Optional[int]:
+        if self._prompt_token_count is _UNSET:
+            self._prompt_token_count = self._extract_prompt_token_count()
         return self._prompt_token_count
 
     @property
     def candidates_token_count(self) -> Optional[int]:
+        if self._candidates_token_count is _UNSET:
+            self._candidates_token_count = self._extract_candidates_token_count()
         return self._candidates_token_count
 
     @property
     def total_token_count(self) -> Optional[int]:
+        if self._total_token_count is _UNSET:
+            self._total_token_count = self._extract_total_token_count()
         return self._total_token_count
 
     @property
     def thoughts(self) -> Optional[str]:
+        if self._thoughts is _UNSET:
+            self._thoughts = self._extract_thoughts()
         return self._thoughts
 
     @property
     def json_dumps(self) -> str:
-        return self._json_dumps
+        # 很少被读取，按需序列化且不缓存
+        return json.dumps(self._data, indent=4, ensure_ascii=False)
 
     @property
     def model(self) -> str:
@@ -133,6 +166,8 @@ class GeminiResponseWrapper:
 
     @property
     def function_call(self) -> Optional[Dict[str, Any]]:
+        if self._function_call is _UNSET:
+            self._function_call = self._extract_function_call()
         return self._function_call
 
 
@@ -280,40 +315,37 @@ class GeminiClient:
             "Content-Type": "application/json",
         }
         
-        async with httpx.AsyncClient() as client:
-            async with client.stream("POST", url, headers=headers, json=data, timeout=600) as response:
-                response.raise_for_status()
-                buffer = b"" # 用于累积可能不完整的 JSON 数据
-                try:
-                    async for line in response.aiter_lines():
-                        if not line.strip(): # 跳过空行 (SSE 消息分隔符)
-                            continue
-                        if line.startswith("data: "):
-                            line = line[len("data: "):].strip() # 去除 "data: " 前缀
-                        
-                        # 检查是否是结束标志，如果是，结束循环
-                        if line == "[DONE]":
-                            break 
-                        
-                        buffer += line.encode('utf-8')
-                        try:
-                            # 尝试解析整个缓冲区
-                            data = json.loads(buffer.decode('utf-8'))
-                            # 解析成功，清空缓冲区
-                            buffer = b"" 
-                            yield GeminiResponseWrapper(data)
-
-                        except json.JSONDecodeError:
-                            # JSON 不完整，继续累积到 buffer
-                            continue 
-                        except Exception as e:
-                            log('ERROR', f"流式处理期间发生错误", 
-                                extra={'key': self.api_key[:8], 'request_type': 'stream', 'model': request.model})
-                            raise e
-                except Exception as e:
-                    raise e
-                finally:
-                    log('info', "流式请求结束")
+        # 指标子对象在流开始前取出，每个数据块只需一次自增
+        chunks = stream_chunks_total.labels(request.model)
+        timing = current_timing()
+        extensions = {"trace": timing.upstream_trace()} if timing else None
+        start_time = time.perf_counter()
+        first_chunk = True
+        upstream_inflight.inc()
+        try:
+            async with http_client_manager.client() as client:
+                async with client.stream("POST", url, headers=headers, json=data, timeout=600,
+                                         extensions=extensions) as response:
+                    response.raise_for_status()
+                    try:
+                        # 按 SSE 事件边界增量解析原始字节流，每个事件只解码一次
+                        async for event in aiter_sse_json(response.aiter_bytes()):
+                            if first_chunk:
+                                first_chunk = False
+                                time_to_first_byte_seconds.labels(request.model).observe(time.perf_counter() - start_time)
+                                if timing:
+                                    timing.mark(PHASE_TTFB)
+                            chunks.inc()
+                            yield GeminiResponseWrapper(event)
+                    except Exception as e:
+                        log('ERROR', f"流式处理期间发生错误", 
+                            extra={'key': self.api_key[:8], 'request_type': 'stream', 'model': request.model})
+                        raise e
+                    finally:
+                        log('info', "流式请求结束")
+        finally:
+            upstream_inflight.dec()
+            upstream_latency_seconds.labels(request.model).observe(time.perf_counter() - start_time)
 
     # 非流式处理
     async def complete_chat(self, request, contents, safety_settings, system_instruction):
@@ -325,14 +357,27 @@ class GeminiClient:
             "Content-Type": "application/json",
         }
         
+        timing = current_timing()
+        extensions = {"trace": timing.upstream_trace()} if timing else None
+        start_time = time.perf_counter()
+        upstream_inflight.inc()
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers, json=data, timeout=600) 
+            async with http_client_manager.client() as client:
+                # 以流式方式发送，以便在读取响应体之前记录首字节耗时
+                async with client.stream("POST", url, headers=headers, json=data, timeout=600,
+                                         extensions=extensions) as response:
+                    time_to_first_byte_seconds.labels(request.model).observe(time.perf_counter() - start_time)
+                    if timing:
+                        timing.mark(PHASE_TTFB)
+                    await response.aread()
                 response.raise_for_status() # 检查 HTTP 错误状态
             
-            return GeminiResponseWrapper(response.json())
+            return GeminiResponseWrapper(response.json(), len(response.content))
         except Exception as e:
             raise
+        finally:
+            upstream_inflight.dec()
+            upstream_latency_seconds.labels(request.model).observe(time.perf_counter() - start_time)
 
     # OpenAI 格式请求转换为 gemini 格式请求
     def convert_messages(self, messages, use_system_prompt=False, model=None):
@@ -457,7 +502,7 @@ class GeminiClient:
     async def list_available_models(api_key) -> list:
         url = "https://generativelanguage.googleapis.com/v1beta/models?key={}".format(
             api_key)
-        async with httpx.AsyncClient() as client:
+        async with http_client_manager.client() as client:
             response = await client.get(url)
             response.raise_for_status()
             data = response.json()
@@ -22,7 +22,7 @@
   * vue-router v4.5.0
   * (c) 2024 Eduardo San Martin Morote
   * @license MIT
-  */const Ms=typeof document<"u";function RI(r){return typeof r=="object"||"displayName"in r||"props"in r||"__vccOpts"in r}function fB(r){return r.__esModule||r[Symbol.toStringTag]==="Module"||r.default&&RI(r.default)}const ne=Object.assign;function jd(r,t){const e={};for(const n in t){const a=t[n];e[n]=yn(a)?a.map(r):r(a)}return e}const Au=()=>{},yn=Array.isArray,EI=/#/g,cB=/&/g,hB=/\//g,vB=/=/g,dB=/\?/g,kI=/\+/g,pB=/%5B/g,gB=/%5D/g,OI=/%5E/g,yB=/%60/g,NI=/%7B/g,mB=/%7C/g,VI=/%7D/g,_B=/%20/g;function Y0(r){return encodeURI(""+r).replace(mB,"|").replace(pB,"[").replace(gB,"]")}function SB(r){return Y0(r).replace(NI,"{").replace(VI,"}").replace(OI,"^")}function Vy(r){return Y0(r).replace(kI,"%2B").replace(_B,"+").replace(EI,"%23").replace(cB,"%26").replace(yB,"`").replace(NI,"{").replace(VI,"}").replace(OI,"^")}function xB(r){return Vy(r).replace(vB,"%3D")}function bB(r){return Y0(r).replace(EI,"%23").replace(dB,"%3F")}function wB(r){return r==null?"":bB(r).replace(hB,"%2F")}function ju(r){try{return decodeURIComponent(""+r)}catch{}return""+r}const TB=/\/$/,CB=r=>r.replace(TB,"");function Jd(r,t,e="/"){let n,a={},i="",o="";const s=t.indexOf("#");let l=t.indexOf("?");return s<l&&s>=0&&(l=-1),l>-1&&(n=t.slice(0,l),i=t.slice(l+1,s>-1?s:t.length),a=r(i)),s>-1&&(n=n||t.slice(0,s),o=t.slice(s,t.length)),n=IB(n??t,e),{fullPath:n+(i&&"?")+i+o,path:n,query:a,hash:ju(o)}}function AB(r,t){const e=t.query?r(t.query):"";return t.path+(e&&"?")+e+(t.hash||"")}function $S(r,t){return!t||!r.toLowerCase().startsWith(t.toLowerCase())?r:r.slice(t.length)||"/"}function DB(r,t,e){const n=t.matched.length-1,a=e.matched.length-1;return n>-1&&n===a&&Ks(t.matched[n],e.matched[a])&&BI(t.params,e.params)&&r(t.query)===r(e.query)&&t.hash===e.hash}function Ks(r,t){return(r.aliasOf||r)===(t.aliasOf||t)}function BI(r,t){if(Object.keys(r).length!==Object.keys(t).length)return!1;for(const e in r)if(!MB(r[e],t[e]))return!1;return!0}function MB(r,t){return yn(r)?US(r,t):yn(t)?US(t,r):r===t}function US(r,t){return yn(t)?r.length===t.length&&r.every((e,n)=>e===t[n]):r.length===1&&r[0]===t}function IB(r,t){if(r.startsWith("/"))return r;if(!r)return t;const e=t.split("/"),n=r.split("/"),a=n[n.length-1];(a===".."||a===".")&&n.push("");let i=e.length-1,o,s;for(o=0;o<n.length;o++)if(s=n[o],s!==".")if(s==="..")i>1&&i--;else break;return e.slice(0,i).join("/")+"/"+n.slice(o).join("/")}const Na={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var Ju;(function(r){r.pop="pop",r.push="push"})(Ju||(Ju={}));var Du;(function(r){r.back="back",r.forward="forward",r.unknown=""})(Du||(Du={}));function LB(r){if(!r)if(Ms){const t=document.querySelector("base");r=t&&t.getAttribute("href")||"/",r=r.replace(/^\w+:\/\/[^\/]+/,"")}else r="/";return r[0]!=="/"&&r[0]!=="#"&&(r="/"+r),CB(r)}const PB=/^[^#]+#/;function RB(r,t){return r.replace(PB,"#")+t}function EB(r,t){const e=document.documentElement.getBoundingClientRect(),n=r.getBoundingClientRect();return{behavior:t.behavior,left:n.left-e.left-(t.left||0),top:n.top-e.top-(t.top||0)}}const jv=()=>({left:window.scrollX,top:window.scrollY});function kB(r){let t;if("el"in r){const e=r.el,n=typeof e=="string"&&e.startsWith("#"),a=typeof e=="string"?n?document.getElementById(e.slice(1)):document.querySelector(e):e;if(!a)return;t=EB(a,r)}else t=r;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function YS(r,t){return(history.state?history.state.position-t:-1)+r}const By=new Map;function OB(r,t){By.set(r,t)}function NB(r){const t=By.get(r);return By.delete(r),t}let VB=()=>location.protocol+"//"+location.host;function zI(r,t){const{pathname:e,search:n,hash:a}=t,i=r.indexOf("#");if(i>-1){let s=a.includes(r.slice(i))?r.slice(i).length:1,l=a.slice(s);return l[0]!=="/"&&(l="/"+l),$S(l,"")}return $S(e,r)+n+a}function BB(r,t,e,n){let a=[],i=[],o=null;const s=({state:h})=>{const v=zI(r,location),d=e.value,p=t.value;let g=0;if(h){if(e.value=v,t.value=h,o&&o===d){o=null;return}g=p?h.position-p.position:0}else n(v);a.forEach(y=>{y(e.value,d,{delta:g,type:Ju.pop,direction:g?g>0?Du.forward:Du.back:Du.unknown})})};function l(){o=e.value}function u(h){a.push(h);const v=()=>{const d=a.indexOf(h);d>-1&&a.splice(d,1)};return i.push(v),v}function f(){const{history:h}=window;h.state&&h.replaceState(ne({},h.state,{scroll:jv()}),"")}function c(){for(const h of i)h();i=[],window.removeEventListener("popstate",s),window.removeEventListener("beforeunload",f)}return window.addEventListener("popstate",s),window.addEventListener("beforeunload",f,{passive:!0}),{pauseListeners:l,listen:u,destroy:c}}function XS(r,t,e,n=!1,a=!1){return{back:r,current:t,forward:e,replaced:n,position:window.history.length,scroll:a?jv():null}}function zB(r){const{history:t,location:e}=window,n={value:zI(r,e)},a={value:t.state};a.value||i(n.value,{back:null,current:n.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function i(l,u,f){const c=r.indexOf("#"),h=c>-1?(e.host&&document.querySelector("base")?r:r.slice(c))+l:VB()+r+l;try{t[f?"replaceState":"pushState"](u,"",h),a.value=u}catch(v){console.error(v),e[f?"replace":"assign"](h)}}function o(l,u){const f=ne({},t.state,XS(a.value.back,l,a.value.forward,!0),u,{position:a.value.position});i(l,f,!0),n.value=l}function s(l,u){const f=ne({},a.value,t.state,{forward:l,scroll:jv()});i(f.current,f,!0);const c=ne({},XS(n.value,l,null),{position:f.position+1},u);i(l,c,!1),n.value=l}return{location:n,state:a,push:s,replace:o}}function FB(r){r=LB(r);const t=zB(r),e=BB(r,t.state,t.location,t.replace);function n(i,o=!0){o||e.pauseListeners(),history.go(i)}const a=ne({location:"",base:r,go:n,createHref:RB.bind(null,r)},t,e);return Object.defineProperty(a,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(a,"state",{enumerable:!0,get:()=>t.state.value}),a}function GB(r){return typeof r=="string"||r&&typeof r=="object"}function FI(r){return typeof r=="string"||typeof r=="symbol"}const GI=Symbol("");var ZS;(function(r){r[r.aborted=4]="aborted",r[r.cancelled=8]="cancelled",r[r.duplicated=16]="duplicated"})(ZS||(ZS={}));function js(r,t){return ne(new Error,{type:r,[GI]:!0},t)}function sa(r,t){return r instanceof Error&&GI in r&&(t==null||!!(r.type&t))}const qS="[^/]+?",HB={sensitive:!1,strict:!1,start:!0,end:!0},WB=/[.+*?^${}()[\]/\\]/g;function $B(r,t){const e=ne({},HB,t),n=[];let a=e.start?"^":"";const i=[];for(const u of r){const f=u.length?[]:[90];e.strict&&!u.length&&(a+="/");for(let c=0;c<u.length;c++){const h=u[c];let v=40+(e.sensitive?.25:0);if(h.type===0)c||(a+="/"),a+=h.value.replace(WB,"\\$&"),v+=40;else if(h.type===1){const{value:d,repeatable:p,optional:g,regexp:y}=h;i.push({name:d,repeatable:p,optional:g});const m=y||qS;if(m!==qS){v+=10;try{new RegExp(`(${m})`)}catch(S){throw new Error(`Invalid custom RegExp for param "${d}" (${m}): `+S.message)}}let _=p?`((?:${m})(?:/(?:${m}))*)`:`(${m})`;c||(_=g&&u.length<2?`(?:/${_})`:"/"+_),g&&(_+="?"),a+=_,v+=20,g&&(v+=-8),p&&(v+=-20),m===".*"&&(v+=-50)}f.push(v)}n.push(f)}if(e.strict&&e.end){const u=n.length-1;n[u][n[u].length-1]+=.7000000000000001}e.strict||(a+="/?"),e.end?a+="$":e.strict&&!a.endsWith("/")&&(a+="(?:/|$)");const o=new RegExp(a,e.sensitive?"":"i");function s(u){const f=u.match(o),c={};if(!f)return null;for(let h=1;h<f.length;h++){const v=f[h]||"",d=i[h-1];c[d.name]=v&&d.repeatable?v.split("/"):v}return c}function l(u){let f="",c=!1;for(const h of r){(!c||!f.endsWith("/"))&&(f+="/"),c=!1;for(const v of h)if(v.type===0)f+=v.value;else if(v.type===1){const{value:d,repeatable:p,optional:g}=v,y=d in u?u[d]:"";if(yn(y)&&!p)throw new Error(`Provided param "${d}" is an array but it is not repeatable (* or + modifiers)`);const m=yn(y)?y.join("/"):y;if(!m)if(g)h.length<2&&(f.endsWith("/")?f=f.slice(0,-1):c=!0);else throw new Error(`Missing required param "${d}"`);f+=m}}return f||"/"}return{re:o,score:n,keys:i,parse:s,stringify:l}}function UB(r,t){let e=0;for(;e<r.length&&e<t.length;){const n=t[e]-r[e];if(n)return n;e++}return r.length<t.length?r.length===1&&r[0]===80?-1:1:r.length>t.length?t.length===1&&t[0]===80?1:-1:0}function HI(r,t){let e=0;const n=r.score,a=t.score;for(;e<n.length&&e<a.length;){const i=UB(n[e],a[e]);if(i)return i;e++}if(Math.abs(a.length-n.length)===1){if(KS(n))return 1;if(KS(a))return-1}return a.length-n.length}function KS(r){const t=r[r.length-1];return r.length>0&&t[t.length-1]<0}const YB={type:0,value:""},XB=/[a-zA-Z0-9_]/;function ZB(r){if(!r)return[[]];if(r==="/")return[[YB]];if(!r.startsWith("/"))throw new Error(`Invalid path "${r}"`);function t(v){throw new Error(`ERR (${e})/"${u}": ${v}`)}let e=0,n=e;const a=[];let i;function o(){i&&a.push(i),i=[]}let s=0,l,u="",f="";function c(){u&&(e===0?i.push({type:0,value:u}):e===1||e===2||e===3?(i.length>1&&(l==="*"||l==="+")&&t(`A repeatable param (${u}) must be alone in its segment. eg: '/:ids+.`),i.push({type:1,value:u,regexp:f,repeatable:l==="*"||l==="+",optional:l==="*"||l==="?"})):t("Invalid state to consume buffer"),u="")}function h(){u+=l}for(;s<r.length;){if(l=r[s++],l==="\\"&&e!==2){n=e,e=4;continue}switch(e){case 0:l==="/"?(u&&c(),o()):l===":"?(c(),e=1):h();break;case 4:h(),e=n;break;case 1:l==="("?e=2:XB.test(l)?h():(c(),e=0,l!=="*"&&l!=="?"&&l!=="+"&&s--);break;case 2:l===")"?f[f.length-1]=="\\"?f=f.slice(0,-1)+l:e=3:f+=l;break;case 3:c(),e=0,l!=="*"&&l!=="?"&&l!=="+"&&s--,f="";break;default:t("Unknown state");break}}return e===2&&t(`Unfinished custom RegExp for param "${u}"`),c(),o(),a}function qB(r,t,e){const n=$B(ZB(r.path),e),a=ne(n,{record:r,parent:t,children:[],alias:[]});return t&&!a.record.aliasOf==!t.record.aliasOf&&t.children.push(a),a}function KB(r,t){const e=[],n=new Map;t=tx({strict:!1,end:!0,sensitive:!1},t);function a(c){return n.get(c)}function i(c,h,v){const d=!v,p=JS(c);p.aliasOf=v&&v.record;const g=tx(t,c),y=[p];if("alias"in c){const S=typeof c.alias=="string"?[c.alias]:c.alias;for(const x of S)y.push(JS(ne({},p,{components:v?v.record.components:p.components,path:x,aliasOf:v?v.record:p})))}let m,_;for(const S of y){const{path:x}=S;if(h&&x[0]!=="/"){const b=h.record.path,w=b[b.length-1]==="/"?"":"/";S.path=h.record.path+(x&&w+x)}if(m=qB(S,h,g),v?v.alias.push(m):(_=_||m,_!==m&&_.alias.push(m),d&&c.name&&!QS(m)&&o(c.name)),WI(m)&&l(m),p.children){const b=p.children;for(let w=0;w<b.length;w++)i(b[w],m,v&&v.children[w])}v=v||m}return _?()=>{o(_)}:Au}function o(c){if(FI(c)){const h=n.get(c);h&&(n.delete(c),e.splice(e.indexOf(h),1),h.children.forEach(o),h.alias.forEach(o))}else{const h=e.indexOf(c);h>-1&&(e.splice(h,1),c.record.name&&n.delete(c.record.name),c.children.forEach(o),c.alias.forEach(o))}}function s(){return e}function l(c){const h=QB(c,e);e.splice(h,0,c),c.record.name&&!QS(c)&&n.set(c.record.name,c)}function u(c,h){let v,d={},p,g;if("name"in c&&c.name){if(v=n.get(c.name),!v)throw js(1,{location:c});g=v.record.name,d=ne(jS(h.params,v.keys.filter(_=>!_.optional).concat(v.parent?v.parent.keys.filter(_=>_.optional):[]).map(_=>_.name)),c.params&&jS(c.params,v.keys.map(_=>_.name))),p=v.stringify(d)}else if(c.path!=null)p=c.path,v=e.find(_=>_.re.test(p)),v&&(d=v.parse(p),g=v.record.name);else{if(v=h.name?n.get(h.name):e.find(_=>_.re.test(h.path)),!v)throw js(1,{location:c,currentLocation:h});g=v.record.name,d=ne({},h.params,c.params),p=v.stringify(d)}const y=[];let m=v;for(;m;)y.unshift(m.record),m=m.parent;return{name:g,path:p,params:d,matched:y,meta:JB(y)}}r.forEach(c=>i(c));function f(){e.length=0,n.clear()}return{addRoute:i,resolve:u,removeRoute:o,clearRoutes:f,getRoutes:s,getRecordMatcher:a}}function jS(r,t){const e={};for(const n of t)n in r&&(e[n]=r[n]);return e}function JS(r){const t={path:r.path,redirect:r.redirect,name:r.name,meta:r.meta||{},aliasOf:r.aliasOf,beforeEnter:r.beforeEnter,props:jB(r),children:r.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in r?r.components||null:r.component&&{default:r.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function jB(r){const t={},e=r.props||!1;if("component"in r)t.default=e;else for(const n in r.components)t[n]=typeof e=="object"?e[n]:e;return t}function QS(r){for(;r;){if(r.record.aliasOf)return!0;r=r.parent}return!1}function JB(r){return r.reduce((t,e)=>ne(t,e.meta),{})}function tx(r,t){const e={};for(const n in r)e[n]=n in t?t[n]:r[n];return e}function QB(r,t){let e=0,n=t.length;for(;e!==n;){const i=e+n>>1;HI(r,t[i])<0?n=i:e=i+1}const a=t5(r);return a&&(n=t.lastIndexOf(a,n-1)),n}function t5(r){let t=r;for(;t=t.parent;)if(WI(t)&&HI(r,t)===0)return t}function WI({record:r}){return!!(r.name||r.components&&Object.keys(r.components).length||r.redirect)}function e5(r){const t={};if(r===""||r==="?")return t;const n=(r[0]==="?"?r.slice(1):r).split("&");for(let a=0;a<n.length;++a){const i=n[a].replace(kI," "),o=i.indexOf("="),s=ju(o<0?i:i.slice(0,o)),l=o<0?null:ju(i.slice(o+1));if(s in t){let u=t[s];yn(u)||(u=t[s]=[u]),u.push(l)}else t[s]=l}return t}function ex(r){let t="";for(let e in r){const n=r[e];if(e=xB(e),n==null){n!==void 0&&(t+=(t.length?"&":"")+e);continue}(yn(n)?n.map(i=>i&&Vy(i)):[n&&Vy(n)]).forEach(i=>{i!==void 0&&(t+=(t.length?"&":"")+e,i!=null&&(t+="="+i))})}return t}function r5(r){const t={};for(const e in r){const n=r[e];n!==void 0&&(t[e]=yn(n)?n.map(a=>a==null?null:""+a):n==null?n:""+n)}return t}const n5=Symbol(""),rx=Symbol(""),X0=Symbol(""),$I=Symbol(""),zy=Symbol("");function Ml(){let r=[];function t(n){return r.push(n),()=>{const a=r.indexOf(n);a>-1&&r.splice(a,1)}}function e(){r=[]}return{add:t,list:()=>r.slice(),reset:e}}function Ja(r,t,e,n,a,i=o=>o()){const o=n&&(n.enterCallbacks[a]=n.enterCallbacks[a]||[]);return()=>new Promise((s,l)=>{const u=h=>{h===!1?l(js(4,{from:e,to:t})):h instanceof Error?l(h):GB(h)?l(js(2,{from:t,to:h})):(o&&n.enterCallbacks[a]===o&&typeof h=="function"&&o.push(h),s())},f=i(()=>r.call(n&&n.instances[a],t,e,u));let c=Promise.resolve(f);r.length<3&&(c=c.then(u)),c.catch(h=>l(h))})}function Qd(r,t,e,n,a=i=>i()){const i=[];for(const o of r)for(const s in o.components){let l=o.components[s];if(!(t!=="beforeRouteEnter"&&!o.instances[s]))if(RI(l)){const f=(l.__vccOpts||l)[t];f&&i.push(Ja(f,e,n,o,s,a))}else{let u=l();i.push(()=>u.then(f=>{if(!f)throw new Error(`Couldn't resolve component "${s}" at "${o.path}"`);const c=fB(f)?f.default:f;o.mods[s]=f,o.components[s]=c;const v=(c.__vccOpts||c)[t];return v&&Ja(v,e,n,o,s,a)()}))}}return i}function nx(r){const t=$n(X0),e=$n($I),n=Fe(()=>{const l=fe(r.to);return t.resolve(l)}),a=Fe(()=>{const{matched:l}=n.value,{length:u}=l,f=l[u-1],c=e.matched;if(!f||!c.length)return-1;const h=c.findIndex(Ks.bind(null,f));if(h>-1)return h;const v=ax(l[u-2]);return u>1&&ax(f)===v&&c[c.length-1].path!==v?c.findIndex(Ks.bind(null,l[u-2])):h}),i=Fe(()=>a.value>-1&&l5(e.params,n.value.params)),o=Fe(()=>a.value>-1&&a.value===e.matched.length-1&&BI(e.params,n.value.params));function s(l={}){if(s5(l)){const u=t[fe(r.replace)?"replace":"push"](fe(r.to)).catch(Au);return r.viewTransition&&typeof document<"u"&&"startViewTransition"in document&&document.startViewTransition(()=>u),u}return Promise.resolve()}return{route:n,href:Fe(()=>n.value.href),isActive:i,isExactActive:o,navigate:s}}function a5(r){return r.length===1?r[0]:r}const i5=JM({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"}},useLink:nx,setup(r,{slots:t}){const e=Ii(nx(r)),{options:n}=$n(X0),a=Fe(()=>({[ix(r.activeClass,n.linkActiveClass,"router-link-active")]:e.isActive,[ix(r.exactActiveClass,n.linkExactActiveClass,"router-link-exact-active")]:e.isExactActive}));return()=>{const i=t.default&&a5(t.default(e));return r.custom?i:U0("a",{"aria-current":e.isExactActive?r.ariaCurrentValue:null,href:e.href,onClick:e.navigate,class:a.value},i)}}}),o5=i5;function s5(r){if(!(r.metaKey||r.altKey||r.ctrlKey||r.shiftKey)&&!r.defaultPrevented&&!(r.button!==void 0&&r.button!==0)){if(r.currentTarget&&r.currentTarget.getAttribute){const t=r.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return r.preventDefault&&r.preventDefault(),!0}}function l5(r,t){for(const e in t){const n=t[e],a=r[e];if(typeof n=="string"){if(n!==a)return!1}else if(!yn(a)||a.length!==n.length||n.some((i,o)=>i!==a[o]))return!1}return!0}function ax(r){return r?r.aliasOf?r.aliasOf.path:r.path:""}const ix=(r,t,e)=>r??t??e,u5=JM({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(r,{attrs:t,slots:e}){const n=$n(zy),a=Fe(()=>r.route||n.value),i=$n(rx,0),o=Fe(()=>{let u=fe(i);const{matched:f}=a.value;let c;for(;(c=f[u])&&!c.components;)u++;return u}),s=Fe(()=>a.value.matched[o.value]);lh(rx,Fe(()=>o.value+1)),lh(n5,s),lh(zy,a);const l=St();return Un(()=>[l.value,s.value,r.name],([u,f,c],[h,v,d])=>{f&&(f.instances[c]=u,v&&v!==f&&u&&u===h&&(f.leaveGuards.size||(f.leaveGuards=v.leaveGuards),f.updateGuards.size||(f.updateGuards=v.updateGuards))),u&&f&&(!v||!Ks(f,v)||!h)&&(f.enterCallbacks[c]||[]).forEach(p=>p(u))},{flush:"post"}),()=>{const u=a.value,f=r.name,c=s.value,h=c&&c.components[f];if(!h)return ox(e.default,{Component:h,route:u});const v=c.props[f],d=v?v===!0?u.params:typeof v=="function"?v(u):v:null,g=U0(h,ne({},d,t,{onVnodeUnmounted:y=>{y.component.isUnmounted&&(c.instances[f]=null)},ref:l}));return ox(e.default,{Component:g,route:u})||g}}});function ox(r,t){if(!r)return null;const e=r(t);return e.length===1?e[0]:e}const UI=u5;function f5(r){const t=KB(r.routes,r),e=r.parseQuery||e5,n=r.stringifyQuery||ex,a=r.history,i=Ml(),o=Ml(),s=Ml(),l=sN(Na);let u=Na;Ms&&r.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const f=jd.bind(null,Y=>""+Y),c=jd.bind(null,wB),h=jd.bind(null,ju);function v(Y,J){let U,tt;return FI(Y)?(U=t.getRecordMatcher(Y),tt=J):tt=Y,t.addRoute(tt,U)}function d(Y){const J=t.getRecordMatcher(Y);J&&t.removeRoute(J)}function p(){return t.getRoutes().map(Y=>Y.record)}function g(Y){return!!t.getRecordMatcher(Y)}function y(Y,J){if(J=ne({},J||l.value),typeof Y=="string"){const G=Jd(e,Y,J.path),$=t.resolve({path:G.path},J),q=a.createHref(G.fullPath);return ne(G,$,{params:h($.params),hash:ju(G.hash),redirectedFrom:void 0,href:q})}let U;if(Y.path!=null)U=ne({},Y,{path:Jd(e,Y.path,J.path).path});else{const G=ne({},Y.params);for(const $ in G)G[$]==null&&delete G[$];U=ne({},Y,{params:c(G)}),J.params=c(J.params)}const tt=t.resolve(U,J),et=Y.hash||"";tt.params=f(h(tt.params));const R=AB(n,ne({},Y,{hash:SB(et),path:tt.path})),N=a.createHref(R);return ne({fullPath:R,hash:et,query:n===ex?r5(Y.query):Y.query||{}},tt,{redirectedFrom:void 0,href:N})}function m(Y){return typeof Y=="string"?Jd(e,Y,l.value.path):ne({},Y)}function _(Y,J){if(u!==Y)return js(8,{from:J,to:Y})}function S(Y){return w(Y)}function x(Y){return S(ne(m(Y),{replace:!0}))}function b(Y){const J=Y.matched[Y.matched.length-1];if(J&&J.redirect){const{redirect:U}=J;let tt=typeof U=="function"?U(Y):U;return typeof tt=="string"&&(tt=tt.includes("?")||tt.includes("#")?tt=m(tt):{path:tt},tt.params={}),ne({query:Y.query,hash:Y.hash,params:tt.path!=null?{}:Y.params},tt)}}function w(Y,J){const U=u=y(Y),tt=l.value,et=Y.state,R=Y.force,N=Y.replace===!0,G=b(U);if(G)return w(ne(m(G),{state:typeof G=="object"?ne({},et,G.state):et,force:R,replace:N}),J||U);const $=U;$.redirectedFrom=J;let q;return!R&&DB(n,tt,U)&&(q=js(16,{to:$,from:tt}),Z(tt,tt,!0,!1)),(q?Promise.resolve(q):A($,tt)).catch(j=>sa(j)?sa(j,2)?j:H(j):O(j,$,tt)).then(j=>{if(j){if(sa(j,2))return w(ne({replace:N},m(j.to),{state:typeof j.to=="object"?ne({},et,j.to.state):et,force:R}),J||$)}else j=I($,tt,!0,N,et);return M($,tt,j),j})}function C(Y,J){const U=_(Y,J);return U?Promise.reject(U):Promise.resolve()}function T(Y){const J=ht.values().next().value;return J&&typeof J.runWithContext=="function"?J.runWithContext(Y):Y()}function A(Y,J){let U;const[tt,et,R]=c5(Y,J);U=Qd(tt.reverse(),"beforeRouteLeave",Y,J);for(const G of tt)G.leaveGuards.forEach($=>{U.push(Ja($,Y,J))});const N=C.bind(null,Y,J);return U.push(N),Vt(U).then(()=>{U=[];for(const G of i.list())U.push(Ja(G,Y,J));return U.push(N),Vt(U)}).then(()=>{U=Qd(et,"beforeRouteUpdate",Y,J);for(const G of et)G.updateGuards.forEach($=>{U.push(Ja($,Y,J))});return U.push(N),Vt(U)}).then(()=>{U=[];for(const G of R)if(G.beforeEnter)if(yn(G.beforeEnter))for(const $ of G.beforeEnter)U.push(Ja($,Y,J));else U.push(Ja(G.beforeEnter,Y,J));return U.push(N),Vt(U)}).then(()=>(Y.matched.forEach(G=>G.enterCallbacks={}),U=Qd(R,"beforeRouteEnter",Y,J,T),U.push(N),Vt(U))).then(()=>{U=[];for(const G of o.list())U.push(Ja(G,Y,J));return U.push(N),Vt(U)}).catch(G=>sa(G,8)?G:Promise.reject(G))}function M(Y,J,U){s.list().forEach(tt=>T(()=>tt(Y,J,U)))}function I(Y,J,U,tt,et){const R=_(Y,J);if(R)return R;const N=J===Na,G=Ms?history.state:{};U&&(tt||N?a.replace(Y.fullPath,ne({scroll:N&&G&&G.scroll},et)):a.push(Y.fullPath,et)),l.value=Y,Z(Y,J,U,N),H()}let L;function P(){L||(L=a.listen((Y,J,U)=>{if(!mt.listening)return;const tt=y(Y),et=b(tt);if(et){w(ne(et,{replace:!0,force:!0}),tt).catch(Au);return}u=tt;const R=l.value;Ms&&OB(YS(R.fullPath,U.delta),jv()),A(tt,R).catch(N=>sa(N,12)?N:sa(N,2)?(w(ne(m(N.to),{force:!0}),tt).then(G=>{sa(G,20)&&!U.delta&&U.type===Ju.pop&&a.go(-1,!1)}).catch(Au),Promise.reject()):(U.delta&&a.go(-U.delta,!1),O(N,tt,R))).then(N=>{N=N||I(tt,R,!1),N&&(U.delta&&!sa(N,8)?a.go(-U.delta,!1):U.type===Ju.pop&&sa(N,20)&&a.go(-1,!1)),M(tt,R,N)}).catch(Au)}))}let E=Ml(),k=Ml(),z;function O(Y,J,U){H(Y);const tt=k.list();return tt.length?tt.forEach(et=>et(Y,J,U)):console.error(Y),Promise.reject(Y)}function B(){return z&&l.value!==Na?Promise.resolve():new Promise((Y,J)=>{E.add([Y,J])})}function H(Y){return z||(z=!Y,P(),E.list().forEach(([J,U])=>Y?U(Y):J()),E.reset()),Y}function Z(Y,J,U,tt){const{scrollBehavior:et}=r;if(!Ms||!et)return Promise.resolve();const R=!U&&NB(YS(Y.fullPath,0))||(tt||!U)&&history.state&&history.state.scroll||null;return qs().then(()=>et(Y,J,R)).then(N=>N&&kB(N)).catch(N=>O(N,Y,J))}const Q=Y=>a.go(Y);let ft;const ht=new Set,mt={currentRoute:l,listening:!0,addRoute:v,removeRoute:d,clearRoutes:t.clearRoutes,hasRoute:g,getRoutes:p,resolve:y,options:r,push:S,replace:x,go:Q,back:()=>Q(-1),forward:()=>Q(1),beforeEach:i.add,beforeResolve:o.add,afterEach:s.add,onError:k.add,isReady:B,install(Y){const J=this;Y.component("RouterLink",o5),Y.component("RouterView",UI),Y.config.globalProperties.$router=J,Object.defineProperty(Y.config.globalProperties,"$route",{enumerable:!0,get:()=>fe(l)}),Ms&&!ft&&l.value===Na&&(ft=!0,S(a.location).catch(et=>{}));const U={};for(const et in Na)Object.defineProperty(U,et,{get:()=>l.value[et],enumerable:!0});Y.provide(X0,J),Y.provide($I,VM(U)),Y.provide(zy,l);const tt=Y.unmount;ht.add(Y),Y.unmount=function(){ht.delete(Y),ht.size<1&&(u=Na,L&&L(),L=null,l.value=Na,ft=!1,z=!1),tt()}}};function Vt(Y){return Y.reduce((J,U)=>J.then(()=>T(U)),Promise.resolve())}return mt}function c5(r,t){const e=[],n=[],a=[],i=Math.max(t.matched.length,r.matched.length);for(let o=0;o<i;o++){const s=t.matched[o];s&&(r.matched.find(u=>Ks(u,s))?n.push(s):e.push(s));const l=r.matched[o];l&&(t.matched.find(u=>Ks(u,l))||a.push(l))}return[e,n,a]}const h5={__name:"App",setup(r){return(t,e)=>(wt(),W0(fe(UI)))}},Sn=uB("dashboard",()=>{const r=St({keyCount:0,modelCount:0,retryCount:0,last24hCalls:0,hourlyCalls:0,minuteCalls:0}),t=St({calls:[],tokens:[]}),e=St({maxRequestsPerMinute:0,maxRequestsPerDayPerIp:0,currentTime:"",fakeStreaming:!1,fakeStreamingInterval:0,randomString:!1,localVersion:"",remoteVersion:"",hasUpdate:!1,concurrentRequests:0,increaseConcurrentOnFailure:0,maxConcurrentRequests:0,maxRetryNum:0,searchPrompt:"",maxEmptyResponses:0}),n=St([]),a=St([]),i=St(!1),o=St(!1),s=St("all"),l=St([]),u=St(localStorage.getItem("darkMode")==="true");Un(u,y=>{localStorage.setItem("darkMode",y),f(y)});function f(y){y?document.documentElement.classList.add("dark-mode"):document.documentElement.classList.remove("dark-mode")}f(u.value);async function c(){if(!i.value){i.value=!0;try{const y=await fetch("/api/dashboard-data");if(!y.ok)throw new Error(`HTTP error! status: ${y.status}`);const m=await y.json();h(m)}catch(y){console.error("获取数据失败:",y)}finally{i.value=!1}}}function h(y){if(r.value={keyCount:y.key_count||0,modelCount:y.model_count||0,retryCount:y.retry_count||0,last24hCalls:y.last_24h_calls||0,hourlyCalls:y.hourly_calls||0,minuteCalls:y.minute_calls||0,enableVertex:y.enable_vertex||!1},y.calls_time_series&&(t.value.calls=y.calls_time_series),y.tokens_time_series&&(t.value.tokens=y.tokens_time_series),e.value={maxRequestsPerMinute:y.max_requests_per_minute||0,maxRequestsPerDayPerIp:y.max_requests_per_day_per_ip||0,currentTime:y.current_time||"",fakeStreaming:y.fake_streaming||!1,fakeStreamingInterval:y.fake_streaming_interval||0,randomString:y.random_string||!1,randomStringLength:y.random_string_length||0,searchMode:y.search_mode||!1,searchPrompt:y.search_prompt||"",localVersion:y.local_version||"",remoteVersion:y.remote_version||"",hasUpdate:y.has_update||!1,concurrentRequests:y.concurrent_requests||0,increaseConcurrentOnFailure:y.increase_concurrent_on_failure||0,maxConcurrentRequests:y.max_concurrent_requests||0,enableVertex:y.enable_vertex||!1,enableVertexExpress:y.enable_vertex_express||!1,vertexExpressApiKey:y.vertex_express_api_key||!1,googleCredentialsJson:y.google_credentials_json||!1,maxRetryNum:y.max_retry_num||0,maxEmptyResponses:y.max_empty_responses||0},y.api_key_stats){n.value=y.api_key_stats.map(_=>({..._,model_stats:Object.entries(_.model_stats||{}).reduce((S,[x,b])=>(S[x]={calls:typeof b=="object"?b.calls:b,tokens:typeof b=="object"?b.tokens:0},S),{})}));const m=new Set(["all"]);y.api_key_stats.forEach(_=>{_.model_stats&&Object.keys(_.model_stats).forEach(S=>{m.add(S)})}),l.value=Array.from(m),l.value.includes(s.value)||(s.value="all")}y.logs&&(a.value=y.logs),o.value=!0}function v(y){s.value=y}function d(){u.value=!u.value}async function p(){try{const y=!e.value.enableVertex;await g("enableVertex",y,"123"),e.value.enableVertex=y}catch(y){console.error("切换Vertex AI失败:",y)}}async function g(y,m,_){try{const S=y.replace(/[A-Z]/g,w=>`_${w.toLowerCase()}`),x=await fetch("/api/update-config",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({key:S,value:m,password:_})});if(!x.ok){const w=await x.json();throw new Error(w.detail||"更新配置失败")}return await x.json()}catch(S){throw console.error("更新配置失败:",S),S}}return{status:r,config:e,apiKeyStats:n,logs:a,isRefreshing:i,timeSeriesData:t,fetchDashboardData:c,selectedModel:s,availableModels:l,setSelectedModel:v,isDarkMode:u,toggleDarkMode:d,updateConfig:g,toggleVertex:p,isConfigLoaded:o}}),ea=(r,t)=>{const e=r.__vccOpts||r;for(const[n,a]of t)e[n]=a;return e},v5={key:0,class:"stats-grid"},d5={class:"stat-card"},p5={class:"stat-value"},g5={class:"stat-card"},y5={class:"stat-value"},m5={class:"stat-card"},_5={class:"stat-value"},S5={__name:"StatusStats",setup(r){const t=Sn();return(e,n)=>fe(t).status.enableVertex?Jt("",!0):(wt(),Ct("div",v5,[V("div",d5,[V("div",p5,bt(fe(t).status.keyCount),1),n[0]||(n[0]=V("div",{class:"stat-label"},"可用密钥数量",-1))]),V("div",g5,[V("div",y5,bt(fe(t).status.modelCount),1),n[1]||(n[1]=V("div",{class:"stat-label"},"可用模型数量",-1))]),V("div",m5,[V("div",_5,bt(fe(t).config.maxRetryNum),1),n[2]||(n[2]=V("div",{class:"stat-label"},"最大重试次数",-1))])]))}},x5=ea(S5,[["__scopeId","data-v-8b643ea6"]]);/*! *****************************************************************************
+  */const Ms=typeof document<"u";function RI(r){return typeof r=="object"||"displayName"in r||"props"in r||"__vccOpts"in r}function fB(r){return r.__esModule||r[Symbol.toStringTag]==="Module"||r.default&&RI(r.default)}const ne=Object.assign;function jd(r,t){const e={};for(const n in t){const a=t[n];e[n]=yn(a)?a.map(r):r(a)}return e}const Au=()=>{},yn=Array.isArray,EI=/#/g,cB=/&/g,hB=/\//g,vB=/=/g,dB=/\?/g,kI=/\+/g,pB=/%5B/g,gB=/%5D/g,OI=/%5E/g,yB=/%60/g,NI=/%7B/g,mB=/%7C/g,VI=/%7D/g,_B=/%20/g;function Y0(r){return encodeURI(""+r).replace(mB,"|").replace(pB,"[").replace(gB,"]")}function SB(r){return Y0(r).replace(NI,"{").replace(VI,"}").replace(OI,"^")}function Vy(r){return Y0(r).replace(kI,"%2B").replace(_B,"+").replace(EI,"%23").replace(cB,"%26").replace(yB,"`").replace(NI,"{").replace(VI,"}").replace(OI,"^")}function xB(r){return Vy(r).replace(vB,"%3D")}function bB(r){return Y0(r).replace(EI,"%23").replace(dB,"%3F")}function wB(r){return r==null?"":bB(r).replace(hB,"%2F")}function ju(r){try{return decodeURIComponent(""+r)}catch{}return""+r}const TB=/\/$/,CB=r=>r.replace(TB,"");function Jd(r,t,e="/"){let n,a={},i="",o="";const s=t.indexOf("#");let l=t.indexOf("?");return s<l&&s>=0&&(l=-1),l>-1&&(n=t.slice(0,l),i=t.slice(l+1,s>-1?s:t.length),a=r(i)),s>-1&&(n=n||t.slice(0,s),o=t.slice(s,t.length)),n=IB(n??t,e),{fullPath:n+(i&&"?")+i+o,path:n,query:a,hash:ju(o)}}function AB(r,t){const e=t.query?r(t.query):"";return t.path+(e&&"?")+e+(t.hash||"")}function $S(r,t){return!t||!r.toLowerCase().startsWith(t.toLowerCase())?r:r.slice(t.length)||"/"}function DB(r,t,e){const n=t.matched.length-1,a=e.matched.length-1;return n>-1&&n===a&&Ks(t.matched[n],e.matched[a])&&BI(t.params,e.params)&&r(t.query)===r(e.query)&&t.hash===e.hash}function Ks(r,t){return(r.aliasOf||r)===(t.aliasOf||t)}function BI(r,t){if(Object.keys(r).length!==Object.keys(t).length)return!1;for(const e in r)if(!MB(r[e],t[e]))return!1;return!0}function MB(r,t){return yn(r)?US(r,t):yn(t)?US(t,r):r===t}function US(r,t){return yn(t)?r.length===t.length&&r.every((e,n)=>e===t[n]):r.length===1&&r[0]===t}function IB(r,t){if(r.startsWith("/"))return r;if(!r)return t;const e=t.split("/"),n=r.split("/"),a=n[n.length-1];(a===".."||a===".")&&n.push("");let i=e.length-1,o,s;for(o=0;o<n.length;o++)if(s=n[o],s!==".")if(s==="..")i>1&&i--;else break;return e.slice(0,i).join("/")+"/"+n.slice(o).join("/")}const Na={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var Ju;(function(r){r.pop="pop",r.push="push"})(Ju||(Ju={}));var Du;(function(r){r.back="back",r.forward="forward",r.unknown=""})(Du||(Du={}));function LB(r){if(!r)if(Ms){const t=document.querySelector("base");r=t&&t.getAttribute("href")||"/",r=r.replace(/^\w+:\/\/[^\/]+/,"")}else r="/";return r[0]!=="/"&&r[0]!=="#"&&(r="/"+r),CB(r)}const PB=/^[^#]+#/;function RB(r,t){return r.replace(PB,"#")+t}function EB(r,t){const e=document.documentElement.getBoundingClientRect(),n=r.getBoundingClientRect();return{behavior:t.behavior,left:n.left-e.left-(t.left||0),top:n.top-e.top-(t.top||0)}}const jv=()=>({left:window.scrollX,top:window.scrollY});function kB(r){let t;if("el"in r){const e=r.el,n=typeof e=="string"&&e.startsWith("#"),a=typeof e=="string"?n?document.getElementById(e.slice(1)):document.querySelector(e):e;if(!a)return;t=EB(a,r)}else t=r;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function YS(r,t){return(history.state?history.state.position-t:-1)+r}const By=new Map;function OB(r,t){By.set(r,t)}function NB(r){const t=By.get(r);return By.delete(r),t}let VB=()=>location.protocol+"//"+location.host;function zI(r,t){const{pathname:e,search:n,hash:a}=t,i=r.indexOf("#");if(i>-1){let s=a.includes(r.slice(i))?r.slice(i).length:1,l=a.slice(s);return l[0]!=="/"&&(l="/"+l),$S(l,"")}return $S(e,r)+n+a}function BB(r,t,e,n){let a=[],i=[],o=null;const s=({state:h})=>{const v=zI(r,location),d=e.value,p=t.value;let g=0;if(h){if(e.value=v,t.value=h,o&&o===d){o=null;return}g=p?h.position-p.position:0}else n(v);a.forEach(y=>{y(e.value,d,{delta:g,type:Ju.pop,direction:g?g>0?Du.forward:Du.back:Du.unknown})})};function l(){o=e.value}function u(h){a.push(h);const v=()=>{const d=a.indexOf(h);d>-1&&a.splice(d,1)};return i.push(v),v}function f(){const{history:h}=window;h.state&&h.replaceState(ne({},h.state,{scroll:jv()}),"")}function c(){for(const h of i)h();i=[],window.removeEventListener("popstate",s),window.removeEventListener("beforeunload",f)}return window.addEventListener("popstate",s),window.addEventListener("beforeunload",f,{passive:!0}),{pauseListeners:l,listen:u,destroy:c}}function XS(r,t,e,n=!1,a=!1){return{back:r,current:t,forward:e,replaced:n,position:window.history.length,scroll:a?jv():null}}function zB(r){const{history:t,location:e}=window,n={value:zI(r,e)},a={value:t.state};a.value||i(n.value,{back:null,current:n.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function i(l,u,f){const c=r.indexOf("#"),h=c>-1?(e.host&&document.querySelector("base")?r:r.slice(c))+l:VB()+r+l;try{t[f?"replaceState":"pushState"](u,"",h),a.value=u}catch(v){console.error(v),e[f?"replace":"assign"](h)}}function o(l,u){const f=ne({},t.state,XS(a.value.back,l,a.value.forward,!0),u,{position:a.value.position});i(l,f,!0),n.value=l}function s(l,u){const f=ne({},a.value,t.state,{forward:l,scroll:jv()});i(f.current,f,!0);const c=ne({},XS(n.value,l,null),{position:f.position+1},u);i(l,c,!1),n.value=l}return{location:n,state:a,push:s,replace:o}}function FB(r){r=LB(r);const t=zB(r),e=BB(r,t.state,t.location,t.replace);function n(i,o=!0){o||e.pauseListeners(),history.go(i)}const a=ne({location:"",base:r,go:n,createHref:RB.bind(null,r)},t,e);return Object.defineProperty(a,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(a,"state",{enumerable:!0,get:()=>t.state.value}),a}function GB(r){return typeof r=="string"||r&&typeof r=="object"}function FI(r){return typeof r=="string"||typeof r=="symbol"}const GI=Symbol("");var ZS;(function(r){r[r.aborted=4]="aborted",r[r.cancelled=8]="cancelled",r[r.duplicated=16]="duplicated"})(ZS||(ZS={}));function js(r,t){return ne(new Error,{type:r,[GI]:!0},t)}function sa(r,t){return r instanceof Error&&GI in r&&(t==null||!!(r.type&t))}const qS="[^/]+?",HB={sensitive:!1,strict:!1,start:!0,end:!0},WB=/[.+*?^${}()[\]/\\]/g;function $B(r,t){const e=ne({},HB,t),n=[];let a=e.start?"^":"";const i=[];for(const u of r){const f=u.length?[]:[90];e.strict&&!u.length&&(a+="/");for(let c=0;c<u.length;c++){const h=u[c];let v=40+(e.sensitive?.25:0);if(h.type===0)c||(a+="/"),a+=h.value.replace(WB,"\\$&"),v+=40;else if(h.type===1){const{value:d,repeatable:p,optional:g,regexp:y}=h;i.push({name:d,repeatable:p,optional:g});const m=y||qS;if(m!==qS){v+=10;try{new RegExp(`(${m})`)}catch(S){throw new Error(`Invalid custom RegExp for param "${d}" (${m}): `+S.message)}}let _=p?`((?:${m})(?:/(?:${m}))*)`:`(${m})`;c||(_=g&&u.length<2?`(?:/${_})`:"/"+_),g&&(_+="?"),a+=_,v+=20,g&&(v+=-8),p&&(v+=-20),m===".*"&&(v+=-50)}f.push(v)}n.push(f)}if(e.strict&&e.end){const u=n.length-1;n[u][n[u].length-1]+=.7000000000000001}e.strict||(a+="/?"),e.end?a+="$":e.strict&&!a.endsWith("/")&&(a+="(?:/|$)");const o=new RegExp(a,e.sensitive?"":"i");function s(u){const f=u.match(o),c={};if(!f)return null;for(let h=1;h<f.length;h++){const v=f[h]||"",d=i[h-1];c[d.name]=v&&d.repeatable?v.split("/"):v}return c}function l(u){let f="",c=!1;for(const h of r){(!c||!f.endsWith("/"))&&(f+="/"),c=!1;for(const v of h)if(v.type===0)f+=v.value;else if(v.type===1){const{value:d,repeatable:p,optional:g}=v,y=d in u?u[d]:"";if(yn(y)&&!p)throw new Error(`Provided param "${d}" is an array but it is not repeatable (* or + modifiers)`);const m=yn(y)?y.join("/"):y;if(!m)if(g)h.length<2&&(f.endsWith("/")?f=f.slice(0,-1):c=!0);else throw new Error(`Missing required param "${d}"`);f+=m}}return f||"/"}return{re:o,score:n,keys:i,parse:s,stringify:l}}function UB(r,t){let e=0;for(;e<r.length&&e<t.length;){const n=t[e]-r[e];if(n)return n;e++}return r.length<t.length?r.length===1&&r[0]===80?-1:1:r.length>t.length?t.length===1&&t[0]===80?1:-1:0}function HI(r,t){let e=0;const n=r.score,a=t.score;for(;e<n.length&&e<a.length;){const i=UB(n[e],a[e]);if(i)return i;e++}if(Math.abs(a.length-n.length)===1){if(KS(n))return 1;if(KS(a))return-1}return a.length-n.length}function KS(r){const t=r[r.length-1];return r.length>0&&t[t.length-1]<0}const YB={type:0,value:""},XB=/[a-zA-Z0-9_]/;function ZB(r){if(!r)return[[]];if(r==="/")return[[YB]];if(!r.startsWith("/"))throw new Error(`Invalid path "${r}"`);function t(v){throw new Error(`ERR (${e})/"${u}": ${v}`)}let e=0,n=e;const a=[];let i;function o(){i&&a.push(i),i=[]}let s=0,l,u="",f="";function c(){u&&(e===0?i.push({type:0,value:u}):e===1||e===2||e===3?(i.length>1&&(l==="*"||l==="+")&&t(`A repeatable param (${u}) must be alone in its segment. eg: '/:ids+.`),i.push({type:1,value:u,regexp:f,repeatable:l==="*"||l==="+",optional:l==="*"||l==="?"})):t("Invalid state to consume buffer"),u="")}function h(){u+=l}for(;s<r.length;){if(l=r[s++],l==="\\"&&e!==2){n=e,e=4;continue}switch(e){case 0:l==="/"?(u&&c(),o()):l===":"?(c(),e=1):h();break;case 4:h(),e=n;break;case 1:l==="("?e=2:XB.test(l)?h():(c(),e=0,l!=="*"&&l!=="?"&&l!=="+"&&s--);break;case 2:l===")"?f[f.length-1]=="\\"?f=f.slice(0,-1)+l:e=3:f+=l;break;case 3:c(),e=0,l!=="*"&&l!=="?"&&l!=="+"&&s--,f="";break;default:t("Unknown state");break}}return e===2&&t(`Unfinished custom RegExp for param "${u}"`),c(),o(),a}function qB(r,t,e){const n=$B(ZB(r.path),e),a=ne(n,{record:r,parent:t,children:[],alias:[]});return t&&!a.record.aliasOf==!t.record.aliasOf&&t.children.push(a),a}function KB(r,t){const e=[],n=new Map;t=tx({strict:!1,end:!0,sensitive:!1},t);function a(c){return n.get(c)}function i(c,h,v){const d=!v,p=JS(c);p.aliasOf=v&&v.record;const g=tx(t,c),y=[p];if("alias"in c){const S=typeof c.alias=="string"?[c.alias]:c.alias;for(const x of S)y.push(JS(ne({},p,{components:v?v.record.components:p.components,path:x,aliasOf:v?v.record:p})))}let m,_;for(const S of y){const{path:x}=S;if(h&&x[0]!=="/"){const b=h.record.path,w=b[b.length-1]==="/"?"":"/";S.path=h.record.path+(x&&w+x)}if(m=qB(S,h,g),v?v.alias.push(m):(_=_||m,_!==m&&_.alias.push(m),d&&c.name&&!QS(m)&&o(c.name)),WI(m)&&l(m),p.children){const b=p.children;for(let w=0;w<b.length;w++)i(b[w],m,v&&v.children[w])}v=v||m}return _?()=>{o(_)}:Au}function o(c){if(FI(c)){const h=n.get(c);h&&(n.delete(c),e.splice(e.indexOf(h),1),h.children.forEach(o),h.alias.forEach(o))}else{const h=e.indexOf(c);h>-1&&(e.splice(h,1),c.record.name&&n.delete(c.record.name),c.children.forEach(o),c.alias.forEach(o))}}function s(){return e}function l(c){const h=QB(c,e);e.splice(h,0,c),c.record.name&&!QS(c)&&n.set(c.record.name,c)}function u(c,h){let v,d={},p,g;if("name"in c&&c.name){if(v=n.get(c.name),!v)throw js(1,{location:c});g=v.record.name,d=ne(jS(h.params,v.keys.filter(_=>!_.optional).concat(v.parent?v.parent.keys.filter(_=>_.optional):[]).map(_=>_.name)),c.params&&jS(c.params,v.keys.map(_=>_.name))),p=v.stringify(d)}else if(c.path!=null)p=c.path,v=e.find(_=>_.re.test(p)),v&&(d=v.parse(p),g=v.record.name);else{if(v=h.name?n.get(h.name):e.find(_=>_.re.test(h.path)),!v)throw js(1,{location:c,currentLocation:h});g=v.record.name,d=ne({},h.params,c.params),p=v.stringify(d)}const y=[];let m=v;for(;m;)y.unshift(m.record),m=m.parent;return{name:g,path:p,params:d,matched:y,meta:JB(y)}}r.forEach(c=>i(c));function f(){e.length=0,n.clear()}return{addRoute:i,resolve:u,removeRoute:o,clearRoutes:f,getRoutes:s,getRecordMatcher:a}}function jS(r,t){const e={};for(const n of t)n in r&&(e[n]=r[n]);return e}function JS(r){const t={path:r.path,redirect:r.redirect,name:r.name,meta:r.meta||{},aliasOf:r.aliasOf,beforeEnter:r.beforeEnter,props:jB(r),children:r.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in r?r.components||null:r.component&&{default:r.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function jB(r){const t={},e=r.props||!1;if("component"in r)t.default=e;else for(const n in r.components)t[n]=typeof e=="object"?e[n]:e;return t}function QS(r){for(;r;){if(r.record.aliasOf)return!0;r=r.parent}return!1}function JB(r){return r.reduce((t,e)=>ne(t,e.meta),{})}function tx(r,t){const e={};for(const n in r)e[n]=n in t?t[n]:r[n];return e}function QB(r,t){let e=0,n=t.length;for(;e!==n;){const i=e+n>>1;HI(r,t[i])<0?n=i:e=i+1}const a=t5(r);return a&&(n=t.lastIndexOf(a,n-1)),n}function t5(r){let t=r;for(;t=t.parent;)if(WI(t)&&HI(r,t)===0)return t}function WI({record:r}){return!!(r.name||r.components&&Object.keys(r.components).length||r.redirect)}function e5(r){const t={};if(r===""||r==="?")return t;const n=(r[0]==="?"?r.slice(1):r).split("&");for(let a=0;a<n.length;++a){const i=n[a].replace(kI," "),o=i.indexOf("="),s=ju(o<0?i:i.slice(0,o)),l=o<0?null:ju(i.slice(o+1));if(s in t){let u=t[s];yn(u)||(u=t[s]=[u]),u.push(l)}else t[s]=l}return t}function ex(r){let t="";for(let e in r){const n=r[e];if(e=xB(e),n==null){n!==void 0&&(t+=(t.length?"&":"")+e);continue}(yn(n)?n.map(i=>i&&Vy(i)):[n&&Vy(n)]).forEach(i=>{i!==void 0&&(t+=(t.length?"&":"")+e,i!=null&&(t+="="+i))})}return t}function r5(r){const t={};for(const e in r){const n=r[e];n!==void 0&&(t[e]=yn(n)?n.map(a=>a==null?null:""+a):n==null?n:""+n)}return t}const n5=Symbol(""),rx=Symbol(""),X0=Symbol(""),$I=Symbol(""),zy=Symbol("");function Ml(){let r=[];function t(n){return r.push(n),()=>{const a=r.indexOf(n);a>-1&&r.splice(a,1)}}function e(){r=[]}return{add:t,list:()=>r.slice(),reset:e}}function Ja(r,t,e,n,a,i=o=>o()){const o=n&&(n.enterCallbacks[a]=n.enterCallbacks[a]||[]);return()=>new Promise((s,l)=>{const u=h=>{h===!1?l(js(4,{from:e,to:t})):h instanceof Error?l(h):GB(h)?l(js(2,{from:t,to:h})):(o&&n.enterCallbacks[a]===o&&typeof h=="function"&&o.push(h),s())},f=i(()=>r.call(n&&n.instances[a],t,e,u));let c=Promise.resolve(f);r.length<3&&(c=c.then(u)),c.catch(h=>l(h))})}function Qd(r,t,e,n,a=i=>i()){const i=[];for(const o of r)for(const s in o.components){let l=o.components[s];if(!(t!=="beforeRouteEnter"&&!o.instances[s]))if(RI(l)){const f=(l.__vccOpts||l)[t];f&&i.push(Ja(f,e,n,o,s,a))}else{let u=l();i.push(()=>u.then(f=>{if(!f)throw new Error(`Couldn't resolve component "${s}" at "${o.path}"`);const c=fB(f)?f.default:f;o.mods[s]=f,o.components[s]=c;const v=(c.__vccOpts||c)[t];return v&&Ja(v,e,n,o,s,a)()}))}}return i}function nx(r){const t=$n(X0),e=$n($I),n=Fe(()=>{const l=fe(r.to);return t.resolve(l)}),a=Fe(()=>{const{matched:l}=n.value,{length:u}=l,f=l[u-1],c=e.matched;if(!f||!c.length)return-1;const h=c.findIndex(Ks.bind(null,f));if(h>-1)return h;const v=ax(l[u-2]);return u>1&&ax(f)===v&&c[c.length-1].path!==v?c.findIndex(Ks.bind(null,l[u-2])):h}),i=Fe(()=>a.value>-1&&l5(e.params,n.value.params)),o=Fe(()=>a.value>-1&&a.value===e.matched.length-1&&BI(e.params,n.value.params));function s(l={}){if(s5(l)){const u=t[fe(r.replace)?"replace":"push"](fe(r.to)).catch(Au);return r.viewTransition&&typeof document<"u"&&"startViewTransition"in document&&document.startViewTransition(()=>u),u}return Promise.resolve()}return{route:n,href:Fe(()=>n.value.href),isActive:i,isExactActive:o,navigate:s}}function a5(r){return r.length===1?r[0]:r}const i5=JM({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"}},useLink:nx,setup(r,{slots:t}){const e=Ii(nx(r)),{options:n}=$n(X0),a=Fe(()=>({[ix(r.activeClass,n.linkActiveClass,"router-link-active")]:e.isActive,[ix(r.exactActiveClass,n.linkExactActiveClass,"router-link-exact-active")]:e.isExactActive}));return()=>{const i=t.default&&a5(t.default(e));return r.custom?i:U0("a",{"aria-current":e.isExactActive?r.ariaCurrentValue:null,href:e.href,onClick:e.navigate,class:a.value},i)}}}),o5=i5;function s5(r){if(!(r.metaKey||r.altKey||r.ctrlKey||r.shiftKey)&&!r.defaultPrevented&&!(r.button!==void 0&&r.button!==0)){if(r.currentTarget&&r.currentTarget.getAttribute){const t=r.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return r.preventDefault&&r.preventDefault(),!0}}function l5(r,t){for(const e in t){const n=t[e],a=r[e];if(typeof n=="string"){if(n!==a)return!1}else if(!yn(a)||a.length!==n.length||n.some((i,o)=>i!==a[o]))return!1}return!0}function ax(r){return r?r.aliasOf?r.aliasOf.path:r.path:""}const ix=(r,t,e)=>r??t??e,u5=JM({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(r,{attrs:t,slots:e}){const n=$n(zy),a=Fe(()=>r.route||n.value),i=$n(rx,0),o=Fe(()=>{let u=fe(i);const{matched:f}=a.value;let c;for(;(c=f[u])&&!c.components;)u++;return u}),s=Fe(()=>a.value.matched[o.value]);lh(rx,Fe(()=>o.value+1)),lh(n5,s),lh(zy,a);const l=St();return Un(()=>[l.value,s.value,r.name],([u,f,c],[h,v,d])=>{f&&(f.instances[c]=u,v&&v!==f&&u&&u===h&&(f.leaveGuards.size||(f.leaveGuards=v.leaveGuards),f.updateGuards.size||(f.updateGuards=v.updateGuards))),u&&f&&(!v||!Ks(f,v)||!h)&&(f.enterCallbacks[c]||[]).forEach(p=>p(u))},{flush:"post"}),()=>{const u=a.value,f=r.name,c=s.value,h=c&&c.components[f];if(!h)return ox(e.default,{Component:h,route:u});const v=c.props[f],d=v?v===!0?u.params:typeof v=="function"?v(u):v:null,g=U0(h,ne({},d,t,{onVnodeUnmounted:y=>{y.component.isUnmounted&&(c.instances[f]=null)},ref:l}));return ox(e.default,{Component:g,route:u})||g}}});function ox(r,t){if(!r)return null;const e=r(t);return e.length===1?e[0]:e}const UI=u5;function f5(r){const t=KB(r.routes,r),e=r.parseQuery||e5,n=r.stringifyQuery||ex,a=r.history,i=Ml(),o=Ml(),s=Ml(),l=sN(Na);let u=Na;Ms&&r.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const f=jd.bind(null,Y=>""+Y),c=jd.bind(null,wB),h=jd.bind(null,ju);function v(Y,J){let U,tt;return FI(Y)?(U=t.getRecordMatcher(Y),tt=J):tt=Y,t.addRoute(tt,U)}function d(Y){const J=t.getRecordMatcher(Y);J&&t.removeRoute(J)}function p(){return t.getRoutes().map(Y=>Y.record)}function g(Y){return!!t.getRecordMatcher(Y)}function y(Y,J){if(J=ne({},J||l.value),typeof Y=="string"){const G=Jd(e,Y,J.path),$=t.resolve({path:G.path},J),q=a.createHref(G.fullPath);return ne(G,$,{params:h($.params),hash:ju(G.hash),redirectedFrom:void 0,href:q})}let U;if(Y.path!=null)U=ne({},Y,{path:Jd(e,Y.path,J.path).path});else{const G=ne({},Y.params);for(const $ in G)G[$]==null&&delete G[$];U=ne({},Y,{params:c(G)}),J.params=c(J.params)}const tt=t.resolve(U,J),et=Y.hash||"";tt.params=f(h(tt.params));const R=AB(n,ne({},Y,{hash:SB(et),path:tt.path})),N=a.createHref(R);return ne({fullPath:R,hash:et,query:n===ex?r5(Y.query):Y.query||{}},tt,{redirectedFrom:void 0,href:N})}function m(Y){return typeof Y=="string"?Jd(e,Y,l.value.path):ne({},Y)}function _(Y,J){if(u!==Y)return js(8,{from:J,to:Y})}function S(Y){return w(Y)}function x(Y){return S(ne(m(Y),{replace:!0}))}function b(Y){const J=Y.matched[Y.matched.length-1];if(J&&J.redirect){const{redirect:U}=J;let tt=typeof U=="function"?U(Y):U;return typeof tt=="string"&&(tt=tt.includes("?")||tt.includes("#")?tt=m(tt):{path:tt},tt.params={}),ne({query:Y.query,hash:Y.hash,params:tt.path!=null?{}:Y.params},tt)}}function w(Y,J){const U=u=y(Y),tt=l.value,et=Y.state,R=Y.force,N=Y.replace===!0,G=b(U);if(G)return w(ne(m(G),{state:typeof G=="object"?ne({},et,G.state):et,force:R,replace:N}),J||U);const $=U;$.redirectedFrom=J;let q;return!R&&DB(n,tt,U)&&(q=js(16,{to:$,from:tt}),Z(tt,tt,!0,!1)),(q?Promise.resolve(q):A($,tt)).catch(j=>sa(j)?sa(j,2)?j:H(j):O(j,$,tt)).then(j=>{if(j){if(sa(j,2))return w(ne({replace:N},m(j.to),{state:typeof j.to=="object"?ne({},et,j.to.state):et,force:R}),J||$)}else j=I($,tt,!0,N,et);return M($,tt,j),j})}function C(Y,J){const U=_(Y,J);return U?Promise.reject(U):Promise.resolve()}function T(Y){const J=ht.values().next().value;return J&&typeof J.runWithContext=="function"?J.runWithContext(Y):Y()}function A(Y,J){let U;const[tt,et,R]=c5(Y,J);U=Qd(tt.reverse(),"beforeRouteLeave",Y,J);for(const G of tt)G.leaveGuards.forEach($=>{U.push(Ja($,Y,J))});const N=C.bind(null,Y,J);return U.push(N),Vt(U).then(()=>{U=[];for(const G of i.list())U.push(Ja(G,Y,J));return U.push(N),Vt(U)}).then(()=>{U=Qd(et,"beforeRouteUpdate",Y,J);for(const G of et)G.updateGuards.forEach($=>{U.push(Ja($,Y,J))});return U.push(N),Vt(U)}).then(()=>{U=[];for(const G of R)if(G.beforeEnter)if(yn(G.beforeEnter))for(const $ of G.beforeEnter)U.push(Ja($,Y,J));else U.push(Ja(G.beforeEnter,Y,J));return U.push(N),Vt(U)}).then(()=>(Y.matched.forEach(G=>G.enterCallbacks={}),U=Qd(R,"beforeRouteEnter",Y,J,T),U.push(N),Vt(U))).then(()=>{U=[];for(const G of o.list())U.push(Ja(G,Y,J));return U.push(N),Vt(U)}).catch(G=>sa(G,8)?G:Promise.reject(G))}function M(Y,J,U){s.list().forEach(tt=>T(()=>tt(Y,J,U)))}function I(Y,J,U,tt,et){const R=_(Y,J);if(R)return R;const N=J===Na,G=Ms?history.state:{};U&&(tt||N?a.replace(Y.fullPath,ne({scroll:N&&G&&G.scroll},et)):a.push(Y.fullPath,et)),l.value=Y,Z(Y,J,U,N),H()}let L;function P(){L||(L=a.listen((Y,J,U)=>{if(!mt.listening)return;const tt=y(Y),et=b(tt);if(et){w(ne(et,{replace:!0,force:!0}),tt).catch(Au);return}u=tt;const R=l.value;Ms&&OB(YS(R.fullPath,U.delta),jv()),A(tt,R).catch(N=>sa(N,12)?N:sa(N,2)?(w(ne(m(N.to),{force:!0}),tt).then(G=>{sa(G,20)&&!U.delta&&U.type===Ju.pop&&a.go(-1,!1)}).catch(Au),Promise.reject()):(U.delta&&a.go(-U.delta,!1),O(N,tt,R))).then(N=>{N=N||I(tt,R,!1),N&&(U.delta&&!sa(N,8)?a.go(-U.delta,!1):U.type===Ju.pop&&sa(N,20)&&a.go(-1,!1)),M(tt,R,N)}).catch(Au)}))}let E=Ml(),k=Ml(),z;function O(Y,J,U){H(Y);const tt=k.list();return tt.length?tt.forEach(et=>et(Y,J,U)):console.error(Y),Promise.reject(Y)}function B(){return z&&l.value!==Na?Promise.resolve():new Promise((Y,J)=>{E.add([Y,J])})}function H(Y){return z||(z=!Y,P(),E.list().forEach(([J,U])=>Y?U(Y):J()),E.reset()),Y}function Z(Y,J,U,tt){const{scrollBehavior:et}=r;if(!Ms||!et)return Promise.resolve();const R=!U&&NB(YS(Y.fullPath,0))||(tt||!U)&&history.state&&history.state.scroll||null;return qs().then(()=>et(Y,J,R)).then(N=>N&&kB(N)).catch(N=>O(N,Y,J))}const Q=Y=>a.go(Y);let ft;const ht=new Set,mt={currentRoute:l,listening:!0,addRoute:v,removeRoute:d,clearRoutes:t.clearRoutes,hasRoute:g,getRoutes:p,resolve:y,options:r,push:S,replace:x,go:Q,back:()=>Q(-1),forward:()=>Q(1),beforeEach:i.add,beforeResolve:o.add,afterEach:s.add,onError:k.add,isReady:B,install(Y){const J=this;Y.component("RouterLink",o5),Y.component("RouterView",UI),Y.config.globalProperties.$router=J,Object.defineProperty(Y.config.globalProperties,"$route",{enumerable:!0,get:()=>fe(l)}),Ms&&!ft&&l.value===Na&&(ft=!0,S(a.location).catch(et=>{}));const U={};for(const et in Na)Object.defineProperty(U,et,{get:()=>l.value[et],enumerable:!0});Y.provide(X0,J),Y.provide($I,VM(U)),Y.provide(zy,l);const tt=Y.unmount;ht.add(Y),Y.unmount=function(){ht.delete(Y),ht.size<1&&(u=Na,L&&L(),L=null,l.value=Na,ft=!1,z=!1),tt()}}};function Vt(Y){return Y.reduce((J,U)=>J.then(()=>T(U)),Promise.resolve())}return mt}function c5(r,t){const e=[],n=[],a=[],i=Math.max(t.matched.length,r.matched.length);for(let o=0;o<i;o++){const s=t.matched[o];s&&(r.matched.find(u=>Ks(u,s))?n.push(s):e.push(s));const l=r.matched[o];l&&(t.matched.find(u=>Ks(u,l))||a.push(l))}return[e,n,a]}const h5={__name:"App",setup(r){return(t,e)=>(wt(),W0(fe(UI)))}},Sn=uB("dashboard",()=>{const r=St({keyCount:0,modelCount:0,retryCount:0,last24hCalls:0,hourlyCalls:0,minuteCalls:0,upstreamOpenConnections:0,upstreamReuseRatio:0,upstreamHttp2:!1,cacheEntries:0,maxCacheEntries:0,cacheBytes:0,maxCacheBytes:0}),t=St({calls:[],tokens:[]}),e=St({maxRequestsPerMinute:0,maxRequestsPerDayPerIp:0,currentTime:"",fakeStreaming:!1,fakeStreamingInterval:0,randomString:!1,localVersion:"",remoteVersion:"",hasUpdate:!1,concurrentRequests:0,increaseConcurrentOnFailure:0,maxConcurrentRequests:0,adaptiveConcurrency:!1,concurrencyFanout:{},maxRetryNum:0,searchPrompt:"",maxEmptyResponses:0}),n=St([]),a=St([]),i=St(!1),o=St(!1),s=St("all"),l=St([]),u=St(localStorage.getItem("darkMode")==="true");Un(u,y=>{localStorage.setItem("darkMode",y),f(y)});function f(y){y?document.documentElement.classList.add("dark-mode"):document.documentElement.classList.remove("dark-mode")}f(u.value);let C=null,E=null,M={};async function c(){if(!i.value){i.value=!0;try{const y=C?`/api/dashboard-data?since=${encodeURIComponent(C)}`:"/api/dashboard-data",m=E?{"If-None-Match":E}:{},_=await fetch(y,{headers:m});if(_.status===304)return;if(!_.ok)throw new Error(`HTTP error! status: ${_.status}`);const S=await _.json();E=_.headers.get("ETag"),P(S)}catch(y){console.error("获取数据失败:",y)}finally{i.value=!1}}}function P(y){C=y.cursor;const{logs:m,logs_full:_,full:S,...x}=y;M=S?x:{...M,...x};const w={...M};if(_)w.logs=m;else{const b=a.value.length?a.value[a.value.length-1].seq:0,D=m.filter(z=>z.seq>b);D.length&&(w.logs=a.value.concat(D).slice(-500))}h(w)}let A=null;function k(){return A||typeof EventSource>"u"?!1:(A=new EventSource("/api/dashboard-stream"),A.onmessage=y=>{try{P(JSON.parse(y.data))}catch(m){console.error("处理推送数据失败:",m)}},!0)}function T(){A&&(A.close(),A=null)}async function L(y){try{const m=await fetch(`/api/stats-history?range=${y}`);if(!m.ok)throw new Error(`HTTP error! status: ${m.status}`);const _=await m.json();return{calls:_.calls_time_series||[],tokens:_.tokens_time_series||[]}}catch(m){return console.error("获取历史数据失败:",m),{calls:[],tokens:[]}}}function h(y){if(r.value={keyCount:y.key_count||0,keyHealth:y.key_health||{},modelCount:y.model_count||0,retryCount:y.retry_count||0,last24hCalls:y.last_24h_calls||0,hourlyCalls:y.hourly_calls||0,minuteCalls:y.minute_calls||0,enableVertex:y.enable_vertex||!1,upstreamOpenConnections:y.upstream_pool?.open_connections||0,upstreamReuseRatio:y.upstream_pool?.reuse_ratio||0,upstreamHttp2:y.upstream_pool?.http2||!1,cacheEntries:y.cache_entries||0,maxCacheEntries:y.max_cache_entries||0,cacheBytes:y.cache_bytes||0,maxCacheBytes:y.max_cache_bytes||0,diskCacheEnabled:y.disk_cache_enabled||!1,diskCacheEntries:y.disk_cache_entries||0,diskCacheBytes:y.disk_cache_bytes||0},y.calls_time_series&&(t.value.calls=y.calls_time_series),y.tokens_time_series&&(t.value.tokens=y.tokens_time_series),e.value={maxRequestsPerMinute:y.max_requests_per_minute||0,maxRequestsPerDayPerIp:y.max_requests_per_day_per_ip||0,currentTime:y.current_time||"",fakeStreaming:y.fake_streaming||!1,fakeStreamingInterval:y.fake_streaming_interval||0,randomString:y.random_string||!1,randomStringLength:y.random_string_length||0,searchMode:y.search_mode||!1,searchPrompt:y.search_prompt||"",localVersion:y.local_version||"",remoteVersion:y.remote_version||"",hasUpdate:y.has_update||!1,concurrentRequests:y.concurrent_requests||0,increaseConcurrentOnFailure:y.increase_concurrent_on_failure||0,maxConcurrentRequests:y.max_concurrent_requests||0,adaptiveConcurrency:y.adaptive_concurrency||!1,concurrencyFanout:y.concurrency_fanout||{},enableVertex:y.enable_vertex||!1,enableVertexExpress:y.enable_vertex_express||!1,vertexExpressApiKey:y.vertex_express_api_key||!1,googleCredentialsJson:y.google_credentials_json||!1,maxRetryNum:y.max_retry_num||0,maxEmptyResponses:y.max_empty_responses||0},y.api_key_stats){n.value=y.api_key_stats.map(_=>({..._,model_stats:Object.entries(_.model_stats||{}).reduce((S,[x,b])=>(S[x]={calls:typeof b=="object"?b.calls:b,tokens:typeof b=="object"?b.tokens:0},S),{})}));const m=new Set(["all"]);y.api_key_stats.forEach(_=>{_.model_stats&&Object.keys(_.model_stats).forEach(S=>{m.add(S)})}),l.value=Array.from(m),l.value.includes(s.value)||(s.value="all")}y.logs&&(a.value=y.logs),o.value=!0}function v(y){s.value=y}function d(){u.value=!u.value}async function p(){try{const y=!e.value.enableVertex;await g("enableVertex",y,"123"),e.value.enableVertex=y}catch(y){console.error("切换Vertex AI失败:",y)}}async function g(y,m,_){try{const S=y.replace(/[A-Z]/g,w=>`_${w.toLowerCase()}`),x=await fetch("/api/update-config",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({key:S,value:m,password:_})});if(!x.ok){const w=await x.json();throw new Error(w.detail||"更新配置失败")}return await x.json()}catch(S){throw console.error("更新配置失败:",S),S}}return{status:r,config:e,apiKeyStats:n,logs:a,isRefreshing:i,timeSeriesData:t,fetchDashboardData:c,connectDashboardStream:k,disconnectDashboardStream:T,fetchStatsHistory:L,selectedModel:s,availableModels:l,setSelectedModel:v,isDarkMode:u,toggleDarkMode:d,updateConfig:g,toggleVertex:p,isConfigLoaded:o}}),ea=(r,t)=>{const e=r.__vccOpts||r;for(const[n,a]of t)e[n]=a;return e},v5={key:0,class:"stats-grid"},d5={class:"stat-card"},p5={class:"stat-value"},g5={class:"stat-card"},y5={class:"stat-value"},m5={class:"stat-card"},_5={class:"stat-value"},S5={__name:"StatusStats",setup(r){const t=Sn();function o(e){return e<1024?`${e} B`:e<1024*1024?`${(e/1024).toFixed(1)} KB`:`${(e/1024/1024).toFixed(1)} MB`}return(e,n)=>fe(t).status.enableVertex?Jt("",!0):(wt(),Ct("div",v5,[V("div",d5,[V("div",p5,bt(fe(t).status.keyCount),1),n[0]||(n[0]=V("div",{class:"stat-label"},"可用密钥数量",-1))]),V("div",g5,[V("div",y5,bt(fe(t).status.modelCount),1),n[1]||(n[1]=V("div",{class:"stat-label"},"可用模型数量",-1))]),V("div",m5,[V("div",_5,bt(fe(t).config.maxRetryNum),1),n[2]||(n[2]=V("div",{class:"stat-label"},"最大重试次数",-1))]),V("div",{class:"stat-card"},[V("div",{class:"stat-value"},bt(fe(t).status.upstreamOpenConnections),1),n[3]||(n[3]=V("div",{class:"stat-label"},"上游连接数",-1))]),V("div",{class:"stat-card"},[V("div",{class:"stat-value"},bt((fe(t).status.upstreamReuseRatio*100).toFixed(1))+"%",1),n[4]||(n[4]=V("div",{class:"stat-label"},"连接复用率",-1))]),V("div",{class:"stat-card"},[V("div",{class:"stat-value"},bt(fe(t).status.upstreamHttp2?"HTTP/2":"HTTP/1.1"),1),n[5]||(n[5]=V("div",{class:"stat-label"},"上游协议",-1))]),V("div",{class:"stat-card"},[V("div",{class:"stat-value"},bt(fe(t).status.cacheEntries)+" / "+bt(fe(t).status.maxCacheEntries),1),n[6]||(n[6]=V("div",{class:"stat-label"},"缓存条目",-1))]),V("div",{class:"stat-card"},[V("div",{class:"stat-value"},bt(o(fe(t).status.cacheBytes)),1),n[7]||(n[7]=V("div",{class:"stat-label"},"缓存占用",-1))]),V("div",{class:"stat-card"},[V("div",{class:"stat-value"},bt(fe(t).status.maxCacheBytes?o(fe(t).status.maxCacheBytes):"不限"),1),n[8]||(n[8]=V("div",{class:"stat-label"},"缓存字节上限",-1))]),fe(t).status.diskCacheEnabled?(wt(),Ct("div",{key:0,class:"stat-card"},[V("div",{class:"stat-value"},bt(fe(t).status.diskCacheEntries),1),n[9]||(n[9]=V("div",{class:"stat-label"},"磁盘缓存条目",-1))])):Jt("",!0),fe(t).status.diskCacheEnabled?(wt(),Ct("div",{key:1,class:"stat-card"},[V("div",{class:"stat-value"},bt(o(fe(t).status.diskCacheBytes)),1),n[10]||(n[10]=V("div",{class:"stat-label"},"磁盘缓存占用",-1))])):Jt("",!0)]))}},x5=ea(S5,[["__scopeId","data-v-8b643ea6"]]);/*! *****************************************************************************
 Copyright (c) Microsoft Corporation.
 
 Permission to use, copy, modify, and/or distribute this software for any
@@ -81,4 +81,4 @@ PERFORMANCE OF THIS SOFTWARE.
 
 `:"<br/>",y=c.join(g);this._showOrMove(s,function(){this._updateContentNotChangedOnAxis(e,u)?this._updatePosition(s,v,o[0],o[1],this._tooltipContent,u):this._showTooltipContent(s,y,u,Math.random()+"",o[0],o[1],v,null,h)})},t.prototype._showSeriesItemTooltip=function(e,n,a){var i=this._ecModel,o=xt(n),s=o.seriesIndex,l=i.getSeriesByIndex(s),u=o.dataModel||l,f=o.dataIndex,c=o.dataType,h=u.getData(c),v=this._renderMode,d=e.positionDefault,p=Ql([h.getItemModel(f),u,l&&(l.coordinateSystem||{}).model],this._tooltipModel,d?{position:d}:null),g=p.get("trigger");if(!(g!=null&&g!=="item")){var y=u.getDataParams(f,c),m=new Xp;y.marker=m.makeTooltipMarker("item",Uo(y.color),v);var _=$b(u.formatTooltip(f,!1,c)),S=p.get("order"),x=p.get("valueFormatter"),b=_.frag,w=b?Kb(x?W({valueFormatter:x},b):b,m,v,S,i.get("useUTC"),p.get("textStyle")):_.text,C="item_"+u.name+"_"+f;this._showOrMove(p,function(){this._showTooltipContent(p,w,y,C,e.offsetX,e.offsetY,e.position,e.target,m)}),a({type:"showTip",dataIndexInside:f,dataIndex:h.getRawIndex(f),seriesIndex:s,from:this.uid})}},t.prototype._showComponentItemTooltip=function(e,n,a){var i=this._renderMode==="html",o=xt(n),s=o.tooltipConfig,l=s.option||{},u=l.encodeHTMLContent;if(it(l)){var f=l;l={content:f,formatter:f},u=!0}u&&i&&l.content&&(l=yt(l),l.content=fr(l.content));var c=[l],h=this._ecModel.getComponent(o.componentMainType,o.componentIndex);h&&c.push(h),c.push({formatter:l.content});var v=e.positionDefault,d=Ql(c,this._tooltipModel,v?{position:v}:null),p=d.get("content"),g=Math.random()+"",y=new Xp;this._showOrMove(d,function(){var m=yt(d.get("formatterParams")||{});this._showTooltipContent(d,p,m,g,e.offsetX,e.offsetY,e.position,n,y)}),a({type:"showTip",from:this.uid})},t.prototype._showTooltipContent=function(e,n,a,i,o,s,l,u,f){if(this._ticket="",!(!e.get("showContent")||!e.get("show"))){var c=this._tooltipContent;c.setEnterable(e.get("enterable"));var h=e.get("formatter");l=l||e.get("position");var v=n,d=this._getNearestPoint([o,s],a,e.get("trigger"),e.get("borderColor")),p=d.color;if(h)if(it(h)){var g=e.ecModel.get("useUTC"),y=X(a)?a[0]:a,m=y&&y.axisType&&y.axisType.indexOf("time")>=0;v=h,m&&(v=gd(y.axisValue,v,g)),v=N2(v,a,!0)}else if(dt(h)){var _=ot(function(S,x){S===this._ticket&&(c.setContent(x,f,e,p,l),this._updatePosition(e,l,o,s,c,a,u))},this);this._ticket=i,v=h(a,i,_)}else v=h;c.setContent(v,f,e,p,l),c.show(e,p),this._updatePosition(e,l,o,s,c,a,u)}},t.prototype._getNearestPoint=function(e,n,a,i){if(a==="axis"||X(n))return{color:i||(this._renderMode==="html"?"#fff":"none")};if(!X(n))return{color:i||n.color||n.borderColor}},t.prototype._updatePosition=function(e,n,a,i,o,s,l){var u=this._api.getWidth(),f=this._api.getHeight();n=n||e.get("position");var c=o.getSize(),h=e.get("align"),v=e.get("verticalAlign"),d=l&&l.getBoundingRect().clone();if(l&&d.applyTransform(l.transform),dt(n)&&(n=n([a,i],s,o.el,d,{viewSize:[u,f],contentSize:c.slice()})),X(n))a=rt(n[0],u),i=rt(n[1],f);else if(gt(n)){var p=n;p.width=c[0],p.height=c[1];var g=Ie(p,{width:u,height:f});a=g.x,i=g.y,h=null,v=null}else if(it(n)&&l){var y=Ej(n,d,c,e.get("borderWidth"));a=y[0],i=y[1]}else{var y=Pj(a,i,o,u,f,h?null:20,v?null:20);a=y[0],i=y[1]}if(h&&(a-=iD(h)?c[0]/2:h==="right"?c[0]:0),v&&(i-=iD(v)?c[1]/2:v==="bottom"?c[1]:0),tO(e)){var y=Rj(a,i,o,u,f);a=y[0],i=y[1]}o.moveTo(a,i)},t.prototype._updateContentNotChangedOnAxis=function(e,n){var a=this._lastDataByCoordSys,i=this._cbParamsList,o=!!a&&a.length===e.length;return o&&D(a,function(s,l){var u=s.dataByAxis||[],f=e[l]||{},c=f.dataByAxis||[];o=o&&u.length===c.length,o&&D(u,function(h,v){var d=c[v]||{},p=h.seriesDataIndices||[],g=d.seriesDataIndices||[];o=o&&h.value===d.value&&h.axisType===d.axisType&&h.axisId===d.axisId&&p.length===g.length,o&&D(p,function(y,m){var _=g[m];o=o&&y.seriesIndex===_.seriesIndex&&y.dataIndex===_.dataIndex}),i&&D(h.seriesDataIndices,function(y){var m=y.seriesIndex,_=n[m],S=i[m];_&&S&&S.data!==_.data&&(o=!1)})})}),this._lastDataByCoordSys=e,this._cbParamsList=n,!!o},t.prototype._hide=function(e){this._lastDataByCoordSys=null,e({type:"hideTip",from:this.uid})},t.prototype.dispose=function(e,n){Nt.node||!n.getDom()||(vf(this,"_updatePosition"),this._tooltipContent.dispose(),v0("itemTooltip",n))},t.type="tooltip",t}(ge);function Ql(r,t,e){var n=t.ecModel,a;e?(a=new Kt(e,n,n),a=new Kt(t.option,a,n)):a=t;for(var i=r.length-1;i>=0;i--){var o=r[i];o&&(o instanceof Kt&&(o=o.get("tooltip",!0)),it(o)&&(o={formatter:o}),o&&(a=new Kt(o,a,n)))}return a}function aD(r,t){return r.dispatchAction||ot(t.dispatchAction,t)}function Pj(r,t,e,n,a,i,o){var s=e.getSize(),l=s[0],u=s[1];return i!=null&&(r+l+i+2>n?r-=l+i:r+=i),o!=null&&(t+u+o>a?t-=u+o:t+=o),[r,t]}function Rj(r,t,e,n,a){var i=e.getSize(),o=i[0],s=i[1];return r=Math.min(r+o,n)-o,t=Math.min(t+s,a)-s,r=Math.max(r,0),t=Math.max(t,0),[r,t]}function Ej(r,t,e,n){var a=e[0],i=e[1],o=Math.ceil(Math.SQRT2*n)+8,s=0,l=0,u=t.width,f=t.height;switch(r){case"inside":s=t.x+u/2-a/2,l=t.y+f/2-i/2;break;case"top":s=t.x+u/2-a/2,l=t.y-i-o;break;case"bottom":s=t.x+u/2-a/2,l=t.y+f+o;break;case"left":s=t.x-a-o,l=t.y+f/2-i/2;break;case"right":s=t.x+u+o,l=t.y+f/2-i/2}return[s,l]}function iD(r){return r==="center"||r==="middle"}function kj(r,t,e){var n=u_(r).queryOptionMap,a=n.keys()[0];if(!(!a||a==="series")){var i=Of(t,a,n.get(a),{useDefault:!1,enableAll:!1,enableNone:!1}),o=i.models[0];if(o){var s=e.getViewOfComponentModel(o),l;if(s.group.traverse(function(u){var f=xt(u).tooltipConfig;if(f&&f.name===r.name)return l=u,!0}),l)return{componentMainType:a,componentIndex:o.componentIndex,el:l}}}}function Oj(r){kt(Qf),r.registerComponentModel(yj),r.registerComponentView(Lj),r.registerAction({type:"showTip",event:"showTip",update:"tooltip:manuallyShowTip"},xe),r.registerAction({type:"hideTip",event:"hideTip",update:"tooltip:manuallyHideTip"},xe)}var Nj=["rect","polygon","keep","clear"];function Vj(r,t){var e=te(r?r.brush:[]);if(e.length){var n=[];D(e,function(l){var u=l.hasOwnProperty("toolbox")?l.toolbox:[];u instanceof Array&&(n=n.concat(u))});var a=r&&r.toolbox;X(a)&&(a=a[0]),a||(a={feature:{}},r.toolbox=[a]);var i=a.feature||(a.feature={}),o=i.brush||(i.brush={}),s=o.type||(o.type=[]);s.push.apply(s,n),Bj(s),t&&!s.length&&s.push.apply(s,Nj)}}function Bj(r){var t={};D(r,function(e){t[e]=1}),r.length=0,D(t,function(e,n){r.push(n)})}var oD=D;function sD(r){if(r){for(var t in r)if(r.hasOwnProperty(t))return!0}}function _0(r,t,e){var n={};return oD(t,function(i){var o=n[i]=a();oD(r[i],function(s,l){if(Oe.isValidType(l)){var u={type:l,visual:s};e&&e(u,i),o[l]=new Oe(u),l==="opacity"&&(u=yt(u),u.type="colorAlpha",o.__hidden.__alphaForOpacity=new Oe(u))}})}),n;function a(){var i=function(){};i.prototype.__hidden=i.prototype;var o=new i;return o}}function aO(r,t,e){var n;D(e,function(a){t.hasOwnProperty(a)&&sD(t[a])&&(n=!0)}),n&&D(e,function(a){t.hasOwnProperty(a)&&sD(t[a])?r[a]=yt(t[a]):delete r[a]})}function zj(r,t,e,n,a,i){var o={};D(r,function(c){var h=Oe.prepareVisualTypes(t[c]);o[c]=h});var s;function l(c){return B_(e,s,c)}function u(c,h){CP(e,s,c,h)}e.each(f);function f(c,h){s=c;var v=e.getRawDataItem(s);if(!(v&&v.visualMap===!1))for(var d=n.call(a,c),p=t[d],g=o[d],y=0,m=g.length;y<m;y++){var _=g[y];p[_]&&p[_].applyVisual(c,l,u)}}}function Fj(r,t,e,n){var a={};return D(r,function(i){var o=Oe.prepareVisualTypes(t[i]);a[i]=o}),{progress:function(o,s){var l;n!=null&&(l=s.getDimensionIndex(n));function u(x){return B_(s,c,x)}function f(x,b){CP(s,c,x,b)}for(var c,h=s.getStore();(c=o.next())!=null;){var v=s.getRawDataItem(c);if(!(v&&v.visualMap===!1))for(var d=n!=null?h.get(l,c):c,p=e(d),g=t[p],y=a[p],m=0,_=y.length;m<_;m++){var S=y[m];g[S]&&g[S].applyVisual(d,u,f)}}}}}function Gj(r){var t=r.brushType,e={point:function(n){return lD[t].point(n,e,r)},rect:function(n){return lD[t].rect(n,e,r)}};return e}var lD={lineX:uD(0),lineY:uD(1),rect:{point:function(r,t,e){return r&&e.boundingRect.contain(r[0],r[1])},rect:function(r,t,e){return r&&e.boundingRect.intersect(r)}},polygon:{point:function(r,t,e){return r&&e.boundingRect.contain(r[0],r[1])&&go(e.range,r[0],r[1])},rect:function(r,t,e){var n=e.range;if(!r||n.length<=1)return!1;var a=r.x,i=r.y,o=r.width,s=r.height,l=n[0];if(go(n,a,i)||go(n,a+o,i)||go(n,a,i+s)||go(n,a+o,i+s)||Lt.create(r).contain(l[0],l[1])||fu(a,i,a+o,i,n)||fu(a,i,a,i+s,n)||fu(a+o,i,a+o,i+s,n)||fu(a,i+s,a+o,i+s,n))return!0}}};function uD(r){var t=["x","y"],e=["width","height"];return{point:function(n,a,i){if(n){var o=i.range,s=n[r];return tu(s,o)}},rect:function(n,a,i){if(n){var o=i.range,s=[n[t[r]],n[t[r]]+n[e[r]]];return s[1]<s[0]&&s.reverse(),tu(s[0],o)||tu(s[1],o)||tu(o[0],s)||tu(o[1],s)}}}}function tu(r,t){return t[0]<=r&&r<=t[1]}var fD=["inBrush","outOfBrush"],uy="__ecBrushSelect",S0="__ecInBrushSelectEvent";function iO(r){r.eachComponent({mainType:"brush"},function(t){var e=t.brushTargetManager=new X1(t.option,r);e.setInputRanges(t.areas,r)})}function Hj(r,t,e){var n=[],a,i;r.eachComponent({mainType:"brush"},function(o){e&&e.type==="takeGlobalCursor"&&o.setBrushOption(e.key==="brush"?e.brushOption:{brushType:!1})}),iO(r),r.eachComponent({mainType:"brush"},function(o,s){var l={brushId:o.id,brushIndex:s,brushName:o.name,areas:yt(o.areas),selected:[]};n.push(l);var u=o.option,f=u.brushLink,c=[],h=[],v=[],d=!1;s||(a=u.throttleType,i=u.throttleDelay);var p=K(o.areas,function(x){var b=Yj[x.brushType],w=pt({boundingRect:b?b(x):void 0},x);return w.selectors=Gj(w),w}),g=_0(o.option,fD,function(x){x.mappingMethod="fixed"});X(f)&&D(f,function(x){c[x]=1});function y(x){return f==="all"||!!c[x]}function m(x){return!!x.length}r.eachSeries(function(x,b){var w=v[b]=[];x.subType==="parallel"?_(x,b):S(x,b,w)});function _(x,b){var w=x.coordinateSystem;d=d||w.hasAxisBrushed(),y(b)&&w.eachActiveState(x.getData(),function(C,T){C==="active"&&(h[T]=1)})}function S(x,b,w){if(!(!x.brushSelector||Uj(o,b))&&(D(p,function(T){o.brushTargetManager.controlSeries(T,x,r)&&w.push(T),d=d||m(w)}),y(b)&&m(w))){var C=x.getData();C.each(function(T){cD(x,w,C,T)&&(h[T]=1)})}}r.eachSeries(function(x,b){var w={seriesId:x.id,seriesIndex:b,seriesName:x.name,dataIndex:[]};l.selected.push(w);var C=v[b],T=x.getData(),A=y(b)?function(M){return h[M]?(w.dataIndex.push(T.getRawIndex(M)),"inBrush"):"outOfBrush"}:function(M){return cD(x,C,T,M)?(w.dataIndex.push(T.getRawIndex(M)),"inBrush"):"outOfBrush"};(y(b)?d:m(C))&&zj(fD,g,T,A)})}),Wj(t,a,i,n,e)}function Wj(r,t,e,n,a){if(a){var i=r.getZr();if(!i[S0]){i[uy]||(i[uy]=$j);var o=xl(i,uy,e,t);o(r,n)}}}function $j(r,t){if(!r.isDisposed()){var e=r.getZr();e[S0]=!0,r.dispatchAction({type:"brushSelect",batch:t}),e[S0]=!1}}function cD(r,t,e,n){for(var a=0,i=t.length;a<i;a++){var o=t[a];if(r.brushSelector(n,e,o.selectors,o))return!0}}function Uj(r,t){var e=r.option.seriesIndex;return e!=null&&e!=="all"&&(X(e)?Et(e,t)<0:t!==e)}var Yj={rect:function(r){return hD(r.range)},polygon:function(r){for(var t,e=r.range,n=0,a=e.length;n<a;n++){t=t||[[1/0,-1/0],[1/0,-1/0]];var i=e[n];i[0]<t[0][0]&&(t[0][0]=i[0]),i[0]>t[0][1]&&(t[0][1]=i[0]),i[1]<t[1][0]&&(t[1][0]=i[1]),i[1]>t[1][1]&&(t[1][1]=i[1])}return t&&hD(t)}};function hD(r){return new Lt(r[0][0],r[1][0],r[0][1]-r[0][0],r[1][1]-r[1][0])}var Xj=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.init=function(e,n){this.ecModel=e,this.api=n,this.model,(this._brushController=new S1(n.getZr())).on("brush",ot(this._onBrush,this)).mount()},t.prototype.render=function(e,n,a,i){this.model=e,this._updateController(e,n,a,i)},t.prototype.updateTransform=function(e,n,a,i){iO(n),this._updateController(e,n,a,i)},t.prototype.updateVisual=function(e,n,a,i){this.updateTransform(e,n,a,i)},t.prototype.updateView=function(e,n,a,i){this._updateController(e,n,a,i)},t.prototype._updateController=function(e,n,a,i){(!i||i.$from!==e.id)&&this._brushController.setPanels(e.brushTargetManager.makePanelOpts(a)).enableBrush(e.brushOption).updateCovers(e.areas.slice())},t.prototype.dispose=function(){this._brushController.dispose()},t.prototype._onBrush=function(e){var n=this.model.id,a=this.model.brushTargetManager.setOutputRanges(e.areas,this.ecModel);(!e.isEnd||e.removeOnClick)&&this.api.dispatchAction({type:"brush",brushId:n,areas:yt(a),$from:n}),e.isEnd&&this.api.dispatchAction({type:"brushEnd",brushId:n,areas:yt(a),$from:n})},t.type="brush",t}(ge),Zj="#ddd",qj=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.areas=[],e.brushOption={},e}return t.prototype.optionUpdated=function(e,n){var a=this.option;!n&&aO(a,e,["inBrush","outOfBrush"]);var i=a.inBrush=a.inBrush||{};a.outOfBrush=a.outOfBrush||{color:Zj},i.hasOwnProperty("liftZ")||(i.liftZ=5)},t.prototype.setAreas=function(e){e&&(this.areas=K(e,function(n){return vD(this.option,n)},this))},t.prototype.setBrushOption=function(e){this.brushOption=vD(this.option,e),this.brushType=this.brushOption.brushType},t.type="brush",t.dependencies=["geo","grid","xAxis","yAxis","parallel","series"],t.defaultOption={seriesIndex:"all",brushType:"rect",brushMode:"single",transformable:!0,brushStyle:{borderWidth:1,color:"rgba(210,219,238,0.3)",borderColor:"#D2DBEE"},throttleType:"fixRate",throttleDelay:0,removeOnClick:!0,z:1e4},t}(zt);function vD(r,t){return Dt({brushType:r.brushType,brushMode:r.brushMode,transformable:r.transformable,brushStyle:new Kt(r.brushStyle).getItemStyle(),removeOnClick:r.removeOnClick,z:r.z},t,!0)}var Kj=["rect","polygon","lineX","lineY","keep","clear"],jj=function(r){F(t,r);function t(){return r!==null&&r.apply(this,arguments)||this}return t.prototype.render=function(e,n,a){var i,o,s;n.eachComponent({mainType:"brush"},function(l){i=l.brushType,o=l.brushOption.brushMode||"single",s=s||!!l.areas.length}),this._brushType=i,this._brushMode=o,D(e.get("type",!0),function(l){e.setIconStatus(l,(l==="keep"?o==="multiple":l==="clear"?s:l===i)?"emphasis":"normal")})},t.prototype.updateView=function(e,n,a){this.render(e,n,a)},t.prototype.getIcons=function(){var e=this.model,n=e.get("icon",!0),a={};return D(e.get("type",!0),function(i){n[i]&&(a[i]=n[i])}),a},t.prototype.onclick=function(e,n,a){var i=this._brushType,o=this._brushMode;a==="clear"?(n.dispatchAction({type:"axisAreaSelect",intervals:[]}),n.dispatchAction({type:"brush",command:"clear",areas:[]})):n.dispatchAction({type:"takeGlobalCursor",key:"brush",brushOption:{brushType:a==="keep"?i:i===a?!1:a,brushMode:a==="keep"?o==="multiple"?"single":"multiple":o}})},t.getDefaultOption=function(e){var n={show:!0,type:Kj.slice(),icon:{rect:"M7.3,34.7 M0.4,10V-0.2h9.8 M89.6,10V-0.2h-9.8 M0.4,60v10.2h9.8 M89.6,60v10.2h-9.8 M12.3,22.4V10.5h13.1 M33.6,10.5h7.8 M49.1,10.5h7.8 M77.5,22.4V10.5h-13 M12.3,31.1v8.2 M77.7,31.1v8.2 M12.3,47.6v11.9h13.1 M33.6,59.5h7.6 M49.1,59.5 h7.7 M77.5,47.6v11.9h-13",polygon:"M55.2,34.9c1.7,0,3.1,1.4,3.1,3.1s-1.4,3.1-3.1,3.1 s-3.1-1.4-3.1-3.1S53.5,34.9,55.2,34.9z M50.4,51c1.7,0,3.1,1.4,3.1,3.1c0,1.7-1.4,3.1-3.1,3.1c-1.7,0-3.1-1.4-3.1-3.1 C47.3,52.4,48.7,51,50.4,51z M55.6,37.1l1.5-7.8 M60.1,13.5l1.6-8.7l-7.8,4 M59,19l-1,5.3 M24,16.1l6.4,4.9l6.4-3.3 M48.5,11.6 l-5.9,3.1 M19.1,12.8L9.7,5.1l1.1,7.7 M13.4,29.8l1,7.3l6.6,1.6 M11.6,18.4l1,6.1 M32.8,41.9 M26.6,40.4 M27.3,40.2l6.1,1.6 M49.9,52.1l-5.6-7.6l-4.9-1.2",lineX:"M15.2,30 M19.7,15.6V1.9H29 M34.8,1.9H40.4 M55.3,15.6V1.9H45.9 M19.7,44.4V58.1H29 M34.8,58.1H40.4 M55.3,44.4 V58.1H45.9 M12.5,20.3l-9.4,9.6l9.6,9.8 M3.1,29.9h16.5 M62.5,20.3l9.4,9.6L62.3,39.7 M71.9,29.9H55.4",lineY:"M38.8,7.7 M52.7,12h13.2v9 M65.9,26.6V32 M52.7,46.3h13.2v-9 M24.9,12H11.8v9 M11.8,26.6V32 M24.9,46.3H11.8v-9 M48.2,5.1l-9.3-9l-9.4,9.2 M38.9-3.9V12 M48.2,53.3l-9.3,9l-9.4-9.2 M38.9,62.3V46.4",keep:"M4,10.5V1h10.3 M20.7,1h6.1 M33,1h6.1 M55.4,10.5V1H45.2 M4,17.3v6.6 M55.6,17.3v6.6 M4,30.5V40h10.3 M20.7,40 h6.1 M33,40h6.1 M55.4,30.5V40H45.2 M21,18.9h62.9v48.6H21V18.9z",clear:"M22,14.7l30.9,31 M52.9,14.7L22,45.7 M4.7,16.8V4.2h13.1 M26,4.2h7.8 M41.6,4.2h7.8 M70.3,16.8V4.2H57.2 M4.7,25.9v8.6 M70.3,25.9v8.6 M4.7,43.2v12.6h13.1 M26,55.8h7.8 M41.6,55.8h7.8 M70.3,43.2v12.6H57.2"},title:e.getLocaleModel().get(["toolbox","brush","title"])};return n},t}(Zr);function Jj(r){r.registerComponentView(Xj),r.registerComponentModel(qj),r.registerPreprocessor(Vj),r.registerVisual(r.PRIORITY.VISUAL.BRUSH,Hj),r.registerAction({type:"brush",event:"brush",update:"updateVisual"},function(t,e){e.eachComponent({mainType:"brush",query:t},function(n){n.setAreas(t.areas)})}),r.registerAction({type:"brushSelect",event:"brushSelected",update:"none"},xe),r.registerAction({type:"brushEnd",event:"brushEnd",update:"none"},xe),Rs("brush",jj)}var Qj=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.layoutMode={type:"box",ignoreSize:!0},e}return t.type="title",t.defaultOption={z:6,show:!0,text:"",target:"blank",subtext:"",subtarget:"blank",left:0,top:0,backgroundColor:"rgba(0,0,0,0)",borderColor:"#ccc",borderWidth:0,padding:5,itemGap:10,textStyle:{fontSize:18,fontWeight:"bold",color:"#464646"},subtextStyle:{fontSize:12,color:"#6E7079"}},t}(zt),tJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.render=function(e,n,a){if(this.group.removeAll(),!!e.get("show")){var i=this.group,o=e.getModel("textStyle"),s=e.getModel("subtextStyle"),l=e.get("textAlign"),u=Tt(e.get("textBaseline"),e.get("textVerticalAlign")),f=new $t({style:le(o,{text:e.get("text"),fill:o.getTextColor()},{disableBox:!0}),z2:10}),c=f.getBoundingRect(),h=e.get("subtext"),v=new $t({style:le(s,{text:h,fill:s.getTextColor(),y:c.height+e.get("itemGap"),verticalAlign:"top"},{disableBox:!0}),z2:10}),d=e.get("link"),p=e.get("sublink"),g=e.get("triggerEvent",!0);f.silent=!d&&!g,v.silent=!p&&!g,d&&f.on("click",function(){iv(d,"_"+e.get("target"))}),p&&v.on("click",function(){iv(p,"_"+e.get("subtarget"))}),xt(f).eventData=xt(v).eventData=g?{componentType:"title",componentIndex:e.componentIndex}:null,i.add(f),h&&i.add(v);var y=i.getBoundingRect(),m=e.getBoxLayoutParams();m.width=y.width,m.height=y.height;var _=Ie(m,{width:a.getWidth(),height:a.getHeight()},e.get("padding"));l||(l=e.get("left")||e.get("right"),l==="middle"&&(l="center"),l==="right"?_.x+=_.width:l==="center"&&(_.x+=_.width/2)),u||(u=e.get("top")||e.get("bottom"),u==="center"&&(u="middle"),u==="bottom"?_.y+=_.height:u==="middle"&&(_.y+=_.height/2),u=u||"top"),i.x=_.x,i.y=_.y,i.markRedraw();var S={align:l,verticalAlign:u};f.setStyle(S),v.setStyle(S),y=i.getBoundingRect();var x=_.margin,b=e.getItemStyle(["color","opacity"]);b.fill=e.get("backgroundColor");var w=new Ht({shape:{x:y.x-x[3],y:y.y-x[0],width:y.width+x[1]+x[3],height:y.height+x[0]+x[2],r:e.get("borderRadius")},style:b,subPixelOptimize:!0,silent:!0});i.add(w)}},t.type="title",t}(ge);function eJ(r){r.registerComponentModel(Qj),r.registerComponentView(tJ)}var dD=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.layoutMode="box",e}return t.prototype.init=function(e,n,a){this.mergeDefaultAndTheme(e,a),this._initData()},t.prototype.mergeOption=function(e){r.prototype.mergeOption.apply(this,arguments),this._initData()},t.prototype.setCurrentIndex=function(e){e==null&&(e=this.option.currentIndex);var n=this._data.count();this.option.loop?e=(e%n+n)%n:(e>=n&&(e=n-1),e<0&&(e=0)),this.option.currentIndex=e},t.prototype.getCurrentIndex=function(){return this.option.currentIndex},t.prototype.isIndexMax=function(){return this.getCurrentIndex()>=this._data.count()-1},t.prototype.setPlayState=function(e){this.option.autoPlay=!!e},t.prototype.getPlayState=function(){return!!this.option.autoPlay},t.prototype._initData=function(){var e=this.option,n=e.data||[],a=e.axisType,i=this._names=[],o;a==="category"?(o=[],D(n,function(u,f){var c=Me(hl(u),""),h;gt(u)?(h=yt(u),h.value=f):h=f,o.push(h),i.push(c)})):o=n;var s={category:"ordinal",time:"time",value:"number"}[a]||"number",l=this._data=new cr([{name:"value",type:s}],this);l.initData(o,i)},t.prototype.getData=function(){return this._data},t.prototype.getCategories=function(){if(this.get("axisType")==="category")return this._names.slice()},t.type="timeline",t.defaultOption={z:4,show:!0,axisType:"time",realtime:!0,left:"20%",top:null,right:"20%",bottom:0,width:null,height:40,padding:5,controlPosition:"left",autoPlay:!1,rewind:!1,loop:!0,playInterval:2e3,currentIndex:0,itemStyle:{},label:{color:"#000"},data:[]},t}(zt),oO=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.type="timeline.slider",t.defaultOption=Pi(dD.defaultOption,{backgroundColor:"rgba(0,0,0,0)",borderColor:"#ccc",borderWidth:0,orient:"horizontal",inverse:!1,tooltip:{trigger:"item"},symbol:"circle",symbolSize:12,lineStyle:{show:!0,width:2,color:"#DAE1F5"},label:{position:"auto",show:!0,interval:"auto",rotate:0,color:"#A4B1D7"},itemStyle:{color:"#A4B1D7",borderWidth:1},checkpointStyle:{symbol:"circle",symbolSize:15,color:"#316bf3",borderColor:"#fff",borderWidth:2,shadowBlur:2,shadowOffsetX:1,shadowOffsetY:1,shadowColor:"rgba(0, 0, 0, 0.3)",animation:!0,animationDuration:300,animationEasing:"quinticInOut"},controlStyle:{show:!0,showPlayBtn:!0,showPrevBtn:!0,showNextBtn:!0,itemSize:24,itemGap:12,position:"left",playIcon:"path://M31.6,53C17.5,53,6,41.5,6,27.4S17.5,1.8,31.6,1.8C45.7,1.8,57.2,13.3,57.2,27.4S45.7,53,31.6,53z M31.6,3.3 C18.4,3.3,7.5,14.1,7.5,27.4c0,13.3,10.8,24.1,24.1,24.1C44.9,51.5,55.7,40.7,55.7,27.4C55.7,14.1,44.9,3.3,31.6,3.3z M24.9,21.3 c0-2.2,1.6-3.1,3.5-2l10.5,6.1c1.899,1.1,1.899,2.9,0,4l-10.5,6.1c-1.9,1.1-3.5,0.2-3.5-2V21.3z",stopIcon:"path://M30.9,53.2C16.8,53.2,5.3,41.7,5.3,27.6S16.8,2,30.9,2C45,2,56.4,13.5,56.4,27.6S45,53.2,30.9,53.2z M30.9,3.5C17.6,3.5,6.8,14.4,6.8,27.6c0,13.3,10.8,24.1,24.101,24.1C44.2,51.7,55,40.9,55,27.6C54.9,14.4,44.1,3.5,30.9,3.5z M36.9,35.8c0,0.601-0.4,1-0.9,1h-1.3c-0.5,0-0.9-0.399-0.9-1V19.5c0-0.6,0.4-1,0.9-1H36c0.5,0,0.9,0.4,0.9,1V35.8z M27.8,35.8 c0,0.601-0.4,1-0.9,1h-1.3c-0.5,0-0.9-0.399-0.9-1V19.5c0-0.6,0.4-1,0.9-1H27c0.5,0,0.9,0.4,0.9,1L27.8,35.8L27.8,35.8z",nextIcon:"M2,18.5A1.52,1.52,0,0,1,.92,18a1.49,1.49,0,0,1,0-2.12L7.81,9.36,1,3.11A1.5,1.5,0,1,1,3,.89l8,7.34a1.48,1.48,0,0,1,.49,1.09,1.51,1.51,0,0,1-.46,1.1L3,18.08A1.5,1.5,0,0,1,2,18.5Z",prevIcon:"M10,.5A1.52,1.52,0,0,1,11.08,1a1.49,1.49,0,0,1,0,2.12L4.19,9.64,11,15.89a1.5,1.5,0,1,1-2,2.22L1,10.77A1.48,1.48,0,0,1,.5,9.68,1.51,1.51,0,0,1,1,8.58L9,.92A1.5,1.5,0,0,1,10,.5Z",prevBtnSize:18,nextBtnSize:18,color:"#A4B1D7",borderColor:"#A4B1D7",borderWidth:1},emphasis:{label:{show:!0,color:"#6f778d"},itemStyle:{color:"#316BF3"},controlStyle:{color:"#316BF3",borderColor:"#316BF3",borderWidth:2}},progress:{lineStyle:{color:"#316BF3"},itemStyle:{color:"#316BF3"},label:{color:"#6f778d"}},data:[]}),t}(dD);De(oO,wd.prototype);var rJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.type="timeline",t}(ge),nJ=function(r){F(t,r);function t(e,n,a,i){var o=r.call(this,e,n,a)||this;return o.type=i||"value",o}return t.prototype.getLabelModel=function(){return this.model.getModel("label")},t.prototype.isHorizontal=function(){return this.model.get("orient")==="horizontal"},t}(bn),fy=Math.PI,pD=Wt(),aJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.init=function(e,n){this.api=n},t.prototype.render=function(e,n,a){if(this.model=e,this.api=a,this.ecModel=n,this.group.removeAll(),e.get("show",!0)){var i=this._layout(e,a),o=this._createGroup("_mainGroup"),s=this._createGroup("_labelGroup"),l=this._axis=this._createAxis(i,e);e.formatTooltip=function(u){var f=l.scale.getLabel({value:u});return Ve("nameValue",{noName:!0,value:f})},D(["AxisLine","AxisTick","Control","CurrentPointer"],function(u){this["_render"+u](i,o,l,e)},this),this._renderAxisLabel(i,s,l,e),this._position(i,e)}this._doPlayStop(),this._updateTicksStatus()},t.prototype.remove=function(){this._clearTimer(),this.group.removeAll()},t.prototype.dispose=function(){this._clearTimer()},t.prototype._layout=function(e,n){var a=e.get(["label","position"]),i=e.get("orient"),o=oJ(e,n),s;a==null||a==="auto"?s=i==="horizontal"?o.y+o.height/2<n.getHeight()/2?"-":"+":o.x+o.width/2<n.getWidth()/2?"+":"-":it(a)?s={horizontal:{top:"-",bottom:"+"},vertical:{left:"-",right:"+"}}[i][a]:s=a;var l={horizontal:"center",vertical:s>=0||s==="+"?"left":"right"},u={horizontal:s>=0||s==="+"?"top":"bottom",vertical:"middle"},f={horizontal:0,vertical:fy/2},c=i==="vertical"?o.height:o.width,h=e.getModel("controlStyle"),v=h.get("show",!0),d=v?h.get("itemSize"):0,p=v?h.get("itemGap"):0,g=d+p,y=e.get(["label","rotate"])||0;y=y*fy/180;var m,_,S,x=h.get("position",!0),b=v&&h.get("showPlayBtn",!0),w=v&&h.get("showPrevBtn",!0),C=v&&h.get("showNextBtn",!0),T=0,A=c;x==="left"||x==="bottom"?(b&&(m=[0,0],T+=g),w&&(_=[T,0],T+=g),C&&(S=[A-d,0],A-=g)):(b&&(m=[A-d,0],A-=g),w&&(_=[0,0],T+=g),C&&(S=[A-d,0],A-=g));var M=[T,A];return e.get("inverse")&&M.reverse(),{viewRect:o,mainLength:c,orient:i,rotation:f[i],labelRotation:y,labelPosOpt:s,labelAlign:e.get(["label","align"])||l[i],labelBaseline:e.get(["label","verticalAlign"])||e.get(["label","baseline"])||u[i],playPosition:m,prevBtnPosition:_,nextBtnPosition:S,axisExtent:M,controlSize:d,controlGap:p}},t.prototype._position=function(e,n){var a=this._mainGroup,i=this._labelGroup,o=e.viewRect;if(e.orient==="vertical"){var s=kr(),l=o.x,u=o.y+o.height;jn(s,s,[-l,-u]),qo(s,s,-fy/2),jn(s,s,[l,u]),o=o.clone(),o.applyTransform(s)}var f=m(o),c=m(a.getBoundingRect()),h=m(i.getBoundingRect()),v=[a.x,a.y],d=[i.x,i.y];d[0]=v[0]=f[0][0];var p=e.labelPosOpt;if(p==null||it(p)){var g=p==="+"?0:1;_(v,c,f,1,g),_(d,h,f,1,1-g)}else{var g=p>=0?0:1;_(v,c,f,1,g),d[1]=v[1]+p}a.setPosition(v),i.setPosition(d),a.rotation=i.rotation=e.rotation,y(a),y(i);function y(S){S.originX=f[0][0]-S.x,S.originY=f[1][0]-S.y}function m(S){return[[S.x,S.x+S.width],[S.y,S.y+S.height]]}function _(S,x,b,w,C){S[w]+=b[w][C]-x[w][C]}},t.prototype._createAxis=function(e,n){var a=n.getData(),i=n.get("axisType"),o=iJ(n,i);o.getTicks=function(){return a.mapArray(["value"],function(u){return{value:u}})};var s=a.getDataExtent("value");o.setExtent(s[0],s[1]),o.calcNiceTicks();var l=new nJ("value",o,e.axisExtent,i);return l.model=n,l},t.prototype._createGroup=function(e){var n=this[e]=new _t;return this.group.add(n),n},t.prototype._renderAxisLine=function(e,n,a,i){var o=a.getExtent();if(i.get(["lineStyle","show"])){var s=new Ee({shape:{x1:o[0],y1:0,x2:o[1],y2:0},style:W({lineCap:"round"},i.getModel("lineStyle").getLineStyle()),silent:!0,z2:1});n.add(s);var l=this._progressLine=new Ee({shape:{x1:o[0],x2:this._currentPointer?this._currentPointer.x:o[0],y1:0,y2:0},style:pt({lineCap:"round",lineWidth:s.style.lineWidth},i.getModel(["progress","lineStyle"]).getLineStyle()),silent:!0,z2:1});n.add(l)}},t.prototype._renderAxisTick=function(e,n,a,i){var o=this,s=i.getData(),l=a.scale.getTicks();this._tickSymbols=[],D(l,function(u){var f=a.dataToCoord(u.value),c=s.getItemModel(u.value),h=c.getModel("itemStyle"),v=c.getModel(["emphasis","itemStyle"]),d=c.getModel(["progress","itemStyle"]),p={x:f,y:0,onclick:ot(o._changeTimeline,o,u.value)},g=gD(c,h,n,p);g.ensureState("emphasis").style=v.getItemStyle(),g.ensureState("progress").style=d.getItemStyle(),ko(g);var y=xt(g);c.get("tooltip")?(y.dataIndex=u.value,y.dataModel=i):y.dataIndex=y.dataModel=null,o._tickSymbols.push(g)})},t.prototype._renderAxisLabel=function(e,n,a,i){var o=this,s=a.getLabelModel();if(s.get("show")){var l=i.getData(),u=a.getViewLabels();this._tickLabels=[],D(u,function(f){var c=f.tickValue,h=l.getItemModel(c),v=h.getModel("label"),d=h.getModel(["emphasis","label"]),p=h.getModel(["progress","label"]),g=a.dataToCoord(f.tickValue),y=new $t({x:g,y:0,rotation:e.labelRotation-e.rotation,onclick:ot(o._changeTimeline,o,c),silent:!1,style:le(v,{text:f.formattedLabel,align:e.labelAlign,verticalAlign:e.labelBaseline})});y.ensureState("emphasis").style=le(d),y.ensureState("progress").style=le(p),n.add(y),ko(y),pD(y).dataIndex=c,o._tickLabels.push(y)})}},t.prototype._renderControl=function(e,n,a,i){var o=e.controlSize,s=e.rotation,l=i.getModel("controlStyle").getItemStyle(),u=i.getModel(["emphasis","controlStyle"]).getItemStyle(),f=i.getPlayState(),c=i.get("inverse",!0);h(e.nextBtnPosition,"next",ot(this._changeTimeline,this,c?"-":"+")),h(e.prevBtnPosition,"prev",ot(this._changeTimeline,this,c?"+":"-")),h(e.playPosition,f?"stop":"play",ot(this._handlePlayClick,this,!f),!0);function h(v,d,p,g){if(v){var y=mn(Tt(i.get(["controlStyle",d+"BtnSize"]),o),o),m=[0,-y/2,y,y],_=sJ(i,d+"Icon",m,{x:v[0],y:v[1],originX:o/2,originY:0,rotation:g?-s:0,rectHover:!0,style:l,onclick:p});_.ensureState("emphasis").style=u,n.add(_),ko(_)}}},t.prototype._renderCurrentPointer=function(e,n,a,i){var o=i.getData(),s=i.getCurrentIndex(),l=o.getItemModel(s).getModel("checkpointStyle"),u=this,f={onCreate:function(c){c.draggable=!0,c.drift=ot(u._handlePointerDrag,u),c.ondragend=ot(u._handlePointerDragend,u),yD(c,u._progressLine,s,a,i,!0)},onUpdate:function(c){yD(c,u._progressLine,s,a,i)}};this._currentPointer=gD(l,l,this._mainGroup,{},this._currentPointer,f)},t.prototype._handlePlayClick=function(e){this._clearTimer(),this.api.dispatchAction({type:"timelinePlayChange",playState:e,from:this.uid})},t.prototype._handlePointerDrag=function(e,n,a){this._clearTimer(),this._pointerChangeTimeline([a.offsetX,a.offsetY])},t.prototype._handlePointerDragend=function(e){this._pointerChangeTimeline([e.offsetX,e.offsetY],!0)},t.prototype._pointerChangeTimeline=function(e,n){var a=this._toAxisCoord(e)[0],i=this._axis,o=jr(i.getExtent().slice());a>o[1]&&(a=o[1]),a<o[0]&&(a=o[0]),this._currentPointer.x=a,this._currentPointer.markRedraw();var s=this._progressLine;s&&(s.shape.x2=a,s.dirty());var l=this._findNearestTick(a),u=this.model;(n||l!==u.getCurrentIndex()&&u.get("realtime"))&&this._changeTimeline(l)},t.prototype._doPlayStop=function(){var e=this;this._clearTimer(),this.model.getPlayState()&&(this._timer=setTimeout(function(){var n=e.model;e._changeTimeline(n.getCurrentIndex()+(n.get("rewind",!0)?-1:1))},this.model.get("playInterval")))},t.prototype._toAxisCoord=function(e){var n=this._mainGroup.getLocalTransform();return pn(e,n,!0)},t.prototype._findNearestTick=function(e){var n=this.model.getData(),a=1/0,i,o=this._axis;return n.each(["value"],function(s,l){var u=o.dataToCoord(s),f=Math.abs(u-e);f<a&&(a=f,i=l)}),i},t.prototype._clearTimer=function(){this._timer&&(clearTimeout(this._timer),this._timer=null)},t.prototype._changeTimeline=function(e){var n=this.model.getCurrentIndex();e==="+"?e=n+1:e==="-"&&(e=n-1),this.api.dispatchAction({type:"timelineChange",currentIndex:e,from:this.uid})},t.prototype._updateTicksStatus=function(){var e=this.model.getCurrentIndex(),n=this._tickSymbols,a=this._tickLabels;if(n)for(var i=0;i<n.length;i++)n&&n[i]&&n[i].toggleState("progress",i<e);if(a)for(var i=0;i<a.length;i++)a&&a[i]&&a[i].toggleState("progress",pD(a[i]).dataIndex<=e)},t.type="timeline.slider",t}(rJ);function iJ(r,t){if(t=t||r.get("type"),t)switch(t){case"category":return new Id({ordinalMeta:r.getCategories(),extent:[1/0,-1/0]});case"time":return new Y_({locale:r.ecModel.getLocaleModel(),useUTC:r.ecModel.get("useUTC")});default:return new Ma}}function oJ(r,t){return Ie(r.getBoxLayoutParams(),{width:t.getWidth(),height:t.getHeight()},r.get("padding"))}function sJ(r,t,e,n){var a=n.style,i=Ff(r.get(["controlStyle",t]),n||{},new Lt(e[0],e[1],e[2],e[3]));return a&&i.setStyle(a),i}function gD(r,t,e,n,a,i){var o=t.get("color");if(a)a.setColor(o),e.add(a),i&&i.onUpdate(a);else{var s=r.get("symbol");a=Ae(s,-1,-1,2,2,o),a.setStyle("strokeNoScale",!0),e.add(a),i&&i.onCreate(a)}var l=t.getItemStyle(["color"]);a.setStyle(l),n=Dt({rectHover:!0,z2:100},n,!0);var u=bl(r.get("symbolSize"));n.scaleX=u[0]/2,n.scaleY=u[1]/2;var f=Jo(r.get("symbolOffset"),u);f&&(n.x=(n.x||0)+f[0],n.y=(n.y||0)+f[1]);var c=r.get("symbolRotate");return n.rotation=(c||0)*Math.PI/180||0,a.attr(n),a.updateTransform(),a}function yD(r,t,e,n,a,i){if(!r.dragging){var o=a.getModel("checkpointStyle"),s=n.dataToCoord(a.getData().get("value",e));if(i||!o.get("animation",!0))r.attr({x:s,y:0}),t&&t.attr({shape:{x2:s}});else{var l={duration:o.get("animationDuration",!0),easing:o.get("animationEasing",!0)};r.stopAnimation(null,!0),r.animateTo({x:s,y:0},l),t&&t.animateTo({shape:{x2:s}},l)}}}function lJ(r){r.registerAction({type:"timelineChange",event:"timelineChanged",update:"prepareAndUpdate"},function(t,e,n){var a=e.getComponent("timeline");return a&&t.currentIndex!=null&&(a.setCurrentIndex(t.currentIndex),!a.get("loop",!0)&&a.isIndexMax()&&a.getPlayState()&&(a.setPlayState(!1),n.dispatchAction({type:"timelinePlayChange",playState:!1,from:t.from}))),e.resetOption("timeline",{replaceMerge:a.get("replaceMerge",!0)}),pt({currentIndex:a.option.currentIndex},t)}),r.registerAction({type:"timelinePlayChange",event:"timelinePlayChanged",update:"update"},function(t,e){var n=e.getComponent("timeline");n&&t.playState!=null&&n.setPlayState(t.playState)})}function uJ(r){var t=r&&r.timeline;X(t)||(t=t?[t]:[]),D(t,function(e){e&&fJ(e)})}function fJ(r){var t=r.type,e={number:"value",time:"time"};if(e[t]&&(r.axisType=e[t],delete r.type),mD(r),_o(r,"controlPosition")){var n=r.controlStyle||(r.controlStyle={});_o(n,"position")||(n.position=r.controlPosition),n.position==="none"&&!_o(n,"show")&&(n.show=!1,delete n.position),delete r.controlPosition}D(r.data||[],function(a){gt(a)&&!X(a)&&(!_o(a,"value")&&_o(a,"name")&&(a.value=a.name),mD(a))})}function mD(r){var t=r.itemStyle||(r.itemStyle={}),e=t.emphasis||(t.emphasis={}),n=r.label||r.label||{},a=n.normal||(n.normal={}),i={normal:1,emphasis:1};D(n,function(o,s){!i[s]&&!_o(a,s)&&(a[s]=o)}),e.label&&!_o(n,"emphasis")&&(n.emphasis=e.label,delete e.label)}function _o(r,t){return r.hasOwnProperty(t)}function cJ(r){r.registerComponentModel(oO),r.registerComponentView(aJ),r.registerSubTypeDefaulter("timeline",function(){return"slider"}),lJ(r),r.registerPreprocessor(uJ)}function K1(r,t){if(!r)return!1;for(var e=X(r)?r:[r],n=0;n<e.length;n++)if(e[n]&&e[n][t])return!0;return!1}function th(r){Fo(r,"label",["show"])}var eh=Wt(),La=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.createdBySelf=!1,e}return t.prototype.init=function(e,n,a){this.mergeDefaultAndTheme(e,a),this._mergeOption(e,a,!1,!0)},t.prototype.isAnimationEnabled=function(){if(Nt.node)return!1;var e=this.__hostSeries;return this.getShallow("animation")&&e&&e.isAnimationEnabled()},t.prototype.mergeOption=function(e,n){this._mergeOption(e,n,!1,!1)},t.prototype._mergeOption=function(e,n,a,i){var o=this.mainType;a||n.eachSeries(function(s){var l=s.get(this.mainType,!0),u=eh(s)[o];if(!l||!l.data){eh(s)[o]=null;return}u?u._mergeOption(l,n,!0):(i&&th(l),D(l.data,function(f){f instanceof Array?(th(f[0]),th(f[1])):th(f)}),u=this.createMarkerModelFromSeries(l,this,n),W(u,{mainType:this.mainType,seriesIndex:s.seriesIndex,name:s.name,createdBySelf:!0}),u.__hostSeries=s),eh(s)[o]=u},this)},t.prototype.formatTooltip=function(e,n,a){var i=this.getData(),o=this.getRawValue(e),s=i.getName(e);return Ve("section",{header:this.name,blocks:[Ve("nameValue",{name:s,value:o,noName:!s,noValue:o==null})]})},t.prototype.getData=function(){return this._data},t.prototype.setData=function(e){this._data=e},t.prototype.getDataParams=function(e,n){var a=wd.prototype.getDataParams.call(this,e,n),i=this.__hostSeries;return i&&(a.seriesId=i.id,a.seriesName=i.name,a.seriesType=i.subType),a},t.getMarkerModelFromSeries=function(e,n){return eh(e)[n]},t.type="marker",t.dependencies=["series","grid","polar","geo"],t}(zt);De(La,wd.prototype);var hJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.createMarkerModelFromSeries=function(e,n,a){return new t(e,n,a)},t.type="markPoint",t.defaultOption={z:5,symbol:"pin",symbolSize:50,tooltip:{trigger:"item"},label:{show:!0,position:"inside"},itemStyle:{borderWidth:2},emphasis:{label:{show:!0}}},t}(La);function x0(r){return!(isNaN(parseFloat(r.x))&&isNaN(parseFloat(r.y)))}function vJ(r){return!isNaN(parseFloat(r.x))&&!isNaN(parseFloat(r.y))}function rh(r,t,e,n,a,i){var o=[],s=wi(t,n),l=s?t.getCalculationInfo("stackResultDimension"):n,u=j1(t,l,r),f=t.indicesOfNearest(l,u)[0];o[a]=t.get(e,f),o[i]=t.get(l,f);var c=t.get(n,f),h=zn(t.get(n,f));return h=Math.min(h,20),h>=0&&(o[i]=+o[i].toFixed(h)),[o,c]}var cy={min:At(rh,"min"),max:At(rh,"max"),average:At(rh,"average"),median:At(rh,"median")};function Df(r,t){if(t){var e=r.getData(),n=r.coordinateSystem,a=n&&n.dimensions;if(!vJ(t)&&!X(t.coord)&&X(a)){var i=sO(t,e,n,r);if(t=yt(t),t.type&&cy[t.type]&&i.baseAxis&&i.valueAxis){var o=Et(a,i.baseAxis.dim),s=Et(a,i.valueAxis.dim),l=cy[t.type](e,i.baseDataDim,i.valueDataDim,o,s);t.coord=l[0],t.value=l[1]}else t.coord=[t.xAxis!=null?t.xAxis:t.radiusAxis,t.yAxis!=null?t.yAxis:t.angleAxis]}if(t.coord==null||!X(a))t.coord=[];else for(var u=t.coord,f=0;f<2;f++)cy[u[f]]&&(u[f]=j1(e,e.mapDimension(a[f]),u[f]));return t}}function sO(r,t,e,n){var a={};return r.valueIndex!=null||r.valueDim!=null?(a.valueDataDim=r.valueIndex!=null?t.getDimension(r.valueIndex):r.valueDim,a.valueAxis=e.getAxis(dJ(n,a.valueDataDim)),a.baseAxis=e.getOtherAxis(a.valueAxis),a.baseDataDim=t.mapDimension(a.baseAxis.dim)):(a.baseAxis=n.getBaseAxis(),a.valueAxis=e.getOtherAxis(a.baseAxis),a.baseDataDim=t.mapDimension(a.baseAxis.dim),a.valueDataDim=t.mapDimension(a.valueAxis.dim)),a}function dJ(r,t){var e=r.getData().getDimensionInfo(t);return e&&e.coordDim}function Mf(r,t){return r&&r.containData&&t.coord&&!x0(t)?r.containData(t.coord):!0}function pJ(r,t,e){return r&&r.containZone&&t.coord&&e.coord&&!x0(t)&&!x0(e)?r.containZone(t.coord,e.coord):!0}function lO(r,t){return r?function(e,n,a,i){var o=i<2?e.coord&&e.coord[i]:e.value;return di(o,t[i])}:function(e,n,a,i){return di(e.value,t[i])}}function j1(r,t,e){if(e==="average"){var n=0,a=0;return r.each(t,function(i,o){isNaN(i)||(n+=i,a++)}),n/a}else return e==="median"?r.getMedian(t):r.getDataExtent(t)[e==="max"?1:0]}var hy=Wt(),J1=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.init=function(){this.markerGroupMap=ct()},t.prototype.render=function(e,n,a){var i=this,o=this.markerGroupMap;o.each(function(s){hy(s).keep=!1}),n.eachSeries(function(s){var l=La.getMarkerModelFromSeries(s,i.type);l&&i.renderSeries(s,l,n,a)}),o.each(function(s){!hy(s).keep&&i.group.remove(s.group)})},t.prototype.markKeep=function(e){hy(e).keep=!0},t.prototype.toggleBlurSeries=function(e,n){var a=this;D(e,function(i){var o=La.getMarkerModelFromSeries(i,a.type);if(o){var s=o.getData();s.eachItemGraphicEl(function(l){l&&(n?QL(l):g_(l))})}})},t.type="marker",t}(ge);function _D(r,t,e){var n=t.coordinateSystem;r.each(function(a){var i=r.getItemModel(a),o,s=rt(i.get("x"),e.getWidth()),l=rt(i.get("y"),e.getHeight());if(!isNaN(s)&&!isNaN(l))o=[s,l];else if(t.getMarkerPosition)o=t.getMarkerPosition(r.getValues(r.dimensions,a));else if(n){var u=r.get(n.dimensions[0],a),f=r.get(n.dimensions[1],a);o=n.dataToPoint([u,f])}isNaN(s)||(o[0]=s),isNaN(l)||(o[1]=l),r.setItemLayout(a,o)})}var gJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.updateTransform=function(e,n,a){n.eachSeries(function(i){var o=La.getMarkerModelFromSeries(i,"markPoint");o&&(_D(o.getData(),i,a),this.markerGroupMap.get(i.id).updateLayout())},this)},t.prototype.renderSeries=function(e,n,a,i){var o=e.coordinateSystem,s=e.id,l=e.getData(),u=this.markerGroupMap,f=u.get(s)||u.set(s,new Yf),c=yJ(o,e,n);n.setData(c),_D(n.getData(),e,i),c.each(function(h){var v=c.getItemModel(h),d=v.getShallow("symbol"),p=v.getShallow("symbolSize"),g=v.getShallow("symbolRotate"),y=v.getShallow("symbolOffset"),m=v.getShallow("symbolKeepAspect");if(dt(d)||dt(p)||dt(g)||dt(y)){var _=n.getRawValue(h),S=n.getDataParams(h);dt(d)&&(d=d(_,S)),dt(p)&&(p=p(_,S)),dt(g)&&(g=g(_,S)),dt(y)&&(y=y(_,S))}var x=v.getModel("itemStyle").getItemStyle(),b=Hf(l,"color");x.fill||(x.fill=b),c.setItemVisual(h,{symbol:d,symbolSize:p,symbolRotate:g,symbolOffset:y,symbolKeepAspect:m,style:x})}),f.updateData(c),this.group.add(f.group),c.eachItemGraphicEl(function(h){h.traverse(function(v){xt(v).dataModel=n})}),this.markKeep(f),f.group.silent=n.get("silent")||e.get("silent")},t.type="markPoint",t}(J1);function yJ(r,t,e){var n;r?n=K(r&&r.dimensions,function(s){var l=t.getData().getDimensionInfo(t.getData().mapDimension(s))||{};return W(W({},l),{name:s,ordinalMeta:null})}):n=[{name:"value",type:"float"}];var a=new cr(n,e),i=K(e.get("data"),At(Df,t));r&&(i=Zt(i,At(Mf,r)));var o=lO(!!r,n);return a.initData(i,null,o),a}function mJ(r){r.registerComponentModel(hJ),r.registerComponentView(gJ),r.registerPreprocessor(function(t){K1(t.series,"markPoint")&&(t.markPoint=t.markPoint||{})})}var _J=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.createMarkerModelFromSeries=function(e,n,a){return new t(e,n,a)},t.type="markLine",t.defaultOption={z:5,symbol:["circle","arrow"],symbolSize:[8,16],symbolOffset:0,precision:2,tooltip:{trigger:"item"},label:{show:!0,position:"end",distance:5},lineStyle:{type:"dashed"},emphasis:{label:{show:!0},lineStyle:{width:3}},animationEasing:"linear"},t}(La),nh=Wt(),SJ=function(r,t,e,n){var a=r.getData(),i;if(X(n))i=n;else{var o=n.type;if(o==="min"||o==="max"||o==="average"||o==="median"||n.xAxis!=null||n.yAxis!=null){var s=void 0,l=void 0;if(n.yAxis!=null||n.xAxis!=null)s=t.getAxis(n.yAxis!=null?"y":"x"),l=Ge(n.yAxis,n.xAxis);else{var u=sO(n,a,t,r);s=u.valueAxis;var f=tR(a,u.valueDataDim);l=j1(a,f,o)}var c=s.dim==="x"?0:1,h=1-c,v=yt(n),d={coord:[]};v.type=null,v.coord=[],v.coord[h]=-1/0,d.coord[h]=1/0;var p=e.get("precision");p>=0&&Ut(l)&&(l=+l.toFixed(Math.min(p,20))),v.coord[c]=d.coord[c]=l,i=[v,d,{type:o,valueIndex:n.valueIndex,value:l}]}else i=[]}var g=[Df(r,i[0]),Df(r,i[1]),W({},i[2])];return g[2].type=g[2].type||null,Dt(g[2],g[0]),Dt(g[2],g[1]),g};function Lv(r){return!isNaN(r)&&!isFinite(r)}function SD(r,t,e,n){var a=1-r,i=n.dimensions[r];return Lv(t[a])&&Lv(e[a])&&t[r]===e[r]&&n.getAxis(i).containData(t[r])}function xJ(r,t){if(r.type==="cartesian2d"){var e=t[0].coord,n=t[1].coord;if(e&&n&&(SD(1,e,n,r)||SD(0,e,n,r)))return!0}return Mf(r,t[0])&&Mf(r,t[1])}function vy(r,t,e,n,a){var i=n.coordinateSystem,o=r.getItemModel(t),s,l=rt(o.get("x"),a.getWidth()),u=rt(o.get("y"),a.getHeight());if(!isNaN(l)&&!isNaN(u))s=[l,u];else{if(n.getMarkerPosition)s=n.getMarkerPosition(r.getValues(r.dimensions,t));else{var f=i.dimensions,c=r.get(f[0],t),h=r.get(f[1],t);s=i.dataToPoint([c,h])}if(ts(i,"cartesian2d")){var v=i.getAxis("x"),d=i.getAxis("y"),f=i.dimensions;Lv(r.get(f[0],t))?s[0]=v.toGlobalCoord(v.getExtent()[e?0:1]):Lv(r.get(f[1],t))&&(s[1]=d.toGlobalCoord(d.getExtent()[e?0:1]))}isNaN(l)||(s[0]=l),isNaN(u)||(s[1]=u)}r.setItemLayout(t,s)}var bJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.updateTransform=function(e,n,a){n.eachSeries(function(i){var o=La.getMarkerModelFromSeries(i,"markLine");if(o){var s=o.getData(),l=nh(o).from,u=nh(o).to;l.each(function(f){vy(l,f,!0,i,a),vy(u,f,!1,i,a)}),s.each(function(f){s.setItemLayout(f,[l.getItemLayout(f),u.getItemLayout(f)])}),this.markerGroupMap.get(i.id).updateLayout()}},this)},t.prototype.renderSeries=function(e,n,a,i){var o=e.coordinateSystem,s=e.id,l=e.getData(),u=this.markerGroupMap,f=u.get(s)||u.set(s,new _1);this.group.add(f.group);var c=wJ(o,e,n),h=c.from,v=c.to,d=c.line;nh(n).from=h,nh(n).to=v,n.setData(d);var p=n.get("symbol"),g=n.get("symbolSize"),y=n.get("symbolRotate"),m=n.get("symbolOffset");X(p)||(p=[p,p]),X(g)||(g=[g,g]),X(y)||(y=[y,y]),X(m)||(m=[m,m]),c.from.each(function(S){_(h,S,!0),_(v,S,!1)}),d.each(function(S){var x=d.getItemModel(S).getModel("lineStyle").getLineStyle();d.setItemLayout(S,[h.getItemLayout(S),v.getItemLayout(S)]),x.stroke==null&&(x.stroke=h.getItemVisual(S,"style").fill),d.setItemVisual(S,{fromSymbolKeepAspect:h.getItemVisual(S,"symbolKeepAspect"),fromSymbolOffset:h.getItemVisual(S,"symbolOffset"),fromSymbolRotate:h.getItemVisual(S,"symbolRotate"),fromSymbolSize:h.getItemVisual(S,"symbolSize"),fromSymbol:h.getItemVisual(S,"symbol"),toSymbolKeepAspect:v.getItemVisual(S,"symbolKeepAspect"),toSymbolOffset:v.getItemVisual(S,"symbolOffset"),toSymbolRotate:v.getItemVisual(S,"symbolRotate"),toSymbolSize:v.getItemVisual(S,"symbolSize"),toSymbol:v.getItemVisual(S,"symbol"),style:x})}),f.updateData(d),c.line.eachItemGraphicEl(function(S){xt(S).dataModel=n,S.traverse(function(x){xt(x).dataModel=n})});function _(S,x,b){var w=S.getItemModel(x);vy(S,x,b,e,i);var C=w.getModel("itemStyle").getItemStyle();C.fill==null&&(C.fill=Hf(l,"color")),S.setItemVisual(x,{symbolKeepAspect:w.get("symbolKeepAspect"),symbolOffset:Tt(w.get("symbolOffset",!0),m[b?0:1]),symbolRotate:Tt(w.get("symbolRotate",!0),y[b?0:1]),symbolSize:Tt(w.get("symbolSize"),g[b?0:1]),symbol:Tt(w.get("symbol",!0),p[b?0:1]),style:C})}this.markKeep(f),f.group.silent=n.get("silent")||e.get("silent")},t.type="markLine",t}(J1);function wJ(r,t,e){var n;r?n=K(r&&r.dimensions,function(u){var f=t.getData().getDimensionInfo(t.getData().mapDimension(u))||{};return W(W({},f),{name:u,ordinalMeta:null})}):n=[{name:"value",type:"float"}];var a=new cr(n,e),i=new cr(n,e),o=new cr([],e),s=K(e.get("data"),At(SJ,t,r,e));r&&(s=Zt(s,At(xJ,r)));var l=lO(!!r,n);return a.initData(K(s,function(u){return u[0]}),null,l),i.initData(K(s,function(u){return u[1]}),null,l),o.initData(K(s,function(u){return u[2]})),o.hasItemOption=!0,{from:a,to:i,line:o}}function TJ(r){r.registerComponentModel(_J),r.registerComponentView(bJ),r.registerPreprocessor(function(t){K1(t.series,"markLine")&&(t.markLine=t.markLine||{})})}var CJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.createMarkerModelFromSeries=function(e,n,a){return new t(e,n,a)},t.type="markArea",t.defaultOption={z:1,tooltip:{trigger:"item"},animation:!1,label:{show:!0,position:"top"},itemStyle:{borderWidth:0},emphasis:{label:{show:!0,position:"top"}}},t}(La),ah=Wt(),AJ=function(r,t,e,n){var a=n[0],i=n[1];if(!(!a||!i)){var o=Df(r,a),s=Df(r,i),l=o.coord,u=s.coord;l[0]=Ge(l[0],-1/0),l[1]=Ge(l[1],-1/0),u[0]=Ge(u[0],1/0),u[1]=Ge(u[1],1/0);var f=J0([{},o,s]);return f.coord=[o.coord,s.coord],f.x0=o.x,f.y0=o.y,f.x1=s.x,f.y1=s.y,f}};function Pv(r){return!isNaN(r)&&!isFinite(r)}function xD(r,t,e,n){var a=1-r;return Pv(t[a])&&Pv(e[a])}function DJ(r,t){var e=t.coord[0],n=t.coord[1],a={coord:e,x:t.x0,y:t.y0},i={coord:n,x:t.x1,y:t.y1};return ts(r,"cartesian2d")?e&&n&&(xD(1,e,n)||xD(0,e,n))?!0:pJ(r,a,i):Mf(r,a)||Mf(r,i)}function bD(r,t,e,n,a){var i=n.coordinateSystem,o=r.getItemModel(t),s,l=rt(o.get(e[0]),a.getWidth()),u=rt(o.get(e[1]),a.getHeight());if(!isNaN(l)&&!isNaN(u))s=[l,u];else{if(n.getMarkerPosition){var f=r.getValues(["x0","y0"],t),c=r.getValues(["x1","y1"],t),h=i.clampData(f),v=i.clampData(c),d=[];e[0]==="x0"?d[0]=h[0]>v[0]?c[0]:f[0]:d[0]=h[0]>v[0]?f[0]:c[0],e[1]==="y0"?d[1]=h[1]>v[1]?c[1]:f[1]:d[1]=h[1]>v[1]?f[1]:c[1],s=n.getMarkerPosition(d,e,!0)}else{var p=r.get(e[0],t),g=r.get(e[1],t),y=[p,g];i.clampData&&i.clampData(y,y),s=i.dataToPoint(y,!0)}if(ts(i,"cartesian2d")){var m=i.getAxis("x"),_=i.getAxis("y"),p=r.get(e[0],t),g=r.get(e[1],t);Pv(p)?s[0]=m.toGlobalCoord(m.getExtent()[e[0]==="x0"?0:1]):Pv(g)&&(s[1]=_.toGlobalCoord(_.getExtent()[e[1]==="y0"?0:1]))}isNaN(l)||(s[0]=l),isNaN(u)||(s[1]=u)}return s}var wD=[["x0","y0"],["x1","y0"],["x1","y1"],["x0","y1"]],MJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.updateTransform=function(e,n,a){n.eachSeries(function(i){var o=La.getMarkerModelFromSeries(i,"markArea");if(o){var s=o.getData();s.each(function(l){var u=K(wD,function(c){return bD(s,l,c,i,a)});s.setItemLayout(l,u);var f=s.getItemGraphicEl(l);f.setShape("points",u)})}},this)},t.prototype.renderSeries=function(e,n,a,i){var o=e.coordinateSystem,s=e.id,l=e.getData(),u=this.markerGroupMap,f=u.get(s)||u.set(s,{group:new _t});this.group.add(f.group),this.markKeep(f);var c=IJ(o,e,n);n.setData(c),c.each(function(h){var v=K(wD,function(C){return bD(c,h,C,e,i)}),d=o.getAxis("x").scale,p=o.getAxis("y").scale,g=d.getExtent(),y=p.getExtent(),m=[d.parse(c.get("x0",h)),d.parse(c.get("x1",h))],_=[p.parse(c.get("y0",h)),p.parse(c.get("y1",h))];jr(m),jr(_);var S=!(g[0]>m[1]||g[1]<m[0]||y[0]>_[1]||y[1]<_[0]),x=!S;c.setItemLayout(h,{points:v,allClipped:x});var b=c.getItemModel(h).getModel("itemStyle").getItemStyle(),w=Hf(l,"color");b.fill||(b.fill=w,it(b.fill)&&(b.fill=Xh(b.fill,.4))),b.stroke||(b.stroke=w),c.setItemVisual(h,"style",b)}),c.diff(ah(f).data).add(function(h){var v=c.getItemLayout(h);if(!v.allClipped){var d=new gr({shape:{points:v.points}});c.setItemGraphicEl(h,d),f.group.add(d)}}).update(function(h,v){var d=ah(f).data.getItemGraphicEl(v),p=c.getItemLayout(h);p.allClipped?d&&f.group.remove(d):(d?Yt(d,{shape:{points:p.points}},n,h):d=new gr({shape:{points:p.points}}),c.setItemGraphicEl(h,d),f.group.add(d))}).remove(function(h){var v=ah(f).data.getItemGraphicEl(h);f.group.remove(v)}).execute(),c.eachItemGraphicEl(function(h,v){var d=c.getItemModel(v),p=c.getItemVisual(v,"style");h.useStyle(c.getItemVisual(v,"style")),Ze(h,Ne(d),{labelFetcher:n,labelDataIndex:v,defaultText:c.getName(v)||"",inheritColor:it(p.fill)?Xh(p.fill,1):"#000"}),Xe(h,d),ye(h,null,null,d.get(["emphasis","disabled"])),xt(h).dataModel=n}),ah(f).data=c,f.group.silent=n.get("silent")||e.get("silent")},t.type="markArea",t}(J1);function IJ(r,t,e){var n,a,i=["x0","y0","x1","y1"];if(r){var o=K(r&&r.dimensions,function(u){var f=t.getData(),c=f.getDimensionInfo(f.mapDimension(u))||{};return W(W({},c),{name:u,ordinalMeta:null})});a=K(i,function(u,f){return{name:u,type:o[f%2].type}}),n=new cr(a,e)}else a=[{name:"value",type:"float"}],n=new cr(a,e);var s=K(e.get("data"),At(AJ,t,r,e));r&&(s=Zt(s,At(DJ,r)));var l=r?function(u,f,c,h){var v=u.coord[Math.floor(h/2)][h%2];return di(v,a[h])}:function(u,f,c,h){return di(u.value,a[h])};return n.initData(s,null,l),n.hasItemOption=!0,n}function LJ(r){r.registerComponentModel(CJ),r.registerComponentView(MJ),r.registerPreprocessor(function(t){K1(t.series,"markArea")&&(t.markArea=t.markArea||{})})}var PJ=function(r,t){if(t==="all")return{type:"all",title:r.getLocaleModel().get(["legend","selector","all"])};if(t==="inverse")return{type:"inverse",title:r.getLocaleModel().get(["legend","selector","inverse"])}},b0=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.layoutMode={type:"box",ignoreSize:!0},e}return t.prototype.init=function(e,n,a){this.mergeDefaultAndTheme(e,a),e.selected=e.selected||{},this._updateSelector(e)},t.prototype.mergeOption=function(e,n){r.prototype.mergeOption.call(this,e,n),this._updateSelector(e)},t.prototype._updateSelector=function(e){var n=e.selector,a=this.ecModel;n===!0&&(n=e.selector=["all","inverse"]),X(n)&&D(n,function(i,o){it(i)&&(i={type:i}),n[o]=Dt(i,PJ(a,i.type))})},t.prototype.optionUpdated=function(){this._updateData(this.ecModel);var e=this._data;if(e[0]&&this.get("selectedMode")==="single"){for(var n=!1,a=0;a<e.length;a++){var i=e[a].get("name");if(this.isSelected(i)){this.select(i),n=!0;break}}!n&&this.select(e[0].get("name"))}},t.prototype._updateData=function(e){var n=[],a=[];e.eachRawSeries(function(l){var u=l.name;a.push(u);var f;if(l.legendVisualProvider){var c=l.legendVisualProvider,h=c.getAllNames();e.isSeriesFiltered(l)||(a=a.concat(h)),h.length?n=n.concat(h):f=!0}else f=!0;f&&l_(l)&&n.push(l.name)}),this._availableNames=a;var i=this.get("data")||n,o=ct(),s=K(i,function(l){return(it(l)||Ut(l))&&(l={name:l}),o.get(l.name)?null:(o.set(l.name,!0),new Kt(l,this,this.ecModel))},this);this._data=Zt(s,function(l){return!!l})},t.prototype.getData=function(){return this._data},t.prototype.select=function(e){var n=this.option.selected,a=this.get("selectedMode");if(a==="single"){var i=this._data;D(i,function(o){n[o.get("name")]=!1})}n[e]=!0},t.prototype.unSelect=function(e){this.get("selectedMode")!=="single"&&(this.option.selected[e]=!1)},t.prototype.toggleSelected=function(e){var n=this.option.selected;n.hasOwnProperty(e)||(n[e]=!0),this[n[e]?"unSelect":"select"](e)},t.prototype.allSelect=function(){var e=this._data,n=this.option.selected;D(e,function(a){n[a.get("name",!0)]=!0})},t.prototype.inverseSelect=function(){var e=this._data,n=this.option.selected;D(e,function(a){var i=a.get("name",!0);n.hasOwnProperty(i)||(n[i]=!0),n[i]=!n[i]})},t.prototype.isSelected=function(e){var n=this.option.selected;return!(n.hasOwnProperty(e)&&!n[e])&&Et(this._availableNames,e)>=0},t.prototype.getOrient=function(){return this.get("orient")==="vertical"?{index:1,name:"vertical"}:{index:0,name:"horizontal"}},t.type="legend.plain",t.dependencies=["series"],t.defaultOption={z:4,show:!0,orient:"horizontal",left:"center",top:0,align:"auto",backgroundColor:"rgba(0,0,0,0)",borderColor:"#ccc",borderRadius:0,borderWidth:0,padding:5,itemGap:10,itemWidth:25,itemHeight:14,symbolRotate:"inherit",symbolKeepAspect:!0,inactiveColor:"#ccc",inactiveBorderColor:"#ccc",inactiveBorderWidth:"auto",itemStyle:{color:"inherit",opacity:"inherit",borderColor:"inherit",borderWidth:"auto",borderCap:"inherit",borderJoin:"inherit",borderDashOffset:"inherit",borderMiterLimit:"inherit"},lineStyle:{width:"auto",color:"inherit",inactiveColor:"#ccc",inactiveWidth:2,opacity:"inherit",type:"inherit",cap:"inherit",join:"inherit",dashOffset:"inherit",miterLimit:"inherit"},textStyle:{color:"#333"},selectedMode:!0,selector:!1,selectorLabel:{show:!0,borderRadius:10,padding:[3,5,3,5],fontSize:12,fontFamily:"sans-serif",color:"#666",borderWidth:1,borderColor:"#666"},emphasis:{selectorLabel:{show:!0,color:"#eee",backgroundColor:"#666"}},selectorPosition:"auto",selectorItemGap:7,selectorButtonGap:10,tooltip:{show:!1}},t}(zt),ws=At,w0=D,ih=_t,uO=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.newlineDisabled=!1,e}return t.prototype.init=function(){this.group.add(this._contentGroup=new ih),this.group.add(this._selectorGroup=new ih),this._isFirstRender=!0},t.prototype.getContentGroup=function(){return this._contentGroup},t.prototype.getSelectorGroup=function(){return this._selectorGroup},t.prototype.render=function(e,n,a){var i=this._isFirstRender;if(this._isFirstRender=!1,this.resetInner(),!!e.get("show",!0)){var o=e.get("align"),s=e.get("orient");(!o||o==="auto")&&(o=e.get("left")==="right"&&s==="vertical"?"right":"left");var l=e.get("selector",!0),u=e.get("selectorPosition",!0);l&&(!u||u==="auto")&&(u=s==="horizontal"?"end":"start"),this.renderInner(o,e,n,a,l,s,u);var f=e.getBoxLayoutParams(),c={width:a.getWidth(),height:a.getHeight()},h=e.get("padding"),v=Ie(f,c,h),d=this.layoutInner(e,o,v,i,l,u),p=Ie(pt({width:d.width,height:d.height},f),c,h);this.group.x=p.x-d.x,this.group.y=p.y-d.y,this.group.markRedraw(),this.group.add(this._backgroundEl=jk(d,e))}},t.prototype.resetInner=function(){this.getContentGroup().removeAll(),this._backgroundEl&&this.group.remove(this._backgroundEl),this.getSelectorGroup().removeAll()},t.prototype.renderInner=function(e,n,a,i,o,s,l){var u=this.getContentGroup(),f=ct(),c=n.get("selectedMode"),h=[];a.eachRawSeries(function(v){!v.get("legendHoverLink")&&h.push(v.id)}),w0(n.getData(),function(v,d){var p=v.get("name");if(!this.newlineDisabled&&(p===""||p===`
 `)){var g=new ih;g.newline=!0,u.add(g);return}var y=a.getSeriesByName(p)[0];if(!f.get(p))if(y){var m=y.getData(),_=m.getVisual("legendLineStyle")||{},S=m.getVisual("legendIcon"),x=m.getVisual("style"),b=this._createItem(y,p,d,v,n,e,_,x,S,c,i);b.on("click",ws(TD,p,null,i,h)).on("mouseover",ws(T0,y.name,null,i,h)).on("mouseout",ws(C0,y.name,null,i,h)),a.ssr&&b.eachChild(function(w){var C=xt(w);C.seriesIndex=y.seriesIndex,C.dataIndex=d,C.ssrType="legend"}),f.set(p,!0)}else a.eachRawSeries(function(w){if(!f.get(p)&&w.legendVisualProvider){var C=w.legendVisualProvider;if(!C.containName(p))return;var T=C.indexOfName(p),A=C.getItemVisual(T,"style"),M=C.getItemVisual(T,"legendIcon"),I=Or(A.fill);I&&I[3]===0&&(I[3]=.2,A=W(W({},A),{fill:Sa(I,"rgba")}));var L=this._createItem(w,p,d,v,n,e,{},A,M,c,i);L.on("click",ws(TD,null,p,i,h)).on("mouseover",ws(T0,null,p,i,h)).on("mouseout",ws(C0,null,p,i,h)),a.ssr&&L.eachChild(function(P){var E=xt(P);E.seriesIndex=w.seriesIndex,E.dataIndex=d,E.ssrType="legend"}),f.set(p,!0)}},this)},this),o&&this._createSelector(o,n,i,s,l)},t.prototype._createSelector=function(e,n,a,i,o){var s=this.getSelectorGroup();w0(e,function(u){var f=u.type,c=new $t({style:{x:0,y:0,align:"center",verticalAlign:"middle"},onclick:function(){a.dispatchAction({type:f==="all"?"legendAllSelect":"legendInverseSelect",legendId:n.id})}});s.add(c);var h=n.getModel("selectorLabel"),v=n.getModel(["emphasis","selectorLabel"]);Ze(c,{normal:h,emphasis:v},{defaultText:u.title}),ko(c)})},t.prototype._createItem=function(e,n,a,i,o,s,l,u,f,c,h){var v=e.visualDrawType,d=o.get("itemWidth"),p=o.get("itemHeight"),g=o.isSelected(n),y=i.get("symbolRotate"),m=i.get("symbolKeepAspect"),_=i.get("icon");f=_||f||"roundRect";var S=RJ(f,i,l,u,v,g,h),x=new ih,b=i.getModel("textStyle");if(dt(e.getLegendIcon)&&(!_||_==="inherit"))x.add(e.getLegendIcon({itemWidth:d,itemHeight:p,icon:f,iconRotate:y,itemStyle:S.itemStyle,lineStyle:S.lineStyle,symbolKeepAspect:m}));else{var w=_==="inherit"&&e.getData().getVisual("symbol")?y==="inherit"?e.getData().getVisual("symbolRotate"):y:0;x.add(EJ({itemWidth:d,itemHeight:p,icon:f,iconRotate:w,itemStyle:S.itemStyle,symbolKeepAspect:m}))}var C=s==="left"?d+5:-5,T=s,A=o.get("formatter"),M=n;it(A)&&A?M=A.replace("{name}",n??""):dt(A)&&(M=A(n));var I=g?b.getTextColor():i.get("inactiveColor");x.add(new $t({style:le(b,{text:M,x:C,y:p/2,fill:I,align:T,verticalAlign:"middle"},{inheritColor:I})}));var L=new Ht({shape:x.getBoundingRect(),style:{fill:"transparent"}}),P=i.getModel("tooltip");return P.get("show")&&Ko({el:L,componentModel:o,itemName:n,itemTooltipOption:P.option}),x.add(L),x.eachChild(function(E){E.silent=!0}),L.silent=!c,this.getContentGroup().add(x),ko(x),x.__legendDataIndex=a,x},t.prototype.layoutInner=function(e,n,a,i,o,s){var l=this.getContentGroup(),u=this.getSelectorGroup();No(e.get("orient"),l,e.get("itemGap"),a.width,a.height);var f=l.getBoundingRect(),c=[-f.x,-f.y];if(u.markRedraw(),l.markRedraw(),o){No("horizontal",u,e.get("selectorItemGap",!0));var h=u.getBoundingRect(),v=[-h.x,-h.y],d=e.get("selectorButtonGap",!0),p=e.getOrient().index,g=p===0?"width":"height",y=p===0?"height":"width",m=p===0?"y":"x";s==="end"?v[p]+=f[g]+d:c[p]+=h[g]+d,v[1-p]+=f[y]/2-h[y]/2,u.x=v[0],u.y=v[1],l.x=c[0],l.y=c[1];var _={x:0,y:0};return _[g]=f[g]+d+h[g],_[y]=Math.max(f[y],h[y]),_[m]=Math.min(0,h[m]+v[1-p]),_}else return l.x=c[0],l.y=c[1],this.group.getBoundingRect()},t.prototype.remove=function(){this.getContentGroup().removeAll(),this._isFirstRender=!0},t.type="legend.plain",t}(ge);function RJ(r,t,e,n,a,i,o){function s(g,y){g.lineWidth==="auto"&&(g.lineWidth=y.lineWidth>0?2:0),w0(g,function(m,_){g[_]==="inherit"&&(g[_]=y[_])})}var l=t.getModel("itemStyle"),u=l.getItemStyle(),f=r.lastIndexOf("empty",0)===0?"fill":"stroke",c=l.getShallow("decal");u.decal=!c||c==="inherit"?n.decal:rl(c,o),u.fill==="inherit"&&(u.fill=n[a]),u.stroke==="inherit"&&(u.stroke=n[f]),u.opacity==="inherit"&&(u.opacity=(a==="fill"?n:e).opacity),s(u,n);var h=t.getModel("lineStyle"),v=h.getLineStyle();if(s(v,e),u.fill==="auto"&&(u.fill=n.fill),u.stroke==="auto"&&(u.stroke=n.fill),v.stroke==="auto"&&(v.stroke=n.fill),!i){var d=t.get("inactiveBorderWidth"),p=u[f];u.lineWidth=d==="auto"?n.lineWidth>0&&p?2:0:u.lineWidth,u.fill=t.get("inactiveColor"),u.stroke=t.get("inactiveBorderColor"),v.stroke=h.get("inactiveColor"),v.lineWidth=h.get("inactiveWidth")}return{itemStyle:u,lineStyle:v}}function EJ(r){var t=r.icon||"roundRect",e=Ae(t,0,0,r.itemWidth,r.itemHeight,r.itemStyle.fill,r.symbolKeepAspect);return e.setStyle(r.itemStyle),e.rotation=(r.iconRotate||0)*Math.PI/180,e.setOrigin([r.itemWidth/2,r.itemHeight/2]),t.indexOf("empty")>-1&&(e.style.stroke=e.style.fill,e.style.fill="#fff",e.style.lineWidth=2),e}function TD(r,t,e,n){C0(r,t,e,n),e.dispatchAction({type:"legendToggleSelect",name:r??t}),T0(r,t,e,n)}function fO(r){for(var t=r.getZr().storage.getDisplayList(),e,n=0,a=t.length;n<a&&!(e=t[n].states.emphasis);)n++;return e&&e.hoverLayer}function T0(r,t,e,n){fO(e)||e.dispatchAction({type:"highlight",seriesName:r,name:t,excludeSeriesId:n})}function C0(r,t,e,n){fO(e)||e.dispatchAction({type:"downplay",seriesName:r,name:t,excludeSeriesId:n})}function kJ(r){var t=r.findComponents({mainType:"legend"});t&&t.length&&r.filterSeries(function(e){for(var n=0;n<t.length;n++)if(!t[n].isSelected(e.name))return!1;return!0})}function eu(r,t,e){var n=r==="allSelect"||r==="inverseSelect",a={},i=[];e.eachComponent({mainType:"legend",query:t},function(s){n?s[r]():s[r](t.name),CD(s,a),i.push(s.componentIndex)});var o={};return e.eachComponent("legend",function(s){D(a,function(l,u){s[l?"select":"unSelect"](u)}),CD(s,o)}),n?{selected:o,legendIndex:i}:{name:t.name,selected:o}}function CD(r,t){var e=t||{};return D(r.getData(),function(n){var a=n.get("name");if(!(a===`
-`||a==="")){var i=r.isSelected(a);ut(e,a)?e[a]=e[a]&&i:e[a]=i}}),e}function OJ(r){r.registerAction("legendToggleSelect","legendselectchanged",At(eu,"toggleSelected")),r.registerAction("legendAllSelect","legendselectall",At(eu,"allSelect")),r.registerAction("legendInverseSelect","legendinverseselect",At(eu,"inverseSelect")),r.registerAction("legendSelect","legendselected",At(eu,"select")),r.registerAction("legendUnSelect","legendunselected",At(eu,"unSelect"))}function cO(r){r.registerComponentModel(b0),r.registerComponentView(uO),r.registerProcessor(r.PRIORITY.PROCESSOR.SERIES_FILTER,kJ),r.registerSubTypeDefaulter("legend",function(){return"plain"}),OJ(r)}var NJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.setScrollDataIndex=function(e){this.option.scrollDataIndex=e},t.prototype.init=function(e,n,a){var i=ml(e);r.prototype.init.call(this,e,n,a),AD(this,e,i)},t.prototype.mergeOption=function(e,n){r.prototype.mergeOption.call(this,e,n),AD(this,this.option,e)},t.type="legend.scroll",t.defaultOption=Pi(b0.defaultOption,{scrollDataIndex:0,pageButtonItemGap:5,pageButtonGap:null,pageButtonPosition:"end",pageFormatter:"{current}/{total}",pageIcons:{horizontal:["M0,0L12,-10L12,10z","M0,0L-12,-10L-12,10z"],vertical:["M0,0L20,0L10,-20z","M0,0L20,0L10,20z"]},pageIconColor:"#2f4554",pageIconInactiveColor:"#aaa",pageIconSize:15,pageTextStyle:{color:"#333"},animationDurationUpdate:800}),t}(b0);function AD(r,t,e){var n=r.getOrient(),a=[1,1];a[n.index]=0,bi(t,e,{type:"box",ignoreSize:!!a})}var DD=_t,dy=["width","height"],py=["x","y"],VJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.newlineDisabled=!0,e._currentIndex=0,e}return t.prototype.init=function(){r.prototype.init.call(this),this.group.add(this._containerGroup=new DD),this._containerGroup.add(this.getContentGroup()),this.group.add(this._controllerGroup=new DD)},t.prototype.resetInner=function(){r.prototype.resetInner.call(this),this._controllerGroup.removeAll(),this._containerGroup.removeClipPath(),this._containerGroup.__rectSize=null},t.prototype.renderInner=function(e,n,a,i,o,s,l){var u=this;r.prototype.renderInner.call(this,e,n,a,i,o,s,l);var f=this._controllerGroup,c=n.get("pageIconSize",!0),h=X(c)?c:[c,c];d("pagePrev",0);var v=n.getModel("pageTextStyle");f.add(new $t({name:"pageText",style:{text:"xx/xx",fill:v.getTextColor(),font:v.getFont(),verticalAlign:"middle",align:"center"},silent:!0})),d("pageNext",1);function d(p,g){var y=p+"DataIndex",m=Ff(n.get("pageIcons",!0)[n.getOrient().name][g],{onclick:ot(u._pageGo,u,y,n,i)},{x:-h[0]/2,y:-h[1]/2,width:h[0],height:h[1]});m.name=p,f.add(m)}},t.prototype.layoutInner=function(e,n,a,i,o,s){var l=this.getSelectorGroup(),u=e.getOrient().index,f=dy[u],c=py[u],h=dy[1-u],v=py[1-u];o&&No("horizontal",l,e.get("selectorItemGap",!0));var d=e.get("selectorButtonGap",!0),p=l.getBoundingRect(),g=[-p.x,-p.y],y=yt(a);o&&(y[f]=a[f]-p[f]-d);var m=this._layoutContentAndController(e,i,y,u,f,h,v,c);if(o){if(s==="end")g[u]+=m[f]+d;else{var _=p[f]+d;g[u]-=_,m[c]-=_}m[f]+=p[f]+d,g[1-u]+=m[v]+m[h]/2-p[h]/2,m[h]=Math.max(m[h],p[h]),m[v]=Math.min(m[v],p[v]+g[1-u]),l.x=g[0],l.y=g[1],l.markRedraw()}return m},t.prototype._layoutContentAndController=function(e,n,a,i,o,s,l,u){var f=this.getContentGroup(),c=this._containerGroup,h=this._controllerGroup;No(e.get("orient"),f,e.get("itemGap"),i?a.width:null,i?null:a.height),No("horizontal",h,e.get("pageButtonItemGap",!0));var v=f.getBoundingRect(),d=h.getBoundingRect(),p=this._showController=v[o]>a[o],g=[-v.x,-v.y];n||(g[i]=f[u]);var y=[0,0],m=[-d.x,-d.y],_=Tt(e.get("pageButtonGap",!0),e.get("itemGap",!0));if(p){var S=e.get("pageButtonPosition",!0);S==="end"?m[i]+=a[o]-d[o]:y[i]+=d[o]+_}m[1-i]+=v[s]/2-d[s]/2,f.setPosition(g),c.setPosition(y),h.setPosition(m);var x={x:0,y:0};if(x[o]=p?a[o]:v[o],x[s]=Math.max(v[s],d[s]),x[l]=Math.min(0,d[l]+m[1-i]),c.__rectSize=a[o],p){var b={x:0,y:0};b[o]=Math.max(a[o]-d[o]-_,0),b[s]=x[s],c.setClipPath(new Ht({shape:b})),c.__rectSize=b[o]}else h.eachChild(function(C){C.attr({invisible:!0,silent:!0})});var w=this._getPageInfo(e);return w.pageIndex!=null&&Yt(f,{x:w.contentPosition[0],y:w.contentPosition[1]},p?e:null),this._updatePageInfoView(e,w),x},t.prototype._pageGo=function(e,n,a){var i=this._getPageInfo(n)[e];i!=null&&a.dispatchAction({type:"legendScroll",scrollDataIndex:i,legendId:n.id})},t.prototype._updatePageInfoView=function(e,n){var a=this._controllerGroup;D(["pagePrev","pageNext"],function(f){var c=f+"DataIndex",h=n[c]!=null,v=a.childOfName(f);v&&(v.setStyle("fill",h?e.get("pageIconColor",!0):e.get("pageIconInactiveColor",!0)),v.cursor=h?"pointer":"default")});var i=a.childOfName("pageText"),o=e.get("pageFormatter"),s=n.pageIndex,l=s!=null?s+1:0,u=n.pageCount;i&&o&&i.setStyle("text",it(o)?o.replace("{current}",l==null?"":l+"").replace("{total}",u==null?"":u+""):o({current:l,total:u}))},t.prototype._getPageInfo=function(e){var n=e.get("scrollDataIndex",!0),a=this.getContentGroup(),i=this._containerGroup.__rectSize,o=e.getOrient().index,s=dy[o],l=py[o],u=this._findTargetItemIndex(n),f=a.children(),c=f[u],h=f.length,v=h?1:0,d={contentPosition:[a.x,a.y],pageCount:v,pageIndex:v-1,pagePrevDataIndex:null,pageNextDataIndex:null};if(!c)return d;var p=S(c);d.contentPosition[o]=-p.s;for(var g=u+1,y=p,m=p,_=null;g<=h;++g)_=S(f[g]),(!_&&m.e>y.s+i||_&&!x(_,y.s))&&(m.i>y.i?y=m:y=_,y&&(d.pageNextDataIndex==null&&(d.pageNextDataIndex=y.i),++d.pageCount)),m=_;for(var g=u-1,y=p,m=p,_=null;g>=-1;--g)_=S(f[g]),(!_||!x(m,_.s))&&y.i<m.i&&(m=y,d.pagePrevDataIndex==null&&(d.pagePrevDataIndex=y.i),++d.pageCount,++d.pageIndex),y=_;return d;function S(b){if(b){var w=b.getBoundingRect(),C=w[l]+b[l];return{s:C,e:C+w[s],i:b.__legendDataIndex}}}function x(b,w){return b.e>=w&&b.s<=w+i}},t.prototype._findTargetItemIndex=function(e){if(!this._showController)return 0;var n,a=this.getContentGroup(),i;return a.eachChild(function(o,s){var l=o.__legendDataIndex;i==null&&l!=null&&(i=s),l===e&&(n=s)}),n??i},t.type="legend.scroll",t}(uO);function BJ(r){r.registerAction("legendScroll","legendscroll",function(t,e){var n=t.scrollDataIndex;n!=null&&e.eachComponent({mainType:"legend",subType:"scroll",query:t},function(a){a.setScrollDataIndex(n)})})}function zJ(r){kt(cO),r.registerComponentModel(NJ),r.registerComponentView(VJ),BJ(r)}function FJ(r){kt(cO),kt(zJ)}var GJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.type="dataZoom.inside",t.defaultOption=Pi(Af.defaultOption,{disabled:!1,zoomLock:!1,zoomOnMouseWheel:!0,moveOnMouseMove:!0,moveOnMouseWheel:!1,preventDefaultMouseMove:!0}),t}(Af),Q1=Wt();function HJ(r,t,e){Q1(r).coordSysRecordMap.each(function(n){var a=n.dataZoomInfoMap.get(t.uid);a&&(a.getRange=e)})}function WJ(r,t){for(var e=Q1(r).coordSysRecordMap,n=e.keys(),a=0;a<n.length;a++){var i=n[a],o=e.get(i),s=o.dataZoomInfoMap;if(s){var l=t.uid,u=s.get(l);u&&(s.removeKey(l),s.keys().length||hO(e,o))}}}function hO(r,t){if(t){r.removeKey(t.model.uid);var e=t.controller;e&&e.dispose()}}function $J(r,t){var e={model:t,containsPoint:At(YJ,t),dispatchAction:At(UJ,r),dataZoomInfoMap:null,controller:null},n=e.controller=new jf(r.getZr());return D(["pan","zoom","scrollMove"],function(a){n.on(a,function(i){var o=[];e.dataZoomInfoMap.each(function(s){if(i.isAvailableBehavior(s.model.option)){var l=(s.getRange||{})[a],u=l&&l(s.dzReferCoordSysInfo,e.model.mainType,e.controller,i);!s.model.get("disabled",!0)&&u&&o.push({dataZoomId:s.model.id,start:u[0],end:u[1]})}}),o.length&&e.dispatchAction(o)})}),e}function UJ(r,t){r.isDisposed()||r.dispatchAction({type:"dataZoom",animation:{easing:"cubicOut",duration:100},batch:t})}function YJ(r,t,e,n){return r.coordinateSystem.containPoint([e,n])}function XJ(r){var t,e="type_",n={type_true:2,type_move:1,type_false:0,type_undefined:-1},a=!0;return r.each(function(i){var o=i.model,s=o.get("disabled",!0)?!1:o.get("zoomLock",!0)?"move":!0;n[e+s]>n[e+t]&&(t=s),a=a&&o.get("preventDefaultMouseMove",!0)}),{controlType:t,opt:{zoomOnMouseWheel:!0,moveOnMouseMove:!0,moveOnMouseWheel:!0,preventDefaultMouseMove:!!a}}}function ZJ(r){r.registerProcessor(r.PRIORITY.PROCESSOR.FILTER,function(t,e){var n=Q1(e),a=n.coordSysRecordMap||(n.coordSysRecordMap=ct());a.each(function(i){i.dataZoomInfoMap=null}),t.eachComponent({mainType:"dataZoom",subType:"inside"},function(i){var o=Zk(i);D(o.infoList,function(s){var l=s.model.uid,u=a.get(l)||a.set(l,$J(e,s.model)),f=u.dataZoomInfoMap||(u.dataZoomInfoMap=ct());f.set(i.uid,{dzReferCoordSysInfo:s,model:i,getRange:null})})}),a.each(function(i){var o=i.controller,s,l=i.dataZoomInfoMap;if(l){var u=l.keys()[0];u!=null&&(s=l.get(u))}if(!s){hO(a,i);return}var f=XJ(l);o.enable(f.controlType,f.opt),o.setPointerChecker(i.containsPoint),xl(i,"dispatchAction",s.model.get("throttle",!0),"fixRate")})})}var qJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type="dataZoom.inside",e}return t.prototype.render=function(e,n,a){if(r.prototype.render.apply(this,arguments),e.noTarget()){this._clear();return}this.range=e.getPercentRange(),HJ(a,e,{pan:ot(gy.pan,this),zoom:ot(gy.zoom,this),scrollMove:ot(gy.scrollMove,this)})},t.prototype.dispose=function(){this._clear(),r.prototype.dispose.apply(this,arguments)},t.prototype._clear=function(){WJ(this.api,this.dataZoomModel),this.range=null},t.type="dataZoom.inside",t}($1),gy={zoom:function(r,t,e,n){var a=this.range,i=a.slice(),o=r.axisModels[0];if(o){var s=yy[t](null,[n.originX,n.originY],o,e,r),l=(s.signal>0?s.pixelStart+s.pixelLength-s.pixel:s.pixel-s.pixelStart)/s.pixelLength*(i[1]-i[0])+i[0],u=Math.max(1/n.scale,0);i[0]=(i[0]-l)*u+l,i[1]=(i[1]-l)*u+l;var f=this.dataZoomModel.findRepresentativeAxisProxy().getMinMaxSpan();if(rs(0,i,[0,100],0,f.minSpan,f.maxSpan),this.range=i,a[0]!==i[0]||a[1]!==i[1])return i}},pan:MD(function(r,t,e,n,a,i){var o=yy[n]([i.oldX,i.oldY],[i.newX,i.newY],t,a,e);return o.signal*(r[1]-r[0])*o.pixel/o.pixelLength}),scrollMove:MD(function(r,t,e,n,a,i){var o=yy[n]([0,0],[i.scrollDelta,i.scrollDelta],t,a,e);return o.signal*(r[1]-r[0])*i.scrollDelta})};function MD(r){return function(t,e,n,a){var i=this.range,o=i.slice(),s=t.axisModels[0];if(s){var l=r(o,s,t,e,n,a);if(rs(l,o,[0,100],"all"),this.range=o,i[0]!==o[0]||i[1]!==o[1])return o}}}var yy={grid:function(r,t,e,n,a){var i=e.axis,o={},s=a.model.coordinateSystem.getRect();return r=r||[0,0],i.dim==="x"?(o.pixel=t[0]-r[0],o.pixelLength=s.width,o.pixelStart=s.x,o.signal=i.inverse?1:-1):(o.pixel=t[1]-r[1],o.pixelLength=s.height,o.pixelStart=s.y,o.signal=i.inverse?-1:1),o},polar:function(r,t,e,n,a){var i=e.axis,o={},s=a.model.coordinateSystem,l=s.getRadiusAxis().getExtent(),u=s.getAngleAxis().getExtent();return r=r?s.pointToCoord(r):[0,0],t=s.pointToCoord(t),e.mainType==="radiusAxis"?(o.pixel=t[0]-r[0],o.pixelLength=l[1]-l[0],o.pixelStart=l[0],o.signal=i.inverse?1:-1):(o.pixel=t[1]-r[1],o.pixelLength=u[1]-u[0],o.pixelStart=u[0],o.signal=i.inverse?-1:1),o},singleAxis:function(r,t,e,n,a){var i=e.axis,o=a.model.coordinateSystem.getRect(),s={};return r=r||[0,0],i.orient==="horizontal"?(s.pixel=t[0]-r[0],s.pixelLength=o.width,s.pixelStart=o.x,s.signal=i.inverse?1:-1):(s.pixel=t[1]-r[1],s.pixelLength=o.height,s.pixelStart=o.y,s.signal=i.inverse?-1:1),s}};function vO(r){U1(r),r.registerComponentModel(GJ),r.registerComponentView(qJ),ZJ(r)}var KJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.type="dataZoom.slider",t.layoutMode="box",t.defaultOption=Pi(Af.defaultOption,{show:!0,right:"ph",top:"ph",width:"ph",height:"ph",left:null,bottom:null,borderColor:"#d2dbee",borderRadius:3,backgroundColor:"rgba(47,69,84,0)",dataBackground:{lineStyle:{color:"#d2dbee",width:.5},areaStyle:{color:"#d2dbee",opacity:.2}},selectedDataBackground:{lineStyle:{color:"#8fb0f7",width:.5},areaStyle:{color:"#8fb0f7",opacity:.2}},fillerColor:"rgba(135,175,274,0.2)",handleIcon:"path://M-9.35,34.56V42m0-40V9.5m-2,0h4a2,2,0,0,1,2,2v21a2,2,0,0,1-2,2h-4a2,2,0,0,1-2-2v-21A2,2,0,0,1-11.35,9.5Z",handleSize:"100%",handleStyle:{color:"#fff",borderColor:"#ACB8D1"},moveHandleSize:7,moveHandleIcon:"path://M-320.9-50L-320.9-50c18.1,0,27.1,9,27.1,27.1V85.7c0,18.1-9,27.1-27.1,27.1l0,0c-18.1,0-27.1-9-27.1-27.1V-22.9C-348-41-339-50-320.9-50z M-212.3-50L-212.3-50c18.1,0,27.1,9,27.1,27.1V85.7c0,18.1-9,27.1-27.1,27.1l0,0c-18.1,0-27.1-9-27.1-27.1V-22.9C-239.4-41-230.4-50-212.3-50z M-103.7-50L-103.7-50c18.1,0,27.1,9,27.1,27.1V85.7c0,18.1-9,27.1-27.1,27.1l0,0c-18.1,0-27.1-9-27.1-27.1V-22.9C-130.9-41-121.8-50-103.7-50z",moveHandleStyle:{color:"#D2DBEE",opacity:.7},showDetail:!0,showDataShadow:"auto",realtime:!0,zoomLock:!1,textStyle:{color:"#6E7079"},brushSelect:!0,brushStyle:{color:"rgba(135,175,274,0.15)"},emphasis:{handleLabel:{show:!0},handleStyle:{borderColor:"#8FB0F7"},moveHandleStyle:{color:"#8FB0F7"}}}),t}(Af),ru=Ht,ID=7,jJ=1,my=30,JJ=7,nu="horizontal",LD="vertical",QJ=5,tQ=["line","bar","candlestick","scatter"],eQ={easing:"cubicOut",duration:100,delay:0},rQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e._displayables={},e}return t.prototype.init=function(e,n){this.api=n,this._onBrush=ot(this._onBrush,this),this._onBrushEnd=ot(this._onBrushEnd,this)},t.prototype.render=function(e,n,a,i){if(r.prototype.render.apply(this,arguments),xl(this,"_dispatchZoomAction",e.get("throttle"),"fixRate"),this._orient=e.getOrient(),e.get("show")===!1){this.group.removeAll();return}if(e.noTarget()){this._clear(),this.group.removeAll();return}(!i||i.type!=="dataZoom"||i.from!==this.uid)&&this._buildView(),this._updateView()},t.prototype.dispose=function(){this._clear(),r.prototype.dispose.apply(this,arguments)},t.prototype._clear=function(){vf(this,"_dispatchZoomAction");var e=this.api.getZr();e.off("mousemove",this._onBrush),e.off("mouseup",this._onBrushEnd)},t.prototype._buildView=function(){var e=this.group;e.removeAll(),this._brushing=!1,this._displayables.brushRect=null,this._resetLocation(),this._resetInterval();var n=this._displayables.sliderGroup=new _t;this._renderBackground(),this._renderHandle(),this._renderDataShadow(),e.add(n),this._positionGroup()},t.prototype._resetLocation=function(){var e=this.dataZoomModel,n=this.api,a=e.get("brushSelect"),i=a?JJ:0,o=this._findCoordRect(),s={width:n.getWidth(),height:n.getHeight()},l=this._orient===nu?{right:s.width-o.x-o.width,top:s.height-my-ID-i,width:o.width,height:my}:{right:ID,top:o.y,width:my,height:o.height},u=ml(e.option);D(["right","top","width","height"],function(c){u[c]==="ph"&&(u[c]=l[c])});var f=Ie(u,s);this._location={x:f.x,y:f.y},this._size=[f.width,f.height],this._orient===LD&&this._size.reverse()},t.prototype._positionGroup=function(){var e=this.group,n=this._location,a=this._orient,i=this.dataZoomModel.getFirstTargetAxisModel(),o=i&&i.get("inverse"),s=this._displayables.sliderGroup,l=(this._dataShadowInfo||{}).otherAxisInverse;s.attr(a===nu&&!o?{scaleY:l?1:-1,scaleX:1}:a===nu&&o?{scaleY:l?1:-1,scaleX:-1}:a===LD&&!o?{scaleY:l?-1:1,scaleX:1,rotation:Math.PI/2}:{scaleY:l?-1:1,scaleX:-1,rotation:Math.PI/2});var u=e.getBoundingRect([s]);e.x=n.x-u.x,e.y=n.y-u.y,e.markRedraw()},t.prototype._getViewExtent=function(){return[0,this._size[0]]},t.prototype._renderBackground=function(){var e=this.dataZoomModel,n=this._size,a=this._displayables.sliderGroup,i=e.get("brushSelect");a.add(new ru({silent:!0,shape:{x:0,y:0,width:n[0],height:n[1]},style:{fill:e.get("backgroundColor")},z2:-40}));var o=new ru({shape:{x:0,y:0,width:n[0],height:n[1]},style:{fill:"transparent"},z2:0,onclick:ot(this._onClickPanel,this)}),s=this.api.getZr();i?(o.on("mousedown",this._onBrushStart,this),o.cursor="crosshair",s.on("mousemove",this._onBrush),s.on("mouseup",this._onBrushEnd)):(s.off("mousemove",this._onBrush),s.off("mouseup",this._onBrushEnd)),a.add(o)},t.prototype._renderDataShadow=function(){var e=this._dataShadowInfo=this._prepareDataShadowInfo();if(this._displayables.dataShadowSegs=[],!e)return;var n=this._size,a=this._shadowSize||[],i=e.series,o=i.getRawData(),s=i.getShadowDim&&i.getShadowDim(),l=s&&o.getDimensionInfo(s)?i.getShadowDim():e.otherDim;if(l==null)return;var u=this._shadowPolygonPts,f=this._shadowPolylinePts;if(o!==this._shadowData||l!==this._shadowDim||n[0]!==a[0]||n[1]!==a[1]){var c=o.getDataExtent(l),h=(c[1]-c[0])*.3;c=[c[0]-h,c[1]+h];var v=[0,n[1]],d=[0,n[0]],p=[[n[0],0],[0,0]],g=[],y=d[1]/(o.count()-1),m=0,_=Math.round(o.count()/n[0]),S;o.each([l],function(T,A){if(_>0&&A%_){m+=y;return}var M=T==null||isNaN(T)||T==="",I=M?0:qt(T,c,v,!0);M&&!S&&A?(p.push([p[p.length-1][0],0]),g.push([g[g.length-1][0],0])):!M&&S&&(p.push([m,0]),g.push([m,0])),p.push([m,I]),g.push([m,I]),m+=y,S=M}),u=this._shadowPolygonPts=p,f=this._shadowPolylinePts=g}this._shadowData=o,this._shadowDim=l,this._shadowSize=[n[0],n[1]];var x=this.dataZoomModel;function b(T){var A=x.getModel(T?"selectedDataBackground":"dataBackground"),M=new _t,I=new gr({shape:{points:u},segmentIgnoreThreshold:1,style:A.getModel("areaStyle").getAreaStyle(),silent:!0,z2:-20}),L=new yr({shape:{points:f},segmentIgnoreThreshold:1,style:A.getModel("lineStyle").getLineStyle(),silent:!0,z2:-19});return M.add(I),M.add(L),M}for(var w=0;w<3;w++){var C=b(w===1);this._displayables.sliderGroup.add(C),this._displayables.dataShadowSegs.push(C)}},t.prototype._prepareDataShadowInfo=function(){var e=this.dataZoomModel,n=e.get("showDataShadow");if(n!==!1){var a,i=this.ecModel;return e.eachTargetAxis(function(o,s){var l=e.getAxisProxy(o,s).getTargetSeriesModels();D(l,function(u){if(!a&&!(n!==!0&&Et(tQ,u.get("type"))<0)){var f=i.getComponent(ui(o),s).axis,c=nQ(o),h,v=u.coordinateSystem;c!=null&&v.getOtherAxis&&(h=v.getOtherAxis(f).inverse),c=u.getData().mapDimension(c),a={thisAxis:f,series:u,thisDim:o,otherDim:c,otherAxisInverse:h}}},this)},this),a}},t.prototype._renderHandle=function(){var e=this.group,n=this._displayables,a=n.handles=[null,null],i=n.handleLabels=[null,null],o=this._displayables.sliderGroup,s=this._size,l=this.dataZoomModel,u=this.api,f=l.get("borderRadius")||0,c=l.get("brushSelect"),h=n.filler=new ru({silent:c,style:{fill:l.get("fillerColor")},textConfig:{position:"inside"}});o.add(h),o.add(new ru({silent:!0,subPixelOptimize:!0,shape:{x:0,y:0,width:s[0],height:s[1],r:f},style:{stroke:l.get("dataBackgroundColor")||l.get("borderColor"),lineWidth:jJ,fill:"rgba(0,0,0,0)"}})),D([0,1],function(_){var S=l.get("handleIcon");!lv[S]&&S.indexOf("path://")<0&&S.indexOf("image://")<0&&(S="path://"+S);var x=Ae(S,-1,0,2,2,null,!0);x.attr({cursor:PD(this._orient),draggable:!0,drift:ot(this._onDragMove,this,_),ondragend:ot(this._onDragEnd,this),onmouseover:ot(this._showDataInfo,this,!0),onmouseout:ot(this._showDataInfo,this,!1),z2:5});var b=x.getBoundingRect(),w=l.get("handleSize");this._handleHeight=rt(w,this._size[1]),this._handleWidth=b.width/b.height*this._handleHeight,x.setStyle(l.getModel("handleStyle").getItemStyle()),x.style.strokeNoScale=!0,x.rectHover=!0,x.ensureState("emphasis").style=l.getModel(["emphasis","handleStyle"]).getItemStyle(),ko(x);var C=l.get("handleColor");C!=null&&(x.style.fill=C),o.add(a[_]=x);var T=l.getModel("textStyle"),A=l.get("handleLabel")||{},M=A.show||!1;e.add(i[_]=new $t({silent:!0,invisible:!M,style:le(T,{x:0,y:0,text:"",verticalAlign:"middle",align:"center",fill:T.getTextColor(),font:T.getFont()}),z2:10}))},this);var v=h;if(c){var d=rt(l.get("moveHandleSize"),s[1]),p=n.moveHandle=new Ht({style:l.getModel("moveHandleStyle").getItemStyle(),silent:!0,shape:{r:[0,0,2,2],y:s[1]-.5,height:d}}),g=d*.8,y=n.moveHandleIcon=Ae(l.get("moveHandleIcon"),-g/2,-g/2,g,g,"#fff",!0);y.silent=!0,y.y=s[1]+d/2-.5,p.ensureState("emphasis").style=l.getModel(["emphasis","moveHandleStyle"]).getItemStyle();var m=Math.min(s[1]/2,Math.max(d,10));v=n.moveZone=new Ht({invisible:!0,shape:{y:s[1]-m,height:d+m}}),v.on("mouseover",function(){u.enterEmphasis(p)}).on("mouseout",function(){u.leaveEmphasis(p)}),o.add(p),o.add(y),o.add(v)}v.attr({draggable:!0,cursor:PD(this._orient),drift:ot(this._onDragMove,this,"all"),ondragstart:ot(this._showDataInfo,this,!0),ondragend:ot(this._onDragEnd,this),onmouseover:ot(this._showDataInfo,this,!0),onmouseout:ot(this._showDataInfo,this,!1)})},t.prototype._resetInterval=function(){var e=this._range=this.dataZoomModel.getPercentRange(),n=this._getViewExtent();this._handleEnds=[qt(e[0],[0,100],n,!0),qt(e[1],[0,100],n,!0)]},t.prototype._updateInterval=function(e,n){var a=this.dataZoomModel,i=this._handleEnds,o=this._getViewExtent(),s=a.findRepresentativeAxisProxy().getMinMaxSpan(),l=[0,100];rs(n,i,o,a.get("zoomLock")?"all":e,s.minSpan!=null?qt(s.minSpan,l,o,!0):null,s.maxSpan!=null?qt(s.maxSpan,l,o,!0):null);var u=this._range,f=this._range=jr([qt(i[0],o,l,!0),qt(i[1],o,l,!0)]);return!u||u[0]!==f[0]||u[1]!==f[1]},t.prototype._updateView=function(e){var n=this._displayables,a=this._handleEnds,i=jr(a.slice()),o=this._size;D([0,1],function(v){var d=n.handles[v],p=this._handleHeight;d.attr({scaleX:p/2,scaleY:p/2,x:a[v]+(v?-1:1),y:o[1]/2-p/2})},this),n.filler.setShape({x:i[0],y:0,width:i[1]-i[0],height:o[1]});var s={x:i[0],width:i[1]-i[0]};n.moveHandle&&(n.moveHandle.setShape(s),n.moveZone.setShape(s),n.moveZone.getBoundingRect(),n.moveHandleIcon&&n.moveHandleIcon.attr("x",s.x+s.width/2));for(var l=n.dataShadowSegs,u=[0,i[0],i[1],o[0]],f=0;f<l.length;f++){var c=l[f],h=c.getClipPath();h||(h=new Ht,c.setClipPath(h)),h.setShape({x:u[f],y:0,width:u[f+1]-u[f],height:o[1]})}this._updateDataInfo(e)},t.prototype._updateDataInfo=function(e){var n=this.dataZoomModel,a=this._displayables,i=a.handleLabels,o=this._orient,s=["",""];if(n.get("showDetail")){var l=n.findRepresentativeAxisProxy();if(l){var u=l.getAxisModel().axis,f=this._range,c=e?l.calculateDataWindow({start:f[0],end:f[1]}).valueWindow:l.getDataValueWindow();s=[this._formatLabel(c[0],u),this._formatLabel(c[1],u)]}}var h=jr(this._handleEnds.slice());v.call(this,0),v.call(this,1);function v(d){var p=Oo(a.handles[d].parent,this.group),g=dd(d===0?"right":"left",p),y=this._handleWidth/2+QJ,m=pn([h[d]+(d===0?-y:y),this._size[1]/2],p);i[d].setStyle({x:m[0],y:m[1],verticalAlign:o===nu?"middle":g,align:o===nu?g:"center",text:s[d]})}},t.prototype._formatLabel=function(e,n){var a=this.dataZoomModel,i=a.get("labelFormatter"),o=a.get("labelPrecision");(o==null||o==="auto")&&(o=n.getPixelPrecision());var s=e==null||isNaN(e)?"":n.type==="category"||n.type==="time"?n.scale.getLabel({value:Math.round(e)}):e.toFixed(Math.min(o,20));return dt(i)?i(e,s):it(i)?i.replace("{value}",s):s},t.prototype._showDataInfo=function(e){var n=this.dataZoomModel.get("handleLabel")||{},a=n.show||!1,i=this.dataZoomModel.getModel(["emphasis","handleLabel"]),o=i.get("show")||!1,s=e||this._dragging?o:a,l=this._displayables,u=l.handleLabels;u[0].attr("invisible",!s),u[1].attr("invisible",!s),l.moveHandle&&this.api[s?"enterEmphasis":"leaveEmphasis"](l.moveHandle,1)},t.prototype._onDragMove=function(e,n,a,i){this._dragging=!0,wa(i.event);var o=this._displayables.sliderGroup.getLocalTransform(),s=pn([n,a],o,!0),l=this._updateInterval(e,s[0]),u=this.dataZoomModel.get("realtime");this._updateView(!u),l&&u&&this._dispatchZoomAction(!0)},t.prototype._onDragEnd=function(){this._dragging=!1,this._showDataInfo(!1);var e=this.dataZoomModel.get("realtime");!e&&this._dispatchZoomAction(!1)},t.prototype._onClickPanel=function(e){var n=this._size,a=this._displayables.sliderGroup.transformCoordToLocal(e.offsetX,e.offsetY);if(!(a[0]<0||a[0]>n[0]||a[1]<0||a[1]>n[1])){var i=this._handleEnds,o=(i[0]+i[1])/2,s=this._updateInterval("all",a[0]-o);this._updateView(),s&&this._dispatchZoomAction(!1)}},t.prototype._onBrushStart=function(e){var n=e.offsetX,a=e.offsetY;this._brushStart=new Mt(n,a),this._brushing=!0,this._brushStartTime=+new Date},t.prototype._onBrushEnd=function(e){if(this._brushing){var n=this._displayables.brushRect;if(this._brushing=!1,!!n){n.attr("ignore",!0);var a=n.shape,i=+new Date;if(!(i-this._brushStartTime<200&&Math.abs(a.width)<5)){var o=this._getViewExtent(),s=[0,100];this._range=jr([qt(a.x,o,s,!0),qt(a.x+a.width,o,s,!0)]),this._handleEnds=[a.x,a.x+a.width],this._updateView(),this._dispatchZoomAction(!1)}}}},t.prototype._onBrush=function(e){this._brushing&&(wa(e.event),this._updateBrushRect(e.offsetX,e.offsetY))},t.prototype._updateBrushRect=function(e,n){var a=this._displayables,i=this.dataZoomModel,o=a.brushRect;o||(o=a.brushRect=new ru({silent:!0,style:i.getModel("brushStyle").getItemStyle()}),a.sliderGroup.add(o)),o.attr("ignore",!1);var s=this._brushStart,l=this._displayables.sliderGroup,u=l.transformCoordToLocal(e,n),f=l.transformCoordToLocal(s.x,s.y),c=this._size;u[0]=Math.max(Math.min(c[0],u[0]),0),o.setShape({x:f[0],y:0,width:u[0]-f[0],height:c[1]})},t.prototype._dispatchZoomAction=function(e){var n=this._range;this.api.dispatchAction({type:"dataZoom",from:this.uid,dataZoomId:this.dataZoomModel.id,animation:e?eQ:null,start:n[0],end:n[1]})},t.prototype._findCoordRect=function(){var e,n=Zk(this.dataZoomModel).infoList;if(!e&&n.length){var a=n[0].model.coordinateSystem;e=a.getRect&&a.getRect()}if(!e){var i=this.api.getWidth(),o=this.api.getHeight();e={x:i*.2,y:o*.2,width:i*.6,height:o*.6}}return e},t.type="dataZoom.slider",t}($1);function nQ(r){var t={x:"y",y:"x",radius:"angle",angle:"radius"};return t[r]}function PD(r){return r==="vertical"?"ns-resize":"ew-resize"}function dO(r){r.registerComponentModel(KJ),r.registerComponentView(rQ),U1(r)}function aQ(r){kt(vO),kt(dO)}var pO={get:function(r,t,e){var n=yt((iQ[r]||{})[t]);return e&&X(n)?n[n.length-1]:n}},iQ={color:{active:["#006edd","#e0ffff"],inactive:["rgba(0,0,0,0)"]},colorHue:{active:[0,360],inactive:[0,0]},colorSaturation:{active:[.3,1],inactive:[0,0]},colorLightness:{active:[.9,.5],inactive:[0,0]},colorAlpha:{active:[.3,1],inactive:[0,0]},opacity:{active:[.3,1],inactive:[0,0]},symbol:{active:["circle","roundRect","diamond"],inactive:["none"]},symbolSize:{active:[10,50],inactive:[0,0]}},RD=Oe.mapVisual,oQ=Oe.eachVisual,sQ=X,ED=D,lQ=jr,uQ=qt,Rv=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.stateList=["inRange","outOfRange"],e.replacableOptionKeys=["inRange","outOfRange","target","controller","color"],e.layoutMode={type:"box",ignoreSize:!0},e.dataBound=[-1/0,1/0],e.targetVisuals={},e.controllerVisuals={},e}return t.prototype.init=function(e,n,a){this.mergeDefaultAndTheme(e,a)},t.prototype.optionUpdated=function(e,n){var a=this.option;!n&&aO(a,e,this.replacableOptionKeys),this.textStyleModel=this.getModel("textStyle"),this.resetItemSize(),this.completeVisualOption()},t.prototype.resetVisual=function(e){var n=this.stateList;e=ot(e,this),this.controllerVisuals=_0(this.option.controller,n,e),this.targetVisuals=_0(this.option.target,n,e)},t.prototype.getItemSymbol=function(){return null},t.prototype.getTargetSeriesIndices=function(){var e=this.option.seriesIndex,n=[];return e==null||e==="all"?this.ecModel.eachSeries(function(a,i){n.push(i)}):n=te(e),n},t.prototype.eachTargetSeries=function(e,n){D(this.getTargetSeriesIndices(),function(a){var i=this.ecModel.getSeriesByIndex(a);i&&e.call(n,i)},this)},t.prototype.isTargetSeries=function(e){var n=!1;return this.eachTargetSeries(function(a){a===e&&(n=!0)}),n},t.prototype.formatValueText=function(e,n,a){var i=this.option,o=i.precision,s=this.dataBound,l=i.formatter,u;a=a||["<",">"],X(e)&&(e=e.slice(),u=!0);var f=n?e:u?[c(e[0]),c(e[1])]:c(e);if(it(l))return l.replace("{value}",u?f[0]:f).replace("{value2}",u?f[1]:f);if(dt(l))return u?l(e[0],e[1]):l(e);if(u)return e[0]===s[0]?a[0]+" "+f[1]:e[1]===s[1]?a[1]+" "+f[0]:f[0]+" - "+f[1];return f;function c(h){return h===s[0]?"min":h===s[1]?"max":(+h).toFixed(Math.min(o,20))}},t.prototype.resetExtent=function(){var e=this.option,n=lQ([e.min,e.max]);this._dataExtent=n},t.prototype.getDataDimensionIndex=function(e){var n=this.option.dimension;if(n!=null)return e.getDimensionIndex(n);for(var a=e.dimensions,i=a.length-1;i>=0;i--){var o=a[i],s=e.getDimensionInfo(o);if(!s.isCalculationCoord)return s.storeDimIndex}},t.prototype.getExtent=function(){return this._dataExtent.slice()},t.prototype.completeVisualOption=function(){var e=this.ecModel,n=this.option,a={inRange:n.inRange,outOfRange:n.outOfRange},i=n.target||(n.target={}),o=n.controller||(n.controller={});Dt(i,a),Dt(o,a);var s=this.isCategory();l.call(this,i),l.call(this,o),u.call(this,i,"inRange","outOfRange"),f.call(this,o);function l(c){sQ(n.color)&&!c.inRange&&(c.inRange={color:n.color.slice().reverse()}),c.inRange=c.inRange||{color:e.get("gradientColor")}}function u(c,h,v){var d=c[h],p=c[v];d&&!p&&(p=c[v]={},ED(d,function(g,y){if(Oe.isValidType(y)){var m=pO.get(y,"inactive",s);m!=null&&(p[y]=m,y==="color"&&!p.hasOwnProperty("opacity")&&!p.hasOwnProperty("colorAlpha")&&(p.opacity=[0,0]))}}))}function f(c){var h=(c.inRange||{}).symbol||(c.outOfRange||{}).symbol,v=(c.inRange||{}).symbolSize||(c.outOfRange||{}).symbolSize,d=this.get("inactiveColor"),p=this.getItemSymbol(),g=p||"roundRect";ED(this.stateList,function(y){var m=this.itemSize,_=c[y];_||(_=c[y]={color:s?d:[d]}),_.symbol==null&&(_.symbol=h&&yt(h)||(s?g:[g])),_.symbolSize==null&&(_.symbolSize=v&&yt(v)||(s?m[0]:[m[0],m[0]])),_.symbol=RD(_.symbol,function(b){return b==="none"?g:b});var S=_.symbolSize;if(S!=null){var x=-1/0;oQ(S,function(b){b>x&&(x=b)}),_.symbolSize=RD(S,function(b){return uQ(b,[0,x],[0,m[0]],!0)})}},this)}},t.prototype.resetItemSize=function(){this.itemSize=[parseFloat(this.get("itemWidth")),parseFloat(this.get("itemHeight"))]},t.prototype.isCategory=function(){return!!this.option.categories},t.prototype.setSelected=function(e){},t.prototype.getSelected=function(){return null},t.prototype.getValueState=function(e){return null},t.prototype.getVisualMeta=function(e){return null},t.type="visualMap",t.dependencies=["series"],t.defaultOption={show:!0,z:4,seriesIndex:"all",min:0,max:200,left:0,right:null,top:null,bottom:0,itemWidth:null,itemHeight:null,inverse:!1,orient:"vertical",backgroundColor:"rgba(0,0,0,0)",borderColor:"#ccc",contentColor:"#5793f3",inactiveColor:"#aaa",borderWidth:0,padding:5,textGap:10,precision:0,textStyle:{color:"#333"}},t}(zt),kD=[20,140],fQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.optionUpdated=function(e,n){r.prototype.optionUpdated.apply(this,arguments),this.resetExtent(),this.resetVisual(function(a){a.mappingMethod="linear",a.dataExtent=this.getExtent()}),this._resetRange()},t.prototype.resetItemSize=function(){r.prototype.resetItemSize.apply(this,arguments);var e=this.itemSize;(e[0]==null||isNaN(e[0]))&&(e[0]=kD[0]),(e[1]==null||isNaN(e[1]))&&(e[1]=kD[1])},t.prototype._resetRange=function(){var e=this.getExtent(),n=this.option.range;!n||n.auto?(e.auto=1,this.option.range=e):X(n)&&(n[0]>n[1]&&n.reverse(),n[0]=Math.max(n[0],e[0]),n[1]=Math.min(n[1],e[1]))},t.prototype.completeVisualOption=function(){r.prototype.completeVisualOption.apply(this,arguments),D(this.stateList,function(e){var n=this.option.controller[e].symbolSize;n&&n[0]!==n[1]&&(n[0]=n[1]/3)},this)},t.prototype.setSelected=function(e){this.option.range=e.slice(),this._resetRange()},t.prototype.getSelected=function(){var e=this.getExtent(),n=jr((this.get("range")||[]).slice());return n[0]>e[1]&&(n[0]=e[1]),n[1]>e[1]&&(n[1]=e[1]),n[0]<e[0]&&(n[0]=e[0]),n[1]<e[0]&&(n[1]=e[0]),n},t.prototype.getValueState=function(e){var n=this.option.range,a=this.getExtent();return(n[0]<=a[0]||n[0]<=e)&&(n[1]>=a[1]||e<=n[1])?"inRange":"outOfRange"},t.prototype.findTargetDataIndices=function(e){var n=[];return this.eachTargetSeries(function(a){var i=[],o=a.getData();o.each(this.getDataDimensionIndex(o),function(s,l){e[0]<=s&&s<=e[1]&&i.push(l)},this),n.push({seriesId:a.id,dataIndex:i})},this),n},t.prototype.getVisualMeta=function(e){var n=OD(this,"outOfRange",this.getExtent()),a=OD(this,"inRange",this.option.range.slice()),i=[];function o(v,d){i.push({value:v,color:e(v,d)})}for(var s=0,l=0,u=a.length,f=n.length;l<f&&(!a.length||n[l]<=a[0]);l++)n[l]<a[s]&&o(n[l],"outOfRange");for(var c=1;s<u;s++,c=0)c&&i.length&&o(a[s],"outOfRange"),o(a[s],"inRange");for(var c=1;l<f;l++)(!a.length||a[a.length-1]<n[l])&&(c&&(i.length&&o(i[i.length-1].value,"outOfRange"),c=0),o(n[l],"outOfRange"));var h=i.length;return{stops:i,outerColors:[h?i[0].color:"transparent",h?i[h-1].color:"transparent"]}},t.type="visualMap.continuous",t.defaultOption=Pi(Rv.defaultOption,{align:"auto",calculable:!1,hoverLink:!0,realtime:!0,handleIcon:"path://M-11.39,9.77h0a3.5,3.5,0,0,1-3.5,3.5h-22a3.5,3.5,0,0,1-3.5-3.5h0a3.5,3.5,0,0,1,3.5-3.5h22A3.5,3.5,0,0,1-11.39,9.77Z",handleSize:"120%",handleStyle:{borderColor:"#fff",borderWidth:1},indicatorIcon:"circle",indicatorSize:"50%",indicatorStyle:{borderColor:"#fff",borderWidth:2,shadowBlur:2,shadowOffsetX:1,shadowOffsetY:1,shadowColor:"rgba(0,0,0,0.2)"}}),t}(Rv);function OD(r,t,e){if(e[0]===e[1])return e.slice();for(var n=200,a=(e[1]-e[0])/n,i=e[0],o=[],s=0;s<=n&&i<e[1];s++)o.push(i),i+=a;return o.push(e[1]),o}var gO=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.autoPositionValues={left:1,right:1,top:1,bottom:1},e}return t.prototype.init=function(e,n){this.ecModel=e,this.api=n},t.prototype.render=function(e,n,a,i){if(this.visualMapModel=e,e.get("show")===!1){this.group.removeAll();return}this.doRender(e,n,a,i)},t.prototype.renderBackground=function(e){var n=this.visualMapModel,a=yl(n.get("padding")||0),i=e.getBoundingRect();e.add(new Ht({z2:-1,silent:!0,shape:{x:i.x-a[3],y:i.y-a[0],width:i.width+a[3]+a[1],height:i.height+a[0]+a[2]},style:{fill:n.get("backgroundColor"),stroke:n.get("borderColor"),lineWidth:n.get("borderWidth")}}))},t.prototype.getControllerVisual=function(e,n,a){a=a||{};var i=a.forceState,o=this.visualMapModel,s={};if(n==="color"){var l=o.get("contentColor");s.color=l}function u(v){return s[v]}function f(v,d){s[v]=d}var c=o.controllerVisuals[i||o.getValueState(e)],h=Oe.prepareVisualTypes(c);return D(h,function(v){var d=c[v];a.convertOpacityToAlpha&&v==="opacity"&&(v="colorAlpha",d=c.__alphaForOpacity),Oe.dependsOn(v,n)&&d&&d.applyVisual(e,u,f)}),s[n]},t.prototype.positionGroup=function(e){var n=this.visualMapModel,a=this.api;xd(e,n.getBoxLayoutParams(),{width:a.getWidth(),height:a.getHeight()})},t.prototype.doRender=function(e,n,a,i){},t.type="visualMap",t}(ge),ND=[["left","right","width"],["top","bottom","height"]];function yO(r,t,e){var n=r.option,a=n.align;if(a!=null&&a!=="auto")return a;for(var i={width:t.getWidth(),height:t.getHeight()},o=n.orient==="horizontal"?1:0,s=ND[o],l=[0,null,10],u={},f=0;f<3;f++)u[ND[1-o][f]]=l[f],u[s[f]]=f===2?e[0]:n[s[f]];var c=[["x","width",3],["y","height",0]][o],h=Ie(u,i,n.padding);return s[(h.margin[c[2]]||0)+h[c[0]]+h[c[1]]*.5<i[c[1]]*.5?0:1]}function Eh(r,t){return D(r||[],function(e){e.dataIndex!=null&&(e.dataIndexInside=e.dataIndex,e.dataIndex=null),e.highlightKey="visualMap"+(t?t.componentIndex:"")}),r}var En=qt,cQ=D,VD=Math.min,_y=Math.max,hQ=12,vQ=6,dQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e._shapes={},e._dataInterval=[],e._handleEnds=[],e._hoverLinkDataIndices=[],e}return t.prototype.init=function(e,n){r.prototype.init.call(this,e,n),this._hoverLinkFromSeriesMouseOver=ot(this._hoverLinkFromSeriesMouseOver,this),this._hideIndicator=ot(this._hideIndicator,this)},t.prototype.doRender=function(e,n,a,i){(!i||i.type!=="selectDataRange"||i.from!==this.uid)&&this._buildView()},t.prototype._buildView=function(){this.group.removeAll();var e=this.visualMapModel,n=this.group;this._orient=e.get("orient"),this._useHandle=e.get("calculable"),this._resetInterval(),this._renderBar(n);var a=e.get("text");this._renderEndsText(n,a,0),this._renderEndsText(n,a,1),this._updateView(!0),this.renderBackground(n),this._updateView(),this._enableHoverLinkToSeries(),this._enableHoverLinkFromSeries(),this.positionGroup(n)},t.prototype._renderEndsText=function(e,n,a){if(n){var i=n[1-a];i=i!=null?i+"":"";var o=this.visualMapModel,s=o.get("textGap"),l=o.itemSize,u=this._shapes.mainGroup,f=this._applyTransform([l[0]/2,a===0?-s:l[1]+s],u),c=this._applyTransform(a===0?"bottom":"top",u),h=this._orient,v=this.visualMapModel.textStyleModel;this.group.add(new $t({style:le(v,{x:f[0],y:f[1],verticalAlign:h==="horizontal"?"middle":c,align:h==="horizontal"?c:"center",text:i})}))}},t.prototype._renderBar=function(e){var n=this.visualMapModel,a=this._shapes,i=n.itemSize,o=this._orient,s=this._useHandle,l=yO(n,this.api,i),u=a.mainGroup=this._createBarGroup(l),f=new _t;u.add(f),f.add(a.outOfRange=BD()),f.add(a.inRange=BD(null,s?FD(this._orient):null,ot(this._dragHandle,this,"all",!1),ot(this._dragHandle,this,"all",!0))),f.setClipPath(new Ht({shape:{x:0,y:0,width:i[0],height:i[1],r:3}}));var c=n.textStyleModel.getTextRect("国"),h=_y(c.width,c.height);s&&(a.handleThumbs=[],a.handleLabels=[],a.handleLabelPoints=[],this._createHandle(n,u,0,i,h,o),this._createHandle(n,u,1,i,h,o)),this._createIndicator(n,u,i,h,o),e.add(u)},t.prototype._createHandle=function(e,n,a,i,o,s){var l=ot(this._dragHandle,this,a,!1),u=ot(this._dragHandle,this,a,!0),f=mn(e.get("handleSize"),i[0]),c=Ae(e.get("handleIcon"),-f/2,-f/2,f,f,null,!0),h=FD(this._orient);c.attr({cursor:h,draggable:!0,drift:l,ondragend:u,onmousemove:function(y){wa(y.event)}}),c.x=i[0]/2,c.useStyle(e.getModel("handleStyle").getItemStyle()),c.setStyle({strokeNoScale:!0,strokeFirst:!0}),c.style.lineWidth*=2,c.ensureState("emphasis").style=e.getModel(["emphasis","handleStyle"]).getItemStyle(),bo(c,!0),n.add(c);var v=this.visualMapModel.textStyleModel,d=new $t({cursor:h,draggable:!0,drift:l,onmousemove:function(y){wa(y.event)},ondragend:u,style:le(v,{x:0,y:0,text:""})});d.ensureState("blur").style={opacity:.1},d.stateTransition={duration:200},this.group.add(d);var p=[f,0],g=this._shapes;g.handleThumbs[a]=c,g.handleLabelPoints[a]=p,g.handleLabels[a]=d},t.prototype._createIndicator=function(e,n,a,i,o){var s=mn(e.get("indicatorSize"),a[0]),l=Ae(e.get("indicatorIcon"),-s/2,-s/2,s,s,null,!0);l.attr({cursor:"move",invisible:!0,silent:!0,x:a[0]/2});var u=e.getModel("indicatorStyle").getItemStyle();if(l instanceof We){var f=l.style;l.useStyle(W({image:f.image,x:f.x,y:f.y,width:f.width,height:f.height},u))}else l.useStyle(u);n.add(l);var c=this.visualMapModel.textStyleModel,h=new $t({silent:!0,invisible:!0,style:le(c,{x:0,y:0,text:""})});this.group.add(h);var v=[(o==="horizontal"?i/2:vQ)+a[0]/2,0],d=this._shapes;d.indicator=l,d.indicatorLabel=h,d.indicatorLabelPoint=v,this._firstShowIndicator=!0},t.prototype._dragHandle=function(e,n,a,i){if(this._useHandle){if(this._dragging=!n,!n){var o=this._applyTransform([a,i],this._shapes.mainGroup,!0);this._updateInterval(e,o[1]),this._hideIndicator(),this._updateView()}n===!this.visualMapModel.get("realtime")&&this.api.dispatchAction({type:"selectDataRange",from:this.uid,visualMapId:this.visualMapModel.id,selected:this._dataInterval.slice()}),n?!this._hovering&&this._clearHoverLinkToSeries():zD(this.visualMapModel)&&this._doHoverLinkToSeries(this._handleEnds[e],!1)}},t.prototype._resetInterval=function(){var e=this.visualMapModel,n=this._dataInterval=e.getSelected(),a=e.getExtent(),i=[0,e.itemSize[1]];this._handleEnds=[En(n[0],a,i,!0),En(n[1],a,i,!0)]},t.prototype._updateInterval=function(e,n){n=n||0;var a=this.visualMapModel,i=this._handleEnds,o=[0,a.itemSize[1]];rs(n,i,o,e,0);var s=a.getExtent();this._dataInterval=[En(i[0],o,s,!0),En(i[1],o,s,!0)]},t.prototype._updateView=function(e){var n=this.visualMapModel,a=n.getExtent(),i=this._shapes,o=[0,n.itemSize[1]],s=e?o:this._handleEnds,l=this._createBarVisual(this._dataInterval,a,s,"inRange"),u=this._createBarVisual(a,a,o,"outOfRange");i.inRange.setStyle({fill:l.barColor}).setShape("points",l.barPoints),i.outOfRange.setStyle({fill:u.barColor}).setShape("points",u.barPoints),this._updateHandle(s,l)},t.prototype._createBarVisual=function(e,n,a,i){var o={forceState:i,convertOpacityToAlpha:!0},s=this._makeColorGradient(e,o),l=[this.getControllerVisual(e[0],"symbolSize",o),this.getControllerVisual(e[1],"symbolSize",o)],u=this._createBarPoints(a,l);return{barColor:new $o(0,0,0,1,s),barPoints:u,handlesColor:[s[0].color,s[s.length-1].color]}},t.prototype._makeColorGradient=function(e,n){var a=100,i=[],o=(e[1]-e[0])/a;i.push({color:this.getControllerVisual(e[0],"color",n),offset:0});for(var s=1;s<a;s++){var l=e[0]+o*s;if(l>e[1])break;i.push({color:this.getControllerVisual(l,"color",n),offset:s/a})}return i.push({color:this.getControllerVisual(e[1],"color",n),offset:1}),i},t.prototype._createBarPoints=function(e,n){var a=this.visualMapModel.itemSize;return[[a[0]-n[0],e[0]],[a[0],e[0]],[a[0],e[1]],[a[0]-n[1],e[1]]]},t.prototype._createBarGroup=function(e){var n=this._orient,a=this.visualMapModel.get("inverse");return new _t(n==="horizontal"&&!a?{scaleX:e==="bottom"?1:-1,rotation:Math.PI/2}:n==="horizontal"&&a?{scaleX:e==="bottom"?-1:1,rotation:-Math.PI/2}:n==="vertical"&&!a?{scaleX:e==="left"?1:-1,scaleY:-1}:{scaleX:e==="left"?1:-1})},t.prototype._updateHandle=function(e,n){if(this._useHandle){var a=this._shapes,i=this.visualMapModel,o=a.handleThumbs,s=a.handleLabels,l=i.itemSize,u=i.getExtent(),f=this._applyTransform("left",a.mainGroup);cQ([0,1],function(c){var h=o[c];h.setStyle("fill",n.handlesColor[c]),h.y=e[c];var v=En(e[c],[0,l[1]],u,!0),d=this.getControllerVisual(v,"symbolSize");h.scaleX=h.scaleY=d/l[0],h.x=l[0]-d/2;var p=pn(a.handleLabelPoints[c],Oo(h,this.group));if(this._orient==="horizontal"){var g=f==="left"||f==="top"?(l[0]-d)/2:(l[0]-d)/-2;p[1]+=g}s[c].setStyle({x:p[0],y:p[1],text:i.formatValueText(this._dataInterval[c]),verticalAlign:"middle",align:this._orient==="vertical"?this._applyTransform("left",a.mainGroup):"center"})},this)}},t.prototype._showIndicator=function(e,n,a,i){var o=this.visualMapModel,s=o.getExtent(),l=o.itemSize,u=[0,l[1]],f=this._shapes,c=f.indicator;if(c){c.attr("invisible",!1);var h={convertOpacityToAlpha:!0},v=this.getControllerVisual(e,"color",h),d=this.getControllerVisual(e,"symbolSize"),p=En(e,s,u,!0),g=l[0]-d/2,y={x:c.x,y:c.y};c.y=p,c.x=g;var m=pn(f.indicatorLabelPoint,Oo(c,this.group)),_=f.indicatorLabel;_.attr("invisible",!1);var S=this._applyTransform("left",f.mainGroup),x=this._orient,b=x==="horizontal";_.setStyle({text:(a||"")+o.formatValueText(n),verticalAlign:b?S:"middle",align:b?"center":S});var w={x:g,y:p,style:{fill:v}},C={style:{x:m[0],y:m[1]}};if(o.ecModel.isAnimationEnabled()&&!this._firstShowIndicator){var T={duration:100,easing:"cubicInOut",additive:!0};c.x=y.x,c.y=y.y,c.animateTo(w,T),_.animateTo(C,T)}else c.attr(w),_.attr(C);this._firstShowIndicator=!1;var A=this._shapes.handleLabels;if(A)for(var M=0;M<A.length;M++)this.api.enterBlur(A[M])}},t.prototype._enableHoverLinkToSeries=function(){var e=this;this._shapes.mainGroup.on("mousemove",function(n){if(e._hovering=!0,!e._dragging){var a=e.visualMapModel.itemSize,i=e._applyTransform([n.offsetX,n.offsetY],e._shapes.mainGroup,!0,!0);i[1]=VD(_y(0,i[1]),a[1]),e._doHoverLinkToSeries(i[1],0<=i[0]&&i[0]<=a[0])}}).on("mouseout",function(){e._hovering=!1,!e._dragging&&e._clearHoverLinkToSeries()})},t.prototype._enableHoverLinkFromSeries=function(){var e=this.api.getZr();this.visualMapModel.option.hoverLink?(e.on("mouseover",this._hoverLinkFromSeriesMouseOver,this),e.on("mouseout",this._hideIndicator,this)):this._clearHoverLinkFromSeries()},t.prototype._doHoverLinkToSeries=function(e,n){var a=this.visualMapModel,i=a.itemSize;if(a.option.hoverLink){var o=[0,i[1]],s=a.getExtent();e=VD(_y(o[0],e),o[1]);var l=pQ(a,s,o),u=[e-l,e+l],f=En(e,o,s,!0),c=[En(u[0],o,s,!0),En(u[1],o,s,!0)];u[0]<o[0]&&(c[0]=-1/0),u[1]>o[1]&&(c[1]=1/0),n&&(c[0]===-1/0?this._showIndicator(f,c[1],"< ",l):c[1]===1/0?this._showIndicator(f,c[0],"> ",l):this._showIndicator(f,f,"≈ ",l));var h=this._hoverLinkDataIndices,v=[];(n||zD(a))&&(v=this._hoverLinkDataIndices=a.findTargetDataIndices(c));var d=xF(h,v);this._dispatchHighDown("downplay",Eh(d[0],a)),this._dispatchHighDown("highlight",Eh(d[1],a))}},t.prototype._hoverLinkFromSeriesMouseOver=function(e){var n;if(To(e.target,function(l){var u=xt(l);if(u.dataIndex!=null)return n=u,!0},!0),!!n){var a=this.ecModel.getSeriesByIndex(n.seriesIndex),i=this.visualMapModel;if(i.isTargetSeries(a)){var o=a.getData(n.dataType),s=o.getStore().get(i.getDataDimensionIndex(o),n.dataIndex);isNaN(s)||this._showIndicator(s,s)}}},t.prototype._hideIndicator=function(){var e=this._shapes;e.indicator&&e.indicator.attr("invisible",!0),e.indicatorLabel&&e.indicatorLabel.attr("invisible",!0);var n=this._shapes.handleLabels;if(n)for(var a=0;a<n.length;a++)this.api.leaveBlur(n[a])},t.prototype._clearHoverLinkToSeries=function(){this._hideIndicator();var e=this._hoverLinkDataIndices;this._dispatchHighDown("downplay",Eh(e,this.visualMapModel)),e.length=0},t.prototype._clearHoverLinkFromSeries=function(){this._hideIndicator();var e=this.api.getZr();e.off("mouseover",this._hoverLinkFromSeriesMouseOver),e.off("mouseout",this._hideIndicator)},t.prototype._applyTransform=function(e,n,a,i){var o=Oo(n,i?null:this.group);return X(e)?pn(e,o,a):dd(e,o,a)},t.prototype._dispatchHighDown=function(e,n){n&&n.length&&this.api.dispatchAction({type:e,batch:n})},t.prototype.dispose=function(){this._clearHoverLinkFromSeries(),this._clearHoverLinkToSeries()},t.type="visualMap.continuous",t}(gO);function BD(r,t,e,n){return new gr({shape:{points:r},draggable:!!e,cursor:t,drift:e,onmousemove:function(a){wa(a.event)},ondragend:n})}function pQ(r,t,e){var n=hQ/2,a=r.get("hoverLinkDataSize");return a&&(n=En(a,t,e,!0)/2),n}function zD(r){var t=r.get("hoverLinkOnHandle");return!!(t??r.get("realtime"))}function FD(r){return r==="vertical"?"ns-resize":"ew-resize"}var gQ={type:"selectDataRange",event:"dataRangeSelected",update:"update"},yQ=function(r,t){t.eachComponent({mainType:"visualMap",query:r},function(e){e.setSelected(r.selected)})},mQ=[{createOnAllSeries:!0,reset:function(r,t){var e=[];return t.eachComponent("visualMap",function(n){var a=r.pipelineContext;!n.isTargetSeries(r)||a&&a.large||e.push(Fj(n.stateList,n.targetVisuals,ot(n.getValueState,n),n.getDataDimensionIndex(r.getData())))}),e}},{createOnAllSeries:!0,reset:function(r,t){var e=r.getData(),n=[];t.eachComponent("visualMap",function(a){if(a.isTargetSeries(r)){var i=a.getVisualMeta(ot(_Q,null,r,a))||{stops:[],outerColors:[]},o=a.getDataDimensionIndex(e);o>=0&&(i.dimension=o,n.push(i))}}),r.getData().setVisual("visualMeta",n)}}];function _Q(r,t,e,n){for(var a=t.targetVisuals[n],i=Oe.prepareVisualTypes(a),o={color:Hf(r.getData(),"color")},s=0,l=i.length;s<l;s++){var u=i[s],f=a[u==="opacity"?"__alphaForOpacity":u];f&&f.applyVisual(e,c,h)}return o.color;function c(v){return o[v]}function h(v,d){o[v]=d}}var GD=D;function SQ(r){var t=r&&r.visualMap;X(t)||(t=t?[t]:[]),GD(t,function(e){if(e){Ts(e,"splitList")&&!Ts(e,"pieces")&&(e.pieces=e.splitList,delete e.splitList);var n=e.pieces;n&&X(n)&&GD(n,function(a){gt(a)&&(Ts(a,"start")&&!Ts(a,"min")&&(a.min=a.start),Ts(a,"end")&&!Ts(a,"max")&&(a.max=a.end))})}})}function Ts(r,t){return r&&r.hasOwnProperty&&r.hasOwnProperty(t)}var HD=!1;function mO(r){HD||(HD=!0,r.registerSubTypeDefaulter("visualMap",function(t){return!t.categories&&(!(t.pieces?t.pieces.length>0:t.splitNumber>0)||t.calculable)?"continuous":"piecewise"}),r.registerAction(gQ,yQ),D(mQ,function(t){r.registerVisual(r.PRIORITY.VISUAL.COMPONENT,t)}),r.registerPreprocessor(SQ))}function _O(r){r.registerComponentModel(fQ),r.registerComponentView(dQ),mO(r)}var xQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e._pieceList=[],e}return t.prototype.optionUpdated=function(e,n){r.prototype.optionUpdated.apply(this,arguments),this.resetExtent();var a=this._mode=this._determineMode();this._pieceList=[],bQ[this._mode].call(this,this._pieceList),this._resetSelected(e,n);var i=this.option.categories;this.resetVisual(function(o,s){a==="categories"?(o.mappingMethod="category",o.categories=yt(i)):(o.dataExtent=this.getExtent(),o.mappingMethod="piecewise",o.pieceList=K(this._pieceList,function(l){return l=yt(l),s!=="inRange"&&(l.visual=null),l}))})},t.prototype.completeVisualOption=function(){var e=this.option,n={},a=Oe.listVisualTypes(),i=this.isCategory();D(e.pieces,function(s){D(a,function(l){s.hasOwnProperty(l)&&(n[l]=1)})}),D(n,function(s,l){var u=!1;D(this.stateList,function(f){u=u||o(e,f,l)||o(e.target,f,l)},this),!u&&D(this.stateList,function(f){(e[f]||(e[f]={}))[l]=pO.get(l,f==="inRange"?"active":"inactive",i)})},this);function o(s,l,u){return s&&s[l]&&s[l].hasOwnProperty(u)}r.prototype.completeVisualOption.apply(this,arguments)},t.prototype._resetSelected=function(e,n){var a=this.option,i=this._pieceList,o=(n?a:e).selected||{};if(a.selected=o,D(i,function(l,u){var f=this.getSelectedMapKey(l);o.hasOwnProperty(f)||(o[f]=!0)},this),a.selectedMode==="single"){var s=!1;D(i,function(l,u){var f=this.getSelectedMapKey(l);o[f]&&(s?o[f]=!1:s=!0)},this)}},t.prototype.getItemSymbol=function(){return this.get("itemSymbol")},t.prototype.getSelectedMapKey=function(e){return this._mode==="categories"?e.value+"":e.index+""},t.prototype.getPieceList=function(){return this._pieceList},t.prototype._determineMode=function(){var e=this.option;return e.pieces&&e.pieces.length>0?"pieces":this.option.categories?"categories":"splitNumber"},t.prototype.setSelected=function(e){this.option.selected=yt(e)},t.prototype.getValueState=function(e){var n=Oe.findPieceIndex(e,this._pieceList);return n!=null&&this.option.selected[this.getSelectedMapKey(this._pieceList[n])]?"inRange":"outOfRange"},t.prototype.findTargetDataIndices=function(e){var n=[],a=this._pieceList;return this.eachTargetSeries(function(i){var o=[],s=i.getData();s.each(this.getDataDimensionIndex(s),function(l,u){var f=Oe.findPieceIndex(l,a);f===e&&o.push(u)},this),n.push({seriesId:i.id,dataIndex:o})},this),n},t.prototype.getRepresentValue=function(e){var n;if(this.isCategory())n=e.value;else if(e.value!=null)n=e.value;else{var a=e.interval||[];n=a[0]===-1/0&&a[1]===1/0?0:(a[0]+a[1])/2}return n},t.prototype.getVisualMeta=function(e){if(this.isCategory())return;var n=[],a=["",""],i=this;function o(f,c){var h=i.getRepresentValue({interval:f});c||(c=i.getValueState(h));var v=e(h,c);f[0]===-1/0?a[0]=v:f[1]===1/0?a[1]=v:n.push({value:f[0],color:v},{value:f[1],color:v})}var s=this._pieceList.slice();if(!s.length)s.push({interval:[-1/0,1/0]});else{var l=s[0].interval[0];l!==-1/0&&s.unshift({interval:[-1/0,l]}),l=s[s.length-1].interval[1],l!==1/0&&s.push({interval:[l,1/0]})}var u=-1/0;return D(s,function(f){var c=f.interval;c&&(c[0]>u&&o([u,c[0]],"outOfRange"),o(c.slice()),u=c[1])},this),{stops:n,outerColors:a}},t.type="visualMap.piecewise",t.defaultOption=Pi(Rv.defaultOption,{selected:null,minOpen:!1,maxOpen:!1,align:"auto",itemWidth:20,itemHeight:14,itemSymbol:"roundRect",pieces:null,categories:null,splitNumber:5,selectedMode:"multiple",itemGap:10,hoverLink:!0}),t}(Rv),bQ={splitNumber:function(r){var t=this.option,e=Math.min(t.precision,20),n=this.getExtent(),a=t.splitNumber;a=Math.max(parseInt(a,10),1),t.splitNumber=a;for(var i=(n[1]-n[0])/a;+i.toFixed(e)!==i&&e<5;)e++;t.precision=e,i=+i.toFixed(e),t.minOpen&&r.push({interval:[-1/0,n[0]],close:[0,0]});for(var o=0,s=n[0];o<a;s+=i,o++){var l=o===a-1?n[1]:s+i;r.push({interval:[s,l],close:[1,1]})}t.maxOpen&&r.push({interval:[n[1],1/0],close:[0,0]}),Nx(r),D(r,function(u,f){u.index=f,u.text=this.formatValueText(u.interval)},this)},categories:function(r){var t=this.option;D(t.categories,function(e){r.push({text:this.formatValueText(e,!0),value:e})},this),WD(t,r)},pieces:function(r){var t=this.option;D(t.pieces,function(e,n){gt(e)||(e={value:e});var a={text:"",index:n};if(e.label!=null&&(a.text=e.label),e.hasOwnProperty("value")){var i=a.value=e.value;a.interval=[i,i],a.close=[1,1]}else{for(var o=a.interval=[],s=a.close=[0,0],l=[1,0,1],u=[-1/0,1/0],f=[],c=0;c<2;c++){for(var h=[["gte","gt","min"],["lte","lt","max"]][c],v=0;v<3&&o[c]==null;v++)o[c]=e[h[v]],s[c]=l[v],f[c]=v===2;o[c]==null&&(o[c]=u[c])}f[0]&&o[1]===1/0&&(s[0]=0),f[1]&&o[0]===-1/0&&(s[1]=0),o[0]===o[1]&&s[0]&&s[1]&&(a.value=o[0])}a.visual=Oe.retrieveVisuals(e),r.push(a)},this),WD(t,r),Nx(r),D(r,function(e){var n=e.close,a=[["<","≤"][n[1]],[">","≥"][n[0]]];e.text=e.text||this.formatValueText(e.value!=null?e.value:e.interval,!1,a)},this)}};function WD(r,t){var e=r.inverse;(r.orient==="vertical"?!e:e)&&t.reverse()}var wQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.doRender=function(){var e=this.group;e.removeAll();var n=this.visualMapModel,a=n.get("textGap"),i=n.textStyleModel,o=i.getFont(),s=i.getTextColor(),l=this._getItemAlign(),u=n.itemSize,f=this._getViewData(),c=f.endsText,h=Ge(n.get("showLabel",!0),!c),v=!n.get("selectedMode");c&&this._renderEndsText(e,c[0],u,h,l),D(f.viewPieceList,function(d){var p=d.piece,g=new _t;g.onclick=ot(this._onItemClick,this,p),this._enableHoverLink(g,d.indexInModelPieceList);var y=n.getRepresentValue(p);if(this._createItemSymbol(g,y,[0,0,u[0],u[1]],v),h){var m=this.visualMapModel.getValueState(y);g.add(new $t({style:{x:l==="right"?-a:u[0]+a,y:u[1]/2,text:p.text,verticalAlign:"middle",align:l,font:o,fill:s,opacity:m==="outOfRange"?.5:1},silent:v}))}e.add(g)},this),c&&this._renderEndsText(e,c[1],u,h,l),No(n.get("orient"),e,n.get("itemGap")),this.renderBackground(e),this.positionGroup(e)},t.prototype._enableHoverLink=function(e,n){var a=this;e.on("mouseover",function(){return i("highlight")}).on("mouseout",function(){return i("downplay")});var i=function(o){var s=a.visualMapModel;s.option.hoverLink&&a.api.dispatchAction({type:o,batch:Eh(s.findTargetDataIndices(n),s)})}},t.prototype._getItemAlign=function(){var e=this.visualMapModel,n=e.option;if(n.orient==="vertical")return yO(e,this.api,e.itemSize);var a=n.align;return(!a||a==="auto")&&(a="left"),a},t.prototype._renderEndsText=function(e,n,a,i,o){if(n){var s=new _t,l=this.visualMapModel.textStyleModel;s.add(new $t({style:le(l,{x:i?o==="right"?a[0]:0:a[0]/2,y:a[1]/2,verticalAlign:"middle",align:i?o:"center",text:n})})),e.add(s)}},t.prototype._getViewData=function(){var e=this.visualMapModel,n=K(e.getPieceList(),function(s,l){return{piece:s,indexInModelPieceList:l}}),a=e.get("text"),i=e.get("orient"),o=e.get("inverse");return(i==="horizontal"?o:!o)?n.reverse():a&&(a=a.slice().reverse()),{viewPieceList:n,endsText:a}},t.prototype._createItemSymbol=function(e,n,a,i){var o=Ae(this.getControllerVisual(n,"symbol"),a[0],a[1],a[2],a[3],this.getControllerVisual(n,"color"));o.silent=i,e.add(o)},t.prototype._onItemClick=function(e){var n=this.visualMapModel,a=n.option,i=a.selectedMode;if(i){var o=yt(a.selected),s=n.getSelectedMapKey(e);i==="single"||i===!0?(o[s]=!0,D(o,function(l,u){o[u]=u===s})):o[s]=!o[s],this.api.dispatchAction({type:"selectDataRange",from:this.uid,visualMapId:this.visualMapModel.id,selected:o})}},t.type="visualMap.piecewise",t}(gO);function SO(r){r.registerComponentModel(xQ),r.registerComponentView(wQ),mO(r)}function TQ(r){kt(_O),kt(SO)}var CQ={label:{enabled:!0},decal:{show:!1}},$D=Wt(),AQ={};function DQ(r,t){var e=r.getModel("aria");if(!e.get("enabled"))return;var n=yt(CQ);Dt(n.label,r.getLocaleModel().get("aria"),!1),Dt(e.option,n,!1),a(),i();function a(){var u=e.getModel("decal"),f=u.get("show");if(f){var c=ct();r.eachSeries(function(h){if(!h.isColorBySeries()){var v=c.get(h.type);v||(v={},c.set(h.type,v)),$D(h).scope=v}}),r.eachRawSeries(function(h){if(r.isSeriesFiltered(h))return;if(dt(h.enableAriaDecal)){h.enableAriaDecal();return}var v=h.getData();if(h.isColorBySeries()){var m=Cm(h.ecModel,h.name,AQ,r.getSeriesCount()),_=v.getVisual("decal");v.setVisual("decal",S(_,m))}else{var d=h.getRawData(),p={},g=$D(h).scope;v.each(function(x){var b=v.getRawIndex(x);p[b]=x});var y=d.count();d.each(function(x){var b=p[x],w=d.getName(x)||x+"",C=Cm(h.ecModel,w,g,y),T=v.getItemVisual(b,"decal");v.setItemVisual(b,"decal",S(T,C))})}function S(x,b){var w=x?W(W({},b),x):b;return w.dirty=!0,w}})}}function i(){var u=t.getZr().dom;if(u){var f=r.getLocaleModel().get("aria"),c=e.getModel("label");if(c.option=pt(c.option,f),!!c.get("enabled")){if(u.setAttribute("role","img"),c.get("description")){u.setAttribute("aria-label",c.get("description"));return}var h=r.getSeriesCount(),v=c.get(["data","maxCount"])||10,d=c.get(["series","maxCount"])||10,p=Math.min(h,d),g;if(!(h<1)){var y=s();if(y){var m=c.get(["general","withTitle"]);g=o(m,{title:y})}else g=c.get(["general","withoutTitle"]);var _=[],S=h>1?c.get(["series","multiple","prefix"]):c.get(["series","single","prefix"]);g+=o(S,{seriesCount:h}),r.eachSeries(function(C,T){if(T<p){var A=void 0,M=C.get("name"),I=M?"withName":"withoutName";A=h>1?c.get(["series","multiple",I]):c.get(["series","single",I]),A=o(A,{seriesId:C.seriesIndex,seriesName:C.get("name"),seriesType:l(C.subType)});var L=C.getData();if(L.count()>v){var P=c.get(["data","partialData"]);A+=o(P,{displayCnt:v})}else A+=c.get(["data","allData"]);for(var E=c.get(["data","separator","middle"]),k=c.get(["data","separator","end"]),z=c.get(["data","excludeDimensionId"]),O=[],B=0;B<L.count();B++)if(B<v){var H=L.getName(B),Z=z?Zt(L.getValues(B),function(ft,ht){return Et(z,ht)===-1}):L.getValues(B),Q=c.get(["data",H?"withName":"withoutName"]);O.push(o(Q,{name:H,value:Z.join(E)}))}A+=O.join(E)+k,_.push(A)}});var x=c.getModel(["series","multiple","separator"]),b=x.get("middle"),w=x.get("end");g+=_.join(b)+w,u.setAttribute("aria-label",g)}}}}function o(u,f){if(!it(u))return u;var c=u;return D(f,function(h,v){c=c.replace(new RegExp("\\{\\s*"+v+"\\s*\\}","g"),h)}),c}function s(){var u=r.get("title");return u&&u.length&&(u=u[0]),u&&u.text}function l(u){var f=r.getLocaleModel().get(["series","typeNames"]);return f[u]||f.chart}}function MQ(r){if(!(!r||!r.aria)){var t=r.aria;t.show!=null&&(t.enabled=t.show),t.label=t.label||{},D(["description","general","series","data"],function(e){t[e]!=null&&(t.label[e]=t[e])})}}function IQ(r){r.registerPreprocessor(MQ),r.registerVisual(r.PRIORITY.VISUAL.ARIA,DQ)}var UD={value:"eq","<":"lt","<=":"lte",">":"gt",">=":"gte","=":"eq","!=":"ne","<>":"ne"},LQ=function(){function r(t){var e=this._condVal=it(t)?new RegExp(t):B5(t)?t:null;if(e==null){var n="";Xt(n)}}return r.prototype.evaluate=function(t){var e=typeof t;return it(e)?this._condVal.test(t):Ut(e)?this._condVal.test(t+""):!1},r}(),PQ=function(){function r(){}return r.prototype.evaluate=function(){return this.value},r}(),RQ=function(){function r(){}return r.prototype.evaluate=function(){for(var t=this.children,e=0;e<t.length;e++)if(!t[e].evaluate())return!1;return!0},r}(),EQ=function(){function r(){}return r.prototype.evaluate=function(){for(var t=this.children,e=0;e<t.length;e++)if(t[e].evaluate())return!0;return!1},r}(),kQ=function(){function r(){}return r.prototype.evaluate=function(){return!this.child.evaluate()},r}(),OQ=function(){function r(){}return r.prototype.evaluate=function(){for(var t=!!this.valueParser,e=this.getValue,n=e(this.valueGetterParam),a=t?this.valueParser(n):null,i=0;i<this.subCondList.length;i++)if(!this.subCondList[i].evaluate(t?a:n))return!1;return!0},r}();function tS(r,t){if(r===!0||r===!1){var e=new PQ;return e.value=r,e}var n="";return xO(r)||Xt(n),r.and?YD("and",r,t):r.or?YD("or",r,t):r.not?NQ(r,t):VQ(r,t)}function YD(r,t,e){var n=t[r],a="";X(n)||Xt(a),n.length||Xt(a);var i=r==="and"?new RQ:new EQ;return i.children=K(n,function(o){return tS(o,e)}),i.children.length||Xt(a),i}function NQ(r,t){var e=r.not,n="";xO(e)||Xt(n);var a=new kQ;return a.child=tS(e,t),a.child||Xt(n),a}function VQ(r,t){for(var e="",n=t.prepareGetValue(r),a=[],i=Ft(r),o=r.parser,s=o?rP(o):null,l=0;l<i.length;l++){var u=i[l];if(!(u==="parser"||t.valueGetterAttrMap.get(u))){var f=ut(UD,u)?UD[u]:u,c=r[u],h=s?s(c):c,v=T4(f,h)||f==="reg"&&new LQ(h);v||Xt(e),a.push(v)}}a.length||Xt(e);var d=new OQ;return d.valueGetterParam=n,d.valueParser=s,d.getValue=t.getValue,d.subCondList=a,d}function xO(r){return gt(r)&&!er(r)}var BQ=function(){function r(t,e){this._cond=tS(t,e)}return r.prototype.evaluate=function(){return this._cond.evaluate()},r}();function zQ(r,t){return new BQ(r,t)}var FQ={type:"echarts:filter",transform:function(r){for(var t=r.upstream,e,n=zQ(r.config,{valueGetterAttrMap:ct({dimension:!0}),prepareGetValue:function(s){var l="",u=s.dimension;ut(s,"dimension")||Xt(l);var f=t.getDimensionInfo(u);return f||Xt(l),{dimIdx:f.index}},getValue:function(s){return t.retrieveValueFromItem(e,s.dimIdx)}}),a=[],i=0,o=t.count();i<o;i++)e=t.getRawDataItem(i),n.evaluate()&&a.push(e);return{data:a}}},GQ={type:"echarts:sort",transform:function(r){var t=r.upstream,e=r.config,n="",a=te(e);a.length||Xt(n);var i=[];D(a,function(f){var c=f.dimension,h=f.order,v=f.parser,d=f.incomparable;if(c==null&&Xt(n),h!=="asc"&&h!=="desc"&&Xt(n),d&&d!=="min"&&d!=="max"){var p="";Xt(p)}if(h!=="asc"&&h!=="desc"){var g="";Xt(g)}var y=t.getDimensionInfo(c);y||Xt(n);var m=v?rP(v):null;v&&!m&&Xt(n),i.push({dimIdx:y.index,parser:m,comparator:new aP(h,d)})});var o=t.sourceFormat;o!==rr&&o!==nn&&Xt(n);for(var s=[],l=0,u=t.count();l<u;l++)s.push(t.getRawDataItem(l));return s.sort(function(f,c){for(var h=0;h<i.length;h++){var v=i[h],d=t.retrieveValueFromItem(f,v.dimIdx),p=t.retrieveValueFromItem(c,v.dimIdx);v.parser&&(d=v.parser(d),p=v.parser(p));var g=v.comparator.evaluate(d,p);if(g!==0)return g}return 0}),{data:s}}};function HQ(r){r.registerTransform(FQ),r.registerTransform(GQ)}var WQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type="dataset",e}return t.prototype.init=function(e,n,a){r.prototype.init.call(this,e,n,a),this._sourceManager=new lP(this),Zb(this)},t.prototype.mergeOption=function(e,n){r.prototype.mergeOption.call(this,e,n),Zb(this)},t.prototype.optionUpdated=function(){this._sourceManager.dirty()},t.prototype.getSourceManager=function(){return this._sourceManager},t.type="dataset",t.defaultOption={seriesLayoutBy:Zn},t}(zt),$Q=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type="dataset",e}return t.type="dataset",t}(ge);function UQ(r){r.registerComponentModel(WQ),r.registerComponentView($Q)}var Pn=ta.CMD;function Vs(r,t){return Math.abs(r-t)<1e-5}function A0(r){var t=r.data,e=r.len(),n=[],a,i=0,o=0,s=0,l=0;function u(L,P){a&&a.length>2&&n.push(a),a=[L,P]}function f(L,P,E,k){Vs(L,E)&&Vs(P,k)||a.push(L,P,E,k,E,k)}function c(L,P,E,k,z,O){var B=Math.abs(P-L),H=Math.tan(B/4)*4/3,Z=P<L?-1:1,Q=Math.cos(L),ft=Math.sin(L),ht=Math.cos(P),mt=Math.sin(P),Vt=Q*z+E,Y=ft*O+k,J=ht*z+E,U=mt*O+k,tt=z*H*Z,et=O*H*Z;a.push(Vt-tt*ft,Y+et*Q,J+tt*mt,U-et*ht,J,U)}for(var h,v,d,p,g=0;g<e;){var y=t[g++],m=g===1;switch(m&&(i=t[g],o=t[g+1],s=i,l=o,(y===Pn.L||y===Pn.C||y===Pn.Q)&&(a=[s,l])),y){case Pn.M:i=s=t[g++],o=l=t[g++],u(s,l);break;case Pn.L:h=t[g++],v=t[g++],f(i,o,h,v),i=h,o=v;break;case Pn.C:a.push(t[g++],t[g++],t[g++],t[g++],i=t[g++],o=t[g++]);break;case Pn.Q:h=t[g++],v=t[g++],d=t[g++],p=t[g++],a.push(i+2/3*(h-i),o+2/3*(v-o),d+2/3*(h-d),p+2/3*(v-p),d,p),i=d,o=p;break;case Pn.A:var _=t[g++],S=t[g++],x=t[g++],b=t[g++],w=t[g++],C=t[g++]+w;g+=1;var T=!t[g++];h=Math.cos(w)*x+_,v=Math.sin(w)*b+S,m?(s=h,l=v,u(s,l)):f(i,o,h,v),i=Math.cos(C)*x+_,o=Math.sin(C)*b+S;for(var A=(T?-1:1)*Math.PI/2,M=w;T?M>C:M<C;M+=A){var I=T?Math.max(M+A,C):Math.min(M+A,C);c(M,I,_,S,x,b)}break;case Pn.R:s=i=t[g++],l=o=t[g++],h=s+t[g++],v=l+t[g++],u(h,l),f(h,l,h,v),f(h,v,s,v),f(s,v,s,l),f(s,l,h,l);break;case Pn.Z:a&&f(i,o,s,l),i=s,o=l;break}}return a&&a.length>2&&n.push(a),n}function D0(r,t,e,n,a,i,o,s,l,u){if(Vs(r,e)&&Vs(t,n)&&Vs(a,o)&&Vs(i,s)){l.push(o,s);return}var f=2/u,c=f*f,h=o-r,v=s-t,d=Math.sqrt(h*h+v*v);h/=d,v/=d;var p=e-r,g=n-t,y=a-o,m=i-s,_=p*p+g*g,S=y*y+m*m;if(_<c&&S<c){l.push(o,s);return}var x=h*p+v*g,b=-h*y-v*m,w=_-x*x,C=S-b*b;if(w<c&&x>=0&&C<c&&b>=0){l.push(o,s);return}var T=[],A=[];Si(r,e,a,o,.5,T),Si(t,n,i,s,.5,A),D0(T[0],A[0],T[1],A[1],T[2],A[2],T[3],A[3],l,u),D0(T[4],A[4],T[5],A[5],T[6],A[6],T[7],A[7],l,u)}function YQ(r,t){var e=A0(r),n=[];t=t||1;for(var a=0;a<e.length;a++){var i=e[a],o=[],s=i[0],l=i[1];o.push(s,l);for(var u=2;u<i.length;){var f=i[u++],c=i[u++],h=i[u++],v=i[u++],d=i[u++],p=i[u++];D0(s,l,f,c,h,v,d,p,o,t),s=d,l=p}n.push(o)}return n}function bO(r,t,e){var n=r[t],a=r[1-t],i=Math.abs(n/a),o=Math.ceil(Math.sqrt(i*e)),s=Math.floor(e/o);s===0&&(s=1,o=e);for(var l=[],u=0;u<o;u++)l.push(s);var f=o*s,c=e-f;if(c>0)for(var u=0;u<c;u++)l[u%o]+=1;return l}function XD(r,t,e){for(var n=r.r0,a=r.r,i=r.startAngle,o=r.endAngle,s=Math.abs(o-i),l=s*a,u=a-n,f=l>Math.abs(u),c=bO([l,u],f?0:1,t),h=(f?s:u)/c.length,v=0;v<c.length;v++)for(var d=(f?u:s)/c[v],p=0;p<c[v];p++){var g={};f?(g.startAngle=i+h*v,g.endAngle=i+h*(v+1),g.r0=n+d*p,g.r=n+d*(p+1)):(g.startAngle=i+d*p,g.endAngle=i+d*(p+1),g.r0=n+h*v,g.r=n+h*(v+1)),g.clockwise=r.clockwise,g.cx=r.cx,g.cy=r.cy,e.push(g)}}function XQ(r,t,e){for(var n=r.width,a=r.height,i=n>a,o=bO([n,a],i?0:1,t),s=i?"width":"height",l=i?"height":"width",u=i?"x":"y",f=i?"y":"x",c=r[s]/o.length,h=0;h<o.length;h++)for(var v=r[l]/o[h],d=0;d<o[h];d++){var p={};p[u]=h*c,p[f]=d*v,p[s]=c,p[l]=v,p.x+=r.x,p.y+=r.y,e.push(p)}}function ZD(r,t,e,n){return r*n-e*t}function ZQ(r,t,e,n,a,i,o,s){var l=e-r,u=n-t,f=o-a,c=s-i,h=ZD(f,c,l,u);if(Math.abs(h)<1e-6)return null;var v=r-a,d=t-i,p=ZD(v,d,f,c)/h;return p<0||p>1?null:new Mt(p*l+r,p*u+t)}function qQ(r,t,e){var n=new Mt;Mt.sub(n,e,t),n.normalize();var a=new Mt;Mt.sub(a,r,t);var i=a.dot(n);return i}function Cs(r,t){var e=r[r.length-1];e&&e[0]===t[0]&&e[1]===t[1]||r.push(t)}function KQ(r,t,e){for(var n=r.length,a=[],i=0;i<n;i++){var o=r[i],s=r[(i+1)%n],l=ZQ(o[0],o[1],s[0],s[1],t.x,t.y,e.x,e.y);l&&a.push({projPt:qQ(l,t,e),pt:l,idx:i})}if(a.length<2)return[{points:r},{points:r}];a.sort(function(g,y){return g.projPt-y.projPt});var u=a[0],f=a[a.length-1];if(f.idx<u.idx){var c=u;u=f,f=c}for(var h=[u.pt.x,u.pt.y],v=[f.pt.x,f.pt.y],d=[h],p=[v],i=u.idx+1;i<=f.idx;i++)Cs(d,r[i].slice());Cs(d,v),Cs(d,h);for(var i=f.idx+1;i<=u.idx+n;i++)Cs(p,r[i%n].slice());return Cs(p,h),Cs(p,v),[{points:d},{points:p}]}function qD(r){var t=r.points,e=[],n=[];ld(t,e,n);var a=new Lt(e[0],e[1],n[0]-e[0],n[1]-e[1]),i=a.width,o=a.height,s=a.x,l=a.y,u=new Mt,f=new Mt;return i>o?(u.x=f.x=s+i/2,u.y=l,f.y=l+o):(u.y=f.y=l+o/2,u.x=s,f.x=s+i),KQ(t,u,f)}function Ev(r,t,e,n){if(e===1)n.push(t);else{var a=Math.floor(e/2),i=r(t);Ev(r,i[0],a,n),Ev(r,i[1],e-a,n)}return n}function jQ(r,t){for(var e=[],n=0;n<t;n++)e.push(m_(r));return e}function JQ(r,t){t.setStyle(r.style),t.z=r.z,t.z2=r.z2,t.zlevel=r.zlevel}function QQ(r){for(var t=[],e=0;e<r.length;)t.push([r[e++],r[e++]]);return t}function ttt(r,t){var e=[],n=r.shape,a;switch(r.type){case"rect":XQ(n,t,e),a=Ht;break;case"sector":XD(n,t,e),a=pr;break;case"circle":XD({r0:0,r:n.r,startAngle:0,endAngle:Math.PI*2,cx:n.cx,cy:n.cy},t,e),a=pr;break;default:var i=r.getComputedTransform(),o=i?Math.sqrt(Math.max(i[0]*i[0]+i[1]*i[1],i[2]*i[2]+i[3]*i[3])):1,s=K(YQ(r.getUpdatedPathProxy(),o),function(y){return QQ(y)}),l=s.length;if(l===0)Ev(qD,{points:s[0]},t,e);else if(l===t)for(var u=0;u<l;u++)e.push({points:s[u]});else{var f=0,c=K(s,function(y){var m=[],_=[];ld(y,m,_);var S=(_[1]-m[1])*(_[0]-m[0]);return f+=S,{poly:y,area:S}});c.sort(function(y,m){return m.area-y.area});for(var h=t,u=0;u<l;u++){var v=c[u];if(h<=0)break;var d=u===l-1?h:Math.ceil(v.area/f*t);d<0||(Ev(qD,{points:v.poly},d,e),h-=d)}}a=gr;break}if(!a)return jQ(r,t);for(var p=[],u=0;u<e.length;u++){var g=new a;g.setShape(e[u]),JQ(r,g),p.push(g)}return p}function ett(r,t){var e=r.length,n=t.length;if(e===n)return[r,t];for(var a=[],i=[],o=e<n?r:t,s=Math.min(e,n),l=Math.abs(n-e)/6,u=(s-2)/6,f=Math.ceil(l/u)+1,c=[o[0],o[1]],h=l,v=2;v<s;){var d=o[v-2],p=o[v-1],g=o[v++],y=o[v++],m=o[v++],_=o[v++],S=o[v++],x=o[v++];if(h<=0){c.push(g,y,m,_,S,x);continue}for(var b=Math.min(h,f-1)+1,w=1;w<=b;w++){var C=w/b;Si(d,g,m,S,C,a),Si(p,y,_,x,C,i),d=a[3],p=i[3],c.push(a[1],i[1],a[2],i[2],d,p),g=a[5],y=i[5],m=a[6],_=i[6]}h-=b-1}return o===r?[c,t]:[r,c]}function KD(r,t){for(var e=r.length,n=r[e-2],a=r[e-1],i=[],o=0;o<t.length;)i[o++]=n,i[o++]=a;return i}function rtt(r,t){for(var e,n,a,i=[],o=[],s=0;s<Math.max(r.length,t.length);s++){var l=r[s],u=t[s],f=void 0,c=void 0;l?u?(e=ett(l,u),f=e[0],c=e[1],n=f,a=c):(c=KD(a||l,l),f=l):(f=KD(n||u,u),c=u),i.push(f),o.push(c)}return[i,o]}function jD(r){for(var t=0,e=0,n=0,a=r.length,i=0,o=a-2;i<a;o=i,i+=2){var s=r[o],l=r[o+1],u=r[i],f=r[i+1],c=s*f-u*l;t+=c,e+=(s+u)*c,n+=(l+f)*c}return t===0?[r[0]||0,r[1]||0]:[e/t/3,n/t/3,t]}function ntt(r,t,e,n){for(var a=(r.length-2)/6,i=1/0,o=0,s=r.length,l=s-2,u=0;u<a;u++){for(var f=u*6,c=0,h=0;h<s;h+=2){var v=h===0?f:(f+h-2)%l+2,d=r[v]-e[0],p=r[v+1]-e[1],g=t[h]-n[0],y=t[h+1]-n[1],m=g-d,_=y-p;c+=m*m+_*_}c<i&&(i=c,o=u)}return o}function att(r){for(var t=[],e=r.length,n=0;n<e;n+=2)t[n]=r[e-n-2],t[n+1]=r[e-n-1];return t}function itt(r,t,e,n){for(var a=[],i,o=0;o<r.length;o++){var s=r[o],l=t[o],u=jD(s),f=jD(l);i==null&&(i=u[2]<0!=f[2]<0);var c=[],h=[],v=0,d=1/0,p=[],g=s.length;i&&(s=att(s));for(var y=ntt(s,l,u,f)*6,m=g-2,_=0;_<m;_+=2){var S=(y+_)%m+2;c[_+2]=s[S]-u[0],c[_+3]=s[S+1]-u[1]}c[0]=s[y]-u[0],c[1]=s[y+1]-u[1];for(var x=n/e,b=-n/2;b<=n/2;b+=x){for(var w=Math.sin(b),C=Math.cos(b),T=0,_=0;_<s.length;_+=2){var A=c[_],M=c[_+1],I=l[_]-f[0],L=l[_+1]-f[1],P=I*C-L*w,E=I*w+L*C;p[_]=P,p[_+1]=E;var k=P-A,z=E-M;T+=k*k+z*z}if(T<d){d=T,v=b;for(var O=0;O<p.length;O++)h[O]=p[O]}}a.push({from:c,to:h,fromCp:u,toCp:f,rotation:-v})}return a}function kv(r){return r.__isCombineMorphing}var wO="__mOriginal_";function Ov(r,t,e){var n=wO+t,a=r[n]||r[t];r[n]||(r[n]=r[t]);var i=e.replace,o=e.after,s=e.before;r[t]=function(){var l=arguments,u;return s&&s.apply(this,l),i?u=i.apply(this,l):u=a.apply(this,l),o&&o.apply(this,l),u}}function Wu(r,t){var e=wO+t;r[e]&&(r[t]=r[e],r[e]=null)}function JD(r,t){for(var e=0;e<r.length;e++)for(var n=r[e],a=0;a<n.length;){var i=n[a],o=n[a+1];n[a++]=t[0]*i+t[2]*o+t[4],n[a++]=t[1]*i+t[3]*o+t[5]}}function TO(r,t){var e=r.getUpdatedPathProxy(),n=t.getUpdatedPathProxy(),a=rtt(A0(e),A0(n)),i=a[0],o=a[1],s=r.getComputedTransform(),l=t.getComputedTransform();function u(){this.transform=null}s&&JD(i,s),l&&JD(o,l),Ov(t,"updateTransform",{replace:u}),t.transform=null;var f=itt(i,o,10,Math.PI),c=[];Ov(t,"buildPath",{replace:function(h){for(var v=t.__morphT,d=1-v,p=[],g=0;g<f.length;g++){var y=f[g],m=y.from,_=y.to,S=y.rotation*v,x=y.fromCp,b=y.toCp,w=Math.sin(S),C=Math.cos(S);dh(p,x,b,v);for(var T=0;T<m.length;T+=2){var A=m[T],M=m[T+1],I=_[T],L=_[T+1],P=A*d+I*v,E=M*d+L*v;c[T]=P*C-E*w+p[0],c[T+1]=P*w+E*C+p[1]}var k=c[0],z=c[1];h.moveTo(k,z);for(var T=2;T<m.length;){var I=c[T++],L=c[T++],O=c[T++],B=c[T++],H=c[T++],Z=c[T++];k===I&&z===L&&O===H&&B===Z?h.lineTo(H,Z):h.bezierCurveTo(I,L,O,B,H,Z),k=H,z=Z}}}})}function eS(r,t,e){if(!r||!t)return t;var n=e.done,a=e.during;TO(r,t),t.__morphT=0;function i(){Wu(t,"buildPath"),Wu(t,"updateTransform"),t.__morphT=-1,t.createPathProxy(),t.dirtyShape()}return t.animateTo({__morphT:1},pt({during:function(o){t.dirtyShape(),a&&a(o)},done:function(){i(),n&&n()}},e)),t}function ott(r,t,e,n,a,i){var o=16;r=a===e?0:Math.round(32767*(r-e)/(a-e)),t=i===n?0:Math.round(32767*(t-n)/(i-n));for(var s=0,l,u=(1<<o)/2;u>0;u/=2){var f=0,c=0;(r&u)>0&&(f=1),(t&u)>0&&(c=1),s+=u*u*(3*f^c),c===0&&(f===1&&(r=u-1-r,t=u-1-t),l=r,r=t,t=l)}return s}function Nv(r){var t=1/0,e=1/0,n=-1/0,a=-1/0,i=K(r,function(s){var l=s.getBoundingRect(),u=s.getComputedTransform(),f=l.x+l.width/2+(u?u[4]:0),c=l.y+l.height/2+(u?u[5]:0);return t=Math.min(f,t),e=Math.min(c,e),n=Math.max(f,n),a=Math.max(c,a),[f,c]}),o=K(i,function(s,l){return{cp:s,z:ott(s[0],s[1],t,e,n,a),path:r[l]}});return o.sort(function(s,l){return s.z-l.z}).map(function(s){return s.path})}function CO(r){return ttt(r.path,r.count)}function M0(){return{fromIndividuals:[],toIndividuals:[],count:0}}function stt(r,t,e){var n=[];function a(x){for(var b=0;b<x.length;b++){var w=x[b];kv(w)?a(w.childrenRef()):w instanceof Ot&&n.push(w)}}a(r);var i=n.length;if(!i)return M0();var o=e.dividePath||CO,s=o({path:t,count:i});if(s.length!==i)return console.error("Invalid morphing: unmatched splitted path"),M0();n=Nv(n),s=Nv(s);for(var l=e.done,u=e.during,f=e.individualDelay,c=new ga,h=0;h<i;h++){var v=n[h],d=s[h];d.parent=t,d.copyTransform(c),f||TO(v,d)}t.__isCombineMorphing=!0,t.childrenRef=function(){return s};function p(x){for(var b=0;b<s.length;b++)s[b].addSelfToZr(x)}Ov(t,"addSelfToZr",{after:function(x){p(x)}}),Ov(t,"removeSelfFromZr",{after:function(x){for(var b=0;b<s.length;b++)s[b].removeSelfFromZr(x)}});function g(){t.__isCombineMorphing=!1,t.__morphT=-1,t.childrenRef=null,Wu(t,"addSelfToZr"),Wu(t,"removeSelfFromZr")}var y=s.length;if(f)for(var m=y,_=function(){m--,m===0&&(g(),l&&l())},h=0;h<y;h++){var S=f?pt({delay:(e.delay||0)+f(h,y,n[h],s[h]),done:_},e):e;eS(n[h],s[h],S)}else t.__morphT=0,t.animateTo({__morphT:1},pt({during:function(x){for(var b=0;b<y;b++){var w=s[b];w.__morphT=t.__morphT,w.dirtyShape()}u&&u(x)},done:function(){g();for(var x=0;x<r.length;x++)Wu(r[x],"updateTransform");l&&l()}},e));return t.__zr&&p(t.__zr),{fromIndividuals:n,toIndividuals:s,count:y}}function ltt(r,t,e){var n=t.length,a=[],i=e.dividePath||CO;function o(v){for(var d=0;d<v.length;d++){var p=v[d];kv(p)?o(p.childrenRef()):p instanceof Ot&&a.push(p)}}if(kv(r)){o(r.childrenRef());var s=a.length;if(s<n)for(var l=0,u=s;u<n;u++)a.push(m_(a[l++%s]));a.length=n}else{a=i({path:r,count:n});for(var f=r.getComputedTransform(),u=0;u<a.length;u++)a[u].setLocalTransform(f);if(a.length!==n)return console.error("Invalid morphing: unmatched splitted path"),M0()}a=Nv(a),t=Nv(t);for(var c=e.individualDelay,u=0;u<n;u++){var h=c?pt({delay:(e.delay||0)+c(u,n,a[u],t[u])},e):e;eS(a[u],t[u],h)}return{fromIndividuals:a,toIndividuals:t,count:t.length}}function QD(r){return X(r[0])}function tM(r,t){for(var e=[],n=r.length,a=0;a<n;a++)e.push({one:r[a],many:[]});for(var a=0;a<t.length;a++){var i=t[a].length,o=void 0;for(o=0;o<i;o++)e[o%n].many.push(t[a][o])}for(var s=0,a=n-1;a>=0;a--)if(!e[a].many.length){var l=e[s].many;if(l.length<=1)if(s)s=0;else return e;var i=l.length,u=Math.ceil(i/2);e[a].many=l.slice(u,i),e[s].many=l.slice(0,u),s++}return e}var utt={clone:function(r){for(var t=[],e=1-Math.pow(1-r.path.style.opacity,1/r.count),n=0;n<r.count;n++){var a=m_(r.path);a.setStyle("opacity",e),t.push(a)}return t},split:null};function Sy(r,t,e,n,a,i){if(!r.length||!t.length)return;var o=dl("update",n,a);if(!(o&&o.duration>0))return;var s=n.getModel("universalTransition").get("delay"),l=Object.assign({setToFinal:!0},o),u,f;QD(r)&&(u=r,f=t),QD(t)&&(u=t,f=r);function c(y,m,_,S,x){var b=y.many,w=y.one;if(b.length===1&&!x){var C=m?b[0]:w,T=m?w:b[0];if(kv(C))c({many:[C],one:T},!0,_,S,!0);else{var A=s?pt({delay:s(_,S)},l):l;eS(C,T,A),i(C,T,C,T,A)}}else for(var M=pt({dividePath:utt[e],individualDelay:s&&function(z,O,B,H){return s(z+_,S)}},l),I=m?stt(b,w,M):ltt(w,b,M),L=I.fromIndividuals,P=I.toIndividuals,E=L.length,k=0;k<E;k++){var A=s?pt({delay:s(k,E)},l):l;i(L[k],P[k],m?b[k]:y.one,m?y.one:b[k],A)}}for(var h=u?u===r:r.length>t.length,v=u?tM(f,u):tM(h?t:r,[h?r:t]),d=0,p=0;p<v.length;p++)d+=v[p].many.length;for(var g=0,p=0;p<v.length;p++)c(v[p],h,g,d),g+=v[p].many.length}function ho(r){if(!r)return[];if(X(r)){for(var t=[],e=0;e<r.length;e++)t.push(ho(r[e]));return t}var n=[];return r.traverse(function(a){a instanceof Ot&&!a.disableMorphing&&!a.invisible&&!a.ignore&&n.push(a)}),n}var AO=1e4,ftt=0,eM=1,rM=2,ctt=Wt();function htt(r,t){for(var e=r.dimensions,n=0;n<e.length;n++){var a=r.getDimensionInfo(e[n]);if(a&&a.otherDims[t]===0)return e[n]}}function vtt(r,t,e){var n=r.getDimensionInfo(e),a=n&&n.ordinalMeta;if(n){var i=r.get(n.name,t);return a&&a.categories[i]||i+""}}function nM(r,t,e,n){var a=n?"itemChildGroupId":"itemGroupId",i=htt(r,a);if(i){var o=vtt(r,t,i);return o}var s=r.getRawDataItem(t),l=n?"childGroupId":"groupId";if(s&&s[l])return s[l]+"";if(!n)return e||r.getId(t)}function aM(r){var t=[];return D(r,function(e){var n=e.data,a=e.dataGroupId;if(!(n.count()>AO))for(var i=n.getIndices(),o=0;o<i.length;o++)t.push({data:n,groupId:nM(n,o,a,!1),childGroupId:nM(n,o,a,!0),divide:e.divide,dataIndex:o})}),t}function xy(r,t,e){r.traverse(function(n){n instanceof Ot&&he(n,{style:{opacity:0}},t,{dataIndex:e,isFrom:!0})})}function by(r){if(r.parent){var t=r.getComputedTransform();r.setLocalTransform(t),r.parent.remove(r)}}function As(r){r.stopAnimation(),r.isGroup&&r.traverse(function(t){t.stopAnimation()})}function dtt(r,t,e){var n=dl("update",e,t);n&&r.traverse(function(a){if(a instanceof tn){var i=sG(a);i&&a.animateFrom({style:i},n)}})}function ptt(r,t){var e=r.length;if(e!==t.length)return!1;for(var n=0;n<e;n++){var a=r[n],i=t[n];if(a.data.getId(a.dataIndex)!==i.data.getId(i.dataIndex))return!1}return!0}function DO(r,t,e){var n=aM(r),a=aM(t);function i(_,S,x,b,w){(x||_)&&S.animateFrom({style:x&&x!==_?W(W({},x.style),_.style):_.style},w)}var o=!1,s=ftt,l=ct(),u=ct();n.forEach(function(_){_.groupId&&l.set(_.groupId,!0),_.childGroupId&&u.set(_.childGroupId,!0)});for(var f=0;f<a.length;f++){var c=a[f].groupId;if(u.get(c)){s=eM;break}var h=a[f].childGroupId;if(h&&l.get(h)){s=rM;break}}function v(_,S){return function(x){var b=x.data,w=x.dataIndex;return S?b.getId(w):_?s===eM?x.childGroupId:x.groupId:s===rM?x.childGroupId:x.groupId}}var d=ptt(n,a),p={};if(!d)for(var f=0;f<a.length;f++){var g=a[f],y=g.data.getItemGraphicEl(g.dataIndex);y&&(p[y.id]=!0)}function m(_,S){var x=n[S],b=a[_],w=b.data.hostModel,C=x.data.getItemGraphicEl(x.dataIndex),T=b.data.getItemGraphicEl(b.dataIndex);if(C===T){T&&dtt(T,b.dataIndex,w);return}C&&p[C.id]||T&&(As(T),C?(As(C),by(C),o=!0,Sy(ho(C),ho(T),b.divide,w,_,i)):xy(T,w,_))}new Da(n,a,v(!0,d),v(!1,d),null,"multiple").update(m).updateManyToOne(function(_,S){var x=a[_],b=x.data,w=b.hostModel,C=b.getItemGraphicEl(x.dataIndex),T=Zt(K(S,function(A){return n[A].data.getItemGraphicEl(n[A].dataIndex)}),function(A){return A&&A!==C&&!p[A.id]});C&&(As(C),T.length?(D(T,function(A){As(A),by(A)}),o=!0,Sy(ho(T),ho(C),x.divide,w,_,i)):xy(C,w,x.dataIndex))}).updateOneToMany(function(_,S){var x=n[S],b=x.data.getItemGraphicEl(x.dataIndex);if(!(b&&p[b.id])){var w=Zt(K(_,function(T){return a[T].data.getItemGraphicEl(a[T].dataIndex)}),function(T){return T&&T!==b}),C=a[_[0]].data.hostModel;w.length&&(D(w,function(T){return As(T)}),b?(As(b),by(b),o=!0,Sy(ho(b),ho(w),x.divide,C,_[0],i)):D(w,function(T){return xy(T,C,_[0])}))}}).updateManyToMany(function(_,S){new Da(S,_,function(x){return n[x].data.getId(n[x].dataIndex)},function(x){return a[x].data.getId(a[x].dataIndex)}).update(function(x,b){m(_[x],S[b])}).execute()}).execute(),o&&D(t,function(_){var S=_.data,x=S.hostModel,b=x&&e.getViewOfSeriesModel(x),w=dl("update",x,0);b&&x.isAnimationEnabled()&&w&&w.duration>0&&b.group.traverse(function(C){C instanceof Ot&&!C.animators.length&&C.animateFrom({style:{opacity:0}},w)})})}function iM(r){var t=r.getModel("universalTransition").get("seriesKey");return t||r.id}function oM(r){return X(r)?r.sort().join(","):r}function ti(r){if(r.hostModel)return r.hostModel.getModel("universalTransition").get("divideShape")}function gtt(r,t){var e=ct(),n=ct(),a=ct();return D(r.oldSeries,function(i,o){var s=r.oldDataGroupIds[o],l=r.oldData[o],u=iM(i),f=oM(u);n.set(f,{dataGroupId:s,data:l}),X(u)&&D(u,function(c){a.set(c,{key:f,dataGroupId:s,data:l})})}),D(t.updatedSeries,function(i){if(i.isUniversalTransitionEnabled()&&i.isAnimationEnabled()){var o=i.get("dataGroupId"),s=i.getData(),l=iM(i),u=oM(l),f=n.get(u);if(f)e.set(u,{oldSeries:[{dataGroupId:f.dataGroupId,divide:ti(f.data),data:f.data}],newSeries:[{dataGroupId:o,divide:ti(s),data:s}]});else if(X(l)){var c=[];D(l,function(d){var p=n.get(d);p.data&&c.push({dataGroupId:p.dataGroupId,divide:ti(p.data),data:p.data})}),c.length&&e.set(u,{oldSeries:c,newSeries:[{dataGroupId:o,data:s,divide:ti(s)}]})}else{var h=a.get(l);if(h){var v=e.get(h.key);v||(v={oldSeries:[{dataGroupId:h.dataGroupId,data:h.data,divide:ti(h.data)}],newSeries:[]},e.set(h.key,v)),v.newSeries.push({dataGroupId:o,data:s,divide:ti(s)})}}}}),e}function sM(r,t){for(var e=0;e<r.length;e++){var n=t.seriesIndex!=null&&t.seriesIndex===r[e].seriesIndex||t.seriesId!=null&&t.seriesId===r[e].id;if(n)return e}}function ytt(r,t,e,n){var a=[],i=[];D(te(r.from),function(o){var s=sM(t.oldSeries,o);s>=0&&a.push({dataGroupId:t.oldDataGroupIds[s],data:t.oldData[s],divide:ti(t.oldData[s]),groupIdDim:o.dimension})}),D(te(r.to),function(o){var s=sM(e.updatedSeries,o);if(s>=0){var l=e.updatedSeries[s].getData();i.push({dataGroupId:t.oldDataGroupIds[s],data:l,divide:ti(l),groupIdDim:o.dimension})}}),a.length>0&&i.length>0&&DO(a,i,n)}function mtt(r){r.registerUpdateLifecycle("series:beforeupdate",function(t,e,n){D(te(n.seriesTransition),function(a){D(te(a.to),function(i){for(var o=n.updatedSeries,s=0;s<o.length;s++)(i.seriesIndex!=null&&i.seriesIndex===o[s].seriesIndex||i.seriesId!=null&&i.seriesId===o[s].id)&&(o[s][Ah]=!0)})})}),r.registerUpdateLifecycle("series:transition",function(t,e,n){var a=ctt(e);if(a.oldSeries&&n.updatedSeries&&n.optionChanged){var i=n.seriesTransition;if(i)D(te(i),function(v){ytt(v,a,n,e)});else{var o=gtt(a,n);D(o.keys(),function(v){var d=o.get(v);DO(d.oldSeries,d.newSeries,e)})}D(n.updatedSeries,function(v){v[Ah]&&(v[Ah]=!1)})}for(var s=t.getSeries(),l=a.oldSeries=[],u=a.oldDataGroupIds=[],f=a.oldData=[],c=0;c<s.length;c++){var h=s[c].getData();h.count()<AO&&(l.push(s[c]),u.push(s[c].get("dataGroupId")),f.push(h))}})}kt([M6]);kt([w6]);kt([Z6,uU,_U,JU,u8,q8,w7,o9,M9,k9,W9,VY,lX,_X,OX,zX,qX,rZ,vZ,_Z,IZ,hq]);kt(Pq);kt(nK);kt(CE);kt(gK);kt(fk);kt(SK);kt(IK);kt(gj);kt(Oj);kt(Qf);kt(Jj);kt(eJ);kt(cJ);kt(mJ);kt(TJ);kt(LJ);kt(FJ);kt(aQ);kt(vO);kt(dO);kt(TQ);kt(_O);kt(SO);kt(IQ);kt(HQ);kt(UQ);kt(mtt);kt(W$);const _tt={class:"api-calls-chart-container"},lM=30,Stt=1e4,xtt={__name:"ApiCallsChart",setup(r){const t=Sn(),e=St(null);let n=null;const a=St({timestamps:[],apiCalls:[],tokens:[]});let i=null;function o(){if(!e.value)return;n=hW(e.value);const u=t.isDarkMode,f=u?"#e0e0e0":"#666",c=u?"#555":"#ccc",h={title:{text:"API实时调用统计",left:"center",textStyle:{color:f}},tooltip:{trigger:"axis",axisPointer:{type:"cross",label:{backgroundColor:"#6a7985"}}},legend:{data:["API调用次数","Token使用量"],top:30,textStyle:{color:f}},grid:{left:"3%",right:"4%",bottom:"3%",containLabel:!0},xAxis:{type:"category",boundaryGap:!1,data:a.value.timestamps,axisLabel:{rotate:45,color:f},axisLine:{lineStyle:{color:c}},splitLine:{lineStyle:{color:u?"rgba(255,255,255,0.1)":"rgba(0,0,0,0.1)"}}},yAxis:[{type:"value",name:"API调用次数",position:"left",axisLine:{show:!0,lineStyle:{color:"#5470c6"}},axisLabel:{formatter:"{value}",color:f},splitLine:{lineStyle:{color:u?"rgba(255,255,255,0.1)":"rgba(0,0,0,0.1)"}}},{type:"value",name:"Token使用量",position:"right",axisLine:{show:!0,lineStyle:{color:"#91cc75"}},axisLabel:{formatter:"{value}",color:f},splitLine:{lineStyle:{color:u?"rgba(255,255,255,0.1)":"rgba(0,0,0,0.1)"}}}],series:[{name:"API调用次数",type:"line",smooth:!0,data:a.value.apiCalls,itemStyle:{color:"#5470c6"},areaStyle:{color:new $o(0,0,0,1,[{offset:0,color:"rgba(84, 112, 198, 0.5)"},{offset:1,color:"rgba(84, 112, 198, 0.1)"}])}},{name:"Token使用量",type:"line",yAxisIndex:1,smooth:!0,data:a.value.tokens,itemStyle:{color:"#91cc75"},areaStyle:{color:new $o(0,0,0,1,[{offset:0,color:"rgba(145, 204, 117, 0.5)"},{offset:1,color:"rgba(145, 204, 117, 0.1)"}])}}]};n.setOption(h),window.addEventListener("resize",()=>{n&&n.resize()})}function s(){a.value.timestamps=[],a.value.apiCalls=[],a.value.tokens=[];const f=new Date().toLocaleTimeString("zh-CN",{hour:"2-digit",minute:"2-digit",second:"2-digit"});if(t.timeSeriesData.calls.length>0&&t.timeSeriesData.tokens.length>0)a.value.timestamps=t.timeSeriesData.calls.map(c=>c.time),a.value.apiCalls=t.timeSeriesData.calls.map(c=>c.value),a.value.tokens=t.timeSeriesData.tokens.map(c=>c.value);else{const c=t.status.minuteCalls,h=l();a.value.timestamps.push(f),a.value.apiCalls.push(c),a.value.tokens.push(h)}if(a.value.timestamps.length>lM){const c=a.value.timestamps.length-lM;a.value.timestamps.splice(0,c),a.value.apiCalls.splice(0,c),a.value.tokens.splice(0,c)}n&&n.setOption({xAxis:{data:a.value.timestamps},series:[{data:a.value.apiCalls},{data:a.value.tokens}]})}function l(){let u=0;return t.apiKeyStats.length>0&&(u=t.apiKeyStats.reduce((f,c)=>{const h=Object.values(c.model_stats||{}).reduce((v,d)=>v+(d.tokens||0),0);return f+h/100},0)),Math.round(u)}return Un(()=>t.isDarkMode,u=>{n&&(n.dispose(),qs(()=>{o(),a.value.timestamps.length>0&&n.setOption({xAxis:{data:a.value.timestamps},series:[{data:a.value.apiCalls},{data:a.value.tokens}]})}))},{immediate:!1}),Pf(()=>{o(),s(),i=setInterval(()=>{t.fetchDashboardData().then(()=>{s()})},Stt)}),Yv(()=>{i&&(clearInterval(i),i=null),n&&(n.dispose(),n=null),window.removeEventListener("resize",()=>{n&&n.resize()})}),(u,f)=>(wt(),Ct("div",_tt,[V("div",{ref_key:"chartContainer",ref:e,class:"chart-container"},null,512)]))}},uM=ea(xtt,[["__scopeId","data-v-d9262b8e"]]),btt={key:0,class:"api-key-stats-container"},wtt={class:"header-section"},Ttt={key:0,class:"api-key-input-form"},Ctt={class:"form-group"},Att=["disabled"],Dtt={class:"form-group"},Mtt=["disabled"],Itt={key:0,class:"api-key-error"},Ltt={key:1,class:"api-key-success"},Ptt={class:"form-actions"},Rtt=["disabled"],Ett={key:0},ktt={key:1},Ott=["disabled"],Ntt={key:0,class:"api-key-test-form"},Vtt={key:0,class:"testing-progress"},Btt={class:"progress-bar-container"},ztt={class:"progress-text"},Ftt={key:1,class:"form-group"},Gtt={key:2,class:"api-key-error"},Htt={key:3,class:"api-key-success"},Wtt={class:"form-actions"},$tt=["disabled"],Utt={key:0,class:"stats-grid"},Ytt={class:"stat-card"},Xtt={class:"stat-value"},Ztt={class:"stat-card"},qtt={class:"stat-value"},Ktt={class:"stat-card"},jtt={class:"stat-value"},Jtt={key:0,class:"fold-content"},Qtt={class:"stats-summary"},tet={class:"summary-item"},eet={class:"summary-value"},ret={class:"summary-item"},net={class:"summary-value"},aet={class:"summary-item"},iet={class:"summary-value"},oet={class:"api-key-stats-list"},set={key:0,class:"api-key-item"},uet={class:"api-key-header"},fet={class:"api-key-name"},cet={class:"api-key-usage"},het={class:"api-key-count"},vet={class:"api-key-limit"},det={class:"api-key-percent"},pet={class:"progress-container"},get={class:"total-tokens"},yet={class:"total-tokens-value"},met={key:0,class:"model-stats-container"},_et=["onClick"],xet={key:0,class:"model-stats-list fold-content"},bet={class:"model-info"},wet={class:"model-name"},Tet={class:"model-count"},Cet={class:"model-tokens"},Aet=["onClick"],Det={key:0,class:"pagination"},Met=["disabled"],Iet={class:"pagination-info"},Let=["disabled"],oh=20,Pet={__name:"ApiKeyStats",setup(r){const t=Sn(),e=St(!1),n=St({}),a=St(!1),i=St(""),o=St(""),s=St(""),l=St(""),u=St(!1),f=St(!1),c=St(""),h=St(""),v=St(""),d=St(!1),p=St(0),g=St(0),y=St(1);function m(){e.value=!e.value}function _(){f.value=!f.value,f.value||(c.value="",h.value="",v.value="")}function S(){a.value=!a.value,a.value||(i.value="",o.value="",s.value="",l.value="")}async function x(){if(s.value="",l.value="",!i.value.trim()){s.value="请输入API密钥";return}if(!o.value.trim()){s.value="请输入密码";return}const O=i.value.split(",").map(B=>B.trim()).filter(B=>B);if(O.length===0){s.value="请输入至少一个有效的API密钥";return}for(const B of O)if(B.length<10){s.value=`API密钥格式不正确: ${B}`;return}u.value=!0;try{await t.updateConfig("geminiApiKeys",i.value,o.value),l.value=`成功添加 ${O.length} 个API密钥`,i.value="",o.value="",await t.fetchDashboardData()}catch(B){s.value=B.message||"添加API密钥失败"}finally{u.value=!1}}async function b(){if(h.value="",v.value="",!c.value.trim()){h.value="请输入密码";return}d.value=!0,p.value=0;try{const O=await fetch("/api/test-api-keys",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({password:c.value})});if(!O.ok){const H=await O.json();throw new Error(H.detail||"测试API密钥失败")}const B=setInterval(async()=>{try{const Z=await(await fetch("/api/test-api-keys/progress")).json();p.value=Z.completed,g.value=Z.total,Z.is_completed&&(clearInterval(B),v.value=`检测完成！有效密钥: ${Z.valid} 个，无效密钥: ${Z.invalid} 个`,await t.fetchDashboardData(),d.value=!1,setTimeout(()=>{f.value&&(f.value=!1)},5e3))}catch(H){console.error("轮询进度时出错:",H)}},1e3)}catch(O){h.value=O.message||"测试API密钥失败",d.value=!1}}function w(O){n.value[O]?n.value[O]=!n.value[O]:n.value[O]=!0}const C=O=>O?"fold-icon rotated":"fold-icon",T=O=>O>75?"high":O>50?"medium":"low",A=O=>O?Object.entries(O).map(([B,H])=>({model:B,calls:H.calls,tokens:H.tokens})).sort((B,H)=>H.calls-B.calls):[],M=O=>O&&Object.keys(O).length>3,I=Fe(()=>t.apiKeyStats.length?Math.ceil(t.apiKeyStats.length/oh):0),L=Fe(()=>{if(!t.apiKeyStats.length)return[];const O=(y.value-1)*oh,B=O+oh;return t.apiKeyStats.slice(O,B)});function P(){y.value<I.value&&y.value++}function E(){y.value>1&&y.value--}const k=Fe(()=>t.apiKeyStats.reduce((O,B)=>O+B.calls_24h,0)),z=Fe(()=>t.apiKeyStats.reduce((O,B)=>O+B.total_tokens,0));return(O,B)=>fe(t).status.enableVertex?Jt("",!0):(wt(),Ct("div",btt,[V("div",wtt,[V("h3",{class:"section-title fold-header",onClick:m},[B[4]||(B[4]=Pr(" API调用统计 ")),V("span",{class:Be(C(e.value))},B[3]||(B[3]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("polyline",{points:"6 9 12 15 18 9"})],-1)]),2)]),V("div",{class:"header-buttons"},[V("button",{class:"add-api-key-button",onClick:S},B[5]||(B[5]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("line",{x1:"12",y1:"5",x2:"12",y2:"19"}),V("line",{x1:"5",y1:"12",x2:"19",y2:"12"})],-1),Pr(" 添加API密钥 ")])),V("button",{class:"test-api-key-button",onClick:_},B[6]||(B[6]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("path",{d:"M20.24 12.24a6 6 0 0 0-8.49-8.49L5 10.5V19h8.5z"}),V("line",{x1:"16",y1:"8",x2:"2",y2:"22"}),V("line",{x1:"17.5",y1:"15",x2:"9",y2:"15"})],-1),Pr(" 检测API密钥 ")]))])]),ie(iu,{name:"slide"},{default:Es(()=>[a.value?(wt(),Ct("div",Ttt,[V("div",Ctt,[B[7]||(B[7]=V("label",{for:"newApiKeys"},"API密钥 (以逗号分隔)",-1)),me(V("textarea",{id:"newApiKeys","onUpdate:modelValue":B[0]||(B[0]=H=>i.value=H),placeholder:"在此输入API密钥，多个密钥请用逗号分隔（注意：如果您使用的是云部署方案或您没有配置持久化，在此处配置的api密钥在重启后会丢失）",disabled:u.value,rows:"3",class:"api-key-textarea"},null,8,Att),[[Le,i.value]])]),V("div",Dtt,[B[8]||(B[8]=V("label",{for:"apiKeyPassword"},"密码",-1)),me(V("input",{id:"apiKeyPassword","onUpdate:modelValue":B[1]||(B[1]=H=>o.value=H),type:"password",placeholder:"请输入管理密码",disabled:u.value,class:"api-key-password"},null,8,Mtt),[[Le,o.value]])]),s.value?(wt(),Ct("div",Itt,bt(s.value),1)):Jt("",!0),l.value?(wt(),Ct("div",Ltt,bt(l.value),1)):Jt("",!0),V("div",Ptt,[V("button",{class:"submit-api-key",onClick:x,disabled:u.value},[u.value?(wt(),Ct("span",Ett,"提交中...")):(wt(),Ct("span",ktt,"提交"))],8,Rtt),V("button",{class:"cancel-api-key",onClick:S,disabled:u.value}," 取消 ",8,Ott)])])):Jt("",!0)]),_:1}),ie(iu,{name:"slide"},{default:Es(()=>[f.value?(wt(),Ct("div",Ntt,[B[10]||(B[10]=V("div",{class:"form-title"},[V("h4",null,"API密钥检测"),V("p",{class:"form-description"}," 此操作将同时检测所有有效和无效API密钥的状态，有效密钥将保存在GEMINI_API_KEYS中， 而无效密钥将移至INVALID_API_KEYS。该过程在后台异步进行，不会阻塞服务运行。 ")],-1)),d.value?(wt(),Ct("div",Vtt,[V("div",Btt,[V("div",{class:"progress-bar-fill",style:Zs({width:g.value?`${p.value/g.value*100}%`:"0%"})},null,4)]),V("div",ztt," 正在检测: "+bt(p.value)+" / "+bt(g.value)+" ("+bt(Math.round(p.value/(g.value||1)*100))+"%) ",1)])):(wt(),Ct("div",Ftt,[B[9]||(B[9]=V("label",{for:"apiKeyTestPassword"},"管理密码",-1)),me(V("input",{id:"apiKeyTestPassword","onUpdate:modelValue":B[2]||(B[2]=H=>c.value=H),type:"password",placeholder:"请输入管理密码以确认操作",class:"api-key-password"},null,512),[[Le,c.value]])])),h.value?(wt(),Ct("div",Gtt,bt(h.value),1)):Jt("",!0),v.value?(wt(),Ct("div",Htt,bt(v.value),1)):Jt("",!0),V("div",Wtt,[d.value?Jt("",!0):(wt(),Ct("button",{key:0,class:"submit-api-key",onClick:b}," 开始检测 ")),V("button",{class:"cancel-api-key",onClick:_,disabled:d.value},bt(d.value?"检测中...":"取消"),9,$tt)])])):Jt("",!0)]),_:1}),e.value?Jt("",!0):(wt(),Ct("div",Utt,[V("div",Ytt,[V("div",Xtt,bt(fe(t).status.last24hCalls),1),B[11]||(B[11]=V("div",{class:"stat-label"},"24小时调用次数",-1))]),V("div",Ztt,[V("div",qtt,bt(fe(t).status.hourlyCalls),1),B[12]||(B[12]=V("div",{class:"stat-label"},"小时调用次数",-1))]),V("div",Ktt,[V("div",jtt,bt(fe(t).status.minuteCalls),1),B[13]||(B[13]=V("div",{class:"stat-label"},"分钟调用次数",-1))])])),e.value?Jt("",!0):(wt(),W0(uM,{key:1})),ie(iu,{name:"fold"},{default:Es(()=>[e.value?(wt(),Ct("div",Jtt,[V("div",Qtt,[V("div",tet,[B[14]||(B[14]=V("div",{class:"summary-label"},"总调用次数",-1)),V("div",eet,bt(k.value.toLocaleString()),1)]),V("div",ret,[B[15]||(B[15]=V("div",{class:"summary-label"},"总Token使用量",-1)),V("div",net,bt(z.value.toLocaleString()),1)]),V("div",aet,[B[16]||(B[16]=V("div",{class:"summary-label"},"API密钥数量",-1)),V("div",iet,bt(fe(t).apiKeyStats.length),1)])]),ie(uM),V("div",oet,[fe(t).apiKeyStats.length?Jt("",!0):(wt(),Ct("div",set," 没有API密钥使用数据 ")),(wt(!0),Ct(Re,null,zh(L.value,(H,Z)=>(wt(),Ct("div",{key:Z,class:"api-key-item"},[V("div",uet,[V("div",fet,"API密钥: "+bt(H.api_key),1),V("div",cet,[V("span",het,bt(H.calls_24h),1),B[17]||(B[17]=Pr(" / ")),V("span",vet,bt(H.limit),1),V("span",det,"("+bt(H.usage_percent)+"%)",1)])]),V("div",pet,[V("div",{class:Be(["progress-bar",T(H.usage_percent)]),style:Zs({width:Math.min(H.usage_percent,100)+"%"})},null,6)]),V("div",get,[B[18]||(B[18]=V("span",{class:"total-tokens-label"},"总Token使用量:",-1)),V("span",yet,bt(H.total_tokens.toLocaleString()),1)]),H.model_stats&&Object.keys(H.model_stats).length>0?(wt(),Ct("div",met,[V("div",{class:"model-stats-header",onClick:Q=>w(H.api_key)},[B[20]||(B[20]=V("span",{class:"model-stats-title"},"模型使用统计",-1)),V("span",{class:Be(C(n.value[H.api_key]))},B[19]||(B[19]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("polyline",{points:"6 9 12 15 18 9"})],-1)]),2)],8,_et),ie(iu,{name:"fold"},{default:Es(()=>[n.value[H.api_key]?(wt(),Ct("div",xet,[(wt(!0),Ct(Re,null,zh(A(H.model_stats).slice(0,M(H.model_stats)&&!n.value[H.api_key]?3:void 0),(Q,ft)=>(wt(),Ct("div",{key:ft,class:"model-stat-item"},[V("div",bet,[V("div",wet,bt(Q.model),1),V("div",Tet,[V("span",null,bt(Q.calls),1),B[21]||(B[21]=V("span",{class:"model-usage-text"},"次调用",-1))]),V("div",Cet,bt(Q.tokens.toLocaleString())+" tokens",1)])]))),128)),M(H.model_stats)&&A(H.model_stats).length>3?(wt(),Ct("div",{key:0,class:"view-more-models",onClick:Q=>w(H.api_key)},bt(n.value[H.api_key]?"收起":"查看更多模型"),9,Aet)):Jt("",!0)])):Jt("",!0)]),_:2},1024)])):Jt("",!0)]))),128))]),fe(t).apiKeyStats.length>oh?(wt(),Ct("div",Det,[V("button",{class:"pagination-button",disabled:y.value===1,onClick:E}," 上一页 ",8,Met),V("div",Iet," 第 "+bt(y.value)+" 页 / 共 "+bt(I.value)+" 页 ",1),V("button",{class:"pagination-button",disabled:y.value===I.value,onClick:P}," 下一页 ",8,Let)])):Jt("",!0)])):Jt("",!0)]),_:1})]))}},Ret=ea(Pet,[["__scopeId","data-v-fbe5d972"]]),Eet={class:"info-box"},ket={class:"section-header"},Oet={key:0,class:"vertex-notice"},Net={key:1,class:"dialog-overlay"},Vet={class:"dialog"},Bet={key:0,class:"error-message"},zet={class:"dialog-buttons"},Fet=["disabled"],Get={__name:"StatusSection",setup(r){const t=Sn(),e=St(!1),n=St(""),a=St(""),i=St(!1);function o(){e.value=!0,n.value="",a.value=""}function s(){e.value=!1,n.value="",a.value=""}async function l(){if(!n.value){a.value="请输入密码";return}i.value=!0,a.value="";try{const u=await fetch("/api/reset-stats",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({password:n.value})}),f=await u.json();if(!u.ok)throw new Error(f.detail||"重置失败");await t.fetchDashboardData(),setTimeout(async()=>{try{await t.fetchDashboardData(),console.log("重置后数据已刷新")}catch(c){console.error("刷新数据失败:",c)}finally{s()}},1e3)}catch(u){console.error("重置失败:",u),a.value=u.message||"重置失败，请检查密码是否正确"}finally{i.value=!1}}return(u,f)=>(wt(),Ct("div",Eet,[V("div",ket,[f[2]||(f[2]=V("h2",{class:"section-title"},"🟢 运行状态",-1)),f[3]||(f[3]=V("div",{class:"status-container"},[V("p",{class:"status"},"服务运行中")],-1)),fe(t).status.enableVertex?Jt("",!0):(wt(),Ct("button",{key:0,class:"reset-button",onClick:o},f[1]||(f[1]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("path",{d:"M3 12a9 9 0 1 0 9-9 9.75 9.75 0 0 0-6.74 2.74L3 8"}),V("path",{d:"M3 3v5h5"})],-1),Pr(" 重置次数 ")])))]),fe(t).status.enableVertex?(wt(),Ct("div",Oet,f[4]||(f[4]=[V("div",{class:"notice-icon"},"ℹ️",-1),V("div",{class:"notice-content"},[V("h3",{class:"notice-title"},"Vertex 模式说明"),V("p",{class:"notice-text"},"当前项目处于 Vertex 模式，完全基于 gzzhongqi/vertex2openai 项目开发。目前处于初步适配阶段，统计功能正在逐步完善中。")],-1)]))):Jt("",!0),ie(x5),ie(Ret),e.value?(wt(),Ct("div",Net,[V("div",Vet,[f[5]||(f[5]=V("h3",null,"重置API调用统计",-1)),f[6]||(f[6]=V("p",null,"请输入密码以确认重置操作：",-1)),me(V("input",{type:"password","onUpdate:modelValue":f[0]||(f[0]=c=>n.value=c),placeholder:"请输入密码",onKeyup:DI(l,["enter"])},null,544),[[Le,n.value]]),a.value?(wt(),Ct("div",Bet,bt(a.value),1)):Jt("",!0),V("div",zet,[V("button",{class:"cancel-button",onClick:s},"取消"),V("button",{class:"confirm-button",onClick:l,disabled:i.value},bt(i.value?"重置中...":"确认重置"),9,Fet)])])])):Jt("",!0)]))}},Het=ea(Get,[["__scopeId","data-v-257ff3a7"]]),Wet={class:"basic-config"},$et={class:"config-form"},Uet={class:"config-row"},Yet={class:"config-group"},Xet={class:"config-group"},Zet={__name:"BasicConfig",setup(r,{expose:t}){const e=Sn(),n=Ii({maxRequestsPerMinute:0,maxRequestsPerDayPerIp:0}),a=St(!1);Un(()=>({storeMaxRequestsPerMinute:e.config.maxRequestsPerMinute,storeMaxRequestsPerDayPerIp:e.config.maxRequestsPerDayPerIp,configIsActuallyLoaded:e.isConfigLoaded}),o=>{o.configIsActuallyLoaded&&!a.value&&(n.maxRequestsPerMinute=o.storeMaxRequestsPerMinute,n.maxRequestsPerDayPerIp=o.storeMaxRequestsPerDayPerIp,a.value=!0)},{deep:!0,immediate:!0});async function i(o){if(!o)return{success:!1,message:"基本配置: 密码未提供"};let s=!0,l=[];const u=Object.keys(n);for(const f of u)if(n[f]!==e.config[f])try{await e.updateConfig(f,n[f],o),e.config[f]=n[f],l.push(`${f} 保存成功`)}catch(c){s=!1,l.push(`${f} 保存失败: ${c.message||"未知错误"}`)}return s&&l.length===0?{success:!0,message:"基本配置: 无更改需要保存"}:{success:s,message:`基本配置: ${l.join("; ")}`}}return t({saveComponentConfigs:i,localConfig:n}),(o,s)=>(wt(),Ct("div",Wet,[s[4]||(s[4]=V("h3",{class:"section-title"},"基本配置",-1)),V("div",$et,[V("div",Uet,[V("div",Yet,[s[2]||(s[2]=V("label",{class:"config-label"},"每分钟请求限制",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":s[0]||(s[0]=l=>n.maxRequestsPerMinute=l),min:"0"},null,512),[[Le,n.maxRequestsPerMinute,void 0,{number:!0}]])]),V("div",Xet,[s[3]||(s[3]=V("label",{class:"config-label"},"每IP每日请求限制",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":s[1]||(s[1]=l=>n.maxRequestsPerDayPerIp=l),min:"0"},null,512),[[Le,n.maxRequestsPerDayPerIp,void 0,{number:!0}]])])])])]))}},qet=ea(Zet,[["__scopeId","data-v-bf7ce7b9"]]),Ket={class:"features-config"},jet={class:"config-form"},Jet={class:"config-row"},Qet={class:"config-group"},trt={class:"toggle-wrapper"},ert={for:"searchMode",class:"toggle-label"},rrt={class:"toggle-text"},nrt={class:"config-group"},art={class:"toggle-wrapper"},irt={for:"fakeStreaming",class:"toggle-label"},ort={class:"toggle-text"},srt={class:"config-group"},lrt={class:"toggle-wrapper"},urt={for:"randomString",class:"toggle-label"},frt={class:"toggle-text"},crt={class:"config-row"},hrt={class:"config-group full-width"},vrt={class:"config-row"},drt={class:"config-group"},prt={class:"config-group"},grt={class:"config-group"},yrt={class:"config-row"},mrt={class:"config-group"},_rt={class:"config-group"},Srt={class:"config-group"},xrt={class:"config-row"},brt={class:"config-group"},wrt={__name:"FeaturesConfig",setup(r,{expose:t}){const e=Sn(),n=Ii({searchMode:!1,searchPrompt:"",maxRetryNum:0,fakeStreaming:!1,fakeStreamingInterval:0,randomString:!1,randomStringLength:0,concurrentRequests:1,increaseConcurrentOnFailure:0,maxConcurrentRequests:1,maxEmptyResponses:0}),a=St(!1);Un(()=>({storeSearchMode:e.config.searchMode,storeSearchPrompt:e.config.searchPrompt,storeMaxRetryNum:e.config.maxRetryNum,storeFakeStreaming:e.config.fakeStreaming,storeFakeStreamingInterval:e.config.fakeStreamingInterval,storeRandomString:e.config.randomString,storeRandomStringLength:e.config.randomStringLength,storeConcurrentRequests:e.config.concurrentRequests,storeIncreaseConcurrentOnFailure:e.config.increaseConcurrentOnFailure,storeMaxConcurrentRequests:e.config.maxConcurrentRequests,storeMaxEmptyResponses:e.config.maxEmptyResponses,configIsActuallyLoaded:e.isConfigLoaded}),s=>{s.configIsActuallyLoaded&&!a.value&&(n.searchMode=s.storeSearchMode,n.searchPrompt=s.storeSearchPrompt,n.maxRetryNum=s.storeMaxRetryNum,n.fakeStreaming=s.storeFakeStreaming,n.fakeStreamingInterval=s.storeFakeStreamingInterval,n.randomString=s.storeRandomString,n.randomStringLength=s.storeRandomStringLength,n.concurrentRequests=s.storeConcurrentRequests,n.increaseConcurrentOnFailure=s.storeIncreaseConcurrentOnFailure,n.maxConcurrentRequests=s.storeMaxConcurrentRequests,n.maxEmptyResponses=s.storeMaxEmptyResponses,a.value=!0)},{deep:!0,immediate:!0});async function i(s){if(!s)return{success:!1,message:"功能配置: 密码未提供"};let l=!0,u=[];const f=Object.keys(n);for(const c of f)if(n[c]!==e.config[c])try{await e.updateConfig(c,n[c],s),e.config[c]=n[c],u.push(`${c} 保存成功`)}catch(h){l=!1,u.push(`${c} 保存失败: ${h.message||"未知错误"}`)}return l&&u.length===0?{success:!0,message:"功能配置: 无更改需要保存"}:{success:l,message:`功能配置: ${u.join("; ")}`}}function o(s){return s?"启用":"禁用"}return t({saveComponentConfigs:i,localConfig:n}),(s,l)=>(wt(),Ct("div",Ket,[l[24]||(l[24]=V("h3",{class:"section-title"},"功能配置",-1)),V("div",jet,[V("div",Jet,[V("div",Qet,[l[11]||(l[11]=V("label",{class:"config-label"},"联网搜索",-1)),V("div",trt,[me(V("input",{type:"checkbox",class:"toggle",id:"searchMode","onUpdate:modelValue":l[0]||(l[0]=u=>n.searchMode=u)},null,512),[[Tu,n.searchMode]]),V("label",ert,[V("span",rrt,bt(o(n.searchMode)),1)])])]),V("div",nrt,[l[12]||(l[12]=V("label",{class:"config-label"},"假流式响应",-1)),V("div",art,[me(V("input",{type:"checkbox",class:"toggle",id:"fakeStreaming","onUpdate:modelValue":l[1]||(l[1]=u=>n.fakeStreaming=u)},null,512),[[Tu,n.fakeStreaming]]),V("label",irt,[V("span",ort,bt(o(n.fakeStreaming)),1)])])]),V("div",srt,[l[13]||(l[13]=V("label",{class:"config-label"},"伪装信息",-1)),V("div",lrt,[me(V("input",{type:"checkbox",class:"toggle",id:"randomString","onUpdate:modelValue":l[2]||(l[2]=u=>n.randomString=u)},null,512),[[Tu,n.randomString]]),V("label",urt,[V("span",frt,bt(o(n.randomString)),1)])])])]),V("div",crt,[V("div",hrt,[l[14]||(l[14]=V("label",{class:"config-label"},"联网搜索提示",-1)),me(V("input",{type:"text",class:"config-input","onUpdate:modelValue":l[3]||(l[3]=u=>n.searchPrompt=u),placeholder:"请输入联网搜索提示"},null,512),[[Le,n.searchPrompt]])])]),V("div",vrt,[V("div",drt,[l[15]||(l[15]=V("label",{class:"config-label"},"最大重试次数",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[4]||(l[4]=u=>n.maxRetryNum=u),min:"0"},null,512),[[Le,n.maxRetryNum,void 0,{number:!0}]])]),V("div",prt,[l[16]||(l[16]=V("label",{class:"config-label"},"假流式间隔(秒)",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[5]||(l[5]=u=>n.fakeStreamingInterval=u),min:"0",step:"0.1"},null,512),[[Le,n.fakeStreamingInterval,void 0,{number:!0}]])]),V("div",grt,[l[17]||(l[17]=V("label",{class:"config-label"},"伪装信息长度",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[6]||(l[6]=u=>n.randomStringLength=u),min:"0"},null,512),[[Le,n.randomStringLength,void 0,{number:!0}]])])]),V("div",yrt,[V("div",mrt,[l[18]||(l[18]=V("label",{class:"config-label"},"默认并发请求数",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[7]||(l[7]=u=>n.concurrentRequests=u),min:"1"},null,512),[[Le,n.concurrentRequests,void 0,{number:!0}]])]),V("div",_rt,[l[19]||(l[19]=V("label",{class:"config-label"},"失败时增加并发数",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[8]||(l[8]=u=>n.increaseConcurrentOnFailure=u),min:"0"},null,512),[[Le,n.increaseConcurrentOnFailure,void 0,{number:!0}]])]),V("div",Srt,[l[20]||(l[20]=V("label",{class:"config-label"},"最大并发请求数",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[9]||(l[9]=u=>n.maxConcurrentRequests=u),min:"1"},null,512),[[Le,n.maxConcurrentRequests,void 0,{number:!0}]])])]),V("div",xrt,[V("div",brt,[l[21]||(l[21]=V("label",{class:"config-label"},"空响应重试限制",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[10]||(l[10]=u=>n.maxEmptyResponses=u),min:"0"},null,512),[[Le,n.maxEmptyResponses,void 0,{number:!0}]])]),l[22]||(l[22]=V("div",{class:"config-group"},null,-1)),l[23]||(l[23]=V("div",{class:"config-group"},null,-1))])])]))}},Trt=ea(wrt,[["__scopeId","data-v-dc697ea9"]]),Crt={class:"stats-grid"},Art={class:"stat-card"},Drt={class:"stat-value"},Mrt={class:"stat-card"},Irt={class:"stat-value"},Lrt={class:"stat-card"},Prt={class:"update-status-container"},Rrt={key:0,class:"update-status"},Ert={key:1,class:"update-status"},krt={__name:"VersionInfo",setup(r){const t=Sn();return(e,n)=>(wt(),Ct("div",null,[n[5]||(n[5]=V("h3",{class:"section-title"},"版本信息",-1)),V("div",Crt,[V("div",Art,[V("div",Drt,bt(fe(t).config.localVersion),1),n[0]||(n[0]=V("div",{class:"stat-label"},"当前版本",-1))]),V("div",Mrt,[V("div",Irt,bt(fe(t).config.remoteVersion),1),n[1]||(n[1]=V("div",{class:"stat-label"},"最新版本",-1))]),V("div",Lrt,[V("div",Prt,[fe(t).config.hasUpdate?(wt(),Ct("div",Rrt,n[2]||(n[2]=[V("span",{class:"status-icon update-needed"},"⚠️",-1),V("span",{class:"status-text update-needed"},"需要更新",-1)]))):(wt(),Ct("div",Ert,n[3]||(n[3]=[V("span",{class:"status-icon up-to-date"},"✓",-1),V("span",{class:"status-text up-to-date"},"已是最新",-1)])))]),n[4]||(n[4]=V("div",{class:"stat-label"},"更新状态",-1))])]),n[6]||(n[6]=vV('<div class="project-link-container" data-v-e1a72b08><a href="https://github.com/wyeeeee/hajimi" target="_blank" rel="noopener noreferrer" class="project-link" data-v-e1a72b08><span class="github-icon" data-v-e1a72b08>🌸</span><span class="project-text" data-v-e1a72b08>项目地址：github.com/wyeeeee/hajimi</span><span class="github-icon" data-v-e1a72b08>🌸</span></a></div>',1))]))}},fM=ea(krt,[["__scopeId","data-v-e1a72b08"]]),Ort={class:"vertex-config"},Nrt={class:"config-form"},Vrt={class:"config-row"},Brt={class:"config-group"},zrt={class:"toggle-wrapper"},Frt={for:"fakeStreaming",class:"toggle-label"},Grt={class:"toggle-text"},Hrt={class:"config-group"},Wrt={class:"toggle-wrapper"},$rt={for:"enableVertexExpress",class:"toggle-label"},Urt={class:"toggle-text"},Yrt={class:"config-row"},Xrt={class:"config-group full-width"},Zrt={class:"config-row"},qrt={class:"config-group full-width"},Krt={class:"save-section"},jrt={class:"password-input"},Jrt=["disabled"],Qrt={key:0,class:"error-message"},tnt={key:1,class:"success-message"},ent={__name:"VertexConfig",setup(r){const t=Sn(),e=Ii({fakeStreaming:t.config.fakeStreaming,enableVertexExpress:t.config.enableVertexExpress,vertexExpressApiKey:t.config.vertexExpressApiKey||"",googleCredentialsJson:t.config.googleCredentialsJson||""}),n=St(""),a=St(""),i=St(""),o=St(!1);async function s(){if(!n.value){a.value="请输入密码";return}o.value=!0,a.value="",i.value="";try{if(e.googleCredentialsJson)try{const f=JSON.parse(e.googleCredentialsJson);e.googleCredentialsJson=JSON.stringify(f)}catch{a.value="请输入有效的 JSON 格式",o.value=!1;return}const u=Object.keys(e);for(const f of u)e[f]!==t.config[f]&&(await t.updateConfig(f,e[f],n.value),t.config[f]=e[f]);i.value="所有配置已保存"}catch(u){a.value=u.message||"保存失败"}finally{o.value=!1}}function l(u){return u?"启用":"禁用"}return(u,f)=>(wt(),Ct("div",Ort,[f[9]||(f[9]=V("h3",{class:"section-title"},"Vertex 配置",-1)),V("div",Nrt,[V("div",Vrt,[V("div",Brt,[f[5]||(f[5]=V("label",{class:"config-label"},"假流式响应",-1)),V("div",zrt,[me(V("input",{type:"checkbox",class:"toggle",id:"fakeStreaming","onUpdate:modelValue":f[0]||(f[0]=c=>e.fakeStreaming=c)},null,512),[[Tu,e.fakeStreaming]]),V("label",Frt,[V("span",Grt,bt(l(e.fakeStreaming)),1)])])]),V("div",Hrt,[f[6]||(f[6]=V("label",{class:"config-label"},"Vertex Express",-1)),V("div",Wrt,[me(V("input",{type:"checkbox",class:"toggle",id:"enableVertexExpress","onUpdate:modelValue":f[1]||(f[1]=c=>e.enableVertexExpress=c)},null,512),[[Tu,e.enableVertexExpress]]),V("label",$rt,[V("span",Urt,bt(l(e.enableVertexExpress)),1)])])])]),V("div",Yrt,[V("div",Xrt,[f[7]||(f[7]=V("label",{class:"config-label"},"Vertex Express API密钥",-1)),me(V("input",{type:"password",class:"config-input","onUpdate:modelValue":f[2]||(f[2]=c=>e.vertexExpressApiKey=c),placeholder:"请输入 Vertex Express API密钥"},null,512),[[Le,e.vertexExpressApiKey]])])]),V("div",Zrt,[V("div",qrt,[f[8]||(f[8]=V("label",{class:"config-label"},"Google Credentials JSON",-1)),me(V("textarea",{class:"config-input text-area","onUpdate:modelValue":f[3]||(f[3]=c=>e.googleCredentialsJson=c),placeholder:"请输入 Google Credentials JSON",rows:"6"},null,512),[[Le,e.googleCredentialsJson]])])]),V("div",Krt,[V("div",jrt,[me(V("input",{type:"password","onUpdate:modelValue":f[4]||(f[4]=c=>n.value=c),placeholder:"请输入管理密码",class:"config-input"},null,512),[[Le,n.value]])]),V("button",{class:"save-button",onClick:s,disabled:o.value},bt(o.value?"保存中...":"保存所有配置"),9,Jrt)]),a.value?(wt(),Ct("div",Qrt,bt(a.value),1)):Jt("",!0),i.value?(wt(),Ct("div",tnt,bt(i.value),1)):Jt("",!0)])]))}},rnt=ea(ent,[["__scopeId","data-v-09bf202e"]]),nnt={class:"info-box"},ant={key:0},int={key:1},ont={key:0,class:"stats-grid"},snt={class:"stat-card"},lnt={class:"stat-value"},unt={class:"stat-card"},fnt={class:"stat-value"},cnt={class:"stat-card"},hnt={class:"stat-value"},vnt={key:0,class:"fold-content"},dnt={class:"shared-save-section"},pnt={class:"password-input-group"},gnt=["disabled"],ynt={key:0,class:"overall-error-message"},mnt={key:1,class:"overall-success-message"},_nt={__name:"ConfigSection",setup(r){const t=Sn(),e=St(!0),n=St(null),a=St(null),i=St(""),o=St(""),s=St(""),l=St(!1);St(!1),St(""),St({x:0,y:0});const u=c=>c?"fold-icon rotated":"fold-icon";async function f(){if(!i.value){o.value="请输入管理密码",s.value="";return}l.value=!0,o.value="",s.value="";let c=[],h=[];try{if(n.value&&typeof n.value.saveComponentConfigs=="function"){const v=await n.value.saveComponentConfigs(i.value);v.success?h.push(v.message):c.push(v.message)}if(a.value&&typeof a.value.saveComponentConfigs=="function"){const v=await a.value.saveComponentConfigs(i.value);v.success?h.push(v.message):c.push(v.message)}c.length>0&&(o.value=c.join("; ")),h.length>0&&c.length===0?s.value="所有配置已成功保存: "+h.join("; "):h.length>0&&c.length>0&&(s.value="部分配置已保存: "+h.join("; ")+". 部分失败.")}catch(v){o.value=v.message||"保存过程中发生意外错误"}finally{l.value=!1}}return(c,h)=>(wt(),Ct("div",nnt,[fe(t).status.enableVertex?(wt(),Ct("div",ant,[ie(rnt),ie(fM)])):(wt(),Ct("div",int,[V("h3",{class:"section-title fold-header",onClick:h[0]||(h[0]=v=>e.value=!e.value)},[h[3]||(h[3]=Pr(" ⚙️ 环境配置 ")),V("span",{class:Be(u(e.value))},h[2]||(h[2]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("polyline",{points:"6 9 12 15 18 9"})],-1)]),2)]),e.value?Jt("",!0):(wt(),Ct("div",ont,[V("div",snt,[V("div",lnt,bt(fe(t).config.maxRequestsPerMinute),1),h[4]||(h[4]=V("div",{class:"stat-label"},"每分钟请求限制",-1))]),V("div",unt,[V("div",fnt,bt(fe(t).config.concurrentRequests),1),h[5]||(h[5]=V("div",{class:"stat-label"},"并发请求数",-1))]),V("div",cnt,[V("div",hnt,bt(fe(t).config.currentTime),1),h[6]||(h[6]=V("div",{class:"stat-label"},"当前服务器时间",-1))])])),ie(iu,{name:"fold"},{default:Es(()=>[e.value?(wt(),Ct("div",vnt,[ie(qet,{ref_key:"basicConfigRef",ref:n},null,512),ie(Trt,{ref_key:"featuresConfigRef",ref:a},null,512),V("div",dnt,[V("div",pnt,[h[7]||(h[7]=V("label",{for:"sharedPasswordInput",class:"shared-password-label"},"管理密码",-1)),me(V("input",{type:"password",id:"sharedPasswordInput","onUpdate:modelValue":h[1]||(h[1]=v=>i.value=v),placeholder:"请输入管理密码以保存更改",class:"config-input"},null,512),[[Le,i.value]])]),V("button",{class:"save-all-button",onClick:f,disabled:l.value},bt(l.value?"保存中...":"保存基本与功能配置"),9,gnt)]),o.value?(wt(),Ct("div",ynt,bt(o.value),1)):Jt("",!0),s.value?(wt(),Ct("div",mnt,bt(s.value),1)):Jt("",!0)])):Jt("",!0)]),_:1}),ie(fM)]))]))}},Snt=ea(_nt,[["__scopeId","data-v-d8cf8b0b"]]),xnt={class:"info-box"},bnt={class:"log-filter"},wnt=["onClick"],Tnt={class:"log-timestamp"},Cnt={class:"log-message"},Ant={__name:"LogSection",setup(r){const t=Sn(),e=St("ALL"),n=St(null),a=St(!0),i=St(!1);function o(f){e.value=f}function s(){n.value&&(n.value.scrollTop=n.value.scrollHeight)}function l(){if(!n.value)return!1;const f=n.value;return f.scrollHeight-f.scrollTop-f.clientHeight<50}function u(){i.value=!0}return Un(()=>t.logs,async()=>{await qs(),a.value?(s(),a.value=!1):l()&&s()},{deep:!0}),Pf(()=>{t.logs.length>0&&qs(()=>{s()}),n.value&&n.value.addEventListener("scroll",u)}),(f,c)=>(wt(),Ct("div",xnt,[c[0]||(c[0]=V("h2",{class:"section-title"},"📋 系统日志",-1)),V("div",bnt,[(wt(),Ct(Re,null,zh(["ALL","INFO","WARNING","ERROR"],h=>V("button",{key:h,class:Be({active:e.value===h}),onClick:v=>o(h)},bt(h==="ALL"?"全部":h==="INFO"?"信息":h==="WARNING"?"警告":"错误"),11,wnt)),64))]),V("div",{class:"log-container",ref_key:"logContainer",ref:n},[(wt(!0),Ct(Re,null,zh(fe(t).logs,(h,v)=>(wt(),Ct("div",{key:v,class:Be(["log-entry",h.level]),style:Zs({display:e.value==="ALL"||h.level===e.value?"block":"none"})},[V("span",Tnt,bt(h.timestamp),1),V("span",{class:Be(["log-level",h.level])},bt(h.level),3),V("span",Cnt,[h.key!=="N/A"?(wt(),Ct(Re,{key:0},[Pr("["+bt(h.key)+"]",1)],64)):Jt("",!0),h.request_type!=="N/A"?(wt(),Ct(Re,{key:1},[Pr(bt(h.request_type),1)],64)):Jt("",!0),h.model!=="N/A"?(wt(),Ct(Re,{key:2},[Pr("["+bt(h.model)+"]",1)],64)):Jt("",!0),h.status_code!=="N/A"?(wt(),Ct(Re,{key:3},[Pr(bt(h.status_code),1)],64)):Jt("",!0),Pr(" : "+bt(h.message)+" ",1),h.error_message?(wt(),Ct(Re,{key:4},[Pr(" - "+bt(h.error_message),1)],64)):Jt("",!0)])],6))),128))],512)]))}},Dnt=ea(Ant,[["__scopeId","data-v-d38f4a7d"]]),Mnt={class:"toggle-container"},Int={class:"sections-row"},Lnt={key:0,class:"password-dialog"},Pnt={class:"password-dialog-content"},Rnt={class:"password-input-container"},Ent={key:0,class:"password-error"},knt={__name:"DashboardView",setup(r){const t=Sn(),e=St(null),n=St(!1),a=St(0),i=St(!1),o=Fe(()=>t.isDarkMode),s=Fe(()=>t.config),l=St(!1),u=St(""),f=St("");Pf(()=>{v(),c(),setTimeout(()=>{n.value=!0;const _=()=>{a.value<10?(a.value++,setTimeout(_,100)):i.value=!0};setTimeout(_,50)},50)}),Yv(()=>{h()});function c(){e.value||(e.value=setInterval(v,1e3),console.log("自动刷新已启动"))}function h(){e.value&&(clearInterval(e.value),e.value=null,console.log("自动刷新已停止"))}async function v(){await t.fetchDashboardData()}function d(){v()}function p(){t.toggleDarkMode()}function g(){l.value=!0,u.value="",f.value=""}function y(){l.value=!1,u.value="",f.value=""}async function m(){if(!u.value){f.value="请输入密码";return}try{await t.updateConfig("enableVertex",!s.value.enableVertex,u.value),t.config.enableVertex=!s.value.enableVertex,y()}catch(_){f.value=_.message||"密码错误"}}return(_,S)=>(wt(),Ct("div",{class:Be(["dashboard",{"page-loaded":n.value}])},[V("div",{class:Be(["header-container",{"animate-in":a.value>=1||i.value}])},[S[1]||(S[1]=V("div",{class:"title-container"},[V("h1",null,[V("span",null,"🤖 Gemini API 代理服务")])],-1)),V("div",Mnt,[V("button",{class:Be(["vertex-button",{active:s.value.enableVertex}]),onClick:g},bt(s.value.enableVertex?"Vertex 开":"Vertex 关"),3),V("button",{class:Be(["theme-button",{active:o.value}]),onClick:p},bt(o.value?"🌙 夜间":"☀️ 日间"),3)])],2),V("div",Int,[ie(Het,{class:Be(["section-animate status-section",{"animate-in":a.value>=2||i.value}])},null,8,["class"]),ie(Snt,{class:Be(["section-animate config-section",{"animate-in":a.value>=3||i.value}])},null,8,["class"])]),ie(Dnt,{class:Be(["section-animate",{"animate-in":a.value>=4||i.value}])},null,8,["class"]),V("button",{class:Be(["refresh-button",{"animate-in":a.value>=5||i.value}]),onClick:d},"刷新数据",2),l.value?(wt(),Ct("div",Lnt,[V("div",Pnt,[S[2]||(S[2]=V("h3",null,"验证密码",-1)),V("p",null,"请输入密码以"+bt(s.value.enableVertex?"禁用":"启用")+" Vertex AI",1),V("div",Rnt,[me(V("input",{type:"password","onUpdate:modelValue":S[0]||(S[0]=x=>u.value=x),class:"password-input",placeholder:"请输入密码",onKeyup:DI(m,["enter"])},null,544),[[Le,u.value]]),f.value?(wt(),Ct("div",Ent,bt(f.value),1)):Jt("",!0)]),V("div",{class:"password-actions"},[V("button",{class:"cancel-btn",onClick:y},"取消"),V("button",{class:"confirm-btn",onClick:m},"确认")])])])):Jt("",!0)],2))}},Ont=f5({history:FB("/"),routes:[{path:"/",name:"dashboard",component:knt},{path:"/:pathMatch(.*)*",redirect:"/"}]}),rS=tB(h5);rS.use(nB());rS.use(Ont);rS.mount("#app");
+`||a==="")){var i=r.isSelected(a);ut(e,a)?e[a]=e[a]&&i:e[a]=i}}),e}function OJ(r){r.registerAction("legendToggleSelect","legendselectchanged",At(eu,"toggleSelected")),r.registerAction("legendAllSelect","legendselectall",At(eu,"allSelect")),r.registerAction("legendInverseSelect","legendinverseselect",At(eu,"inverseSelect")),r.registerAction("legendSelect","legendselected",At(eu,"select")),r.registerAction("legendUnSelect","legendunselected",At(eu,"unSelect"))}function cO(r){r.registerComponentModel(b0),r.registerComponentView(uO),r.registerProcessor(r.PRIORITY.PROCESSOR.SERIES_FILTER,kJ),r.registerSubTypeDefaulter("legend",function(){return"plain"}),OJ(r)}var NJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.setScrollDataIndex=function(e){this.option.scrollDataIndex=e},t.prototype.init=function(e,n,a){var i=ml(e);r.prototype.init.call(this,e,n,a),AD(this,e,i)},t.prototype.mergeOption=function(e,n){r.prototype.mergeOption.call(this,e,n),AD(this,this.option,e)},t.type="legend.scroll",t.defaultOption=Pi(b0.defaultOption,{scrollDataIndex:0,pageButtonItemGap:5,pageButtonGap:null,pageButtonPosition:"end",pageFormatter:"{current}/{total}",pageIcons:{horizontal:["M0,0L12,-10L12,10z","M0,0L-12,-10L-12,10z"],vertical:["M0,0L20,0L10,-20z","M0,0L20,0L10,20z"]},pageIconColor:"#2f4554",pageIconInactiveColor:"#aaa",pageIconSize:15,pageTextStyle:{color:"#333"},animationDurationUpdate:800}),t}(b0);function AD(r,t,e){var n=r.getOrient(),a=[1,1];a[n.index]=0,bi(t,e,{type:"box",ignoreSize:!!a})}var DD=_t,dy=["width","height"],py=["x","y"],VJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.newlineDisabled=!0,e._currentIndex=0,e}return t.prototype.init=function(){r.prototype.init.call(this),this.group.add(this._containerGroup=new DD),this._containerGroup.add(this.getContentGroup()),this.group.add(this._controllerGroup=new DD)},t.prototype.resetInner=function(){r.prototype.resetInner.call(this),this._controllerGroup.removeAll(),this._containerGroup.removeClipPath(),this._containerGroup.__rectSize=null},t.prototype.renderInner=function(e,n,a,i,o,s,l){var u=this;r.prototype.renderInner.call(this,e,n,a,i,o,s,l);var f=this._controllerGroup,c=n.get("pageIconSize",!0),h=X(c)?c:[c,c];d("pagePrev",0);var v=n.getModel("pageTextStyle");f.add(new $t({name:"pageText",style:{text:"xx/xx",fill:v.getTextColor(),font:v.getFont(),verticalAlign:"middle",align:"center"},silent:!0})),d("pageNext",1);function d(p,g){var y=p+"DataIndex",m=Ff(n.get("pageIcons",!0)[n.getOrient().name][g],{onclick:ot(u._pageGo,u,y,n,i)},{x:-h[0]/2,y:-h[1]/2,width:h[0],height:h[1]});m.name=p,f.add(m)}},t.prototype.layoutInner=function(e,n,a,i,o,s){var l=this.getSelectorGroup(),u=e.getOrient().index,f=dy[u],c=py[u],h=dy[1-u],v=py[1-u];o&&No("horizontal",l,e.get("selectorItemGap",!0));var d=e.get("selectorButtonGap",!0),p=l.getBoundingRect(),g=[-p.x,-p.y],y=yt(a);o&&(y[f]=a[f]-p[f]-d);var m=this._layoutContentAndController(e,i,y,u,f,h,v,c);if(o){if(s==="end")g[u]+=m[f]+d;else{var _=p[f]+d;g[u]-=_,m[c]-=_}m[f]+=p[f]+d,g[1-u]+=m[v]+m[h]/2-p[h]/2,m[h]=Math.max(m[h],p[h]),m[v]=Math.min(m[v],p[v]+g[1-u]),l.x=g[0],l.y=g[1],l.markRedraw()}return m},t.prototype._layoutContentAndController=function(e,n,a,i,o,s,l,u){var f=this.getContentGroup(),c=this._containerGroup,h=this._controllerGroup;No(e.get("orient"),f,e.get("itemGap"),i?a.width:null,i?null:a.height),No("horizontal",h,e.get("pageButtonItemGap",!0));var v=f.getBoundingRect(),d=h.getBoundingRect(),p=this._showController=v[o]>a[o],g=[-v.x,-v.y];n||(g[i]=f[u]);var y=[0,0],m=[-d.x,-d.y],_=Tt(e.get("pageButtonGap",!0),e.get("itemGap",!0));if(p){var S=e.get("pageButtonPosition",!0);S==="end"?m[i]+=a[o]-d[o]:y[i]+=d[o]+_}m[1-i]+=v[s]/2-d[s]/2,f.setPosition(g),c.setPosition(y),h.setPosition(m);var x={x:0,y:0};if(x[o]=p?a[o]:v[o],x[s]=Math.max(v[s],d[s]),x[l]=Math.min(0,d[l]+m[1-i]),c.__rectSize=a[o],p){var b={x:0,y:0};b[o]=Math.max(a[o]-d[o]-_,0),b[s]=x[s],c.setClipPath(new Ht({shape:b})),c.__rectSize=b[o]}else h.eachChild(function(C){C.attr({invisible:!0,silent:!0})});var w=this._getPageInfo(e);return w.pageIndex!=null&&Yt(f,{x:w.contentPosition[0],y:w.contentPosition[1]},p?e:null),this._updatePageInfoView(e,w),x},t.prototype._pageGo=function(e,n,a){var i=this._getPageInfo(n)[e];i!=null&&a.dispatchAction({type:"legendScroll",scrollDataIndex:i,legendId:n.id})},t.prototype._updatePageInfoView=function(e,n){var a=this._controllerGroup;D(["pagePrev","pageNext"],function(f){var c=f+"DataIndex",h=n[c]!=null,v=a.childOfName(f);v&&(v.setStyle("fill",h?e.get("pageIconColor",!0):e.get("pageIconInactiveColor",!0)),v.cursor=h?"pointer":"default")});var i=a.childOfName("pageText"),o=e.get("pageFormatter"),s=n.pageIndex,l=s!=null?s+1:0,u=n.pageCount;i&&o&&i.setStyle("text",it(o)?o.replace("{current}",l==null?"":l+"").replace("{total}",u==null?"":u+""):o({current:l,total:u}))},t.prototype._getPageInfo=function(e){var n=e.get("scrollDataIndex",!0),a=this.getContentGroup(),i=this._containerGroup.__rectSize,o=e.getOrient().index,s=dy[o],l=py[o],u=this._findTargetItemIndex(n),f=a.children(),c=f[u],h=f.length,v=h?1:0,d={contentPosition:[a.x,a.y],pageCount:v,pageIndex:v-1,pagePrevDataIndex:null,pageNextDataIndex:null};if(!c)return d;var p=S(c);d.contentPosition[o]=-p.s;for(var g=u+1,y=p,m=p,_=null;g<=h;++g)_=S(f[g]),(!_&&m.e>y.s+i||_&&!x(_,y.s))&&(m.i>y.i?y=m:y=_,y&&(d.pageNextDataIndex==null&&(d.pageNextDataIndex=y.i),++d.pageCount)),m=_;for(var g=u-1,y=p,m=p,_=null;g>=-1;--g)_=S(f[g]),(!_||!x(m,_.s))&&y.i<m.i&&(m=y,d.pagePrevDataIndex==null&&(d.pagePrevDataIndex=y.i),++d.pageCount,++d.pageIndex),y=_;return d;function S(b){if(b){var w=b.getBoundingRect(),C=w[l]+b[l];return{s:C,e:C+w[s],i:b.__legendDataIndex}}}function x(b,w){return b.e>=w&&b.s<=w+i}},t.prototype._findTargetItemIndex=function(e){if(!this._showController)return 0;var n,a=this.getContentGroup(),i;return a.eachChild(function(o,s){var l=o.__legendDataIndex;i==null&&l!=null&&(i=s),l===e&&(n=s)}),n??i},t.type="legend.scroll",t}(uO);function BJ(r){r.registerAction("legendScroll","legendscroll",function(t,e){var n=t.scrollDataIndex;n!=null&&e.eachComponent({mainType:"legend",subType:"scroll",query:t},function(a){a.setScrollDataIndex(n)})})}function zJ(r){kt(cO),r.registerComponentModel(NJ),r.registerComponentView(VJ),BJ(r)}function FJ(r){kt(cO),kt(zJ)}var GJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.type="dataZoom.inside",t.defaultOption=Pi(Af.defaultOption,{disabled:!1,zoomLock:!1,zoomOnMouseWheel:!0,moveOnMouseMove:!0,moveOnMouseWheel:!1,preventDefaultMouseMove:!0}),t}(Af),Q1=Wt();function HJ(r,t,e){Q1(r).coordSysRecordMap.each(function(n){var a=n.dataZoomInfoMap.get(t.uid);a&&(a.getRange=e)})}function WJ(r,t){for(var e=Q1(r).coordSysRecordMap,n=e.keys(),a=0;a<n.length;a++){var i=n[a],o=e.get(i),s=o.dataZoomInfoMap;if(s){var l=t.uid,u=s.get(l);u&&(s.removeKey(l),s.keys().length||hO(e,o))}}}function hO(r,t){if(t){r.removeKey(t.model.uid);var e=t.controller;e&&e.dispose()}}function $J(r,t){var e={model:t,containsPoint:At(YJ,t),dispatchAction:At(UJ,r),dataZoomInfoMap:null,controller:null},n=e.controller=new jf(r.getZr());return D(["pan","zoom","scrollMove"],function(a){n.on(a,function(i){var o=[];e.dataZoomInfoMap.each(function(s){if(i.isAvailableBehavior(s.model.option)){var l=(s.getRange||{})[a],u=l&&l(s.dzReferCoordSysInfo,e.model.mainType,e.controller,i);!s.model.get("disabled",!0)&&u&&o.push({dataZoomId:s.model.id,start:u[0],end:u[1]})}}),o.length&&e.dispatchAction(o)})}),e}function UJ(r,t){r.isDisposed()||r.dispatchAction({type:"dataZoom",animation:{easing:"cubicOut",duration:100},batch:t})}function YJ(r,t,e,n){return r.coordinateSystem.containPoint([e,n])}function XJ(r){var t,e="type_",n={type_true:2,type_move:1,type_false:0,type_undefined:-1},a=!0;return r.each(function(i){var o=i.model,s=o.get("disabled",!0)?!1:o.get("zoomLock",!0)?"move":!0;n[e+s]>n[e+t]&&(t=s),a=a&&o.get("preventDefaultMouseMove",!0)}),{controlType:t,opt:{zoomOnMouseWheel:!0,moveOnMouseMove:!0,moveOnMouseWheel:!0,preventDefaultMouseMove:!!a}}}function ZJ(r){r.registerProcessor(r.PRIORITY.PROCESSOR.FILTER,function(t,e){var n=Q1(e),a=n.coordSysRecordMap||(n.coordSysRecordMap=ct());a.each(function(i){i.dataZoomInfoMap=null}),t.eachComponent({mainType:"dataZoom",subType:"inside"},function(i){var o=Zk(i);D(o.infoList,function(s){var l=s.model.uid,u=a.get(l)||a.set(l,$J(e,s.model)),f=u.dataZoomInfoMap||(u.dataZoomInfoMap=ct());f.set(i.uid,{dzReferCoordSysInfo:s,model:i,getRange:null})})}),a.each(function(i){var o=i.controller,s,l=i.dataZoomInfoMap;if(l){var u=l.keys()[0];u!=null&&(s=l.get(u))}if(!s){hO(a,i);return}var f=XJ(l);o.enable(f.controlType,f.opt),o.setPointerChecker(i.containsPoint),xl(i,"dispatchAction",s.model.get("throttle",!0),"fixRate")})})}var qJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type="dataZoom.inside",e}return t.prototype.render=function(e,n,a){if(r.prototype.render.apply(this,arguments),e.noTarget()){this._clear();return}this.range=e.getPercentRange(),HJ(a,e,{pan:ot(gy.pan,this),zoom:ot(gy.zoom,this),scrollMove:ot(gy.scrollMove,this)})},t.prototype.dispose=function(){this._clear(),r.prototype.dispose.apply(this,arguments)},t.prototype._clear=function(){WJ(this.api,this.dataZoomModel),this.range=null},t.type="dataZoom.inside",t}($1),gy={zoom:function(r,t,e,n){var a=this.range,i=a.slice(),o=r.axisModels[0];if(o){var s=yy[t](null,[n.originX,n.originY],o,e,r),l=(s.signal>0?s.pixelStart+s.pixelLength-s.pixel:s.pixel-s.pixelStart)/s.pixelLength*(i[1]-i[0])+i[0],u=Math.max(1/n.scale,0);i[0]=(i[0]-l)*u+l,i[1]=(i[1]-l)*u+l;var f=this.dataZoomModel.findRepresentativeAxisProxy().getMinMaxSpan();if(rs(0,i,[0,100],0,f.minSpan,f.maxSpan),this.range=i,a[0]!==i[0]||a[1]!==i[1])return i}},pan:MD(function(r,t,e,n,a,i){var o=yy[n]([i.oldX,i.oldY],[i.newX,i.newY],t,a,e);return o.signal*(r[1]-r[0])*o.pixel/o.pixelLength}),scrollMove:MD(function(r,t,e,n,a,i){var o=yy[n]([0,0],[i.scrollDelta,i.scrollDelta],t,a,e);return o.signal*(r[1]-r[0])*i.scrollDelta})};function MD(r){return function(t,e,n,a){var i=this.range,o=i.slice(),s=t.axisModels[0];if(s){var l=r(o,s,t,e,n,a);if(rs(l,o,[0,100],"all"),this.range=o,i[0]!==o[0]||i[1]!==o[1])return o}}}var yy={grid:function(r,t,e,n,a){var i=e.axis,o={},s=a.model.coordinateSystem.getRect();return r=r||[0,0],i.dim==="x"?(o.pixel=t[0]-r[0],o.pixelLength=s.width,o.pixelStart=s.x,o.signal=i.inverse?1:-1):(o.pixel=t[1]-r[1],o.pixelLength=s.height,o.pixelStart=s.y,o.signal=i.inverse?-1:1),o},polar:function(r,t,e,n,a){var i=e.axis,o={},s=a.model.coordinateSystem,l=s.getRadiusAxis().getExtent(),u=s.getAngleAxis().getExtent();return r=r?s.pointToCoord(r):[0,0],t=s.pointToCoord(t),e.mainType==="radiusAxis"?(o.pixel=t[0]-r[0],o.pixelLength=l[1]-l[0],o.pixelStart=l[0],o.signal=i.inverse?1:-1):(o.pixel=t[1]-r[1],o.pixelLength=u[1]-u[0],o.pixelStart=u[0],o.signal=i.inverse?-1:1),o},singleAxis:function(r,t,e,n,a){var i=e.axis,o=a.model.coordinateSystem.getRect(),s={};return r=r||[0,0],i.orient==="horizontal"?(s.pixel=t[0]-r[0],s.pixelLength=o.width,s.pixelStart=o.x,s.signal=i.inverse?1:-1):(s.pixel=t[1]-r[1],s.pixelLength=o.height,s.pixelStart=o.y,s.signal=i.inverse?-1:1),s}};function vO(r){U1(r),r.registerComponentModel(GJ),r.registerComponentView(qJ),ZJ(r)}var KJ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.type="dataZoom.slider",t.layoutMode="box",t.defaultOption=Pi(Af.defaultOption,{show:!0,right:"ph",top:"ph",width:"ph",height:"ph",left:null,bottom:null,borderColor:"#d2dbee",borderRadius:3,backgroundColor:"rgba(47,69,84,0)",dataBackground:{lineStyle:{color:"#d2dbee",width:.5},areaStyle:{color:"#d2dbee",opacity:.2}},selectedDataBackground:{lineStyle:{color:"#8fb0f7",width:.5},areaStyle:{color:"#8fb0f7",opacity:.2}},fillerColor:"rgba(135,175,274,0.2)",handleIcon:"path://M-9.35,34.56V42m0-40V9.5m-2,0h4a2,2,0,0,1,2,2v21a2,2,0,0,1-2,2h-4a2,2,0,0,1-2-2v-21A2,2,0,0,1-11.35,9.5Z",handleSize:"100%",handleStyle:{color:"#fff",borderColor:"#ACB8D1"},moveHandleSize:7,moveHandleIcon:"path://M-320.9-50L-320.9-50c18.1,0,27.1,9,27.1,27.1V85.7c0,18.1-9,27.1-27.1,27.1l0,0c-18.1,0-27.1-9-27.1-27.1V-22.9C-348-41-339-50-320.9-50z M-212.3-50L-212.3-50c18.1,0,27.1,9,27.1,27.1V85.7c0,18.1-9,27.1-27.1,27.1l0,0c-18.1,0-27.1-9-27.1-27.1V-22.9C-239.4-41-230.4-50-212.3-50z M-103.7-50L-103.7-50c18.1,0,27.1,9,27.1,27.1V85.7c0,18.1-9,27.1-27.1,27.1l0,0c-18.1,0-27.1-9-27.1-27.1V-22.9C-130.9-41-121.8-50-103.7-50z",moveHandleStyle:{color:"#D2DBEE",opacity:.7},showDetail:!0,showDataShadow:"auto",realtime:!0,zoomLock:!1,textStyle:{color:"#6E7079"},brushSelect:!0,brushStyle:{color:"rgba(135,175,274,0.15)"},emphasis:{handleLabel:{show:!0},handleStyle:{borderColor:"#8FB0F7"},moveHandleStyle:{color:"#8FB0F7"}}}),t}(Af),ru=Ht,ID=7,jJ=1,my=30,JJ=7,nu="horizontal",LD="vertical",QJ=5,tQ=["line","bar","candlestick","scatter"],eQ={easing:"cubicOut",duration:100,delay:0},rQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e._displayables={},e}return t.prototype.init=function(e,n){this.api=n,this._onBrush=ot(this._onBrush,this),this._onBrushEnd=ot(this._onBrushEnd,this)},t.prototype.render=function(e,n,a,i){if(r.prototype.render.apply(this,arguments),xl(this,"_dispatchZoomAction",e.get("throttle"),"fixRate"),this._orient=e.getOrient(),e.get("show")===!1){this.group.removeAll();return}if(e.noTarget()){this._clear(),this.group.removeAll();return}(!i||i.type!=="dataZoom"||i.from!==this.uid)&&this._buildView(),this._updateView()},t.prototype.dispose=function(){this._clear(),r.prototype.dispose.apply(this,arguments)},t.prototype._clear=function(){vf(this,"_dispatchZoomAction");var e=this.api.getZr();e.off("mousemove",this._onBrush),e.off("mouseup",this._onBrushEnd)},t.prototype._buildView=function(){var e=this.group;e.removeAll(),this._brushing=!1,this._displayables.brushRect=null,this._resetLocation(),this._resetInterval();var n=this._displayables.sliderGroup=new _t;this._renderBackground(),this._renderHandle(),this._renderDataShadow(),e.add(n),this._positionGroup()},t.prototype._resetLocation=function(){var e=this.dataZoomModel,n=this.api,a=e.get("brushSelect"),i=a?JJ:0,o=this._findCoordRect(),s={width:n.getWidth(),height:n.getHeight()},l=this._orient===nu?{right:s.width-o.x-o.width,top:s.height-my-ID-i,width:o.width,height:my}:{right:ID,top:o.y,width:my,height:o.height},u=ml(e.option);D(["right","top","width","height"],function(c){u[c]==="ph"&&(u[c]=l[c])});var f=Ie(u,s);this._location={x:f.x,y:f.y},this._size=[f.width,f.height],this._orient===LD&&this._size.reverse()},t.prototype._positionGroup=function(){var e=this.group,n=this._location,a=this._orient,i=this.dataZoomModel.getFirstTargetAxisModel(),o=i&&i.get("inverse"),s=this._displayables.sliderGroup,l=(this._dataShadowInfo||{}).otherAxisInverse;s.attr(a===nu&&!o?{scaleY:l?1:-1,scaleX:1}:a===nu&&o?{scaleY:l?1:-1,scaleX:-1}:a===LD&&!o?{scaleY:l?-1:1,scaleX:1,rotation:Math.PI/2}:{scaleY:l?-1:1,scaleX:-1,rotation:Math.PI/2});var u=e.getBoundingRect([s]);e.x=n.x-u.x,e.y=n.y-u.y,e.markRedraw()},t.prototype._getViewExtent=function(){return[0,this._size[0]]},t.prototype._renderBackground=function(){var e=this.dataZoomModel,n=this._size,a=this._displayables.sliderGroup,i=e.get("brushSelect");a.add(new ru({silent:!0,shape:{x:0,y:0,width:n[0],height:n[1]},style:{fill:e.get("backgroundColor")},z2:-40}));var o=new ru({shape:{x:0,y:0,width:n[0],height:n[1]},style:{fill:"transparent"},z2:0,onclick:ot(this._onClickPanel,this)}),s=this.api.getZr();i?(o.on("mousedown",this._onBrushStart,this),o.cursor="crosshair",s.on("mousemove",this._onBrush),s.on("mouseup",this._onBrushEnd)):(s.off("mousemove",this._onBrush),s.off("mouseup",this._onBrushEnd)),a.add(o)},t.prototype._renderDataShadow=function(){var e=this._dataShadowInfo=this._prepareDataShadowInfo();if(this._displayables.dataShadowSegs=[],!e)return;var n=this._size,a=this._shadowSize||[],i=e.series,o=i.getRawData(),s=i.getShadowDim&&i.getShadowDim(),l=s&&o.getDimensionInfo(s)?i.getShadowDim():e.otherDim;if(l==null)return;var u=this._shadowPolygonPts,f=this._shadowPolylinePts;if(o!==this._shadowData||l!==this._shadowDim||n[0]!==a[0]||n[1]!==a[1]){var c=o.getDataExtent(l),h=(c[1]-c[0])*.3;c=[c[0]-h,c[1]+h];var v=[0,n[1]],d=[0,n[0]],p=[[n[0],0],[0,0]],g=[],y=d[1]/(o.count()-1),m=0,_=Math.round(o.count()/n[0]),S;o.each([l],function(T,A){if(_>0&&A%_){m+=y;return}var M=T==null||isNaN(T)||T==="",I=M?0:qt(T,c,v,!0);M&&!S&&A?(p.push([p[p.length-1][0],0]),g.push([g[g.length-1][0],0])):!M&&S&&(p.push([m,0]),g.push([m,0])),p.push([m,I]),g.push([m,I]),m+=y,S=M}),u=this._shadowPolygonPts=p,f=this._shadowPolylinePts=g}this._shadowData=o,this._shadowDim=l,this._shadowSize=[n[0],n[1]];var x=this.dataZoomModel;function b(T){var A=x.getModel(T?"selectedDataBackground":"dataBackground"),M=new _t,I=new gr({shape:{points:u},segmentIgnoreThreshold:1,style:A.getModel("areaStyle").getAreaStyle(),silent:!0,z2:-20}),L=new yr({shape:{points:f},segmentIgnoreThreshold:1,style:A.getModel("lineStyle").getLineStyle(),silent:!0,z2:-19});return M.add(I),M.add(L),M}for(var w=0;w<3;w++){var C=b(w===1);this._displayables.sliderGroup.add(C),this._displayables.dataShadowSegs.push(C)}},t.prototype._prepareDataShadowInfo=function(){var e=this.dataZoomModel,n=e.get("showDataShadow");if(n!==!1){var a,i=this.ecModel;return e.eachTargetAxis(function(o,s){var l=e.getAxisProxy(o,s).getTargetSeriesModels();D(l,function(u){if(!a&&!(n!==!0&&Et(tQ,u.get("type"))<0)){var f=i.getComponent(ui(o),s).axis,c=nQ(o),h,v=u.coordinateSystem;c!=null&&v.getOtherAxis&&(h=v.getOtherAxis(f).inverse),c=u.getData().mapDimension(c),a={thisAxis:f,series:u,thisDim:o,otherDim:c,otherAxisInverse:h}}},this)},this),a}},t.prototype._renderHandle=function(){var e=this.group,n=this._displayables,a=n.handles=[null,null],i=n.handleLabels=[null,null],o=this._displayables.sliderGroup,s=this._size,l=this.dataZoomModel,u=this.api,f=l.get("borderRadius")||0,c=l.get("brushSelect"),h=n.filler=new ru({silent:c,style:{fill:l.get("fillerColor")},textConfig:{position:"inside"}});o.add(h),o.add(new ru({silent:!0,subPixelOptimize:!0,shape:{x:0,y:0,width:s[0],height:s[1],r:f},style:{stroke:l.get("dataBackgroundColor")||l.get("borderColor"),lineWidth:jJ,fill:"rgba(0,0,0,0)"}})),D([0,1],function(_){var S=l.get("handleIcon");!lv[S]&&S.indexOf("path://")<0&&S.indexOf("image://")<0&&(S="path://"+S);var x=Ae(S,-1,0,2,2,null,!0);x.attr({cursor:PD(this._orient),draggable:!0,drift:ot(this._onDragMove,this,_),ondragend:ot(this._onDragEnd,this),onmouseover:ot(this._showDataInfo,this,!0),onmouseout:ot(this._showDataInfo,this,!1),z2:5});var b=x.getBoundingRect(),w=l.get("handleSize");this._handleHeight=rt(w,this._size[1]),this._handleWidth=b.width/b.height*this._handleHeight,x.setStyle(l.getModel("handleStyle").getItemStyle()),x.style.strokeNoScale=!0,x.rectHover=!0,x.ensureState("emphasis").style=l.getModel(["emphasis","handleStyle"]).getItemStyle(),ko(x);var C=l.get("handleColor");C!=null&&(x.style.fill=C),o.add(a[_]=x);var T=l.getModel("textStyle"),A=l.get("handleLabel")||{},M=A.show||!1;e.add(i[_]=new $t({silent:!0,invisible:!M,style:le(T,{x:0,y:0,text:"",verticalAlign:"middle",align:"center",fill:T.getTextColor(),font:T.getFont()}),z2:10}))},this);var v=h;if(c){var d=rt(l.get("moveHandleSize"),s[1]),p=n.moveHandle=new Ht({style:l.getModel("moveHandleStyle").getItemStyle(),silent:!0,shape:{r:[0,0,2,2],y:s[1]-.5,height:d}}),g=d*.8,y=n.moveHandleIcon=Ae(l.get("moveHandleIcon"),-g/2,-g/2,g,g,"#fff",!0);y.silent=!0,y.y=s[1]+d/2-.5,p.ensureState("emphasis").style=l.getModel(["emphasis","moveHandleStyle"]).getItemStyle();var m=Math.min(s[1]/2,Math.max(d,10));v=n.moveZone=new Ht({invisible:!0,shape:{y:s[1]-m,height:d+m}}),v.on("mouseover",function(){u.enterEmphasis(p)}).on("mouseout",function(){u.leaveEmphasis(p)}),o.add(p),o.add(y),o.add(v)}v.attr({draggable:!0,cursor:PD(this._orient),drift:ot(this._onDragMove,this,"all"),ondragstart:ot(this._showDataInfo,this,!0),ondragend:ot(this._onDragEnd,this),onmouseover:ot(this._showDataInfo,this,!0),onmouseout:ot(this._showDataInfo,this,!1)})},t.prototype._resetInterval=function(){var e=this._range=this.dataZoomModel.getPercentRange(),n=this._getViewExtent();this._handleEnds=[qt(e[0],[0,100],n,!0),qt(e[1],[0,100],n,!0)]},t.prototype._updateInterval=function(e,n){var a=this.dataZoomModel,i=this._handleEnds,o=this._getViewExtent(),s=a.findRepresentativeAxisProxy().getMinMaxSpan(),l=[0,100];rs(n,i,o,a.get("zoomLock")?"all":e,s.minSpan!=null?qt(s.minSpan,l,o,!0):null,s.maxSpan!=null?qt(s.maxSpan,l,o,!0):null);var u=this._range,f=this._range=jr([qt(i[0],o,l,!0),qt(i[1],o,l,!0)]);return!u||u[0]!==f[0]||u[1]!==f[1]},t.prototype._updateView=function(e){var n=this._displayables,a=this._handleEnds,i=jr(a.slice()),o=this._size;D([0,1],function(v){var d=n.handles[v],p=this._handleHeight;d.attr({scaleX:p/2,scaleY:p/2,x:a[v]+(v?-1:1),y:o[1]/2-p/2})},this),n.filler.setShape({x:i[0],y:0,width:i[1]-i[0],height:o[1]});var s={x:i[0],width:i[1]-i[0]};n.moveHandle&&(n.moveHandle.setShape(s),n.moveZone.setShape(s),n.moveZone.getBoundingRect(),n.moveHandleIcon&&n.moveHandleIcon.attr("x",s.x+s.width/2));for(var l=n.dataShadowSegs,u=[0,i[0],i[1],o[0]],f=0;f<l.length;f++){var c=l[f],h=c.getClipPath();h||(h=new Ht,c.setClipPath(h)),h.setShape({x:u[f],y:0,width:u[f+1]-u[f],height:o[1]})}this._updateDataInfo(e)},t.prototype._updateDataInfo=function(e){var n=this.dataZoomModel,a=this._displayables,i=a.handleLabels,o=this._orient,s=["",""];if(n.get("showDetail")){var l=n.findRepresentativeAxisProxy();if(l){var u=l.getAxisModel().axis,f=this._range,c=e?l.calculateDataWindow({start:f[0],end:f[1]}).valueWindow:l.getDataValueWindow();s=[this._formatLabel(c[0],u),this._formatLabel(c[1],u)]}}var h=jr(this._handleEnds.slice());v.call(this,0),v.call(this,1);function v(d){var p=Oo(a.handles[d].parent,this.group),g=dd(d===0?"right":"left",p),y=this._handleWidth/2+QJ,m=pn([h[d]+(d===0?-y:y),this._size[1]/2],p);i[d].setStyle({x:m[0],y:m[1],verticalAlign:o===nu?"middle":g,align:o===nu?g:"center",text:s[d]})}},t.prototype._formatLabel=function(e,n){var a=this.dataZoomModel,i=a.get("labelFormatter"),o=a.get("labelPrecision");(o==null||o==="auto")&&(o=n.getPixelPrecision());var s=e==null||isNaN(e)?"":n.type==="category"||n.type==="time"?n.scale.getLabel({value:Math.round(e)}):e.toFixed(Math.min(o,20));return dt(i)?i(e,s):it(i)?i.replace("{value}",s):s},t.prototype._showDataInfo=function(e){var n=this.dataZoomModel.get("handleLabel")||{},a=n.show||!1,i=this.dataZoomModel.getModel(["emphasis","handleLabel"]),o=i.get("show")||!1,s=e||this._dragging?o:a,l=this._displayables,u=l.handleLabels;u[0].attr("invisible",!s),u[1].attr("invisible",!s),l.moveHandle&&this.api[s?"enterEmphasis":"leaveEmphasis"](l.moveHandle,1)},t.prototype._onDragMove=function(e,n,a,i){this._dragging=!0,wa(i.event);var o=this._displayables.sliderGroup.getLocalTransform(),s=pn([n,a],o,!0),l=this._updateInterval(e,s[0]),u=this.dataZoomModel.get("realtime");this._updateView(!u),l&&u&&this._dispatchZoomAction(!0)},t.prototype._onDragEnd=function(){this._dragging=!1,this._showDataInfo(!1);var e=this.dataZoomModel.get("realtime");!e&&this._dispatchZoomAction(!1)},t.prototype._onClickPanel=function(e){var n=this._size,a=this._displayables.sliderGroup.transformCoordToLocal(e.offsetX,e.offsetY);if(!(a[0]<0||a[0]>n[0]||a[1]<0||a[1]>n[1])){var i=this._handleEnds,o=(i[0]+i[1])/2,s=this._updateInterval("all",a[0]-o);this._updateView(),s&&this._dispatchZoomAction(!1)}},t.prototype._onBrushStart=function(e){var n=e.offsetX,a=e.offsetY;this._brushStart=new Mt(n,a),this._brushing=!0,this._brushStartTime=+new Date},t.prototype._onBrushEnd=function(e){if(this._brushing){var n=this._displayables.brushRect;if(this._brushing=!1,!!n){n.attr("ignore",!0);var a=n.shape,i=+new Date;if(!(i-this._brushStartTime<200&&Math.abs(a.width)<5)){var o=this._getViewExtent(),s=[0,100];this._range=jr([qt(a.x,o,s,!0),qt(a.x+a.width,o,s,!0)]),this._handleEnds=[a.x,a.x+a.width],this._updateView(),this._dispatchZoomAction(!1)}}}},t.prototype._onBrush=function(e){this._brushing&&(wa(e.event),this._updateBrushRect(e.offsetX,e.offsetY))},t.prototype._updateBrushRect=function(e,n){var a=this._displayables,i=this.dataZoomModel,o=a.brushRect;o||(o=a.brushRect=new ru({silent:!0,style:i.getModel("brushStyle").getItemStyle()}),a.sliderGroup.add(o)),o.attr("ignore",!1);var s=this._brushStart,l=this._displayables.sliderGroup,u=l.transformCoordToLocal(e,n),f=l.transformCoordToLocal(s.x,s.y),c=this._size;u[0]=Math.max(Math.min(c[0],u[0]),0),o.setShape({x:f[0],y:0,width:u[0]-f[0],height:c[1]})},t.prototype._dispatchZoomAction=function(e){var n=this._range;this.api.dispatchAction({type:"dataZoom",from:this.uid,dataZoomId:this.dataZoomModel.id,animation:e?eQ:null,start:n[0],end:n[1]})},t.prototype._findCoordRect=function(){var e,n=Zk(this.dataZoomModel).infoList;if(!e&&n.length){var a=n[0].model.coordinateSystem;e=a.getRect&&a.getRect()}if(!e){var i=this.api.getWidth(),o=this.api.getHeight();e={x:i*.2,y:o*.2,width:i*.6,height:o*.6}}return e},t.type="dataZoom.slider",t}($1);function nQ(r){var t={x:"y",y:"x",radius:"angle",angle:"radius"};return t[r]}function PD(r){return r==="vertical"?"ns-resize":"ew-resize"}function dO(r){r.registerComponentModel(KJ),r.registerComponentView(rQ),U1(r)}function aQ(r){kt(vO),kt(dO)}var pO={get:function(r,t,e){var n=yt((iQ[r]||{})[t]);return e&&X(n)?n[n.length-1]:n}},iQ={color:{active:["#006edd","#e0ffff"],inactive:["rgba(0,0,0,0)"]},colorHue:{active:[0,360],inactive:[0,0]},colorSaturation:{active:[.3,1],inactive:[0,0]},colorLightness:{active:[.9,.5],inactive:[0,0]},colorAlpha:{active:[.3,1],inactive:[0,0]},opacity:{active:[.3,1],inactive:[0,0]},symbol:{active:["circle","roundRect","diamond"],inactive:["none"]},symbolSize:{active:[10,50],inactive:[0,0]}},RD=Oe.mapVisual,oQ=Oe.eachVisual,sQ=X,ED=D,lQ=jr,uQ=qt,Rv=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.stateList=["inRange","outOfRange"],e.replacableOptionKeys=["inRange","outOfRange","target","controller","color"],e.layoutMode={type:"box",ignoreSize:!0},e.dataBound=[-1/0,1/0],e.targetVisuals={},e.controllerVisuals={},e}return t.prototype.init=function(e,n,a){this.mergeDefaultAndTheme(e,a)},t.prototype.optionUpdated=function(e,n){var a=this.option;!n&&aO(a,e,this.replacableOptionKeys),this.textStyleModel=this.getModel("textStyle"),this.resetItemSize(),this.completeVisualOption()},t.prototype.resetVisual=function(e){var n=this.stateList;e=ot(e,this),this.controllerVisuals=_0(this.option.controller,n,e),this.targetVisuals=_0(this.option.target,n,e)},t.prototype.getItemSymbol=function(){return null},t.prototype.getTargetSeriesIndices=function(){var e=this.option.seriesIndex,n=[];return e==null||e==="all"?this.ecModel.eachSeries(function(a,i){n.push(i)}):n=te(e),n},t.prototype.eachTargetSeries=function(e,n){D(this.getTargetSeriesIndices(),function(a){var i=this.ecModel.getSeriesByIndex(a);i&&e.call(n,i)},this)},t.prototype.isTargetSeries=function(e){var n=!1;return this.eachTargetSeries(function(a){a===e&&(n=!0)}),n},t.prototype.formatValueText=function(e,n,a){var i=this.option,o=i.precision,s=this.dataBound,l=i.formatter,u;a=a||["<",">"],X(e)&&(e=e.slice(),u=!0);var f=n?e:u?[c(e[0]),c(e[1])]:c(e);if(it(l))return l.replace("{value}",u?f[0]:f).replace("{value2}",u?f[1]:f);if(dt(l))return u?l(e[0],e[1]):l(e);if(u)return e[0]===s[0]?a[0]+" "+f[1]:e[1]===s[1]?a[1]+" "+f[0]:f[0]+" - "+f[1];return f;function c(h){return h===s[0]?"min":h===s[1]?"max":(+h).toFixed(Math.min(o,20))}},t.prototype.resetExtent=function(){var e=this.option,n=lQ([e.min,e.max]);this._dataExtent=n},t.prototype.getDataDimensionIndex=function(e){var n=this.option.dimension;if(n!=null)return e.getDimensionIndex(n);for(var a=e.dimensions,i=a.length-1;i>=0;i--){var o=a[i],s=e.getDimensionInfo(o);if(!s.isCalculationCoord)return s.storeDimIndex}},t.prototype.getExtent=function(){return this._dataExtent.slice()},t.prototype.completeVisualOption=function(){var e=this.ecModel,n=this.option,a={inRange:n.inRange,outOfRange:n.outOfRange},i=n.target||(n.target={}),o=n.controller||(n.controller={});Dt(i,a),Dt(o,a);var s=this.isCategory();l.call(this,i),l.call(this,o),u.call(this,i,"inRange","outOfRange"),f.call(this,o);function l(c){sQ(n.color)&&!c.inRange&&(c.inRange={color:n.color.slice().reverse()}),c.inRange=c.inRange||{color:e.get("gradientColor")}}function u(c,h,v){var d=c[h],p=c[v];d&&!p&&(p=c[v]={},ED(d,function(g,y){if(Oe.isValidType(y)){var m=pO.get(y,"inactive",s);m!=null&&(p[y]=m,y==="color"&&!p.hasOwnProperty("opacity")&&!p.hasOwnProperty("colorAlpha")&&(p.opacity=[0,0]))}}))}function f(c){var h=(c.inRange||{}).symbol||(c.outOfRange||{}).symbol,v=(c.inRange||{}).symbolSize||(c.outOfRange||{}).symbolSize,d=this.get("inactiveColor"),p=this.getItemSymbol(),g=p||"roundRect";ED(this.stateList,function(y){var m=this.itemSize,_=c[y];_||(_=c[y]={color:s?d:[d]}),_.symbol==null&&(_.symbol=h&&yt(h)||(s?g:[g])),_.symbolSize==null&&(_.symbolSize=v&&yt(v)||(s?m[0]:[m[0],m[0]])),_.symbol=RD(_.symbol,function(b){return b==="none"?g:b});var S=_.symbolSize;if(S!=null){var x=-1/0;oQ(S,function(b){b>x&&(x=b)}),_.symbolSize=RD(S,function(b){return uQ(b,[0,x],[0,m[0]],!0)})}},this)}},t.prototype.resetItemSize=function(){this.itemSize=[parseFloat(this.get("itemWidth")),parseFloat(this.get("itemHeight"))]},t.prototype.isCategory=function(){return!!this.option.categories},t.prototype.setSelected=function(e){},t.prototype.getSelected=function(){return null},t.prototype.getValueState=function(e){return null},t.prototype.getVisualMeta=function(e){return null},t.type="visualMap",t.dependencies=["series"],t.defaultOption={show:!0,z:4,seriesIndex:"all",min:0,max:200,left:0,right:null,top:null,bottom:0,itemWidth:null,itemHeight:null,inverse:!1,orient:"vertical",backgroundColor:"rgba(0,0,0,0)",borderColor:"#ccc",contentColor:"#5793f3",inactiveColor:"#aaa",borderWidth:0,padding:5,textGap:10,precision:0,textStyle:{color:"#333"}},t}(zt),kD=[20,140],fQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.optionUpdated=function(e,n){r.prototype.optionUpdated.apply(this,arguments),this.resetExtent(),this.resetVisual(function(a){a.mappingMethod="linear",a.dataExtent=this.getExtent()}),this._resetRange()},t.prototype.resetItemSize=function(){r.prototype.resetItemSize.apply(this,arguments);var e=this.itemSize;(e[0]==null||isNaN(e[0]))&&(e[0]=kD[0]),(e[1]==null||isNaN(e[1]))&&(e[1]=kD[1])},t.prototype._resetRange=function(){var e=this.getExtent(),n=this.option.range;!n||n.auto?(e.auto=1,this.option.range=e):X(n)&&(n[0]>n[1]&&n.reverse(),n[0]=Math.max(n[0],e[0]),n[1]=Math.min(n[1],e[1]))},t.prototype.completeVisualOption=function(){r.prototype.completeVisualOption.apply(this,arguments),D(this.stateList,function(e){var n=this.option.controller[e].symbolSize;n&&n[0]!==n[1]&&(n[0]=n[1]/3)},this)},t.prototype.setSelected=function(e){this.option.range=e.slice(),this._resetRange()},t.prototype.getSelected=function(){var e=this.getExtent(),n=jr((this.get("range")||[]).slice());return n[0]>e[1]&&(n[0]=e[1]),n[1]>e[1]&&(n[1]=e[1]),n[0]<e[0]&&(n[0]=e[0]),n[1]<e[0]&&(n[1]=e[0]),n},t.prototype.getValueState=function(e){var n=this.option.range,a=this.getExtent();return(n[0]<=a[0]||n[0]<=e)&&(n[1]>=a[1]||e<=n[1])?"inRange":"outOfRange"},t.prototype.findTargetDataIndices=function(e){var n=[];return this.eachTargetSeries(function(a){var i=[],o=a.getData();o.each(this.getDataDimensionIndex(o),function(s,l){e[0]<=s&&s<=e[1]&&i.push(l)},this),n.push({seriesId:a.id,dataIndex:i})},this),n},t.prototype.getVisualMeta=function(e){var n=OD(this,"outOfRange",this.getExtent()),a=OD(this,"inRange",this.option.range.slice()),i=[];function o(v,d){i.push({value:v,color:e(v,d)})}for(var s=0,l=0,u=a.length,f=n.length;l<f&&(!a.length||n[l]<=a[0]);l++)n[l]<a[s]&&o(n[l],"outOfRange");for(var c=1;s<u;s++,c=0)c&&i.length&&o(a[s],"outOfRange"),o(a[s],"inRange");for(var c=1;l<f;l++)(!a.length||a[a.length-1]<n[l])&&(c&&(i.length&&o(i[i.length-1].value,"outOfRange"),c=0),o(n[l],"outOfRange"));var h=i.length;return{stops:i,outerColors:[h?i[0].color:"transparent",h?i[h-1].color:"transparent"]}},t.type="visualMap.continuous",t.defaultOption=Pi(Rv.defaultOption,{align:"auto",calculable:!1,hoverLink:!0,realtime:!0,handleIcon:"path://M-11.39,9.77h0a3.5,3.5,0,0,1-3.5,3.5h-22a3.5,3.5,0,0,1-3.5-3.5h0a3.5,3.5,0,0,1,3.5-3.5h22A3.5,3.5,0,0,1-11.39,9.77Z",handleSize:"120%",handleStyle:{borderColor:"#fff",borderWidth:1},indicatorIcon:"circle",indicatorSize:"50%",indicatorStyle:{borderColor:"#fff",borderWidth:2,shadowBlur:2,shadowOffsetX:1,shadowOffsetY:1,shadowColor:"rgba(0,0,0,0.2)"}}),t}(Rv);function OD(r,t,e){if(e[0]===e[1])return e.slice();for(var n=200,a=(e[1]-e[0])/n,i=e[0],o=[],s=0;s<=n&&i<e[1];s++)o.push(i),i+=a;return o.push(e[1]),o}var gO=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e.autoPositionValues={left:1,right:1,top:1,bottom:1},e}return t.prototype.init=function(e,n){this.ecModel=e,this.api=n},t.prototype.render=function(e,n,a,i){if(this.visualMapModel=e,e.get("show")===!1){this.group.removeAll();return}this.doRender(e,n,a,i)},t.prototype.renderBackground=function(e){var n=this.visualMapModel,a=yl(n.get("padding")||0),i=e.getBoundingRect();e.add(new Ht({z2:-1,silent:!0,shape:{x:i.x-a[3],y:i.y-a[0],width:i.width+a[3]+a[1],height:i.height+a[0]+a[2]},style:{fill:n.get("backgroundColor"),stroke:n.get("borderColor"),lineWidth:n.get("borderWidth")}}))},t.prototype.getControllerVisual=function(e,n,a){a=a||{};var i=a.forceState,o=this.visualMapModel,s={};if(n==="color"){var l=o.get("contentColor");s.color=l}function u(v){return s[v]}function f(v,d){s[v]=d}var c=o.controllerVisuals[i||o.getValueState(e)],h=Oe.prepareVisualTypes(c);return D(h,function(v){var d=c[v];a.convertOpacityToAlpha&&v==="opacity"&&(v="colorAlpha",d=c.__alphaForOpacity),Oe.dependsOn(v,n)&&d&&d.applyVisual(e,u,f)}),s[n]},t.prototype.positionGroup=function(e){var n=this.visualMapModel,a=this.api;xd(e,n.getBoxLayoutParams(),{width:a.getWidth(),height:a.getHeight()})},t.prototype.doRender=function(e,n,a,i){},t.type="visualMap",t}(ge),ND=[["left","right","width"],["top","bottom","height"]];function yO(r,t,e){var n=r.option,a=n.align;if(a!=null&&a!=="auto")return a;for(var i={width:t.getWidth(),height:t.getHeight()},o=n.orient==="horizontal"?1:0,s=ND[o],l=[0,null,10],u={},f=0;f<3;f++)u[ND[1-o][f]]=l[f],u[s[f]]=f===2?e[0]:n[s[f]];var c=[["x","width",3],["y","height",0]][o],h=Ie(u,i,n.padding);return s[(h.margin[c[2]]||0)+h[c[0]]+h[c[1]]*.5<i[c[1]]*.5?0:1]}function Eh(r,t){return D(r||[],function(e){e.dataIndex!=null&&(e.dataIndexInside=e.dataIndex,e.dataIndex=null),e.highlightKey="visualMap"+(t?t.componentIndex:"")}),r}var En=qt,cQ=D,VD=Math.min,_y=Math.max,hQ=12,vQ=6,dQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e._shapes={},e._dataInterval=[],e._handleEnds=[],e._hoverLinkDataIndices=[],e}return t.prototype.init=function(e,n){r.prototype.init.call(this,e,n),this._hoverLinkFromSeriesMouseOver=ot(this._hoverLinkFromSeriesMouseOver,this),this._hideIndicator=ot(this._hideIndicator,this)},t.prototype.doRender=function(e,n,a,i){(!i||i.type!=="selectDataRange"||i.from!==this.uid)&&this._buildView()},t.prototype._buildView=function(){this.group.removeAll();var e=this.visualMapModel,n=this.group;this._orient=e.get("orient"),this._useHandle=e.get("calculable"),this._resetInterval(),this._renderBar(n);var a=e.get("text");this._renderEndsText(n,a,0),this._renderEndsText(n,a,1),this._updateView(!0),this.renderBackground(n),this._updateView(),this._enableHoverLinkToSeries(),this._enableHoverLinkFromSeries(),this.positionGroup(n)},t.prototype._renderEndsText=function(e,n,a){if(n){var i=n[1-a];i=i!=null?i+"":"";var o=this.visualMapModel,s=o.get("textGap"),l=o.itemSize,u=this._shapes.mainGroup,f=this._applyTransform([l[0]/2,a===0?-s:l[1]+s],u),c=this._applyTransform(a===0?"bottom":"top",u),h=this._orient,v=this.visualMapModel.textStyleModel;this.group.add(new $t({style:le(v,{x:f[0],y:f[1],verticalAlign:h==="horizontal"?"middle":c,align:h==="horizontal"?c:"center",text:i})}))}},t.prototype._renderBar=function(e){var n=this.visualMapModel,a=this._shapes,i=n.itemSize,o=this._orient,s=this._useHandle,l=yO(n,this.api,i),u=a.mainGroup=this._createBarGroup(l),f=new _t;u.add(f),f.add(a.outOfRange=BD()),f.add(a.inRange=BD(null,s?FD(this._orient):null,ot(this._dragHandle,this,"all",!1),ot(this._dragHandle,this,"all",!0))),f.setClipPath(new Ht({shape:{x:0,y:0,width:i[0],height:i[1],r:3}}));var c=n.textStyleModel.getTextRect("国"),h=_y(c.width,c.height);s&&(a.handleThumbs=[],a.handleLabels=[],a.handleLabelPoints=[],this._createHandle(n,u,0,i,h,o),this._createHandle(n,u,1,i,h,o)),this._createIndicator(n,u,i,h,o),e.add(u)},t.prototype._createHandle=function(e,n,a,i,o,s){var l=ot(this._dragHandle,this,a,!1),u=ot(this._dragHandle,this,a,!0),f=mn(e.get("handleSize"),i[0]),c=Ae(e.get("handleIcon"),-f/2,-f/2,f,f,null,!0),h=FD(this._orient);c.attr({cursor:h,draggable:!0,drift:l,ondragend:u,onmousemove:function(y){wa(y.event)}}),c.x=i[0]/2,c.useStyle(e.getModel("handleStyle").getItemStyle()),c.setStyle({strokeNoScale:!0,strokeFirst:!0}),c.style.lineWidth*=2,c.ensureState("emphasis").style=e.getModel(["emphasis","handleStyle"]).getItemStyle(),bo(c,!0),n.add(c);var v=this.visualMapModel.textStyleModel,d=new $t({cursor:h,draggable:!0,drift:l,onmousemove:function(y){wa(y.event)},ondragend:u,style:le(v,{x:0,y:0,text:""})});d.ensureState("blur").style={opacity:.1},d.stateTransition={duration:200},this.group.add(d);var p=[f,0],g=this._shapes;g.handleThumbs[a]=c,g.handleLabelPoints[a]=p,g.handleLabels[a]=d},t.prototype._createIndicator=function(e,n,a,i,o){var s=mn(e.get("indicatorSize"),a[0]),l=Ae(e.get("indicatorIcon"),-s/2,-s/2,s,s,null,!0);l.attr({cursor:"move",invisible:!0,silent:!0,x:a[0]/2});var u=e.getModel("indicatorStyle").getItemStyle();if(l instanceof We){var f=l.style;l.useStyle(W({image:f.image,x:f.x,y:f.y,width:f.width,height:f.height},u))}else l.useStyle(u);n.add(l);var c=this.visualMapModel.textStyleModel,h=new $t({silent:!0,invisible:!0,style:le(c,{x:0,y:0,text:""})});this.group.add(h);var v=[(o==="horizontal"?i/2:vQ)+a[0]/2,0],d=this._shapes;d.indicator=l,d.indicatorLabel=h,d.indicatorLabelPoint=v,this._firstShowIndicator=!0},t.prototype._dragHandle=function(e,n,a,i){if(this._useHandle){if(this._dragging=!n,!n){var o=this._applyTransform([a,i],this._shapes.mainGroup,!0);this._updateInterval(e,o[1]),this._hideIndicator(),this._updateView()}n===!this.visualMapModel.get("realtime")&&this.api.dispatchAction({type:"selectDataRange",from:this.uid,visualMapId:this.visualMapModel.id,selected:this._dataInterval.slice()}),n?!this._hovering&&this._clearHoverLinkToSeries():zD(this.visualMapModel)&&this._doHoverLinkToSeries(this._handleEnds[e],!1)}},t.prototype._resetInterval=function(){var e=this.visualMapModel,n=this._dataInterval=e.getSelected(),a=e.getExtent(),i=[0,e.itemSize[1]];this._handleEnds=[En(n[0],a,i,!0),En(n[1],a,i,!0)]},t.prototype._updateInterval=function(e,n){n=n||0;var a=this.visualMapModel,i=this._handleEnds,o=[0,a.itemSize[1]];rs(n,i,o,e,0);var s=a.getExtent();this._dataInterval=[En(i[0],o,s,!0),En(i[1],o,s,!0)]},t.prototype._updateView=function(e){var n=this.visualMapModel,a=n.getExtent(),i=this._shapes,o=[0,n.itemSize[1]],s=e?o:this._handleEnds,l=this._createBarVisual(this._dataInterval,a,s,"inRange"),u=this._createBarVisual(a,a,o,"outOfRange");i.inRange.setStyle({fill:l.barColor}).setShape("points",l.barPoints),i.outOfRange.setStyle({fill:u.barColor}).setShape("points",u.barPoints),this._updateHandle(s,l)},t.prototype._createBarVisual=function(e,n,a,i){var o={forceState:i,convertOpacityToAlpha:!0},s=this._makeColorGradient(e,o),l=[this.getControllerVisual(e[0],"symbolSize",o),this.getControllerVisual(e[1],"symbolSize",o)],u=this._createBarPoints(a,l);return{barColor:new $o(0,0,0,1,s),barPoints:u,handlesColor:[s[0].color,s[s.length-1].color]}},t.prototype._makeColorGradient=function(e,n){var a=100,i=[],o=(e[1]-e[0])/a;i.push({color:this.getControllerVisual(e[0],"color",n),offset:0});for(var s=1;s<a;s++){var l=e[0]+o*s;if(l>e[1])break;i.push({color:this.getControllerVisual(l,"color",n),offset:s/a})}return i.push({color:this.getControllerVisual(e[1],"color",n),offset:1}),i},t.prototype._createBarPoints=function(e,n){var a=this.visualMapModel.itemSize;return[[a[0]-n[0],e[0]],[a[0],e[0]],[a[0],e[1]],[a[0]-n[1],e[1]]]},t.prototype._createBarGroup=function(e){var n=this._orient,a=this.visualMapModel.get("inverse");return new _t(n==="horizontal"&&!a?{scaleX:e==="bottom"?1:-1,rotation:Math.PI/2}:n==="horizontal"&&a?{scaleX:e==="bottom"?-1:1,rotation:-Math.PI/2}:n==="vertical"&&!a?{scaleX:e==="left"?1:-1,scaleY:-1}:{scaleX:e==="left"?1:-1})},t.prototype._updateHandle=function(e,n){if(this._useHandle){var a=this._shapes,i=this.visualMapModel,o=a.handleThumbs,s=a.handleLabels,l=i.itemSize,u=i.getExtent(),f=this._applyTransform("left",a.mainGroup);cQ([0,1],function(c){var h=o[c];h.setStyle("fill",n.handlesColor[c]),h.y=e[c];var v=En(e[c],[0,l[1]],u,!0),d=this.getControllerVisual(v,"symbolSize");h.scaleX=h.scaleY=d/l[0],h.x=l[0]-d/2;var p=pn(a.handleLabelPoints[c],Oo(h,this.group));if(this._orient==="horizontal"){var g=f==="left"||f==="top"?(l[0]-d)/2:(l[0]-d)/-2;p[1]+=g}s[c].setStyle({x:p[0],y:p[1],text:i.formatValueText(this._dataInterval[c]),verticalAlign:"middle",align:this._orient==="vertical"?this._applyTransform("left",a.mainGroup):"center"})},this)}},t.prototype._showIndicator=function(e,n,a,i){var o=this.visualMapModel,s=o.getExtent(),l=o.itemSize,u=[0,l[1]],f=this._shapes,c=f.indicator;if(c){c.attr("invisible",!1);var h={convertOpacityToAlpha:!0},v=this.getControllerVisual(e,"color",h),d=this.getControllerVisual(e,"symbolSize"),p=En(e,s,u,!0),g=l[0]-d/2,y={x:c.x,y:c.y};c.y=p,c.x=g;var m=pn(f.indicatorLabelPoint,Oo(c,this.group)),_=f.indicatorLabel;_.attr("invisible",!1);var S=this._applyTransform("left",f.mainGroup),x=this._orient,b=x==="horizontal";_.setStyle({text:(a||"")+o.formatValueText(n),verticalAlign:b?S:"middle",align:b?"center":S});var w={x:g,y:p,style:{fill:v}},C={style:{x:m[0],y:m[1]}};if(o.ecModel.isAnimationEnabled()&&!this._firstShowIndicator){var T={duration:100,easing:"cubicInOut",additive:!0};c.x=y.x,c.y=y.y,c.animateTo(w,T),_.animateTo(C,T)}else c.attr(w),_.attr(C);this._firstShowIndicator=!1;var A=this._shapes.handleLabels;if(A)for(var M=0;M<A.length;M++)this.api.enterBlur(A[M])}},t.prototype._enableHoverLinkToSeries=function(){var e=this;this._shapes.mainGroup.on("mousemove",function(n){if(e._hovering=!0,!e._dragging){var a=e.visualMapModel.itemSize,i=e._applyTransform([n.offsetX,n.offsetY],e._shapes.mainGroup,!0,!0);i[1]=VD(_y(0,i[1]),a[1]),e._doHoverLinkToSeries(i[1],0<=i[0]&&i[0]<=a[0])}}).on("mouseout",function(){e._hovering=!1,!e._dragging&&e._clearHoverLinkToSeries()})},t.prototype._enableHoverLinkFromSeries=function(){var e=this.api.getZr();this.visualMapModel.option.hoverLink?(e.on("mouseover",this._hoverLinkFromSeriesMouseOver,this),e.on("mouseout",this._hideIndicator,this)):this._clearHoverLinkFromSeries()},t.prototype._doHoverLinkToSeries=function(e,n){var a=this.visualMapModel,i=a.itemSize;if(a.option.hoverLink){var o=[0,i[1]],s=a.getExtent();e=VD(_y(o[0],e),o[1]);var l=pQ(a,s,o),u=[e-l,e+l],f=En(e,o,s,!0),c=[En(u[0],o,s,!0),En(u[1],o,s,!0)];u[0]<o[0]&&(c[0]=-1/0),u[1]>o[1]&&(c[1]=1/0),n&&(c[0]===-1/0?this._showIndicator(f,c[1],"< ",l):c[1]===1/0?this._showIndicator(f,c[0],"> ",l):this._showIndicator(f,f,"≈ ",l));var h=this._hoverLinkDataIndices,v=[];(n||zD(a))&&(v=this._hoverLinkDataIndices=a.findTargetDataIndices(c));var d=xF(h,v);this._dispatchHighDown("downplay",Eh(d[0],a)),this._dispatchHighDown("highlight",Eh(d[1],a))}},t.prototype._hoverLinkFromSeriesMouseOver=function(e){var n;if(To(e.target,function(l){var u=xt(l);if(u.dataIndex!=null)return n=u,!0},!0),!!n){var a=this.ecModel.getSeriesByIndex(n.seriesIndex),i=this.visualMapModel;if(i.isTargetSeries(a)){var o=a.getData(n.dataType),s=o.getStore().get(i.getDataDimensionIndex(o),n.dataIndex);isNaN(s)||this._showIndicator(s,s)}}},t.prototype._hideIndicator=function(){var e=this._shapes;e.indicator&&e.indicator.attr("invisible",!0),e.indicatorLabel&&e.indicatorLabel.attr("invisible",!0);var n=this._shapes.handleLabels;if(n)for(var a=0;a<n.length;a++)this.api.leaveBlur(n[a])},t.prototype._clearHoverLinkToSeries=function(){this._hideIndicator();var e=this._hoverLinkDataIndices;this._dispatchHighDown("downplay",Eh(e,this.visualMapModel)),e.length=0},t.prototype._clearHoverLinkFromSeries=function(){this._hideIndicator();var e=this.api.getZr();e.off("mouseover",this._hoverLinkFromSeriesMouseOver),e.off("mouseout",this._hideIndicator)},t.prototype._applyTransform=function(e,n,a,i){var o=Oo(n,i?null:this.group);return X(e)?pn(e,o,a):dd(e,o,a)},t.prototype._dispatchHighDown=function(e,n){n&&n.length&&this.api.dispatchAction({type:e,batch:n})},t.prototype.dispose=function(){this._clearHoverLinkFromSeries(),this._clearHoverLinkToSeries()},t.type="visualMap.continuous",t}(gO);function BD(r,t,e,n){return new gr({shape:{points:r},draggable:!!e,cursor:t,drift:e,onmousemove:function(a){wa(a.event)},ondragend:n})}function pQ(r,t,e){var n=hQ/2,a=r.get("hoverLinkDataSize");return a&&(n=En(a,t,e,!0)/2),n}function zD(r){var t=r.get("hoverLinkOnHandle");return!!(t??r.get("realtime"))}function FD(r){return r==="vertical"?"ns-resize":"ew-resize"}var gQ={type:"selectDataRange",event:"dataRangeSelected",update:"update"},yQ=function(r,t){t.eachComponent({mainType:"visualMap",query:r},function(e){e.setSelected(r.selected)})},mQ=[{createOnAllSeries:!0,reset:function(r,t){var e=[];return t.eachComponent("visualMap",function(n){var a=r.pipelineContext;!n.isTargetSeries(r)||a&&a.large||e.push(Fj(n.stateList,n.targetVisuals,ot(n.getValueState,n),n.getDataDimensionIndex(r.getData())))}),e}},{createOnAllSeries:!0,reset:function(r,t){var e=r.getData(),n=[];t.eachComponent("visualMap",function(a){if(a.isTargetSeries(r)){var i=a.getVisualMeta(ot(_Q,null,r,a))||{stops:[],outerColors:[]},o=a.getDataDimensionIndex(e);o>=0&&(i.dimension=o,n.push(i))}}),r.getData().setVisual("visualMeta",n)}}];function _Q(r,t,e,n){for(var a=t.targetVisuals[n],i=Oe.prepareVisualTypes(a),o={color:Hf(r.getData(),"color")},s=0,l=i.length;s<l;s++){var u=i[s],f=a[u==="opacity"?"__alphaForOpacity":u];f&&f.applyVisual(e,c,h)}return o.color;function c(v){return o[v]}function h(v,d){o[v]=d}}var GD=D;function SQ(r){var t=r&&r.visualMap;X(t)||(t=t?[t]:[]),GD(t,function(e){if(e){Ts(e,"splitList")&&!Ts(e,"pieces")&&(e.pieces=e.splitList,delete e.splitList);var n=e.pieces;n&&X(n)&&GD(n,function(a){gt(a)&&(Ts(a,"start")&&!Ts(a,"min")&&(a.min=a.start),Ts(a,"end")&&!Ts(a,"max")&&(a.max=a.end))})}})}function Ts(r,t){return r&&r.hasOwnProperty&&r.hasOwnProperty(t)}var HD=!1;function mO(r){HD||(HD=!0,r.registerSubTypeDefaulter("visualMap",function(t){return!t.categories&&(!(t.pieces?t.pieces.length>0:t.splitNumber>0)||t.calculable)?"continuous":"piecewise"}),r.registerAction(gQ,yQ),D(mQ,function(t){r.registerVisual(r.PRIORITY.VISUAL.COMPONENT,t)}),r.registerPreprocessor(SQ))}function _O(r){r.registerComponentModel(fQ),r.registerComponentView(dQ),mO(r)}var xQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e._pieceList=[],e}return t.prototype.optionUpdated=function(e,n){r.prototype.optionUpdated.apply(this,arguments),this.resetExtent();var a=this._mode=this._determineMode();this._pieceList=[],bQ[this._mode].call(this,this._pieceList),this._resetSelected(e,n);var i=this.option.categories;this.resetVisual(function(o,s){a==="categories"?(o.mappingMethod="category",o.categories=yt(i)):(o.dataExtent=this.getExtent(),o.mappingMethod="piecewise",o.pieceList=K(this._pieceList,function(l){return l=yt(l),s!=="inRange"&&(l.visual=null),l}))})},t.prototype.completeVisualOption=function(){var e=this.option,n={},a=Oe.listVisualTypes(),i=this.isCategory();D(e.pieces,function(s){D(a,function(l){s.hasOwnProperty(l)&&(n[l]=1)})}),D(n,function(s,l){var u=!1;D(this.stateList,function(f){u=u||o(e,f,l)||o(e.target,f,l)},this),!u&&D(this.stateList,function(f){(e[f]||(e[f]={}))[l]=pO.get(l,f==="inRange"?"active":"inactive",i)})},this);function o(s,l,u){return s&&s[l]&&s[l].hasOwnProperty(u)}r.prototype.completeVisualOption.apply(this,arguments)},t.prototype._resetSelected=function(e,n){var a=this.option,i=this._pieceList,o=(n?a:e).selected||{};if(a.selected=o,D(i,function(l,u){var f=this.getSelectedMapKey(l);o.hasOwnProperty(f)||(o[f]=!0)},this),a.selectedMode==="single"){var s=!1;D(i,function(l,u){var f=this.getSelectedMapKey(l);o[f]&&(s?o[f]=!1:s=!0)},this)}},t.prototype.getItemSymbol=function(){return this.get("itemSymbol")},t.prototype.getSelectedMapKey=function(e){return this._mode==="categories"?e.value+"":e.index+""},t.prototype.getPieceList=function(){return this._pieceList},t.prototype._determineMode=function(){var e=this.option;return e.pieces&&e.pieces.length>0?"pieces":this.option.categories?"categories":"splitNumber"},t.prototype.setSelected=function(e){this.option.selected=yt(e)},t.prototype.getValueState=function(e){var n=Oe.findPieceIndex(e,this._pieceList);return n!=null&&this.option.selected[this.getSelectedMapKey(this._pieceList[n])]?"inRange":"outOfRange"},t.prototype.findTargetDataIndices=function(e){var n=[],a=this._pieceList;return this.eachTargetSeries(function(i){var o=[],s=i.getData();s.each(this.getDataDimensionIndex(s),function(l,u){var f=Oe.findPieceIndex(l,a);f===e&&o.push(u)},this),n.push({seriesId:i.id,dataIndex:o})},this),n},t.prototype.getRepresentValue=function(e){var n;if(this.isCategory())n=e.value;else if(e.value!=null)n=e.value;else{var a=e.interval||[];n=a[0]===-1/0&&a[1]===1/0?0:(a[0]+a[1])/2}return n},t.prototype.getVisualMeta=function(e){if(this.isCategory())return;var n=[],a=["",""],i=this;function o(f,c){var h=i.getRepresentValue({interval:f});c||(c=i.getValueState(h));var v=e(h,c);f[0]===-1/0?a[0]=v:f[1]===1/0?a[1]=v:n.push({value:f[0],color:v},{value:f[1],color:v})}var s=this._pieceList.slice();if(!s.length)s.push({interval:[-1/0,1/0]});else{var l=s[0].interval[0];l!==-1/0&&s.unshift({interval:[-1/0,l]}),l=s[s.length-1].interval[1],l!==1/0&&s.push({interval:[l,1/0]})}var u=-1/0;return D(s,function(f){var c=f.interval;c&&(c[0]>u&&o([u,c[0]],"outOfRange"),o(c.slice()),u=c[1])},this),{stops:n,outerColors:a}},t.type="visualMap.piecewise",t.defaultOption=Pi(Rv.defaultOption,{selected:null,minOpen:!1,maxOpen:!1,align:"auto",itemWidth:20,itemHeight:14,itemSymbol:"roundRect",pieces:null,categories:null,splitNumber:5,selectedMode:"multiple",itemGap:10,hoverLink:!0}),t}(Rv),bQ={splitNumber:function(r){var t=this.option,e=Math.min(t.precision,20),n=this.getExtent(),a=t.splitNumber;a=Math.max(parseInt(a,10),1),t.splitNumber=a;for(var i=(n[1]-n[0])/a;+i.toFixed(e)!==i&&e<5;)e++;t.precision=e,i=+i.toFixed(e),t.minOpen&&r.push({interval:[-1/0,n[0]],close:[0,0]});for(var o=0,s=n[0];o<a;s+=i,o++){var l=o===a-1?n[1]:s+i;r.push({interval:[s,l],close:[1,1]})}t.maxOpen&&r.push({interval:[n[1],1/0],close:[0,0]}),Nx(r),D(r,function(u,f){u.index=f,u.text=this.formatValueText(u.interval)},this)},categories:function(r){var t=this.option;D(t.categories,function(e){r.push({text:this.formatValueText(e,!0),value:e})},this),WD(t,r)},pieces:function(r){var t=this.option;D(t.pieces,function(e,n){gt(e)||(e={value:e});var a={text:"",index:n};if(e.label!=null&&(a.text=e.label),e.hasOwnProperty("value")){var i=a.value=e.value;a.interval=[i,i],a.close=[1,1]}else{for(var o=a.interval=[],s=a.close=[0,0],l=[1,0,1],u=[-1/0,1/0],f=[],c=0;c<2;c++){for(var h=[["gte","gt","min"],["lte","lt","max"]][c],v=0;v<3&&o[c]==null;v++)o[c]=e[h[v]],s[c]=l[v],f[c]=v===2;o[c]==null&&(o[c]=u[c])}f[0]&&o[1]===1/0&&(s[0]=0),f[1]&&o[0]===-1/0&&(s[1]=0),o[0]===o[1]&&s[0]&&s[1]&&(a.value=o[0])}a.visual=Oe.retrieveVisuals(e),r.push(a)},this),WD(t,r),Nx(r),D(r,function(e){var n=e.close,a=[["<","≤"][n[1]],[">","≥"][n[0]]];e.text=e.text||this.formatValueText(e.value!=null?e.value:e.interval,!1,a)},this)}};function WD(r,t){var e=r.inverse;(r.orient==="vertical"?!e:e)&&t.reverse()}var wQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type=t.type,e}return t.prototype.doRender=function(){var e=this.group;e.removeAll();var n=this.visualMapModel,a=n.get("textGap"),i=n.textStyleModel,o=i.getFont(),s=i.getTextColor(),l=this._getItemAlign(),u=n.itemSize,f=this._getViewData(),c=f.endsText,h=Ge(n.get("showLabel",!0),!c),v=!n.get("selectedMode");c&&this._renderEndsText(e,c[0],u,h,l),D(f.viewPieceList,function(d){var p=d.piece,g=new _t;g.onclick=ot(this._onItemClick,this,p),this._enableHoverLink(g,d.indexInModelPieceList);var y=n.getRepresentValue(p);if(this._createItemSymbol(g,y,[0,0,u[0],u[1]],v),h){var m=this.visualMapModel.getValueState(y);g.add(new $t({style:{x:l==="right"?-a:u[0]+a,y:u[1]/2,text:p.text,verticalAlign:"middle",align:l,font:o,fill:s,opacity:m==="outOfRange"?.5:1},silent:v}))}e.add(g)},this),c&&this._renderEndsText(e,c[1],u,h,l),No(n.get("orient"),e,n.get("itemGap")),this.renderBackground(e),this.positionGroup(e)},t.prototype._enableHoverLink=function(e,n){var a=this;e.on("mouseover",function(){return i("highlight")}).on("mouseout",function(){return i("downplay")});var i=function(o){var s=a.visualMapModel;s.option.hoverLink&&a.api.dispatchAction({type:o,batch:Eh(s.findTargetDataIndices(n),s)})}},t.prototype._getItemAlign=function(){var e=this.visualMapModel,n=e.option;if(n.orient==="vertical")return yO(e,this.api,e.itemSize);var a=n.align;return(!a||a==="auto")&&(a="left"),a},t.prototype._renderEndsText=function(e,n,a,i,o){if(n){var s=new _t,l=this.visualMapModel.textStyleModel;s.add(new $t({style:le(l,{x:i?o==="right"?a[0]:0:a[0]/2,y:a[1]/2,verticalAlign:"middle",align:i?o:"center",text:n})})),e.add(s)}},t.prototype._getViewData=function(){var e=this.visualMapModel,n=K(e.getPieceList(),function(s,l){return{piece:s,indexInModelPieceList:l}}),a=e.get("text"),i=e.get("orient"),o=e.get("inverse");return(i==="horizontal"?o:!o)?n.reverse():a&&(a=a.slice().reverse()),{viewPieceList:n,endsText:a}},t.prototype._createItemSymbol=function(e,n,a,i){var o=Ae(this.getControllerVisual(n,"symbol"),a[0],a[1],a[2],a[3],this.getControllerVisual(n,"color"));o.silent=i,e.add(o)},t.prototype._onItemClick=function(e){var n=this.visualMapModel,a=n.option,i=a.selectedMode;if(i){var o=yt(a.selected),s=n.getSelectedMapKey(e);i==="single"||i===!0?(o[s]=!0,D(o,function(l,u){o[u]=u===s})):o[s]=!o[s],this.api.dispatchAction({type:"selectDataRange",from:this.uid,visualMapId:this.visualMapModel.id,selected:o})}},t.type="visualMap.piecewise",t}(gO);function SO(r){r.registerComponentModel(xQ),r.registerComponentView(wQ),mO(r)}function TQ(r){kt(_O),kt(SO)}var CQ={label:{enabled:!0},decal:{show:!1}},$D=Wt(),AQ={};function DQ(r,t){var e=r.getModel("aria");if(!e.get("enabled"))return;var n=yt(CQ);Dt(n.label,r.getLocaleModel().get("aria"),!1),Dt(e.option,n,!1),a(),i();function a(){var u=e.getModel("decal"),f=u.get("show");if(f){var c=ct();r.eachSeries(function(h){if(!h.isColorBySeries()){var v=c.get(h.type);v||(v={},c.set(h.type,v)),$D(h).scope=v}}),r.eachRawSeries(function(h){if(r.isSeriesFiltered(h))return;if(dt(h.enableAriaDecal)){h.enableAriaDecal();return}var v=h.getData();if(h.isColorBySeries()){var m=Cm(h.ecModel,h.name,AQ,r.getSeriesCount()),_=v.getVisual("decal");v.setVisual("decal",S(_,m))}else{var d=h.getRawData(),p={},g=$D(h).scope;v.each(function(x){var b=v.getRawIndex(x);p[b]=x});var y=d.count();d.each(function(x){var b=p[x],w=d.getName(x)||x+"",C=Cm(h.ecModel,w,g,y),T=v.getItemVisual(b,"decal");v.setItemVisual(b,"decal",S(T,C))})}function S(x,b){var w=x?W(W({},b),x):b;return w.dirty=!0,w}})}}function i(){var u=t.getZr().dom;if(u){var f=r.getLocaleModel().get("aria"),c=e.getModel("label");if(c.option=pt(c.option,f),!!c.get("enabled")){if(u.setAttribute("role","img"),c.get("description")){u.setAttribute("aria-label",c.get("description"));return}var h=r.getSeriesCount(),v=c.get(["data","maxCount"])||10,d=c.get(["series","maxCount"])||10,p=Math.min(h,d),g;if(!(h<1)){var y=s();if(y){var m=c.get(["general","withTitle"]);g=o(m,{title:y})}else g=c.get(["general","withoutTitle"]);var _=[],S=h>1?c.get(["series","multiple","prefix"]):c.get(["series","single","prefix"]);g+=o(S,{seriesCount:h}),r.eachSeries(function(C,T){if(T<p){var A=void 0,M=C.get("name"),I=M?"withName":"withoutName";A=h>1?c.get(["series","multiple",I]):c.get(["series","single",I]),A=o(A,{seriesId:C.seriesIndex,seriesName:C.get("name"),seriesType:l(C.subType)});var L=C.getData();if(L.count()>v){var P=c.get(["data","partialData"]);A+=o(P,{displayCnt:v})}else A+=c.get(["data","allData"]);for(var E=c.get(["data","separator","middle"]),k=c.get(["data","separator","end"]),z=c.get(["data","excludeDimensionId"]),O=[],B=0;B<L.count();B++)if(B<v){var H=L.getName(B),Z=z?Zt(L.getValues(B),function(ft,ht){return Et(z,ht)===-1}):L.getValues(B),Q=c.get(["data",H?"withName":"withoutName"]);O.push(o(Q,{name:H,value:Z.join(E)}))}A+=O.join(E)+k,_.push(A)}});var x=c.getModel(["series","multiple","separator"]),b=x.get("middle"),w=x.get("end");g+=_.join(b)+w,u.setAttribute("aria-label",g)}}}}function o(u,f){if(!it(u))return u;var c=u;return D(f,function(h,v){c=c.replace(new RegExp("\\{\\s*"+v+"\\s*\\}","g"),h)}),c}function s(){var u=r.get("title");return u&&u.length&&(u=u[0]),u&&u.text}function l(u){var f=r.getLocaleModel().get(["series","typeNames"]);return f[u]||f.chart}}function MQ(r){if(!(!r||!r.aria)){var t=r.aria;t.show!=null&&(t.enabled=t.show),t.label=t.label||{},D(["description","general","series","data"],function(e){t[e]!=null&&(t.label[e]=t[e])})}}function IQ(r){r.registerPreprocessor(MQ),r.registerVisual(r.PRIORITY.VISUAL.ARIA,DQ)}var UD={value:"eq","<":"lt","<=":"lte",">":"gt",">=":"gte","=":"eq","!=":"ne","<>":"ne"},LQ=function(){function r(t){var e=this._condVal=it(t)?new RegExp(t):B5(t)?t:null;if(e==null){var n="";Xt(n)}}return r.prototype.evaluate=function(t){var e=typeof t;return it(e)?this._condVal.test(t):Ut(e)?this._condVal.test(t+""):!1},r}(),PQ=function(){function r(){}return r.prototype.evaluate=function(){return this.value},r}(),RQ=function(){function r(){}return r.prototype.evaluate=function(){for(var t=this.children,e=0;e<t.length;e++)if(!t[e].evaluate())return!1;return!0},r}(),EQ=function(){function r(){}return r.prototype.evaluate=function(){for(var t=this.children,e=0;e<t.length;e++)if(t[e].evaluate())return!0;return!1},r}(),kQ=function(){function r(){}return r.prototype.evaluate=function(){return!this.child.evaluate()},r}(),OQ=function(){function r(){}return r.prototype.evaluate=function(){for(var t=!!this.valueParser,e=this.getValue,n=e(this.valueGetterParam),a=t?this.valueParser(n):null,i=0;i<this.subCondList.length;i++)if(!this.subCondList[i].evaluate(t?a:n))return!1;return!0},r}();function tS(r,t){if(r===!0||r===!1){var e=new PQ;return e.value=r,e}var n="";return xO(r)||Xt(n),r.and?YD("and",r,t):r.or?YD("or",r,t):r.not?NQ(r,t):VQ(r,t)}function YD(r,t,e){var n=t[r],a="";X(n)||Xt(a),n.length||Xt(a);var i=r==="and"?new RQ:new EQ;return i.children=K(n,function(o){return tS(o,e)}),i.children.length||Xt(a),i}function NQ(r,t){var e=r.not,n="";xO(e)||Xt(n);var a=new kQ;return a.child=tS(e,t),a.child||Xt(n),a}function VQ(r,t){for(var e="",n=t.prepareGetValue(r),a=[],i=Ft(r),o=r.parser,s=o?rP(o):null,l=0;l<i.length;l++){var u=i[l];if(!(u==="parser"||t.valueGetterAttrMap.get(u))){var f=ut(UD,u)?UD[u]:u,c=r[u],h=s?s(c):c,v=T4(f,h)||f==="reg"&&new LQ(h);v||Xt(e),a.push(v)}}a.length||Xt(e);var d=new OQ;return d.valueGetterParam=n,d.valueParser=s,d.getValue=t.getValue,d.subCondList=a,d}function xO(r){return gt(r)&&!er(r)}var BQ=function(){function r(t,e){this._cond=tS(t,e)}return r.prototype.evaluate=function(){return this._cond.evaluate()},r}();function zQ(r,t){return new BQ(r,t)}var FQ={type:"echarts:filter",transform:function(r){for(var t=r.upstream,e,n=zQ(r.config,{valueGetterAttrMap:ct({dimension:!0}),prepareGetValue:function(s){var l="",u=s.dimension;ut(s,"dimension")||Xt(l);var f=t.getDimensionInfo(u);return f||Xt(l),{dimIdx:f.index}},getValue:function(s){return t.retrieveValueFromItem(e,s.dimIdx)}}),a=[],i=0,o=t.count();i<o;i++)e=t.getRawDataItem(i),n.evaluate()&&a.push(e);return{data:a}}},GQ={type:"echarts:sort",transform:function(r){var t=r.upstream,e=r.config,n="",a=te(e);a.length||Xt(n);var i=[];D(a,function(f){var c=f.dimension,h=f.order,v=f.parser,d=f.incomparable;if(c==null&&Xt(n),h!=="asc"&&h!=="desc"&&Xt(n),d&&d!=="min"&&d!=="max"){var p="";Xt(p)}if(h!=="asc"&&h!=="desc"){var g="";Xt(g)}var y=t.getDimensionInfo(c);y||Xt(n);var m=v?rP(v):null;v&&!m&&Xt(n),i.push({dimIdx:y.index,parser:m,comparator:new aP(h,d)})});var o=t.sourceFormat;o!==rr&&o!==nn&&Xt(n);for(var s=[],l=0,u=t.count();l<u;l++)s.push(t.getRawDataItem(l));return s.sort(function(f,c){for(var h=0;h<i.length;h++){var v=i[h],d=t.retrieveValueFromItem(f,v.dimIdx),p=t.retrieveValueFromItem(c,v.dimIdx);v.parser&&(d=v.parser(d),p=v.parser(p));var g=v.comparator.evaluate(d,p);if(g!==0)return g}return 0}),{data:s}}};function HQ(r){r.registerTransform(FQ),r.registerTransform(GQ)}var WQ=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type="dataset",e}return t.prototype.init=function(e,n,a){r.prototype.init.call(this,e,n,a),this._sourceManager=new lP(this),Zb(this)},t.prototype.mergeOption=function(e,n){r.prototype.mergeOption.call(this,e,n),Zb(this)},t.prototype.optionUpdated=function(){this._sourceManager.dirty()},t.prototype.getSourceManager=function(){return this._sourceManager},t.type="dataset",t.defaultOption={seriesLayoutBy:Zn},t}(zt),$Q=function(r){F(t,r);function t(){var e=r!==null&&r.apply(this,arguments)||this;return e.type="dataset",e}return t.type="dataset",t}(ge);function UQ(r){r.registerComponentModel(WQ),r.registerComponentView($Q)}var Pn=ta.CMD;function Vs(r,t){return Math.abs(r-t)<1e-5}function A0(r){var t=r.data,e=r.len(),n=[],a,i=0,o=0,s=0,l=0;function u(L,P){a&&a.length>2&&n.push(a),a=[L,P]}function f(L,P,E,k){Vs(L,E)&&Vs(P,k)||a.push(L,P,E,k,E,k)}function c(L,P,E,k,z,O){var B=Math.abs(P-L),H=Math.tan(B/4)*4/3,Z=P<L?-1:1,Q=Math.cos(L),ft=Math.sin(L),ht=Math.cos(P),mt=Math.sin(P),Vt=Q*z+E,Y=ft*O+k,J=ht*z+E,U=mt*O+k,tt=z*H*Z,et=O*H*Z;a.push(Vt-tt*ft,Y+et*Q,J+tt*mt,U-et*ht,J,U)}for(var h,v,d,p,g=0;g<e;){var y=t[g++],m=g===1;switch(m&&(i=t[g],o=t[g+1],s=i,l=o,(y===Pn.L||y===Pn.C||y===Pn.Q)&&(a=[s,l])),y){case Pn.M:i=s=t[g++],o=l=t[g++],u(s,l);break;case Pn.L:h=t[g++],v=t[g++],f(i,o,h,v),i=h,o=v;break;case Pn.C:a.push(t[g++],t[g++],t[g++],t[g++],i=t[g++],o=t[g++]);break;case Pn.Q:h=t[g++],v=t[g++],d=t[g++],p=t[g++],a.push(i+2/3*(h-i),o+2/3*(v-o),d+2/3*(h-d),p+2/3*(v-p),d,p),i=d,o=p;break;case Pn.A:var _=t[g++],S=t[g++],x=t[g++],b=t[g++],w=t[g++],C=t[g++]+w;g+=1;var T=!t[g++];h=Math.cos(w)*x+_,v=Math.sin(w)*b+S,m?(s=h,l=v,u(s,l)):f(i,o,h,v),i=Math.cos(C)*x+_,o=Math.sin(C)*b+S;for(var A=(T?-1:1)*Math.PI/2,M=w;T?M>C:M<C;M+=A){var I=T?Math.max(M+A,C):Math.min(M+A,C);c(M,I,_,S,x,b)}break;case Pn.R:s=i=t[g++],l=o=t[g++],h=s+t[g++],v=l+t[g++],u(h,l),f(h,l,h,v),f(h,v,s,v),f(s,v,s,l),f(s,l,h,l);break;case Pn.Z:a&&f(i,o,s,l),i=s,o=l;break}}return a&&a.length>2&&n.push(a),n}function D0(r,t,e,n,a,i,o,s,l,u){if(Vs(r,e)&&Vs(t,n)&&Vs(a,o)&&Vs(i,s)){l.push(o,s);return}var f=2/u,c=f*f,h=o-r,v=s-t,d=Math.sqrt(h*h+v*v);h/=d,v/=d;var p=e-r,g=n-t,y=a-o,m=i-s,_=p*p+g*g,S=y*y+m*m;if(_<c&&S<c){l.push(o,s);return}var x=h*p+v*g,b=-h*y-v*m,w=_-x*x,C=S-b*b;if(w<c&&x>=0&&C<c&&b>=0){l.push(o,s);return}var T=[],A=[];Si(r,e,a,o,.5,T),Si(t,n,i,s,.5,A),D0(T[0],A[0],T[1],A[1],T[2],A[2],T[3],A[3],l,u),D0(T[4],A[4],T[5],A[5],T[6],A[6],T[7],A[7],l,u)}function YQ(r,t){var e=A0(r),n=[];t=t||1;for(var a=0;a<e.length;a++){var i=e[a],o=[],s=i[0],l=i[1];o.push(s,l);for(var u=2;u<i.length;){var f=i[u++],c=i[u++],h=i[u++],v=i[u++],d=i[u++],p=i[u++];D0(s,l,f,c,h,v,d,p,o,t),s=d,l=p}n.push(o)}return n}function bO(r,t,e){var n=r[t],a=r[1-t],i=Math.abs(n/a),o=Math.ceil(Math.sqrt(i*e)),s=Math.floor(e/o);s===0&&(s=1,o=e);for(var l=[],u=0;u<o;u++)l.push(s);var f=o*s,c=e-f;if(c>0)for(var u=0;u<c;u++)l[u%o]+=1;return l}function XD(r,t,e){for(var n=r.r0,a=r.r,i=r.startAngle,o=r.endAngle,s=Math.abs(o-i),l=s*a,u=a-n,f=l>Math.abs(u),c=bO([l,u],f?0:1,t),h=(f?s:u)/c.length,v=0;v<c.length;v++)for(var d=(f?u:s)/c[v],p=0;p<c[v];p++){var g={};f?(g.startAngle=i+h*v,g.endAngle=i+h*(v+1),g.r0=n+d*p,g.r=n+d*(p+1)):(g.startAngle=i+d*p,g.endAngle=i+d*(p+1),g.r0=n+h*v,g.r=n+h*(v+1)),g.clockwise=r.clockwise,g.cx=r.cx,g.cy=r.cy,e.push(g)}}function XQ(r,t,e){for(var n=r.width,a=r.height,i=n>a,o=bO([n,a],i?0:1,t),s=i?"width":"height",l=i?"height":"width",u=i?"x":"y",f=i?"y":"x",c=r[s]/o.length,h=0;h<o.length;h++)for(var v=r[l]/o[h],d=0;d<o[h];d++){var p={};p[u]=h*c,p[f]=d*v,p[s]=c,p[l]=v,p.x+=r.x,p.y+=r.y,e.push(p)}}function ZD(r,t,e,n){return r*n-e*t}function ZQ(r,t,e,n,a,i,o,s){var l=e-r,u=n-t,f=o-a,c=s-i,h=ZD(f,c,l,u);if(Math.abs(h)<1e-6)return null;var v=r-a,d=t-i,p=ZD(v,d,f,c)/h;return p<0||p>1?null:new Mt(p*l+r,p*u+t)}function qQ(r,t,e){var n=new Mt;Mt.sub(n,e,t),n.normalize();var a=new Mt;Mt.sub(a,r,t);var i=a.dot(n);return i}function Cs(r,t){var e=r[r.length-1];e&&e[0]===t[0]&&e[1]===t[1]||r.push(t)}function KQ(r,t,e){for(var n=r.length,a=[],i=0;i<n;i++){var o=r[i],s=r[(i+1)%n],l=ZQ(o[0],o[1],s[0],s[1],t.x,t.y,e.x,e.y);l&&a.push({projPt:qQ(l,t,e),pt:l,idx:i})}if(a.length<2)return[{points:r},{points:r}];a.sort(function(g,y){return g.projPt-y.projPt});var u=a[0],f=a[a.length-1];if(f.idx<u.idx){var c=u;u=f,f=c}for(var h=[u.pt.x,u.pt.y],v=[f.pt.x,f.pt.y],d=[h],p=[v],i=u.idx+1;i<=f.idx;i++)Cs(d,r[i].slice());Cs(d,v),Cs(d,h);for(var i=f.idx+1;i<=u.idx+n;i++)Cs(p,r[i%n].slice());return Cs(p,h),Cs(p,v),[{points:d},{points:p}]}function qD(r){var t=r.points,e=[],n=[];ld(t,e,n);var a=new Lt(e[0],e[1],n[0]-e[0],n[1]-e[1]),i=a.width,o=a.height,s=a.x,l=a.y,u=new Mt,f=new Mt;return i>o?(u.x=f.x=s+i/2,u.y=l,f.y=l+o):(u.y=f.y=l+o/2,u.x=s,f.x=s+i),KQ(t,u,f)}function Ev(r,t,e,n){if(e===1)n.push(t);else{var a=Math.floor(e/2),i=r(t);Ev(r,i[0],a,n),Ev(r,i[1],e-a,n)}return n}function jQ(r,t){for(var e=[],n=0;n<t;n++)e.push(m_(r));return e}function JQ(r,t){t.setStyle(r.style),t.z=r.z,t.z2=r.z2,t.zlevel=r.zlevel}function QQ(r){for(var t=[],e=0;e<r.length;)t.push([r[e++],r[e++]]);return t}function ttt(r,t){var e=[],n=r.shape,a;switch(r.type){case"rect":XQ(n,t,e),a=Ht;break;case"sector":XD(n,t,e),a=pr;break;case"circle":XD({r0:0,r:n.r,startAngle:0,endAngle:Math.PI*2,cx:n.cx,cy:n.cy},t,e),a=pr;break;default:var i=r.getComputedTransform(),o=i?Math.sqrt(Math.max(i[0]*i[0]+i[1]*i[1],i[2]*i[2]+i[3]*i[3])):1,s=K(YQ(r.getUpdatedPathProxy(),o),function(y){return QQ(y)}),l=s.length;if(l===0)Ev(qD,{points:s[0]},t,e);else if(l===t)for(var u=0;u<l;u++)e.push({points:s[u]});else{var f=0,c=K(s,function(y){var m=[],_=[];ld(y,m,_);var S=(_[1]-m[1])*(_[0]-m[0]);return f+=S,{poly:y,area:S}});c.sort(function(y,m){return m.area-y.area});for(var h=t,u=0;u<l;u++){var v=c[u];if(h<=0)break;var d=u===l-1?h:Math.ceil(v.area/f*t);d<0||(Ev(qD,{points:v.poly},d,e),h-=d)}}a=gr;break}if(!a)return jQ(r,t);for(var p=[],u=0;u<e.length;u++){var g=new a;g.setShape(e[u]),JQ(r,g),p.push(g)}return p}function ett(r,t){var e=r.length,n=t.length;if(e===n)return[r,t];for(var a=[],i=[],o=e<n?r:t,s=Math.min(e,n),l=Math.abs(n-e)/6,u=(s-2)/6,f=Math.ceil(l/u)+1,c=[o[0],o[1]],h=l,v=2;v<s;){var d=o[v-2],p=o[v-1],g=o[v++],y=o[v++],m=o[v++],_=o[v++],S=o[v++],x=o[v++];if(h<=0){c.push(g,y,m,_,S,x);continue}for(var b=Math.min(h,f-1)+1,w=1;w<=b;w++){var C=w/b;Si(d,g,m,S,C,a),Si(p,y,_,x,C,i),d=a[3],p=i[3],c.push(a[1],i[1],a[2],i[2],d,p),g=a[5],y=i[5],m=a[6],_=i[6]}h-=b-1}return o===r?[c,t]:[r,c]}function KD(r,t){for(var e=r.length,n=r[e-2],a=r[e-1],i=[],o=0;o<t.length;)i[o++]=n,i[o++]=a;return i}function rtt(r,t){for(var e,n,a,i=[],o=[],s=0;s<Math.max(r.length,t.length);s++){var l=r[s],u=t[s],f=void 0,c=void 0;l?u?(e=ett(l,u),f=e[0],c=e[1],n=f,a=c):(c=KD(a||l,l),f=l):(f=KD(n||u,u),c=u),i.push(f),o.push(c)}return[i,o]}function jD(r){for(var t=0,e=0,n=0,a=r.length,i=0,o=a-2;i<a;o=i,i+=2){var s=r[o],l=r[o+1],u=r[i],f=r[i+1],c=s*f-u*l;t+=c,e+=(s+u)*c,n+=(l+f)*c}return t===0?[r[0]||0,r[1]||0]:[e/t/3,n/t/3,t]}function ntt(r,t,e,n){for(var a=(r.length-2)/6,i=1/0,o=0,s=r.length,l=s-2,u=0;u<a;u++){for(var f=u*6,c=0,h=0;h<s;h+=2){var v=h===0?f:(f+h-2)%l+2,d=r[v]-e[0],p=r[v+1]-e[1],g=t[h]-n[0],y=t[h+1]-n[1],m=g-d,_=y-p;c+=m*m+_*_}c<i&&(i=c,o=u)}return o}function att(r){for(var t=[],e=r.length,n=0;n<e;n+=2)t[n]=r[e-n-2],t[n+1]=r[e-n-1];return t}function itt(r,t,e,n){for(var a=[],i,o=0;o<r.length;o++){var s=r[o],l=t[o],u=jD(s),f=jD(l);i==null&&(i=u[2]<0!=f[2]<0);var c=[],h=[],v=0,d=1/0,p=[],g=s.length;i&&(s=att(s));for(var y=ntt(s,l,u,f)*6,m=g-2,_=0;_<m;_+=2){var S=(y+_)%m+2;c[_+2]=s[S]-u[0],c[_+3]=s[S+1]-u[1]}c[0]=s[y]-u[0],c[1]=s[y+1]-u[1];for(var x=n/e,b=-n/2;b<=n/2;b+=x){for(var w=Math.sin(b),C=Math.cos(b),T=0,_=0;_<s.length;_+=2){var A=c[_],M=c[_+1],I=l[_]-f[0],L=l[_+1]-f[1],P=I*C-L*w,E=I*w+L*C;p[_]=P,p[_+1]=E;var k=P-A,z=E-M;T+=k*k+z*z}if(T<d){d=T,v=b;for(var O=0;O<p.length;O++)h[O]=p[O]}}a.push({from:c,to:h,fromCp:u,toCp:f,rotation:-v})}return a}function kv(r){return r.__isCombineMorphing}var wO="__mOriginal_";function Ov(r,t,e){var n=wO+t,a=r[n]||r[t];r[n]||(r[n]=r[t]);var i=e.replace,o=e.after,s=e.before;r[t]=function(){var l=arguments,u;return s&&s.apply(this,l),i?u=i.apply(this,l):u=a.apply(this,l),o&&o.apply(this,l),u}}function Wu(r,t){var e=wO+t;r[e]&&(r[t]=r[e],r[e]=null)}function JD(r,t){for(var e=0;e<r.length;e++)for(var n=r[e],a=0;a<n.length;){var i=n[a],o=n[a+1];n[a++]=t[0]*i+t[2]*o+t[4],n[a++]=t[1]*i+t[3]*o+t[5]}}function TO(r,t){var e=r.getUpdatedPathProxy(),n=t.getUpdatedPathProxy(),a=rtt(A0(e),A0(n)),i=a[0],o=a[1],s=r.getComputedTransform(),l=t.getComputedTransform();function u(){this.transform=null}s&&JD(i,s),l&&JD(o,l),Ov(t,"updateTransform",{replace:u}),t.transform=null;var f=itt(i,o,10,Math.PI),c=[];Ov(t,"buildPath",{replace:function(h){for(var v=t.__morphT,d=1-v,p=[],g=0;g<f.length;g++){var y=f[g],m=y.from,_=y.to,S=y.rotation*v,x=y.fromCp,b=y.toCp,w=Math.sin(S),C=Math.cos(S);dh(p,x,b,v);for(var T=0;T<m.length;T+=2){var A=m[T],M=m[T+1],I=_[T],L=_[T+1],P=A*d+I*v,E=M*d+L*v;c[T]=P*C-E*w+p[0],c[T+1]=P*w+E*C+p[1]}var k=c[0],z=c[1];h.moveTo(k,z);for(var T=2;T<m.length;){var I=c[T++],L=c[T++],O=c[T++],B=c[T++],H=c[T++],Z=c[T++];k===I&&z===L&&O===H&&B===Z?h.lineTo(H,Z):h.bezierCurveTo(I,L,O,B,H,Z),k=H,z=Z}}}})}function eS(r,t,e){if(!r||!t)return t;var n=e.done,a=e.during;TO(r,t),t.__morphT=0;function i(){Wu(t,"buildPath"),Wu(t,"updateTransform"),t.__morphT=-1,t.createPathProxy(),t.dirtyShape()}return t.animateTo({__morphT:1},pt({during:function(o){t.dirtyShape(),a&&a(o)},done:function(){i(),n&&n()}},e)),t}function ott(r,t,e,n,a,i){var o=16;r=a===e?0:Math.round(32767*(r-e)/(a-e)),t=i===n?0:Math.round(32767*(t-n)/(i-n));for(var s=0,l,u=(1<<o)/2;u>0;u/=2){var f=0,c=0;(r&u)>0&&(f=1),(t&u)>0&&(c=1),s+=u*u*(3*f^c),c===0&&(f===1&&(r=u-1-r,t=u-1-t),l=r,r=t,t=l)}return s}function Nv(r){var t=1/0,e=1/0,n=-1/0,a=-1/0,i=K(r,function(s){var l=s.getBoundingRect(),u=s.getComputedTransform(),f=l.x+l.width/2+(u?u[4]:0),c=l.y+l.height/2+(u?u[5]:0);return t=Math.min(f,t),e=Math.min(c,e),n=Math.max(f,n),a=Math.max(c,a),[f,c]}),o=K(i,function(s,l){return{cp:s,z:ott(s[0],s[1],t,e,n,a),path:r[l]}});return o.sort(function(s,l){return s.z-l.z}).map(function(s){return s.path})}function CO(r){return ttt(r.path,r.count)}function M0(){return{fromIndividuals:[],toIndividuals:[],count:0}}function stt(r,t,e){var n=[];function a(x){for(var b=0;b<x.length;b++){var w=x[b];kv(w)?a(w.childrenRef()):w instanceof Ot&&n.push(w)}}a(r);var i=n.length;if(!i)return M0();var o=e.dividePath||CO,s=o({path:t,count:i});if(s.length!==i)return console.error("Invalid morphing: unmatched splitted path"),M0();n=Nv(n),s=Nv(s);for(var l=e.done,u=e.during,f=e.individualDelay,c=new ga,h=0;h<i;h++){var v=n[h],d=s[h];d.parent=t,d.copyTransform(c),f||TO(v,d)}t.__isCombineMorphing=!0,t.childrenRef=function(){return s};function p(x){for(var b=0;b<s.length;b++)s[b].addSelfToZr(x)}Ov(t,"addSelfToZr",{after:function(x){p(x)}}),Ov(t,"removeSelfFromZr",{after:function(x){for(var b=0;b<s.length;b++)s[b].removeSelfFromZr(x)}});function g(){t.__isCombineMorphing=!1,t.__morphT=-1,t.childrenRef=null,Wu(t,"addSelfToZr"),Wu(t,"removeSelfFromZr")}var y=s.length;if(f)for(var m=y,_=function(){m--,m===0&&(g(),l&&l())},h=0;h<y;h++){var S=f?pt({delay:(e.delay||0)+f(h,y,n[h],s[h]),done:_},e):e;eS(n[h],s[h],S)}else t.__morphT=0,t.animateTo({__morphT:1},pt({during:function(x){for(var b=0;b<y;b++){var w=s[b];w.__morphT=t.__morphT,w.dirtyShape()}u&&u(x)},done:function(){g();for(var x=0;x<r.length;x++)Wu(r[x],"updateTransform");l&&l()}},e));return t.__zr&&p(t.__zr),{fromIndividuals:n,toIndividuals:s,count:y}}function ltt(r,t,e){var n=t.length,a=[],i=e.dividePath||CO;function o(v){for(var d=0;d<v.length;d++){var p=v[d];kv(p)?o(p.childrenRef()):p instanceof Ot&&a.push(p)}}if(kv(r)){o(r.childrenRef());var s=a.length;if(s<n)for(var l=0,u=s;u<n;u++)a.push(m_(a[l++%s]));a.length=n}else{a=i({path:r,count:n});for(var f=r.getComputedTransform(),u=0;u<a.length;u++)a[u].setLocalTransform(f);if(a.length!==n)return console.error("Invalid morphing: unmatched splitted path"),M0()}a=Nv(a),t=Nv(t);for(var c=e.individualDelay,u=0;u<n;u++){var h=c?pt({delay:(e.delay||0)+c(u,n,a[u],t[u])},e):e;eS(a[u],t[u],h)}return{fromIndividuals:a,toIndividuals:t,count:t.length}}function QD(r){return X(r[0])}function tM(r,t){for(var e=[],n=r.length,a=0;a<n;a++)e.push({one:r[a],many:[]});for(var a=0;a<t.length;a++){var i=t[a].length,o=void 0;for(o=0;o<i;o++)e[o%n].many.push(t[a][o])}for(var s=0,a=n-1;a>=0;a--)if(!e[a].many.length){var l=e[s].many;if(l.length<=1)if(s)s=0;else return e;var i=l.length,u=Math.ceil(i/2);e[a].many=l.slice(u,i),e[s].many=l.slice(0,u),s++}return e}var utt={clone:function(r){for(var t=[],e=1-Math.pow(1-r.path.style.opacity,1/r.count),n=0;n<r.count;n++){var a=m_(r.path);a.setStyle("opacity",e),t.push(a)}return t},split:null};function Sy(r,t,e,n,a,i){if(!r.length||!t.length)return;var o=dl("update",n,a);if(!(o&&o.duration>0))return;var s=n.getModel("universalTransition").get("delay"),l=Object.assign({setToFinal:!0},o),u,f;QD(r)&&(u=r,f=t),QD(t)&&(u=t,f=r);function c(y,m,_,S,x){var b=y.many,w=y.one;if(b.length===1&&!x){var C=m?b[0]:w,T=m?w:b[0];if(kv(C))c({many:[C],one:T},!0,_,S,!0);else{var A=s?pt({delay:s(_,S)},l):l;eS(C,T,A),i(C,T,C,T,A)}}else for(var M=pt({dividePath:utt[e],individualDelay:s&&function(z,O,B,H){return s(z+_,S)}},l),I=m?stt(b,w,M):ltt(w,b,M),L=I.fromIndividuals,P=I.toIndividuals,E=L.length,k=0;k<E;k++){var A=s?pt({delay:s(k,E)},l):l;i(L[k],P[k],m?b[k]:y.one,m?y.one:b[k],A)}}for(var h=u?u===r:r.length>t.length,v=u?tM(f,u):tM(h?t:r,[h?r:t]),d=0,p=0;p<v.length;p++)d+=v[p].many.length;for(var g=0,p=0;p<v.length;p++)c(v[p],h,g,d),g+=v[p].many.length}function ho(r){if(!r)return[];if(X(r)){for(var t=[],e=0;e<r.length;e++)t.push(ho(r[e]));return t}var n=[];return r.traverse(function(a){a instanceof Ot&&!a.disableMorphing&&!a.invisible&&!a.ignore&&n.push(a)}),n}var AO=1e4,ftt=0,eM=1,rM=2,ctt=Wt();function htt(r,t){for(var e=r.dimensions,n=0;n<e.length;n++){var a=r.getDimensionInfo(e[n]);if(a&&a.otherDims[t]===0)return e[n]}}function vtt(r,t,e){var n=r.getDimensionInfo(e),a=n&&n.ordinalMeta;if(n){var i=r.get(n.name,t);return a&&a.categories[i]||i+""}}function nM(r,t,e,n){var a=n?"itemChildGroupId":"itemGroupId",i=htt(r,a);if(i){var o=vtt(r,t,i);return o}var s=r.getRawDataItem(t),l=n?"childGroupId":"groupId";if(s&&s[l])return s[l]+"";if(!n)return e||r.getId(t)}function aM(r){var t=[];return D(r,function(e){var n=e.data,a=e.dataGroupId;if(!(n.count()>AO))for(var i=n.getIndices(),o=0;o<i.length;o++)t.push({data:n,groupId:nM(n,o,a,!1),childGroupId:nM(n,o,a,!0),divide:e.divide,dataIndex:o})}),t}function xy(r,t,e){r.traverse(function(n){n instanceof Ot&&he(n,{style:{opacity:0}},t,{dataIndex:e,isFrom:!0})})}function by(r){if(r.parent){var t=r.getComputedTransform();r.setLocalTransform(t),r.parent.remove(r)}}function As(r){r.stopAnimation(),r.isGroup&&r.traverse(function(t){t.stopAnimation()})}function dtt(r,t,e){var n=dl("update",e,t);n&&r.traverse(function(a){if(a instanceof tn){var i=sG(a);i&&a.animateFrom({style:i},n)}})}function ptt(r,t){var e=r.length;if(e!==t.length)return!1;for(var n=0;n<e;n++){var a=r[n],i=t[n];if(a.data.getId(a.dataIndex)!==i.data.getId(i.dataIndex))return!1}return!0}function DO(r,t,e){var n=aM(r),a=aM(t);function i(_,S,x,b,w){(x||_)&&S.animateFrom({style:x&&x!==_?W(W({},x.style),_.style):_.style},w)}var o=!1,s=ftt,l=ct(),u=ct();n.forEach(function(_){_.groupId&&l.set(_.groupId,!0),_.childGroupId&&u.set(_.childGroupId,!0)});for(var f=0;f<a.length;f++){var c=a[f].groupId;if(u.get(c)){s=eM;break}var h=a[f].childGroupId;if(h&&l.get(h)){s=rM;break}}function v(_,S){return function(x){var b=x.data,w=x.dataIndex;return S?b.getId(w):_?s===eM?x.childGroupId:x.groupId:s===rM?x.childGroupId:x.groupId}}var d=ptt(n,a),p={};if(!d)for(var f=0;f<a.length;f++){var g=a[f],y=g.data.getItemGraphicEl(g.dataIndex);y&&(p[y.id]=!0)}function m(_,S){var x=n[S],b=a[_],w=b.data.hostModel,C=x.data.getItemGraphicEl(x.dataIndex),T=b.data.getItemGraphicEl(b.dataIndex);if(C===T){T&&dtt(T,b.dataIndex,w);return}C&&p[C.id]||T&&(As(T),C?(As(C),by(C),o=!0,Sy(ho(C),ho(T),b.divide,w,_,i)):xy(T,w,_))}new Da(n,a,v(!0,d),v(!1,d),null,"multiple").update(m).updateManyToOne(function(_,S){var x=a[_],b=x.data,w=b.hostModel,C=b.getItemGraphicEl(x.dataIndex),T=Zt(K(S,function(A){return n[A].data.getItemGraphicEl(n[A].dataIndex)}),function(A){return A&&A!==C&&!p[A.id]});C&&(As(C),T.length?(D(T,function(A){As(A),by(A)}),o=!0,Sy(ho(T),ho(C),x.divide,w,_,i)):xy(C,w,x.dataIndex))}).updateOneToMany(function(_,S){var x=n[S],b=x.data.getItemGraphicEl(x.dataIndex);if(!(b&&p[b.id])){var w=Zt(K(_,function(T){return a[T].data.getItemGraphicEl(a[T].dataIndex)}),function(T){return T&&T!==b}),C=a[_[0]].data.hostModel;w.length&&(D(w,function(T){return As(T)}),b?(As(b),by(b),o=!0,Sy(ho(b),ho(w),x.divide,C,_[0],i)):D(w,function(T){return xy(T,C,_[0])}))}}).updateManyToMany(function(_,S){new Da(S,_,function(x){return n[x].data.getId(n[x].dataIndex)},function(x){return a[x].data.getId(a[x].dataIndex)}).update(function(x,b){m(_[x],S[b])}).execute()}).execute(),o&&D(t,function(_){var S=_.data,x=S.hostModel,b=x&&e.getViewOfSeriesModel(x),w=dl("update",x,0);b&&x.isAnimationEnabled()&&w&&w.duration>0&&b.group.traverse(function(C){C instanceof Ot&&!C.animators.length&&C.animateFrom({style:{opacity:0}},w)})})}function iM(r){var t=r.getModel("universalTransition").get("seriesKey");return t||r.id}function oM(r){return X(r)?r.sort().join(","):r}function ti(r){if(r.hostModel)return r.hostModel.getModel("universalTransition").get("divideShape")}function gtt(r,t){var e=ct(),n=ct(),a=ct();return D(r.oldSeries,function(i,o){var s=r.oldDataGroupIds[o],l=r.oldData[o],u=iM(i),f=oM(u);n.set(f,{dataGroupId:s,data:l}),X(u)&&D(u,function(c){a.set(c,{key:f,dataGroupId:s,data:l})})}),D(t.updatedSeries,function(i){if(i.isUniversalTransitionEnabled()&&i.isAnimationEnabled()){var o=i.get("dataGroupId"),s=i.getData(),l=iM(i),u=oM(l),f=n.get(u);if(f)e.set(u,{oldSeries:[{dataGroupId:f.dataGroupId,divide:ti(f.data),data:f.data}],newSeries:[{dataGroupId:o,divide:ti(s),data:s}]});else if(X(l)){var c=[];D(l,function(d){var p=n.get(d);p.data&&c.push({dataGroupId:p.dataGroupId,divide:ti(p.data),data:p.data})}),c.length&&e.set(u,{oldSeries:c,newSeries:[{dataGroupId:o,data:s,divide:ti(s)}]})}else{var h=a.get(l);if(h){var v=e.get(h.key);v||(v={oldSeries:[{dataGroupId:h.dataGroupId,data:h.data,divide:ti(h.data)}],newSeries:[]},e.set(h.key,v)),v.newSeries.push({dataGroupId:o,data:s,divide:ti(s)})}}}}),e}function sM(r,t){for(var e=0;e<r.length;e++){var n=t.seriesIndex!=null&&t.seriesIndex===r[e].seriesIndex||t.seriesId!=null&&t.seriesId===r[e].id;if(n)return e}}function ytt(r,t,e,n){var a=[],i=[];D(te(r.from),function(o){var s=sM(t.oldSeries,o);s>=0&&a.push({dataGroupId:t.oldDataGroupIds[s],data:t.oldData[s],divide:ti(t.oldData[s]),groupIdDim:o.dimension})}),D(te(r.to),function(o){var s=sM(e.updatedSeries,o);if(s>=0){var l=e.updatedSeries[s].getData();i.push({dataGroupId:t.oldDataGroupIds[s],data:l,divide:ti(l),groupIdDim:o.dimension})}}),a.length>0&&i.length>0&&DO(a,i,n)}function mtt(r){r.registerUpdateLifecycle("series:beforeupdate",function(t,e,n){D(te(n.seriesTransition),function(a){D(te(a.to),function(i){for(var o=n.updatedSeries,s=0;s<o.length;s++)(i.seriesIndex!=null&&i.seriesIndex===o[s].seriesIndex||i.seriesId!=null&&i.seriesId===o[s].id)&&(o[s][Ah]=!0)})})}),r.registerUpdateLifecycle("series:transition",function(t,e,n){var a=ctt(e);if(a.oldSeries&&n.updatedSeries&&n.optionChanged){var i=n.seriesTransition;if(i)D(te(i),function(v){ytt(v,a,n,e)});else{var o=gtt(a,n);D(o.keys(),function(v){var d=o.get(v);DO(d.oldSeries,d.newSeries,e)})}D(n.updatedSeries,function(v){v[Ah]&&(v[Ah]=!1)})}for(var s=t.getSeries(),l=a.oldSeries=[],u=a.oldDataGroupIds=[],f=a.oldData=[],c=0;c<s.length;c++){var h=s[c].getData();h.count()<AO&&(l.push(s[c]),u.push(s[c].get("dataGroupId")),f.push(h))}})}kt([M6]);kt([w6]);kt([Z6,uU,_U,JU,u8,q8,w7,o9,M9,k9,W9,VY,lX,_X,OX,zX,qX,rZ,vZ,_Z,IZ,hq]);kt(Pq);kt(nK);kt(CE);kt(gK);kt(fk);kt(SK);kt(IK);kt(gj);kt(Oj);kt(Qf);kt(Jj);kt(eJ);kt(cJ);kt(mJ);kt(TJ);kt(LJ);kt(FJ);kt(aQ);kt(vO);kt(dO);kt(TQ);kt(_O);kt(SO);kt(IQ);kt(HQ);kt(UQ);kt(mtt);kt(W$);const _tt={class:"api-calls-chart-container"},lM=30,Stt=1e4,xtt={__name:"ApiCallsChart",setup(r){const t=Sn(),e=St(null);let n=null;const a=St({timestamps:[],apiCalls:[],tokens:[]});let i=null;const v=[{value:"realtime",label:"30分钟"},{value:"24h",label:"24小时"},{value:"7d",label:"7天"},{value:"30d",label:"30天"}],d=St("realtime");function o(){if(!e.value)return;n=hW(e.value);const u=t.isDarkMode,f=u?"#e0e0e0":"#666",c=u?"#555":"#ccc",h={title:{text:"API实时调用统计",left:"center",textStyle:{color:f}},tooltip:{trigger:"axis",axisPointer:{type:"cross",label:{backgroundColor:"#6a7985"}}},legend:{data:["API调用次数","Token使用量"],top:30,textStyle:{color:f}},grid:{left:"3%",right:"4%",bottom:"3%",containLabel:!0},xAxis:{type:"category",boundaryGap:!1,data:a.value.timestamps,axisLabel:{rotate:45,color:f},axisLine:{lineStyle:{color:c}},splitLine:{lineStyle:{color:u?"rgba(255,255,255,0.1)":"rgba(0,0,0,0.1)"}}},yAxis:[{type:"value",name:"API调用次数",position:"left",axisLine:{show:!0,lineStyle:{color:"#5470c6"}},axisLabel:{formatter:"{value}",color:f},splitLine:{lineStyle:{color:u?"rgba(255,255,255,0.1)":"rgba(0,0,0,0.1)"}}},{type:"value",name:"Token使用量",position:"right",axisLine:{show:!0,lineStyle:{color:"#91cc75"}},axisLabel:{formatter:"{value}",color:f},splitLine:{lineStyle:{color:u?"rgba(255,255,255,0.1)":"rgba(0,0,0,0.1)"}}}],series:[{name:"API调用次数",type:"line",smooth:!0,data:a.value.apiCalls,itemStyle:{color:"#5470c6"},areaStyle:{color:new $o(0,0,0,1,[{offset:0,color:"rgba(84, 112, 198, 0.5)"},{offset:1,color:"rgba(84, 112, 198, 0.1)"}])}},{name:"Token使用量",type:"line",yAxisIndex:1,smooth:!0,data:a.value.tokens,itemStyle:{color:"#91cc75"},areaStyle:{color:new $o(0,0,0,1,[{offset:0,color:"rgba(145, 204, 117, 0.5)"},{offset:1,color:"rgba(145, 204, 117, 0.1)"}])}}]};n.setOption(h),window.addEventListener("resize",()=>{n&&n.resize()})}function p(u,f){a.value.timestamps=u.map(c=>c.time),a.value.apiCalls=u.map(c=>c.value),a.value.tokens=f.map(c=>c.value),n&&n.setOption({xAxis:{data:a.value.timestamps},series:[{data:a.value.apiCalls},{data:a.value.tokens}]})}async function g(){const u=d.value,f=await t.fetchStatsHistory(u);u===d.value&&p(f.calls,f.tokens)}function y(u){d.value!==u&&(d.value=u,u==="realtime"?s():g())}function s(){if(d.value!=="realtime")return;a.value.timestamps=[],a.value.apiCalls=[],a.value.tokens=[];const f=new Date().toLocaleTimeString("zh-CN",{hour:"2-digit",minute:"2-digit",second:"2-digit"});if(t.timeSeriesData.calls.length>0&&t.timeSeriesData.tokens.length>0)a.value.timestamps=t.timeSeriesData.calls.map(c=>c.time),a.value.apiCalls=t.timeSeriesData.calls.map(c=>c.value),a.value.tokens=t.timeSeriesData.tokens.map(c=>c.value);else{const c=t.status.minuteCalls,h=l();a.value.timestamps.push(f),a.value.apiCalls.push(c),a.value.tokens.push(h)}if(a.value.timestamps.length>lM){const c=a.value.timestamps.length-lM;a.value.timestamps.splice(0,c),a.value.apiCalls.splice(0,c),a.value.tokens.splice(0,c)}n&&n.setOption({xAxis:{data:a.value.timestamps},series:[{data:a.value.apiCalls},{data:a.value.tokens}]})}function l(){let u=0;return t.apiKeyStats.length>0&&(u=t.apiKeyStats.reduce((f,c)=>{const h=Object.values(c.model_stats||{}).reduce((v,d)=>v+(d.tokens||0),0);return f+h/100},0)),Math.round(u)}return Un(()=>t.isDarkMode,u=>{n&&(n.dispose(),qs(()=>{o(),a.value.timestamps.length>0&&n.setOption({xAxis:{data:a.value.timestamps},series:[{data:a.value.apiCalls},{data:a.value.tokens}]})}))},{immediate:!1}),Pf(()=>{o(),s(),i=setInterval(()=>{t.fetchDashboardData().then(()=>{d.value==="realtime"?s():g()})},Stt)}),Yv(()=>{i&&(clearInterval(i),i=null),n&&(n.dispose(),n=null),window.removeEventListener("resize",()=>{n&&n.resize()})}),(u,f)=>(wt(),Ct("div",_tt,[V("div",{class:"range-selector"},[(wt(),Ct(Re,null,zh(v,c=>V("button",{key:c.value,class:Be(["range-button",{active:d.value===c.value}]),onClick:h=>y(c.value)},bt(c.label),11,["onClick"])),64))]),V("div",{ref_key:"chartContainer",ref:e,class:"chart-container"},null,512)]))}},uM=ea(xtt,[["__scopeId","data-v-d9262b8e"]]),btt={key:0,class:"api-key-stats-container"},wtt={class:"header-section"},Ttt={key:0,class:"api-key-input-form"},Ctt={class:"form-group"},Att=["disabled"],Dtt={class:"form-group"},Mtt=["disabled"],Itt={key:0,class:"api-key-error"},Ltt={key:1,class:"api-key-success"},Ptt={class:"form-actions"},Rtt=["disabled"],Ett={key:0},ktt={key:1},Ott=["disabled"],Ntt={key:0,class:"api-key-test-form"},Vtt={key:0,class:"testing-progress"},Btt={class:"progress-bar-container"},ztt={class:"progress-text"},Ftt={key:1,class:"form-group"},Gtt={key:2,class:"api-key-error"},Htt={key:3,class:"api-key-success"},Wtt={class:"form-actions"},$tt=["disabled"],Utt={key:0,class:"stats-grid"},Ytt={class:"stat-card"},Xtt={class:"stat-value"},Ztt={class:"stat-card"},qtt={class:"stat-value"},Ktt={class:"stat-card"},jtt={class:"stat-value"},Jtt={key:0,class:"fold-content"},Qtt={class:"stats-summary"},tet={class:"summary-item"},eet={class:"summary-value"},ret={class:"summary-item"},net={class:"summary-value"},aet={class:"summary-item"},iet={class:"summary-value"},oet={class:"api-key-stats-list"},set={key:0,class:"api-key-item"},uet={class:"api-key-header"},fet={class:"api-key-name"},cet={class:"api-key-usage"},het={class:"api-key-count"},vet={class:"api-key-limit"},det={class:"api-key-percent"},pet={class:"progress-container"},get={class:"total-tokens"},yet={class:"total-tokens-value"},met={key:0,class:"model-stats-container"},_et=["onClick"],xet={key:0,class:"model-stats-list fold-content"},bet={class:"model-info"},wet={class:"model-name"},Tet={class:"model-count"},Cet={class:"model-tokens"},Aet=["onClick"],Det={key:0,class:"pagination"},Met=["disabled"],Iet={class:"pagination-info"},Let=["disabled"],oh=20,Pet={__name:"ApiKeyStats",setup(r){const t=Sn(),e=St(!1),n=St({}),a=St(!1),i=St(""),o=St(""),s=St(""),l=St(""),u=St(!1),f=St(!1),c=St(""),h=St(""),v=St(""),d=St(!1),p=St(0),g=St(0),y=St(1);function m(){e.value=!e.value}function _(){f.value=!f.value,f.value||(c.value="",h.value="",v.value="")}function S(){a.value=!a.value,a.value||(i.value="",o.value="",s.value="",l.value="")}async function x(){if(s.value="",l.value="",!i.value.trim()){s.value="请输入API密钥";return}if(!o.value.trim()){s.value="请输入密码";return}const O=i.value.split(",").map(B=>B.trim()).filter(B=>B);if(O.length===0){s.value="请输入至少一个有效的API密钥";return}for(const B of O)if(B.length<10){s.value=`API密钥格式不正确: ${B}`;return}u.value=!0;try{await t.updateConfig("geminiApiKeys",i.value,o.value),l.value=`成功添加 ${O.length} 个API密钥`,i.value="",o.value="",await t.fetchDashboardData()}catch(B){s.value=B.message||"添加API密钥失败"}finally{u.value=!1}}async function b(){if(h.value="",v.value="",!c.value.trim()){h.value="请输入密码";return}d.value=!0,p.value=0;try{const O=await fetch("/api/test-api-keys",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({password:c.value})});if(!O.ok){const H=await O.json();throw new Error(H.detail||"测试API密钥失败")}const B=setInterval(async()=>{try{const Z=await(await fetch("/api/test-api-keys/progress")).json();p.value=Z.completed,g.value=Z.total,Z.is_completed&&(clearInterval(B),v.value=`检测完成！有效密钥: ${Z.valid} 个，无效密钥: ${Z.invalid} 个`,await t.fetchDashboardData(),d.value=!1,setTimeout(()=>{f.value&&(f.value=!1)},5e3))}catch(H){console.error("轮询进度时出错:",H)}},1e3)}catch(O){h.value=O.message||"测试API密钥失败",d.value=!1}}function w(O){n.value[O]?n.value[O]=!n.value[O]:n.value[O]=!0}const C=O=>O?"fold-icon rotated":"fold-icon",T=O=>O>75?"high":O>50?"medium":"low",A=O=>O?Object.entries(O).map(([B,H])=>({model:B,calls:H.calls,tokens:H.tokens})).sort((B,H)=>H.calls-B.calls):[],M=O=>O&&Object.keys(O).length>3,G={healthy:"正常",degraded:"降级",open:"熔断",half_open:"半开"},K=O=>G[O]||G.healthy,X=Fe(()=>{const O=t.status.keyHealth||{};return Object.keys(G).map(B=>`${G[B]} ${O[B]||0}`).join(" / ")}),I=Fe(()=>t.apiKeyStats.length?Math.ceil(t.apiKeyStats.length/oh):0),L=Fe(()=>{if(!t.apiKeyStats.length)return[];const O=(y.value-1)*oh,B=O+oh;return t.apiKeyStats.slice(O,B)});function P(){y.value<I.value&&y.value++}function E(){y.value>1&&y.value--}const k=Fe(()=>t.apiKeyStats.reduce((O,B)=>O+B.calls_24h,0)),z=Fe(()=>t.apiKeyStats.reduce((O,B)=>O+B.total_tokens,0));return(O,B)=>fe(t).status.enableVertex?Jt("",!0):(wt(),Ct("div",btt,[V("div",wtt,[V("h3",{class:"section-title fold-header",onClick:m},[B[4]||(B[4]=Pr(" API调用统计 ")),V("span",{class:Be(C(e.value))},B[3]||(B[3]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("polyline",{points:"6 9 12 15 18 9"})],-1)]),2)]),V("div",{class:"header-buttons"},[V("button",{class:"add-api-key-button",onClick:S},B[5]||(B[5]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("line",{x1:"12",y1:"5",x2:"12",y2:"19"}),V("line",{x1:"5",y1:"12",x2:"19",y2:"12"})],-1),Pr(" 添加API密钥 ")])),V("button",{class:"test-api-key-button",onClick:_},B[6]||(B[6]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("path",{d:"M20.24 12.24a6 6 0 0 0-8.49-8.49L5 10.5V19h8.5z"}),V("line",{x1:"16",y1:"8",x2:"2",y2:"22"}),V("line",{x1:"17.5",y1:"15",x2:"9",y2:"15"})],-1),Pr(" 检测API密钥 ")]))])]),ie(iu,{name:"slide"},{default:Es(()=>[a.value?(wt(),Ct("div",Ttt,[V("div",Ctt,[B[7]||(B[7]=V("label",{for:"newApiKeys"},"API密钥 (以逗号分隔)",-1)),me(V("textarea",{id:"newApiKeys","onUpdate:modelValue":B[0]||(B[0]=H=>i.value=H),placeholder:"在此输入API密钥，多个密钥请用逗号分隔（注意：如果您使用的是云部署方案或您没有配置持久化，在此处配置的api密钥在重启后会丢失）",disabled:u.value,rows:"3",class:"api-key-textarea"},null,8,Att),[[Le,i.value]])]),V("div",Dtt,[B[8]||(B[8]=V("label",{for:"apiKeyPassword"},"密码",-1)),me(V("input",{id:"apiKeyPassword","onUpdate:modelValue":B[1]||(B[1]=H=>o.value=H),type:"password",placeholder:"请输入管理密码",disabled:u.value,class:"api-key-password"},null,8,Mtt),[[Le,o.value]])]),s.value?(wt(),Ct("div",Itt,bt(s.value),1)):Jt("",!0),l.value?(wt(),Ct("div",Ltt,bt(l.value),1)):Jt("",!0),V("div",Ptt,[V("button",{class:"submit-api-key",onClick:x,disabled:u.value},[u.value?(wt(),Ct("span",Ett,"提交中...")):(wt(),Ct("span",ktt,"提交"))],8,Rtt),V("button",{class:"cancel-api-key",onClick:S,disabled:u.value}," 取消 ",8,Ott)])])):Jt("",!0)]),_:1}),ie(iu,{name:"slide"},{default:Es(()=>[f.value?(wt(),Ct("div",Ntt,[B[10]||(B[10]=V("div",{class:"form-title"},[V("h4",null,"API密钥检测"),V("p",{class:"form-description"}," 此操作将同时检测所有有效和无效API密钥的状态，有效密钥将保存在GEMINI_API_KEYS中， 而无效密钥将移至INVALID_API_KEYS。该过程在后台异步进行，不会阻塞服务运行。 ")],-1)),d.value?(wt(),Ct("div",Vtt,[V("div",Btt,[V("div",{class:"progress-bar-fill",style:Zs({width:g.value?`${p.value/g.value*100}%`:"0%"})},null,4)]),V("div",ztt," 正在检测: "+bt(p.value)+" / "+bt(g.value)+" ("+bt(Math.round(p.value/(g.value||1)*100))+"%) ",1)])):(wt(),Ct("div",Ftt,[B[9]||(B[9]=V("label",{for:"apiKeyTestPassword"},"管理密码",-1)),me(V("input",{id:"apiKeyTestPassword","onUpdate:modelValue":B[2]||(B[2]=H=>c.value=H),type:"password",placeholder:"请输入管理密码以确认操作",class:"api-key-password"},null,512),[[Le,c.value]])])),h.value?(wt(),Ct("div",Gtt,bt(h.value),1)):Jt("",!0),v.value?(wt(),Ct("div",Htt,bt(v.value),1)):Jt("",!0),V("div",Wtt,[d.value?Jt("",!0):(wt(),Ct("button",{key:0,class:"submit-api-key",onClick:b}," 开始检测 ")),V("button",{class:"cancel-api-key",onClick:_,disabled:d.value},bt(d.value?"检测中...":"取消"),9,$tt)])])):Jt("",!0)]),_:1}),e.value?Jt("",!0):(wt(),Ct("div",Utt,[V("div",Ytt,[V("div",Xtt,bt(fe(t).status.last24hCalls),1),B[11]||(B[11]=V("div",{class:"stat-label"},"24小时调用次数",-1))]),V("div",Ztt,[V("div",qtt,bt(fe(t).status.hourlyCalls),1),B[12]||(B[12]=V("div",{class:"stat-label"},"小时调用次数",-1))]),V("div",Ktt,[V("div",jtt,bt(fe(t).status.minuteCalls),1),B[13]||(B[13]=V("div",{class:"stat-label"},"分钟调用次数",-1))])])),e.value?Jt("",!0):(wt(),W0(uM,{key:1})),ie(iu,{name:"fold"},{default:Es(()=>[e.value?(wt(),Ct("div",Jtt,[V("div",Qtt,[V("div",tet,[B[14]||(B[14]=V("div",{class:"summary-label"},"总调用次数",-1)),V("div",eet,bt(k.value.toLocaleString()),1)]),V("div",ret,[B[15]||(B[15]=V("div",{class:"summary-label"},"总Token使用量",-1)),V("div",net,bt(z.value.toLocaleString()),1)]),V("div",aet,[B[16]||(B[16]=V("div",{class:"summary-label"},"API密钥数量",-1)),V("div",iet,bt(fe(t).apiKeyStats.length),1)]),V("div",{class:"summary-item"},[B[22]||(B[22]=V("div",{class:"summary-label"},"密钥状态",-1)),V("div",{class:"summary-value key-health-summary"},bt(X.value),1)])]),ie(uM),V("div",oet,[fe(t).apiKeyStats.length?Jt("",!0):(wt(),Ct("div",set," 没有API密钥使用数据 ")),(wt(!0),Ct(Re,null,zh(L.value,(H,Z)=>(wt(),Ct("div",{key:Z,class:"api-key-item"},[V("div",uet,[V("div",fet,[Pr(" API密钥: "+bt(H.api_key)+" ",1),V("span",{class:Be(["key-health-badge",H.health||"healthy"])},bt(K(H.health)),3)]),V("div",cet,[V("span",het,bt(H.calls_24h),1),B[17]||(B[17]=Pr(" / ")),V("span",vet,bt(H.limit),1),V("span",det,"("+bt(H.usage_percent)+"%)",1)])]),V("div",pet,[V("div",{class:Be(["progress-bar",T(H.usage_percent)]),style:Zs({width:Math.min(H.usage_percent,100)+"%"})},null,6)]),V("div",get,[B[18]||(B[18]=V("span",{class:"total-tokens-label"},"总Token使用量:",-1)),V("span",yet,bt(H.total_tokens.toLocaleString()),1)]),H.model_stats&&Object.keys(H.model_stats).length>0?(wt(),Ct("div",met,[V("div",{class:"model-stats-header",onClick:Q=>w(H.api_key)},[B[20]||(B[20]=V("span",{class:"model-stats-title"},"模型使用统计",-1)),V("span",{class:Be(C(n.value[H.api_key]))},B[19]||(B[19]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"14",height:"14",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("polyline",{points:"6 9 12 15 18 9"})],-1)]),2)],8,_et),ie(iu,{name:"fold"},{default:Es(()=>[n.value[H.api_key]?(wt(),Ct("div",xet,[(wt(!0),Ct(Re,null,zh(A(H.model_stats).slice(0,M(H.model_stats)&&!n.value[H.api_key]?3:void 0),(Q,ft)=>(wt(),Ct("div",{key:ft,class:"model-stat-item"},[V("div",bet,[V("div",wet,bt(Q.model),1),V("div",Tet,[V("span",null,bt(Q.calls),1),B[21]||(B[21]=V("span",{class:"model-usage-text"},"次调用",-1))]),V("div",Cet,bt(Q.tokens.toLocaleString())+" tokens",1)])]))),128)),M(H.model_stats)&&A(H.model_stats).length>3?(wt(),Ct("div",{key:0,class:"view-more-models",onClick:Q=>w(H.api_key)},bt(n.value[H.api_key]?"收起":"查看更多模型"),9,Aet)):Jt("",!0)])):Jt("",!0)]),_:2},1024)])):Jt("",!0)]))),128))]),fe(t).apiKeyStats.length>oh?(wt(),Ct("div",Det,[V("button",{class:"pagination-button",disabled:y.value===1,onClick:E}," 上一页 ",8,Met),V("div",Iet," 第 "+bt(y.value)+" 页 / 共 "+bt(I.value)+" 页 ",1),V("button",{class:"pagination-button",disabled:y.value===I.value,onClick:P}," 下一页 ",8,Let)])):Jt("",!0)])):Jt("",!0)]),_:1})]))}},Ret=ea(Pet,[["__scopeId","data-v-fbe5d972"]]),Eet={class:"info-box"},ket={class:"section-header"},Oet={key:0,class:"vertex-notice"},Net={key:1,class:"dialog-overlay"},Vet={class:"dialog"},Bet={key:0,class:"error-message"},zet={class:"dialog-buttons"},Fet=["disabled"],Get={__name:"StatusSection",setup(r){const t=Sn(),e=St(!1),n=St(""),a=St(""),i=St(!1);function o(){e.value=!0,n.value="",a.value=""}function s(){e.value=!1,n.value="",a.value=""}async function l(){if(!n.value){a.value="请输入密码";return}i.value=!0,a.value="";try{const u=await fetch("/api/reset-stats",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({password:n.value})}),f=await u.json();if(!u.ok)throw new Error(f.detail||"重置失败");await t.fetchDashboardData(),setTimeout(async()=>{try{await t.fetchDashboardData(),console.log("重置后数据已刷新")}catch(c){console.error("刷新数据失败:",c)}finally{s()}},1e3)}catch(u){console.error("重置失败:",u),a.value=u.message||"重置失败，请检查密码是否正确"}finally{i.value=!1}}return(u,f)=>(wt(),Ct("div",Eet,[V("div",ket,[f[2]||(f[2]=V("h2",{class:"section-title"},"🟢 运行状态",-1)),f[3]||(f[3]=V("div",{class:"status-container"},[V("p",{class:"status"},"服务运行中")],-1)),fe(t).status.enableVertex?Jt("",!0):(wt(),Ct("button",{key:0,class:"reset-button",onClick:o},f[1]||(f[1]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("path",{d:"M3 12a9 9 0 1 0 9-9 9.75 9.75 0 0 0-6.74 2.74L3 8"}),V("path",{d:"M3 3v5h5"})],-1),Pr(" 重置次数 ")])))]),fe(t).status.enableVertex?(wt(),Ct("div",Oet,f[4]||(f[4]=[V("div",{class:"notice-icon"},"ℹ️",-1),V("div",{class:"notice-content"},[V("h3",{class:"notice-title"},"Vertex 模式说明"),V("p",{class:"notice-text"},"当前项目处于 Vertex 模式，完全基于 gzzhongqi/vertex2openai 项目开发。目前处于初步适配阶段，统计功能正在逐步完善中。")],-1)]))):Jt("",!0),ie(x5),ie(Ret),e.value?(wt(),Ct("div",Net,[V("div",Vet,[f[5]||(f[5]=V("h3",null,"重置API调用统计",-1)),f[6]||(f[6]=V("p",null,"请输入密码以确认重置操作：",-1)),me(V("input",{type:"password","onUpdate:modelValue":f[0]||(f[0]=c=>n.value=c),placeholder:"请输入密码",onKeyup:DI(l,["enter"])},null,544),[[Le,n.value]]),a.value?(wt(),Ct("div",Bet,bt(a.value),1)):Jt("",!0),V("div",zet,[V("button",{class:"cancel-button",onClick:s},"取消"),V("button",{class:"confirm-button",onClick:l,disabled:i.value},bt(i.value?"重置中...":"确认重置"),9,Fet)])])])):Jt("",!0)]))}},Het=ea(Get,[["__scopeId","data-v-257ff3a7"]]),Wet={class:"basic-config"},$et={class:"config-form"},Uet={class:"config-row"},Yet={class:"config-group"},Xet={class:"config-group"},Zet={__name:"BasicConfig",setup(r,{expose:t}){const e=Sn(),n=Ii({maxRequestsPerMinute:0,maxRequestsPerDayPerIp:0}),a=St(!1);Un(()=>({storeMaxRequestsPerMinute:e.config.maxRequestsPerMinute,storeMaxRequestsPerDayPerIp:e.config.maxRequestsPerDayPerIp,configIsActuallyLoaded:e.isConfigLoaded}),o=>{o.configIsActuallyLoaded&&!a.value&&(n.maxRequestsPerMinute=o.storeMaxRequestsPerMinute,n.maxRequestsPerDayPerIp=o.storeMaxRequestsPerDayPerIp,a.value=!0)},{deep:!0,immediate:!0});async function i(o){if(!o)return{success:!1,message:"基本配置: 密码未提供"};let s=!0,l=[];const u=Object.keys(n);for(const f of u)if(n[f]!==e.config[f])try{await e.updateConfig(f,n[f],o),e.config[f]=n[f],l.push(`${f} 保存成功`)}catch(c){s=!1,l.push(`${f} 保存失败: ${c.message||"未知错误"}`)}return s&&l.length===0?{success:!0,message:"基本配置: 无更改需要保存"}:{success:s,message:`基本配置: ${l.join("; ")}`}}return t({saveComponentConfigs:i,localConfig:n}),(o,s)=>(wt(),Ct("div",Wet,[s[4]||(s[4]=V("h3",{class:"section-title"},"基本配置",-1)),V("div",$et,[V("div",Uet,[V("div",Yet,[s[2]||(s[2]=V("label",{class:"config-label"},"每分钟请求限制",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":s[0]||(s[0]=l=>n.maxRequestsPerMinute=l),min:"0"},null,512),[[Le,n.maxRequestsPerMinute,void 0,{number:!0}]])]),V("div",Xet,[s[3]||(s[3]=V("label",{class:"config-label"},"每IP每日请求限制",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":s[1]||(s[1]=l=>n.maxRequestsPerDayPerIp=l),min:"0"},null,512),[[Le,n.maxRequestsPerDayPerIp,void 0,{number:!0}]])])])])]))}},qet=ea(Zet,[["__scopeId","data-v-bf7ce7b9"]]),Ket={class:"features-config"},jet={class:"config-form"},Jet={class:"config-row"},Qet={class:"config-group"},trt={class:"toggle-wrapper"},ert={for:"searchMode",class:"toggle-label"},rrt={class:"toggle-text"},nrt={class:"config-group"},art={class:"toggle-wrapper"},irt={for:"fakeStreaming",class:"toggle-label"},ort={class:"toggle-text"},srt={class:"config-group"},lrt={class:"toggle-wrapper"},urt={for:"randomString",class:"toggle-label"},frt={class:"toggle-text"},crt={class:"config-row"},hrt={class:"config-group full-width"},vrt={class:"config-row"},drt={class:"config-group"},prt={class:"config-group"},grt={class:"config-group"},yrt={class:"config-row"},mrt={class:"config-group"},_rt={class:"config-group"},Srt={class:"config-group"},xrt={class:"config-row"},brt={class:"config-group"},wrt={__name:"FeaturesConfig",setup(r,{expose:t}){const e=Sn(),n=Ii({searchMode:!1,searchPrompt:"",maxRetryNum:0,fakeStreaming:!1,fakeStreamingInterval:0,randomString:!1,randomStringLength:0,concurrentRequests:1,increaseConcurrentOnFailure:0,maxConcurrentRequests:1,maxEmptyResponses:0}),a=St(!1);Un(()=>({storeSearchMode:e.config.searchMode,storeSearchPrompt:e.config.searchPrompt,storeMaxRetryNum:e.config.maxRetryNum,storeFakeStreaming:e.config.fakeStreaming,storeFakeStreamingInterval:e.config.fakeStreamingInterval,storeRandomString:e.config.randomString,storeRandomStringLength:e.config.randomStringLength,storeConcurrentRequests:e.config.concurrentRequests,storeIncreaseConcurrentOnFailure:e.config.increaseConcurrentOnFailure,storeMaxConcurrentRequests:e.config.maxConcurrentRequests,storeMaxEmptyResponses:e.config.maxEmptyResponses,configIsActuallyLoaded:e.isConfigLoaded}),s=>{s.configIsActuallyLoaded&&!a.value&&(n.searchMode=s.storeSearchMode,n.searchPrompt=s.storeSearchPrompt,n.maxRetryNum=s.storeMaxRetryNum,n.fakeStreaming=s.storeFakeStreaming,n.fakeStreamingInterval=s.storeFakeStreamingInterval,n.randomString=s.storeRandomString,n.randomStringLength=s.storeRandomStringLength,n.concurrentRequests=s.storeConcurrentRequests,n.increaseConcurrentOnFailure=s.storeIncreaseConcurrentOnFailure,n.maxConcurrentRequests=s.storeMaxConcurrentRequests,n.maxEmptyResponses=s.storeMaxEmptyResponses,a.value=!0)},{deep:!0,immediate:!0});async function i(s){if(!s)return{success:!1,message:"功能配置: 密码未提供"};let l=!0,u=[];const f=Object.keys(n);for(const c of f)if(n[c]!==e.config[c])try{await e.updateConfig(c,n[c],s),e.config[c]=n[c],u.push(`${c} 保存成功`)}catch(h){l=!1,u.push(`${c} 保存失败: ${h.message||"未知错误"}`)}return l&&u.length===0?{success:!0,message:"功能配置: 无更改需要保存"}:{success:l,message:`功能配置: ${u.join("; ")}`}}function o(s){return s?"启用":"禁用"}return t({saveComponentConfigs:i,localConfig:n}),(s,l)=>(wt(),Ct("div",Ket,[l[24]||(l[24]=V("h3",{class:"section-title"},"功能配置",-1)),V("div",jet,[V("div",Jet,[V("div",Qet,[l[11]||(l[11]=V("label",{class:"config-label"},"联网搜索",-1)),V("div",trt,[me(V("input",{type:"checkbox",class:"toggle",id:"searchMode","onUpdate:modelValue":l[0]||(l[0]=u=>n.searchMode=u)},null,512),[[Tu,n.searchMode]]),V("label",ert,[V("span",rrt,bt(o(n.searchMode)),1)])])]),V("div",nrt,[l[12]||(l[12]=V("label",{class:"config-label"},"假流式响应",-1)),V("div",art,[me(V("input",{type:"checkbox",class:"toggle",id:"fakeStreaming","onUpdate:modelValue":l[1]||(l[1]=u=>n.fakeStreaming=u)},null,512),[[Tu,n.fakeStreaming]]),V("label",irt,[V("span",ort,bt(o(n.fakeStreaming)),1)])])]),V("div",srt,[l[13]||(l[13]=V("label",{class:"config-label"},"伪装信息",-1)),V("div",lrt,[me(V("input",{type:"checkbox",class:"toggle",id:"randomString","onUpdate:modelValue":l[2]||(l[2]=u=>n.randomString=u)},null,512),[[Tu,n.randomString]]),V("label",urt,[V("span",frt,bt(o(n.randomString)),1)])])])]),V("div",crt,[V("div",hrt,[l[14]||(l[14]=V("label",{class:"config-label"},"联网搜索提示",-1)),me(V("input",{type:"text",class:"config-input","onUpdate:modelValue":l[3]||(l[3]=u=>n.searchPrompt=u),placeholder:"请输入联网搜索提示"},null,512),[[Le,n.searchPrompt]])])]),V("div",vrt,[V("div",drt,[l[15]||(l[15]=V("label",{class:"config-label"},"最大重试次数",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[4]||(l[4]=u=>n.maxRetryNum=u),min:"0"},null,512),[[Le,n.maxRetryNum,void 0,{number:!0}]])]),V("div",prt,[l[16]||(l[16]=V("label",{class:"config-label"},"假流式间隔(秒)",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[5]||(l[5]=u=>n.fakeStreamingInterval=u),min:"0",step:"0.1"},null,512),[[Le,n.fakeStreamingInterval,void 0,{number:!0}]])]),V("div",grt,[l[17]||(l[17]=V("label",{class:"config-label"},"伪装信息长度",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[6]||(l[6]=u=>n.randomStringLength=u),min:"0"},null,512),[[Le,n.randomStringLength,void 0,{number:!0}]])])]),V("div",yrt,[V("div",mrt,[l[18]||(l[18]=V("label",{class:"config-label"},"默认并发请求数",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[7]||(l[7]=u=>n.concurrentRequests=u),min:"1"},null,512),[[Le,n.concurrentRequests,void 0,{number:!0}]])]),V("div",_rt,[l[19]||(l[19]=V("label",{class:"config-label"},"失败时增加并发数",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[8]||(l[8]=u=>n.increaseConcurrentOnFailure=u),min:"0"},null,512),[[Le,n.increaseConcurrentOnFailure,void 0,{number:!0}]])]),V("div",Srt,[l[20]||(l[20]=V("label",{class:"config-label"},"最大并发请求数",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[9]||(l[9]=u=>n.maxConcurrentRequests=u),min:"1"},null,512),[[Le,n.maxConcurrentRequests,void 0,{number:!0}]])])]),V("div",xrt,[V("div",brt,[l[21]||(l[21]=V("label",{class:"config-label"},"空响应重试限制",-1)),me(V("input",{type:"number",class:"config-input","onUpdate:modelValue":l[10]||(l[10]=u=>n.maxEmptyResponses=u),min:"0"},null,512),[[Le,n.maxEmptyResponses,void 0,{number:!0}]])]),l[22]||(l[22]=V("div",{class:"config-group"},null,-1)),l[23]||(l[23]=V("div",{class:"config-group"},null,-1))])])]))}},Trt=ea(wrt,[["__scopeId","data-v-dc697ea9"]]),Crt={class:"stats-grid"},Art={class:"stat-card"},Drt={class:"stat-value"},Mrt={class:"stat-card"},Irt={class:"stat-value"},Lrt={class:"stat-card"},Prt={class:"update-status-container"},Rrt={key:0,class:"update-status"},Ert={key:1,class:"update-status"},krt={__name:"VersionInfo",setup(r){const t=Sn();return(e,n)=>(wt(),Ct("div",null,[n[5]||(n[5]=V("h3",{class:"section-title"},"版本信息",-1)),V("div",Crt,[V("div",Art,[V("div",Drt,bt(fe(t).config.localVersion),1),n[0]||(n[0]=V("div",{class:"stat-label"},"当前版本",-1))]),V("div",Mrt,[V("div",Irt,bt(fe(t).config.remoteVersion),1),n[1]||(n[1]=V("div",{class:"stat-label"},"最新版本",-1))]),V("div",Lrt,[V("div",Prt,[fe(t).config.hasUpdate?(wt(),Ct("div",Rrt,n[2]||(n[2]=[V("span",{class:"status-icon update-needed"},"⚠️",-1),V("span",{class:"status-text update-needed"},"需要更新",-1)]))):(wt(),Ct("div",Ert,n[3]||(n[3]=[V("span",{class:"status-icon up-to-date"},"✓",-1),V("span",{class:"status-text up-to-date"},"已是最新",-1)])))]),n[4]||(n[4]=V("div",{class:"stat-label"},"更新状态",-1))])]),n[6]||(n[6]=vV('<div class="project-link-container" data-v-e1a72b08><a href="https://github.com/wyeeeee/hajimi" target="_blank" rel="noopener noreferrer" class="project-link" data-v-e1a72b08><span class="github-icon" data-v-e1a72b08>🌸</span><span class="project-text" data-v-e1a72b08>项目地址：github.com/wyeeeee/hajimi</span><span class="github-icon" data-v-e1a72b08>🌸</span></a></div>',1))]))}},fM=ea(krt,[["__scopeId","data-v-e1a72b08"]]),Ort={class:"vertex-config"},Nrt={class:"config-form"},Vrt={class:"config-row"},Brt={class:"config-group"},zrt={class:"toggle-wrapper"},Frt={for:"fakeStreaming",class:"toggle-label"},Grt={class:"toggle-text"},Hrt={class:"config-group"},Wrt={class:"toggle-wrapper"},$rt={for:"enableVertexExpress",class:"toggle-label"},Urt={class:"toggle-text"},Yrt={class:"config-row"},Xrt={class:"config-group full-width"},Zrt={class:"config-row"},qrt={class:"config-group full-width"},Krt={class:"save-section"},jrt={class:"password-input"},Jrt=["disabled"],Qrt={key:0,class:"error-message"},tnt={key:1,class:"success-message"},ent={__name:"VertexConfig",setup(r){const t=Sn(),e=Ii({fakeStreaming:t.config.fakeStreaming,enableVertexExpress:t.config.enableVertexExpress,vertexExpressApiKey:t.config.vertexExpressApiKey||"",googleCredentialsJson:t.config.googleCredentialsJson||""}),n=St(""),a=St(""),i=St(""),o=St(!1);async function s(){if(!n.value){a.value="请输入密码";return}o.value=!0,a.value="",i.value="";try{if(e.googleCredentialsJson)try{const f=JSON.parse(e.googleCredentialsJson);e.googleCredentialsJson=JSON.stringify(f)}catch{a.value="请输入有效的 JSON 格式",o.value=!1;return}const u=Object.keys(e);for(const f of u)e[f]!==t.config[f]&&(await t.updateConfig(f,e[f],n.value),t.config[f]=e[f]);i.value="所有配置已保存"}catch(u){a.value=u.message||"保存失败"}finally{o.value=!1}}function l(u){return u?"启用":"禁用"}return(u,f)=>(wt(),Ct("div",Ort,[f[9]||(f[9]=V("h3",{class:"section-title"},"Vertex 配置",-1)),V("div",Nrt,[V("div",Vrt,[V("div",Brt,[f[5]||(f[5]=V("label",{class:"config-label"},"假流式响应",-1)),V("div",zrt,[me(V("input",{type:"checkbox",class:"toggle",id:"fakeStreaming","onUpdate:modelValue":f[0]||(f[0]=c=>e.fakeStreaming=c)},null,512),[[Tu,e.fakeStreaming]]),V("label",Frt,[V("span",Grt,bt(l(e.fakeStreaming)),1)])])]),V("div",Hrt,[f[6]||(f[6]=V("label",{class:"config-label"},"Vertex Express",-1)),V("div",Wrt,[me(V("input",{type:"checkbox",class:"toggle",id:"enableVertexExpress","onUpdate:modelValue":f[1]||(f[1]=c=>e.enableVertexExpress=c)},null,512),[[Tu,e.enableVertexExpress]]),V("label",$rt,[V("span",Urt,bt(l(e.enableVertexExpress)),1)])])])]),V("div",Yrt,[V("div",Xrt,[f[7]||(f[7]=V("label",{class:"config-label"},"Vertex Express API密钥",-1)),me(V("input",{type:"password",class:"config-input","onUpdate:modelValue":f[2]||(f[2]=c=>e.vertexExpressApiKey=c),placeholder:"请输入 Vertex Express API密钥"},null,512),[[Le,e.vertexExpressApiKey]])])]),V("div",Zrt,[V("div",qrt,[f[8]||(f[8]=V("label",{class:"config-label"},"Google Credentials JSON",-1)),me(V("textarea",{class:"config-input text-area","onUpdate:modelValue":f[3]||(f[3]=c=>e.googleCredentialsJson=c),placeholder:"请输入 Google Credentials JSON",rows:"6"},null,512),[[Le,e.googleCredentialsJson]])])]),V("div",Krt,[V("div",jrt,[me(V("input",{type:"password","onUpdate:modelValue":f[4]||(f[4]=c=>n.value=c),placeholder:"请输入管理密码",class:"config-input"},null,512),[[Le,n.value]])]),V("button",{class:"save-button",onClick:s,disabled:o.value},bt(o.value?"保存中...":"保存所有配置"),9,Jrt)]),a.value?(wt(),Ct("div",Qrt,bt(a.value),1)):Jt("",!0),i.value?(wt(),Ct("div",tnt,bt(i.value),1)):Jt("",!0)])]))}},rnt=ea(ent,[["__scopeId","data-v-09bf202e"]]),nnt={class:"info-box"},ant={key:0},int={key:1},ont={key:0,class:"stats-grid"},snt={class:"stat-card"},lnt={class:"stat-value"},unt={class:"stat-card"},fnt={class:"stat-value"},cnt={class:"stat-card"},hnt={class:"stat-value"},vnt={key:0,class:"fold-content"},dnt={class:"shared-save-section"},pnt={class:"password-input-group"},gnt=["disabled"],ynt={key:0,class:"overall-error-message"},mnt={key:1,class:"overall-success-message"},_nt={__name:"ConfigSection",setup(r){const t=Sn(),e=St(!0),n=St(null),a=St(null),i=St(""),o=St(""),s=St(""),l=St(!1);St(!1),St(""),St({x:0,y:0});const u=c=>c?"fold-icon rotated":"fold-icon";async function f(){if(!i.value){o.value="请输入管理密码",s.value="";return}l.value=!0,o.value="",s.value="";let c=[],h=[];try{if(n.value&&typeof n.value.saveComponentConfigs=="function"){const v=await n.value.saveComponentConfigs(i.value);v.success?h.push(v.message):c.push(v.message)}if(a.value&&typeof a.value.saveComponentConfigs=="function"){const v=await a.value.saveComponentConfigs(i.value);v.success?h.push(v.message):c.push(v.message)}c.length>0&&(o.value=c.join("; ")),h.length>0&&c.length===0?s.value="所有配置已成功保存: "+h.join("; "):h.length>0&&c.length>0&&(s.value="部分配置已保存: "+h.join("; ")+". 部分失败.")}catch(v){o.value=v.message||"保存过程中发生意外错误"}finally{l.value=!1}}return(c,h)=>(wt(),Ct("div",nnt,[fe(t).status.enableVertex?(wt(),Ct("div",ant,[ie(rnt),ie(fM)])):(wt(),Ct("div",int,[V("h3",{class:"section-title fold-header",onClick:h[0]||(h[0]=v=>e.value=!e.value)},[h[3]||(h[3]=Pr(" ⚙️ 环境配置 ")),V("span",{class:Be(u(e.value))},h[2]||(h[2]=[V("svg",{xmlns:"http://www.w3.org/2000/svg",width:"16",height:"16",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor","stroke-width":"2","stroke-linecap":"round","stroke-linejoin":"round"},[V("polyline",{points:"6 9 12 15 18 9"})],-1)]),2)]),e.value?Jt("",!0):(wt(),Ct("div",ont,[V("div",snt,[V("div",lnt,bt(fe(t).config.maxRequestsPerMinute),1),h[4]||(h[4]=V("div",{class:"stat-label"},"每分钟请求限制",-1))]),V("div",unt,[V("div",fnt,bt(fe(t).config.concurrentRequests),1),h[5]||(h[5]=V("div",{class:"stat-label"},"并发请求数",-1))]),fe(t).config.adaptiveConcurrency?(wt(),Ct("div",{key:0,class:"stat-card"},[(wt(!0),Ct(Re,null,zh(fe(t).config.concurrencyFanout,(v,p)=>(wt(),Ct("div",{class:"stat-value",key:p}," "+bt(p)+": "+bt(v.fanout)+" ",1))),128)),h[8]||(h[8]=V("div",{class:"stat-label"},"自适应并发数",-1))])):Jt("",!0),V("div",cnt,[V("div",hnt,bt(fe(t).config.currentTime),1),h[6]||(h[6]=V("div",{class:"stat-label"},"当前服务器时间",-1))])])),ie(iu,{name:"fold"},{default:Es(()=>[e.value?(wt(),Ct("div",vnt,[ie(qet,{ref_key:"basicConfigRef",ref:n},null,512),ie(Trt,{ref_key:"featuresConfigRef",ref:a},null,512),V("div",dnt,[V("div",pnt,[h[7]||(h[7]=V("label",{for:"sharedPasswordInput",class:"shared-password-label"},"管理密码",-1)),me(V("input",{type:"password",id:"sharedPasswordInput","onUpdate:modelValue":h[1]||(h[1]=v=>i.value=v),placeholder:"请输入管理密码以保存更改",class:"config-input"},null,512),[[Le,i.value]])]),V("button",{class:"save-all-button",onClick:f,disabled:l.value},bt(l.value?"保存中...":"保存基本与功能配置"),9,gnt)]),o.value?(wt(),Ct("div",ynt,bt(o.value),1)):Jt("",!0),s.value?(wt(),Ct("div",mnt,bt(s.value),1)):Jt("",!0)])):Jt("",!0)]),_:1}),ie(fM)]))]))}},Snt=ea(_nt,[["__scopeId","data-v-d8cf8b0b"]]),xnt={class:"info-box"},bnt={class:"log-filter"},wnt=["onClick"],Tnt={class:"log-timestamp"},Cnt={class:"log-message"},Ant={__name:"LogSection",setup(r){const t=Sn(),e=St("ALL"),n=St(null),a=St(!0),i=St(!1);function o(f){e.value=f}function s(){n.value&&(n.value.scrollTop=n.value.scrollHeight)}function l(){if(!n.value)return!1;const f=n.value;return f.scrollHeight-f.scrollTop-f.clientHeight<50}function u(){i.value=!0}return Un(()=>t.logs,async()=>{await qs(),a.value?(s(),a.value=!1):l()&&s()},{deep:!0}),Pf(()=>{t.logs.length>0&&qs(()=>{s()}),n.value&&n.value.addEventListener("scroll",u)}),(f,c)=>(wt(),Ct("div",xnt,[c[0]||(c[0]=V("h2",{class:"section-title"},"📋 系统日志",-1)),V("div",bnt,[(wt(),Ct(Re,null,zh(["ALL","INFO","WARNING","ERROR"],h=>V("button",{key:h,class:Be({active:e.value===h}),onClick:v=>o(h)},bt(h==="ALL"?"全部":h==="INFO"?"信息":h==="WARNING"?"警告":"错误"),11,wnt)),64))]),V("div",{class:"log-container",ref_key:"logContainer",ref:n},[(wt(!0),Ct(Re,null,zh(fe(t).logs,(h,v)=>(wt(),Ct("div",{key:v,class:Be(["log-entry",h.level]),style:Zs({display:e.value==="ALL"||h.level===e.value?"block":"none"})},[V("span",Tnt,bt(h.timestamp),1),V("span",{class:Be(["log-level",h.level])},bt(h.level),3),V("span",Cnt,[h.key!=="N/A"?(wt(),Ct(Re,{key:0},[Pr("["+bt(h.key)+"]",1)],64)):Jt("",!0),h.request_type!=="N/A"?(wt(),Ct(Re,{key:1},[Pr(bt(h.request_type),1)],64)):Jt("",!0),h.model!=="N/A"?(wt(),Ct(Re,{key:2},[Pr("["+bt(h.model)+"]",1)],64)):Jt("",!0),h.status_code!=="N/A"?(wt(),Ct(Re,{key:3},[Pr(bt(h.status_code),1)],64)):Jt("",!0),Pr(" : "+bt(h.message)+" ",1),h.error_message?(wt(),Ct(Re,{key:4},[Pr(" - "+bt(h.error_message),1)],64)):Jt("",!0)])],6))),128))],512)]))}},Dnt=ea(Ant,[["__scopeId","data-v-d38f4a7d"]]),Mnt={class:"toggle-container"},Int={class:"sections-row"},Lnt={key:0,class:"password-dialog"},Pnt={class:"password-dialog-content"},Rnt={class:"password-input-container"},Ent={key:0,class:"password-error"},knt={__name:"DashboardView",setup(r){const t=Sn(),e=St(null),n=St(!1),a=St(0),i=St(!1),o=Fe(()=>t.isDarkMode),s=Fe(()=>t.config),l=St(!1),u=St(""),f=St("");Pf(()=>{v(),c(),setTimeout(()=>{n.value=!0;const _=()=>{a.value<10?(a.value++,setTimeout(_,100)):i.value=!0};setTimeout(_,50)},50)}),Yv(()=>{h()});function c(){if(t.connectDashboardStream()){console.log("仪表盘推送已连接");return}e.value||(e.value=setInterval(v,1e3),console.log("自动刷新已启动"))}function h(){t.disconnectDashboardStream(),e.value&&(clearInterval(e.value),e.value=null,console.log("自动刷新已停止"))}async function v(){await t.fetchDashboardData()}function d(){v()}function p(){t.toggleDarkMode()}function g(){l.value=!0,u.value="",f.value=""}function y(){l.value=!1,u.value="",f.value=""}async function m(){if(!u.value){f.value="请输入密码";return}try{await t.updateConfig("enableVertex",!s.value.enableVertex,u.value),t.config.enableVertex=!s.value.enableVertex,y()}catch(_){f.value=_.message||"密码错误"}}return(_,S)=>(wt(),Ct("div",{class:Be(["dashboard",{"page-loaded":n.value}])},[V("div",{class:Be(["header-container",{"animate-in":a.value>=1||i.value}])},[S[1]||(S[1]=V("div",{class:"title-container"},[V("h1",null,[V("span",null,"🤖 Gemini API 代理服务")])],-1)),V("div",Mnt,[V("button",{class:Be(["vertex-button",{active:s.value.enableVertex}]),onClick:g},bt(s.value.enableVertex?"Vertex 开":"Vertex 关"),3),V("button",{class:Be(["theme-button",{active:o.value}]),onClick:p},bt(o.value?"🌙 夜间":"☀️ 日间"),3)])],2),V("div",Int,[ie(Het,{class:Be(["section-animate status-section",{"animate-in":a.value>=2||i.value}])},null,8,["class"]),ie(Snt,{class:Be(["section-animate config-section",{"animate-in":a.value>=3||i.value}])},null,8,["class"])]),ie(Dnt,{class:Be(["section-animate",{"animate-in":a.value>=4||i.value}])},null,8,["class"]),V("button",{class:Be(["refresh-button",{"animate-in":a.value>=5||i.value}]),onClick:d},"刷新数据",2),l.value?(wt(),Ct("div",Lnt,[V("div",Pnt,[S[2]||(S[2]=V("h3",null,"验证密码",-1)),V("p",null,"请输入密码以"+bt(s.value.enableVertex?"禁用":"启用")+" Vertex AI",1),V("div",Rnt,[me(V("input",{type:"password","onUpdate:modelValue":S[0]||(S[0]=x=>u.value=x),class:"password-input",placeholder:"请输入密码",onKeyup:DI(m,["enter"])},null,544),[[Le,u.value]]),f.value?(wt(),Ct("div",Ent,bt(f.value),1)):Jt("",!0)]),V("div",{class:"password-actions"},[V("button",{class:"cancel-btn",onClick:y},"取消"),V("button",{class:"confirm-btn",onClick:m},"确认")])])])):Jt("",!0)],2))}},Ont=f5({history:FB("/"),routes:[{path:"/",name:"dashboard",component:knt},{path:"/:pathMatch(.*)*",redirect:"/"}]}),rS=tB(h5);rS.use(nB());rS.use(Ont);rS.mount("#app");
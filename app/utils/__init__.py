@@ -1,6 +1,7 @@
 # Utils package initialization
 
 from app.utils.logging import logger, log_manager, format_log_message,log
+from app.utils.http_client import http_client_manager
 from app.utils.api_key import APIKeyManager, test_api_key
 from app.utils.error_handling import handle_gemini_error, translate_error, handle_api_error
 from app.utils.rate_limiting import protect_from_abuse
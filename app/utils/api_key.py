@@ -1,14 +1,41 @@
 import random
 import re
 import os
+import time
+import heapq
 import logging
 import asyncio
-from datetime import datetime, timedelta
-from apscheduler.schedulers.background import BackgroundScheduler
-from app.utils.logging import format_log_message
+from app.utils.logging import format_log_message, log
+from app.utils.http_client import http_client_manager
+from app.utils.stats import api_stats_manager
 import app.config.settings as settings
 logger = logging.getLogger("my_logger")
 
+# 密钥健康状态（熔断器状态机）：healthy → degraded → open → half_open → healthy
+KEY_HEALTHY = "healthy"      # 正常
+KEY_DEGRADED = "degraded"    # 近期出现失败，降低被选中的概率
+KEY_OPEN = "open"            # 熔断中，不参与轮询
+KEY_HALF_OPEN = "half_open"  # 熔断期结束，允许一个探测请求
+
+# 各状态在加权随机选择中的基础权重（每轮轮询中入栈的概率）
+_STATE_WEIGHTS = {KEY_HEALTHY: 1.0, KEY_DEGRADED: 0.3, KEY_HALF_OPEN: 0.5}
+
+class KeyHealth:
+    """单个 API 密钥的健康状态"""
+    __slots__ = ("state", "score", "consecutive_failures", "open_until", "probe_started", "cooldown_level")
+
+    def __init__(self):
+        self.state = KEY_HEALTHY
+        self.score = 1.0               # 成功率的指数滑动平均
+        self.consecutive_failures = 0
+        self.open_until = 0.0          # 熔断结束时间
+        self.probe_started = 0.0       # 半开状态下探测请求的开始时间（0 表示没有进行中的探测）
+        self.cooldown_level = 0        # 连续触发 429 冷却的次数，用于指数退避
+
+    def is_probing(self, now) -> bool:
+        # 探测请求的结果迟迟未反馈（如密钥被取出后未实际使用）时，超时后允许重新探测
+        return now - self.probe_started < settings.KEY_BREAKER_OPEN_SECONDS
+
 class APIKeyManager:
     def __init__(self):
         self.api_keys = re.findall(
@@ -20,44 +47,280 @@ class APIKeyManager:
             else:
                 break
 
+        self.key_health = {} # 每个密钥的健康状态
+        self.cooldown_heap = [] # 熔断/冷却结束时间的最小堆 (open_until, key)
+        # 配额索引：已达到每日调用限制的密钥及其恢复时间，由统计模块在用量变化时通知更新
+        self.exhausted_keys = {} # {key: recovery_time}
+        self.quota_heap = [] # 配额恢复时间的最小堆 (recovery_time, key)
+        self._next_rebuild = 0.0 # 没有可用密钥时，在此时间之前不再重建密钥栈
         self.key_stack = [] # 初始化密钥栈
+        self._stacked = set() # 当前在栈中的密钥，避免同一密钥重复入栈
         self._reset_key_stack() # 初始化时创建随机密钥栈
-        self.scheduler = BackgroundScheduler()
-        self.scheduler.start()
         self.lock = asyncio.Lock() # Added lock
+        api_stats_manager.add_listener(on_usage=self.on_key_usage, on_reset=self.on_stats_reset)
+
+    def _health(self, key) -> KeyHealth:
+        health = self.key_health.get(key)
+        if health is None:
+            health = self.key_health[key] = KeyHealth()
+        return health
+
+    def _selection_weight(self, key, now) -> float:
+        """密钥在加权随机选择中的权重，配额耗尽、熔断中或正在探测的密钥权重为 0"""
+        if key in self.exhausted_keys:
+            return 0.0
+        health = self._health(key)
+        state = health.state
+        if state == KEY_OPEN:
+            return 0.0
+        if state == KEY_HALF_OPEN and health.is_probing(now):
+            return 0.0
+        if state == KEY_HEALTHY:
+            return 1.0
+        return _STATE_WEIGHTS[state] * max(health.score, 0.05)
 
     def _reset_key_stack(self):
-        """创建并随机化密钥栈"""
-        shuffled_keys = self.api_keys[:]  # 创建 api_keys 的副本以避免直接修改原列表
-        random.shuffle(shuffled_keys)
-        self.key_stack = shuffled_keys
+        """
+        按健康度生成新一轮的随机密钥栈：熔断中的密钥不入栈，
+        降级的密钥按权重概率入栈（被使用的频率更低），入栈的密钥按权重加权随机排序。
+        """
+        now = time.time()
+        candidates = []
+        weighted = []
+        for key in self.api_keys:
+            weight = self._selection_weight(key, now)
+            if weight <= 0:
+                continue
+            # Efraimidis-Spirakis 加权随机排序：权重越大越可能靠近栈顶
+            item = (random.random() ** (1.0 / weight), key)
+            candidates.append(item)
+            if weight >= 1 or random.random() < weight:
+                weighted.append(item)
+        if not weighted:
+            # 剩余的密钥都处于降级状态时，仍全部参与本轮轮询
+            weighted = candidates
+        weighted.sort()
+        self.key_stack = [key for _, key in weighted]
+        self._stacked = set(self.key_stack)
+        self._next_rebuild = 0.0
+
+    def _push_key(self, key):
+        """将恢复的密钥放到栈顶（已在栈中时不重复入栈）"""
+        if key in self._stacked:
+            return
+        self.key_stack.append(key)
+        self._stacked.add(key)
+
+    def _release_cooled_keys(self, now):
+        """弹出堆中已到期的密钥，转为半开状态并放到栈顶，优先进行探测"""
+        heap = self.cooldown_heap
+        while heap and heap[0][0] <= now:
+            open_until, key = heapq.heappop(heap)
+            health = self.key_health.get(key)
+            # 密钥在冷却期间被再次熔断时，旧的堆条目已失效
+            if health is None or health.state != KEY_OPEN or health.open_until != open_until:
+                continue
+            health.state = KEY_HALF_OPEN
+            health.probe_started = 0.0
+            self._push_key(key)
+            self._next_rebuild = 0.0
+            log('info', f"API密钥 {key[:8]}... 熔断期结束，进入半开状态进行探测",
+                extra={'key': key[:8]})
+
+    def _release_recovered_keys(self, now):
+        """弹出配额已恢复的密钥，重新加入轮询"""
+        heap = self.quota_heap
+        while heap and heap[0][0] <= now:
+            recovery_time, key = heapq.heappop(heap)
+            if self.exhausted_keys.get(key) != recovery_time:
+                continue
+            # 冷却期间仍有进行中的请求完成时，用量可能继续增加，需重新计算恢复时间
+            recovery_time = api_stats_manager.get_key_recovery_time(key)
+            if recovery_time > now:
+                self.exhausted_keys[key] = recovery_time
+                heapq.heappush(heap, (recovery_time, key))
+                continue
+            del self.exhausted_keys[key]
+            self._push_key(key)
+            self._next_rebuild = 0.0
+            log('info', f"API密钥 {key[:8]}... 最近24小时调用次数已低于限制，恢复使用",
+                extra={'key': key[:8]})
+
+    def on_key_usage(self, key, calls):
+        """统计模块回调：密钥用量变化时更新配额索引"""
+        limit = settings.API_KEY_DAILY_LIMIT
+        if calls < limit:
+            if self.exhausted_keys.pop(key, None) is not None:
+                self._next_rebuild = 0.0
+            return
+        if key in self.exhausted_keys:
+            return
+        recovery_time = api_stats_manager.get_key_recovery_time(key)
+        self.exhausted_keys[key] = recovery_time
+        heapq.heappush(self.quota_heap, (recovery_time, key))
+        log('warning', f"API密钥 {key[:8]}... 已达到每日调用限制 ({calls}/{limit})，暂停使用",
+            extra={'key': key[:8]})
+
+    def on_stats_reset(self):
+        """统计模块回调：统计数据重置后所有密钥的配额恢复"""
+        self.exhausted_keys.clear()
+        self.quota_heap.clear()
+        self._next_rebuild = 0.0
+
+    def earliest_recovery(self):
+        """没有可用密钥时，最早有密钥恢复（冷却结束或配额恢复）的时间，无法预计时返回 None"""
+        candidates = []
+        heap = self.cooldown_heap
+        # 先丢弃堆顶已失效的条目（密钥已恢复或被再次熔断）
+        while heap:
+            open_until, key = heap[0]
+            health = self.key_health.get(key)
+            if health is not None and health.state == KEY_OPEN and health.open_until == open_until:
+                candidates.append(open_until)
+                break
+            heapq.heappop(heap)
+        if self.quota_heap:
+            candidates.append(self.quota_heap[0][0])
+        return min(candidates) if candidates else None
+
+    def unavailable_message(self) -> str:
+        """没有可用密钥时的提示信息（包含最早恢复时间）"""
+        recovery = self.earliest_recovery()
+        message = "没有可用的API密钥，所有密钥均已达到调用限制或处于熔断状态"
+        if recovery:
+            message += f"，最早恢复时间: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(recovery))}"
+        return message
+
+    def quota_remaining_ratio(self) -> float:
+        """未达到每日调用限制的密钥比例"""
+        if not self.api_keys:
+            return 0.0
+        return max(0.0, 1 - len(self.exhausted_keys) / len(self.api_keys))
+
+    def _try_acquire(self, key, now) -> bool:
+        """检查出栈的密钥当前能否使用，半开状态的密钥只放行一个探测请求"""
+        if key in self.exhausted_keys:
+            return False
+        health = self._health(key)
+        if health.state == KEY_OPEN:
+            return False
+        if health.state == KEY_HALF_OPEN:
+            if health.is_probing(now):
+                return False
+            health.probe_started = now
+        return True
 
     async def get_available_key(self):
-        """从栈顶获取密钥，若栈空则重新生成
+        """从栈顶获取可用的密钥，若栈空则重新生成
         
         实现负载均衡：
-        1. 维护一个随机排序的栈存储apikey
-        2. 每次调用从栈顶取出一个key返回
-        3. 栈空时重新随机生成栈
+        1. 维护一个按健康度加权随机排序的栈存储apikey
+        2. 每次调用从栈顶取出一个key返回，只返回未达到调用限制且未熔断的key
+           （熔断/冷却结束时间与配额恢复时间分别保存在最小堆中，每次获取时弹出已到期的key）
+        3. 栈空时重新生成栈；没有可用的key时返回 None，最早恢复时间可通过 earliest_recovery() 获取
         4. 确保异步和并发安全
         """
         async with self.lock:
-            # 如果栈为空，重新生成
-            if not self.key_stack:
+            now = time.time()
+            self._release_cooled_keys(now)
+            self._release_recovered_keys(now)
+            for _ in range(2):
+                # 从栈顶取出可用的key
+                while self.key_stack:
+                    key = self.key_stack.pop()
+                    self._stacked.discard(key)
+                    if self._try_acquire(key, now):
+                        return key
+                # 栈为空，重新生成（确认没有可用的key后短时间内不再重复重建）
+                if now < self._next_rebuild:
+                    break
                 self._reset_key_stack()
-            
-            # 从栈顶取出key
-            if self.key_stack:
-                return self.key_stack.pop()
+                if not self.key_stack:
+                    self._next_rebuild = now + 1.0
+                    break
             
             # 如果没有可用的API密钥，记录错误
             if not self.api_keys:
                 log_msg = format_log_message('ERROR', "没有配置任何 API 密钥！")
-                logger.error(log_msg)
-            log_msg = format_log_message('ERROR', "没有可用的API密钥！")
+            else:
+                log_msg = format_log_message('ERROR', self.unavailable_message())
             logger.error(log_msg)
             return None
 
+    def record_success(self, key):
+        """记录密钥请求成功：恢复为健康状态"""
+        health = self._health(key)
+        health.score = health.score * 0.8 + 0.2
+        health.consecutive_failures = 0
+        health.probe_started = 0.0
+        health.cooldown_level = 0
+        self._next_rebuild = 0.0
+        if health.state != KEY_HEALTHY:
+            log('info', f"API密钥 {key[:8]}... 已恢复正常",
+                extra={'key': key[:8]})
+            health.state = KEY_HEALTHY
+
+    def release_probe(self, key):
+        """请求结束但没有记录成功或失败（客户端错误、连接断开、被取消等）时，释放半开密钥的探测名额"""
+        health = self.key_health.get(key)
+        if health is not None and health.state == KEY_HALF_OPEN and health.probe_started:
+            health.probe_started = 0.0
+            self._next_rebuild = 0.0
+
+    def record_failure(self, key, status_code=None, hard=False, retry_after=None):
+        """
+        记录密钥请求失败并推进熔断器状态。
+
+        Args:
+            key: API 密钥
+            status_code: 上游返回的状态码（未知时为 None）
+            hard: 是否为密钥本身的问题（无效密钥、权限被拒绝），此类失败立即熔断
+            retry_after: 上游建议的重试等待秒数（429 时可用），优先于指数退避时长
+        """
+        health = self._health(key)
+        health.score *= 0.8
+        health.consecutive_failures += 1
+        health.probe_started = 0.0
+
+        if status_code == 429:
+            # 限流：按指数退避冷却，冷却结束后自动恢复
+            health.cooldown_level += 1
+            if retry_after:
+                duration = min(retry_after, settings.KEY_COOLDOWN_MAX_SECONDS)
+            else:
+                duration = min(settings.KEY_COOLDOWN_BASE_SECONDS * 2 ** (health.cooldown_level - 1),
+                               settings.KEY_COOLDOWN_MAX_SECONDS)
+            self._open(key, health, duration, status_code)
+        elif hard:
+            self._open(key, health, settings.KEY_BREAKER_HARD_OPEN_SECONDS, status_code)
+        elif health.state == KEY_HALF_OPEN or health.consecutive_failures >= settings.KEY_BREAKER_FAILURE_THRESHOLD:
+            self._open(key, health, settings.KEY_BREAKER_OPEN_SECONDS, status_code)
+        elif health.state == KEY_HEALTHY:
+            health.state = KEY_DEGRADED
+
+    def _open(self, key, health, duration, status_code=None):
+        health.state = KEY_OPEN
+        health.open_until = time.time() + duration
+        heapq.heappush(self.cooldown_heap, (health.open_until, key))
+        log('warning', f"API密钥 {key[:8]}... 熔断 {duration:g} 秒（连续失败 {health.consecutive_failures} 次）",
+            extra={'key': key[:8], 'status_code': status_code})
+
+    def get_health_summary(self) -> dict:
+        """获取各状态的密钥数量与已达到调用限制的密钥数量，供仪表盘展示"""
+        now = time.time()
+        summary = {KEY_HEALTHY: 0, KEY_DEGRADED: 0, KEY_OPEN: 0, KEY_HALF_OPEN: 0}
+        for key in self.api_keys:
+            summary[self.get_key_state(key, now)] += 1
+        summary["exhausted"] = len(self.exhausted_keys)
+        return summary
+
+    def get_key_state(self, key, now=None) -> str:
+        """获取密钥当前状态（熔断期已过、尚未被弹出堆的密钥视为半开）"""
+        health = self._health(key)
+        if health.state == KEY_OPEN and (now or time.time()) >= health.open_until:
+            return KEY_HALF_OPEN
+        return health.state
+
     def show_all_keys(self):
         log_msg = format_log_message('INFO', f"当前可用API key个数: {len(self.api_keys)} ")
         logger.info(log_msg)
@@ -65,21 +328,13 @@ class APIKeyManager:
             log_msg = format_log_message('INFO', f"API Key{i}: {api_key[:8]}...{api_key[-3:]}")
             logger.info(log_msg)
 
-    # def blacklist_key(self, key):
-    #     log_msg = format_log_message('WARNING', f"{key[:8]} → 暂时禁用 {self.api_key_blacklist_duration} 秒")
-    #     logger.warning(log_msg)
-    #     self.api_key_blacklist.add(key)
-    #     self.scheduler.add_job(lambda: self.api_key_blacklist.discard(key), 'date',
-    #                            run_date=datetime.now() + timedelta(seconds=self.api_key_blacklist_duration))
-
 async def test_api_key(api_key: str) -> bool:
     """
     测试 API 密钥是否有效。
     """
     try:
-        import httpx
         url = "https://generativelanguage.googleapis.com/v1beta/models?key={}".format(api_key)
-        async with httpx.AsyncClient() as client:
+        async with http_client_manager.client() as client:
             response = await client.get(url)
             response.raise_for_status()
             return True
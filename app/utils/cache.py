@@ -1,199 +1,399 @@
+import sys
+import json
 import time
+import zlib
 import xxhash 
 import asyncio
-from typing import Dict, Any, Optional, Tuple
+import itertools
+from typing import Dict, Any, List, Optional, Tuple
 import logging
-from collections import deque
+from collections import deque, OrderedDict, ChainMap
+import app.config.settings as settings
 from app.utils.logging import log
+from app.utils.metrics import cache_hits_total, cache_misses_total
 logger = logging.getLogger("my_logger")
-import heapq
 
 # 定义缓存项的结构
 CacheItem = Dict[str, Any]
 
+# 每个缓存项除响应本身之外的固定开销（缓存项字典、deque 与 OrderedDict 中的引用）
+_ENTRY_OVERHEAD = sys.getsizeof(dict.fromkeys(('response', 'expiry_time', 'created_at', 'key', 'id', 'size'))) + 128
+# 响应包装器解析后的字典、列表等结构比上游响应体多出的典型开销（单个文本 part 的响应约 2.3 KB，
+# 与文本长度无关；由大量细小字段组成的函数调用参数解析后可达响应体的数倍，按响应体大小计算时会低估）
+_RESPONSE_OVERHEAD = 2304
+
+def _load_codecs():
+    """可用的压缩算法：{名称: (压缩函数, 解压函数)}，zstd 依赖可选的 zstandard 库"""
+    codecs = {"zlib": (lambda data: zlib.compress(data, 3), zlib.decompress)}
+    try:
+        import zstandard
+        codecs["zstd"] = (zstandard.ZstdCompressor(level=3).compress, zstandard.ZstdDecompressor().decompress)
+    except ImportError:
+        pass
+    return codecs
+
+_CODECS = _load_codecs()
+
+def select_codec(name: str) -> str:
+    """选择压缩算法（留空时自动选择），zstd 不可用时回退到 zlib"""
+    name = (name or "").lower()
+    if name == "zstd" and "zstd" not in _CODECS:
+        log('warning', "未安装 zstandard 依赖，缓存压缩将使用 zlib")
+        return "zlib"
+    if name in _CODECS:
+        return name
+    return "zstd" if "zstd" in _CODECS else "zlib"
+
+
+class CompactResponse:
+    """
+    缓存中紧凑存储的响应。
+
+    写入缓存时把响应的原始数据序列化为一份紧凑的 JSON 字节串，超过阈值时再压缩，
+    不保留解析后的字典与提取出的文本；命中时解压并重新构造响应包装器，
+    其余字段（文本、token 数等）由包装器在读取时按需提取。
+    """
+    __slots__ = ("payload", "codec", "wrapper_cls", "model")
+
+    def __init__(self, response: Any, codec: str, threshold: int):
+        raw = json.dumps(response.data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.codec = None
+        if len(raw) >= threshold:
+            compressed = _CODECS[codec][0](raw)
+            if len(compressed) < len(raw):
+                raw, self.codec = compressed, codec
+        self.payload = raw
+        self.wrapper_cls = type(response)
+        self.model = getattr(response, "model", None)
+
+    @classmethod
+    def from_parts(cls, payload: bytes, codec: Optional[str], wrapper_cls: type, model: Optional[str]):
+        """由已序列化的数据构造（例如从磁盘缓存读取）"""
+        compact = cls.__new__(cls)
+        compact.payload = payload
+        compact.codec = codec
+        compact.wrapper_cls = wrapper_cls
+        compact.model = model
+        return compact
+
+    def restore(self) -> Any:
+        raw = self.payload if self.codec is None else _CODECS[self.codec][1](self.payload)
+        response = self.wrapper_cls(json.loads(raw))
+        if self.model is not None:
+            response.set_model(self.model)
+        return response
+
+
+# CompactResponse 对象本身与字节串对象头的固定开销，模型名称按 64 字节估算
+_COMPACT_OVERHEAD = sys.getsizeof(CompactResponse.__new__(CompactResponse)) + sys.getsizeof(b"") + 64
+
+
+def estimate_size(response: Any) -> int:
+    """
+    估算缓存的响应占用的内存字节数，写入缓存时计算一次。
+
+    紧凑存储的响应按字节串长度加固定开销计算；响应包装器按上游响应体的字节数（raw_size，
+    未记录时按紧凑 JSON 序列化一次的长度）加结构开销计算，函数调用参数等全部数据都计入；
+    其他对象只计算对象本身。
+    """
+    if isinstance(response, CompactResponse):
+        return len(response.payload) + _COMPACT_OVERHEAD
+    data = getattr(response, 'data', None)
+    if data is None:
+        return sys.getsizeof(response)
+    raw_size = getattr(response, 'raw_size', None)
+    if raw_size is None:
+        raw_size = len(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    return raw_size + _RESPONSE_OVERHEAD
+
+
+def _unwrap(response: Any) -> Any:
+    return response.restore() if isinstance(response, CompactResponse) else response
+
+
+class _CacheShard:
+    """
+    缓存的一个分片：拥有独立的锁与容量。
+
+    除了按键分组的 deque 之外，分片内所有缓存项还按写入顺序保存在一个 OrderedDict 中。
+    所有缓存项的有效期相同，写入顺序即过期顺序，并且每个键的 deque 最左侧总是该键最旧的项，
+    因此清理过期项与超出容量时淘汰最旧的项都只需从 OrderedDict 头部弹出，均摊 O(1)。
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int = 0):
+        self.cache: Dict[str, deque[CacheItem]] = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes # 字节数限制，0 表示不限制
+        self.cur_cache_num = 0
+        self.cur_bytes = 0
+        self.lock = asyncio.Lock()
+        self._order: "OrderedDict[int, CacheItem]" = OrderedDict() # 按写入顺序排列的所有缓存项
+        self._ids = itertools.count()
+
+    def add(self, cache_key: str, item: CacheItem) -> List[CacheItem]:
+        """
+        追加缓存项，超出容量时淘汰最旧的项，返回被淘汰的缓存项。
+
+        单个缓存项超过分片的字节数限制时不放入内存，直接作为被淘汰的项返回（可降级到磁盘）。
+        """
+        item['key'] = cache_key
+        if self.max_bytes and item['size'] > self.max_bytes:
+            log('warning', f"缓存项大小 {item['size']} 字节超过单个分片的字节数限制 {self.max_bytes}，不放入内存缓存")
+            return [item]
+        if cache_key not in self.cache:
+            self.cache[cache_key] = deque()
+        self.cache[cache_key].append(item) # 追加到deque末尾
+        item['id'] = next(self._ids)
+        self._order[item['id']] = item
+        self.cur_cache_num += 1
+        self.cur_bytes += item['size']
+        return self.evict_over_budget()
+
+    def peek(self, cache_key: str, now: float) -> Optional[CacheItem]:
+        """获取指定键的第一个有效缓存项（不删除）"""
+        for item in self.cache.get(cache_key, ()):
+            if now < item.get('expiry_time', 0):
+                return item
+        return None
+
+    def pop(self, cache_key: str, now: float) -> Tuple[Optional[CacheItem], List[CacheItem]]:
+        """
+        从最旧的项开始取出第一个有效项，途中遇到的过期项一并移除。
+
+        Returns:
+            (第一个有效项，没有时为 None; 被移除的过期项)
+        """
+        expired = []
+        while cache_key in self.cache:
+            cache_deque = self.cache[cache_key]
+            item = cache_deque.popleft()
+            if not cache_deque:
+                del self.cache[cache_key]
+            del self._order[item['id']]
+            self.cur_cache_num -= 1
+            self.cur_bytes -= item['size']
+            if now < item.get('expiry_time', 0):
+                return item, expired
+            expired.append(item)
+        return None, expired
+
+    def evict_oldest(self) -> CacheItem:
+        """淘汰分片内最旧的缓存项，它一定位于所属键的 deque 最左侧"""
+        _, item = self._order.popitem(last=False)
+        cache_deque = self.cache[item['key']]
+        cache_deque.popleft()
+        if not cache_deque:
+            del self.cache[item['key']]
+        self.cur_cache_num -= 1
+        self.cur_bytes -= item['size']
+        return item
+
+    def over_budget(self) -> bool:
+        return self.cur_cache_num > self.max_entries or (self.max_bytes and self.cur_bytes > self.max_bytes)
+
+    def evict_over_budget(self) -> List[CacheItem]:
+        removed = []
+        while self.over_budget():
+            removed.append(self.evict_oldest())
+        return removed
+
+    def expire(self, now: float) -> List[CacheItem]:
+        """清理过期项（从最旧的项开始，遇到未过期的项即停止），返回被清理的缓存项"""
+        removed = []
+        while self._order:
+            oldest = next(iter(self._order.values()))
+            if now < oldest.get('expiry_time', 0):
+                break
+            removed.append(self.evict_oldest())
+        return removed
+    
+    def drain(self) -> List[CacheItem]:
+        """取出分片内所有缓存项（按写入顺序）"""
+        removed = []
+        while self._order:
+            removed.append(self.evict_oldest())
+        return removed
+
+
 class ResponseCacheManager:
-    """管理API响应缓存的类，一个键可以对应多个缓存项（使用deque）"""
+    """
+    管理API响应缓存的类，一个键可以对应多个缓存项（使用deque）。
+
+    缓存按缓存键的哈希分为若干分片（CACHE_SHARDS），每个分片有独立的锁与容量（总条目数与总字节数平均分配），
+    不同分片上的读写互不阻塞；定时清理逐个分片进行，每处理完一个分片就让出事件循环，
+    不会在整个清理期间阻塞查找。淘汰在分片内按写入顺序进行（命中时缓存项会被取走，
+    最旧优先淘汰即等同于最近最少使用），全局上是近似的最旧优先。
+    设置 max_bytes 时按写入时估算的每个缓存项的内存占用统计总字节数，超出后同样淘汰最旧的项。
+    开启 compact 时响应以压缩后的字节串保存（见 CompactResponse），命中时再还原，
+    用少量 CPU 换取同样内存下数倍的缓存条目数。
+    启用磁盘二级缓存（enable_disk_tier）后，被淘汰或过期的缓存项降级到磁盘，
+    get_and_remove 在内存未命中时再从磁盘查找。
+    """
     
     def __init__(self, expiry_time: int, max_entries: int, 
-                 cache_dict: Dict[str, deque[CacheItem]] = None):
+                 cache_dict: Dict[str, deque[CacheItem]] = None, num_shards: int = None,
+                 max_bytes: int = None, compact: bool = None):
         """
         初始化缓存管理器。
         
         Args:
             expiry_time (int): 缓存项的过期时间（秒）。
             max_entries (int): 缓存中允许的最大总条目数。
-            cache_dict (Dict[str, deque[CacheItem]], optional): 初始缓存字典。默认为 None。
+            cache_dict (Dict[str, deque[CacheItem]], optional): 初始缓存项，会按键分配到各个分片。默认为 None。
+            num_shards (int, optional): 分片数，默认为 CACHE_SHARDS（不超过 max_entries）。
+            max_bytes (int, optional): 缓存占用的最大字节数（估算值），默认为 MAX_CACHE_BYTES，0 表示不限制。
+            compact (bool, optional): 是否以压缩的字节串保存响应，默认为 CACHE_COMPACT_STORAGE。
         """
-        self.cache: Dict[str, deque[CacheItem]] = cache_dict if cache_dict is not None else {}
         self.expiry_time = expiry_time
-        self.max_entries = max_entries # 总条目数限制
-        self.cur_cache_num = 0 # 当前条目数
-        self.lock = asyncio.Lock() # Added lock
-
-    async def get(self, cache_key: str) -> Tuple[Optional[Any], bool]: # Made async
-        """获取指定键的第一个有效缓存项（不删除）"""
-        now = time.time()
-        async with self.lock:
-            if cache_key in self.cache:
-                cache_deque = self.cache[cache_key]
-                # 查找第一个未过期的项，且不删除
-                for item in cache_deque:
-                    if now < item.get('expiry_time', 0):
-                        response = item.get('response',None)
-                        return response, True
-            
-            return None, False
-
-    async def get_and_remove(self, cache_key: str) -> Tuple[Optional[Any], bool]:
-        """获取并删除指定键的第一个有效缓存项。"""
-        now = time.time()
-        async with self.lock:
-            if cache_key in self.cache:
-                cache_deque = self.cache[cache_key]
-
-                # 查找第一个有效项并收集过期项
-                valid_item_to_remove = None
-                response_to_return = None
-                new_deque = deque()
-                items_removed_count = 0
-
-                for item in cache_deque:
-                    if now < item.get('expiry_time', 0):
-                        if valid_item_to_remove is None: # 找到第一个有效项
-                            valid_item_to_remove = item
-                            response_to_return = item.get('response', None)
-                            items_removed_count += 1 # 计数此项为移除
-                            
-                        else:
-                            new_deque.append(item) # 保留后续有效项
-                    else:
-                        items_removed_count += 1 # 计数过期项为移除
-
-                # 更新缓存状态
-                if items_removed_count > 0:
-                    self.cur_cache_num = max(0, self.cur_cache_num - items_removed_count)
-                    if not new_deque:
-                        # 如果所有项都被移除（过期或我们取的那个）
-                        del self.cache[cache_key]
-                    else:
-                        self.cache[cache_key] = new_deque
-
-                if valid_item_to_remove:
-                    return response_to_return, True # 返回找到的有效项
-
-            # 如果键不存在或未找到有效项
-            return None, False
-
-    async def store(self, cache_key: str, response: Any):
-        """存储响应到缓存（追加到键对应的deque）"""
+        num_shards = num_shards or settings.CACHE_SHARDS
+        self.shards = [_CacheShard(0) for _ in range(max(1, min(num_shards, max_entries)))]
+        self.max_entries = max_entries # 总条目数限制（设置时重新分配各分片的容量）
+        self.max_bytes = settings.MAX_CACHE_BYTES if max_bytes is None else max_bytes # 总字节数限制
+        self.compact = settings.CACHE_COMPACT_STORAGE if compact is None else compact
+        self.codec = select_codec(settings.CACHE_COMPRESSION) if self.compact else None
+        self.disk = None # 磁盘二级缓存（DiskCacheStore），未启用时为 None
+        for cache_key, cache_deque in (cache_dict or {}).items():
+            for item in cache_deque:
+                item.setdefault('size', estimate_size(item.get('response')) + _ENTRY_OVERHEAD)
+                self._shard(cache_key).add(cache_key, item)
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int):
+        self._max_entries = value
+        base, extra = divmod(value, len(self.shards))
+        for index, shard in enumerate(self.shards):
+            shard.max_entries = base + (1 if index < extra else 0)
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int):
+        self._max_bytes = value
+        for shard in self.shards:
+            shard.max_bytes = -(-value // len(self.shards)) if value > 0 else 0
+
+    @property
+    def cur_cache_num(self) -> int:
+        """当前条目数"""
+        return sum(shard.cur_cache_num for shard in self.shards)
+
+    @property
+    def cur_cache_bytes(self) -> int:
+        """当前缓存占用的字节数（估算值）"""
+        return sum(shard.cur_bytes for shard in self.shards)
+
+    @property
+    def cache(self):
+        """所有分片的缓存字典的只读合并视图"""
+        return ChainMap(*(shard.cache for shard in self.shards))
+
+    def _shard(self, cache_key: str) -> _CacheShard:
+        return self.shards[hash(cache_key) % len(self.shards)]
+
+    def _new_item(self, response: Any) -> CacheItem:
+        if self.compact and hasattr(response, 'data'):
+            response = CompactResponse(response, self.codec, settings.CACHE_COMPRESS_THRESHOLD)
         now = time.time()
-        new_item: CacheItem = {
+        return {
             'response': response,
             'expiry_time': now + self.expiry_time,
             'created_at': now,
+            'size': estimate_size(response) + _ENTRY_OVERHEAD,
         }
 
-        needs_cleaning = False
-        async with self.lock:
-            if cache_key not in self.cache:
-                self.cache[cache_key] = deque()
-            
-            self.cache[cache_key].append(new_item) # 追加到deque末尾
-            self.cur_cache_num += 1
-            needs_cleaning = self.cur_cache_num > self.max_entries
+    def _demote(self, items: List[CacheItem]):
+        """将被淘汰或过期的缓存项降级到磁盘二级缓存"""
+        if self.disk is not None and items:
+            self.disk.add(items)
 
-        if needs_cleaning:
-             # 在锁外调用清理，避免长时间持有锁
-             await self.clean_if_needed()
+    async def enable_disk_tier(self, store):
+        """
+        启用磁盘二级缓存。
+
+        Args:
+            store: DiskCacheStore 实例，在线程池中打开
+        """
+        await asyncio.to_thread(store.open)
+        self.disk = store
+        log('info', f"磁盘缓存已启用: {store.path}，现有 {store.entries} 个缓存项")
+
+    async def get(self, cache_key: str) -> Tuple[Optional[Any], bool]: # Made async
+        """获取指定键的第一个有效缓存项（不删除）"""
+        shard = self._shard(cache_key)
+        async with shard.lock:
+            item = shard.peek(cache_key, time.time())
+        if item is not None:
+            return _unwrap(item.get('response', None)), True
+        return None, False
+
+    async def get_and_remove(self, cache_key: str) -> Tuple[Optional[Any], bool]:
+        """获取并删除指定键的第一个有效缓存项，内存未命中时从磁盘查找。"""
+        shard = self._shard(cache_key)
+        async with shard.lock:
+            item, expired = shard.pop(cache_key, time.time())
+        self._demote(expired)
+        if item is not None:
+            cache_hits_total.inc()
+            return _unwrap(item.get('response', None)), True # 返回找到的有效项
+        if self.disk is not None:
+            response = await self.disk.pop(cache_key)
+            if response is not None:
+                cache_hits_total.inc()
+                return _unwrap(response), True
+
+        # 如果键不存在或未找到有效项
+        cache_misses_total.inc()
+        return None, False
+
+    async def store(self, cache_key: str, response: Any):
+        """存储响应到缓存（追加到键对应的deque），超出分片容量时淘汰分片内最旧的项"""
+        new_item = self._new_item(response)
+        shard = self._shard(cache_key)
+        async with shard.lock:
+            self._demote(shard.add(cache_key, new_item))
 
     async def clean_expired(self):
-        """清理所有缓存项中已过期的项。"""
-        now = time.time()
-        keys_to_remove = []
+        """逐个分片清理已过期的项，每个分片之间让出事件循环。"""
         total_cleaned = 0
-        async with self.lock:
-            # 迭代 cache 的副本以允许在循环中安全地修改 cache
-            for key, cache_deque in list(self.cache.items()):
-                original_len = len(cache_deque)
-                # 创建一个新的 deque，只包含未过期的项
-                valid_items = deque(item for item in cache_deque if now < item.get('expiry_time', 0))
-                cleaned_count = original_len - len(valid_items)
-
-                if cleaned_count > 0:
-                    log('info', f"清理键 {key[:8]}... 的过期缓存项 {cleaned_count} 个。")
-                    total_cleaned += cleaned_count
-
-                if not valid_items:
-                    keys_to_remove.append(key) # 标记此键以便稍后删除
-                    # 在持有锁时直接删除键
-                    if key in self.cache:
-                         del self.cache[key]
-                         log('info', f"缓存键 {key[:8]}... 的所有项均已过期，移除该键。")
-                elif cleaned_count > 0:
-                    # 替换为只包含有效项的 deque
-                    self.cache[key] = valid_items
-
-            # 统一更新缓存计数
-            if total_cleaned > 0:
-                 self.cur_cache_num = max(0, self.cur_cache_num - total_cleaned)
+        for shard in self.shards:
+            async with shard.lock:
+                expired = shard.expire(time.time())
+            self._demote(expired)
+            total_cleaned += len(expired)
+            await asyncio.sleep(0)
+        if total_cleaned > 0:
+            log('info', f"清理过期缓存项 {total_cleaned} 个，剩余 {self.cur_cache_num} 个。")
 
     async def clean_if_needed(self):
-        """如果缓存总条目数超过限制，清理全局最旧的项目。"""
-
-        async with self.lock: 
-            if self.cur_cache_num <= self.max_entries:
-                return
-
-            # 计算目标大小和需要移除的数量
-            target_size = max(self.max_entries - 10, 10)
-            if self.cur_cache_num <= target_size:
-                return
-
-            items_to_remove_count = self.cur_cache_num - target_size
-            log('info', f"缓存总数 {self.cur_cache_num} 超过限制 {self.max_entries}，需要清理 {items_to_remove_count} 个")
-
-            # 收集所有缓存项及其元数据
-            all_items_meta = []
-            for key, cache_deque in self.cache.items():
-                for item in cache_deque:
-                    all_items_meta.append({'key': key, 'created_at': item.get('created_at', 0), 'item': item})
-
-            # 找出最旧的 N 项
-            actual_remove_count = min(items_to_remove_count, len(all_items_meta))
-            if actual_remove_count <= 0:
-                return # 没有项目可移除或无需移除
-
-            items_to_remove = heapq.nsmallest(actual_remove_count, all_items_meta, key=lambda x: x['created_at'])
-
-            # 执行移除
-            items_actually_removed = 0
-            keys_potentially_empty = set()
-            for item_meta in items_to_remove:
-                key_to_clean = item_meta['key']
-                item_to_clean = item_meta['item']
-
-                if key_to_clean in self.cache:
-                    try:
-                        # 直接从 deque 中移除指定的 item 对象
-                        self.cache[key_to_clean].remove(item_to_clean)
-                        items_actually_removed += 1
-                        # 计数器在最后统一更新
-                        log('info', f"因容量限制，删除键 {key_to_clean[:8]}... 的旧缓存项 (创建于 {item_meta['created_at']})。")
-                        keys_potentially_empty.add(key_to_clean)
-                    except (KeyError, ValueError):
-                        log('warning', f"尝试因容量限制删除缓存项时未找到 (可能已被提前移除): {key_to_clean[:8]}...")
-                        pass
-
-            # 检查是否有 deque 因本次清理变空
-            for key in keys_potentially_empty:
-                 if key in self.cache and not self.cache[key]:
-                     del self.cache[key]
-                     log('info', f"因容量限制清理后，键 {key[:8]}... 的deque已空，移除该键。")
-
-            # 统一更新缓存计数
-            if items_actually_removed > 0:
-                 self.cur_cache_num = max(0, self.cur_cache_num - items_actually_removed)
-                 log('info', f"因容量限制，共清理了 {items_actually_removed} 个旧缓存项。清理后缓存数: {self.cur_cache_num}")
+        """如果缓存总条目数或字节数超过限制（例如调小了容量），逐个分片淘汰最旧的项目。"""
+        removed = 0
+        for shard in self.shards:
+            async with shard.lock:
+                evicted = shard.evict_over_budget()
+            self._demote(evicted)
+            removed += len(evicted)
+            await asyncio.sleep(0)
+        if removed > 0:
+            log('info', f"因容量限制，共清理了 {removed} 个旧缓存项。清理后缓存数: {self.cur_cache_num}")
+
+    async def close(self):
+        """关闭时将内存中的缓存项全部写入磁盘二级缓存（未启用时不做任何事）"""
+        if self.disk is None:
+            return
+        remaining = 0
+        for shard in self.shards:
+            async with shard.lock:
+                items = shard.drain()
+            self._demote(items)
+            remaining += len(items)
+        await self.disk.close()
+        log('info', f"已将 {remaining} 个内存缓存项写入磁盘缓存")
 
 def generate_cache_key(chat_request, last_n_messages: int = 65536, is_gemini=False) -> str:
     """
@@ -0,0 +1,264 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import app.config.settings as settings
+from app.utils.logging import log
+from app.utils.cache import CompactResponse, select_codec
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS entries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        cache_key TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        size INTEGER NOT NULL,
+        codec TEXT,
+        model TEXT,
+        payload BLOB NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS entries_key ON entries (cache_key, id)",
+    "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires_at)",
+)
+
+
+class DiskCacheStore:
+    """
+    响应缓存的磁盘二级缓存（SQLite，WAL 模式）。
+
+    内存缓存因容量淘汰或过期清理的缓存项会降级到这里，内存未命中时再从磁盘查找；
+    磁盘层有独立的有效期（从缓存项创建时算起）与字节数上限，超出上限时删除最旧的缓存项。
+    响应以紧凑的 JSON 字节串（超过阈值时压缩）保存。降级的缓存项先累积在内存中，
+    每隔 write_interval 秒在线程池中用一次事务批量写入，写入失败时放回等待队列下次重试；
+    所有数据库操作在线程池中串行执行，计数（entries、bytes、_key_counts）只在事件循环中更新。
+    写入与读取各自只返回本次插入或删除的变化量，按完成顺序累加，不会用旧的快照覆盖其他操作的结果。
+    """
+
+    def __init__(self, path, response_cls, expiry_time=None, max_bytes=None, write_interval=1.0):
+        self.path = path
+        self.response_cls = response_cls  # 从磁盘还原响应时使用的包装器类型
+        self.expiry_time = settings.DISK_CACHE_EXPIRY_TIME if expiry_time is None else expiry_time
+        self.max_bytes = settings.DISK_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.write_interval = write_interval
+        self.codec = select_codec(settings.CACHE_COMPRESSION)
+        self.entries = 0   # 磁盘上的缓存项数
+        self.bytes = 0     # 磁盘上缓存项的总字节数
+        self._key_counts = {}  # 磁盘上每个缓存键的缓存项数，未命中时不必查询数据库
+        self._conn = None
+        self._db_lock = threading.Lock()
+        self._pending = {}  # 等待写入的缓存项：缓存键 -> [(响应, 创建时间), ...]
+        self._writing = {}  # 正在写入的缓存项，结构同 _pending
+        self._write_handle = None
+        self._write_task = None
+
+    def open(self):
+        """打开（必要时创建）数据库并删除过期的缓存项"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._db_lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            self._prune(time.time(), {})
+            # 打开时没有其他操作在进行，直接读取当前计数
+            self.entries, self.bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            self._key_counts = dict(self._conn.execute(
+                "SELECT cache_key, COUNT(*) FROM entries GROUP BY cache_key"))
+
+    def _prune(self, now, delta):
+        """
+        删除过期的缓存项，总大小超出上限时从最旧的开始删除。
+
+        Args:
+            delta: 每个缓存键的 [缓存项数, 字节数] 变化量，删除的缓存项从中扣除
+        """
+        def remove(cache_key, count, size):
+            change = delta.setdefault(cache_key, [0, 0])
+            change[0] -= count
+            change[1] -= size
+
+        for cache_key, count, size in self._conn.execute(
+                "SELECT cache_key, COUNT(*), SUM(size) FROM entries WHERE expires_at <= ? GROUP BY cache_key",
+                (now,)).fetchall():
+            remove(cache_key, count, size)
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        while self.max_bytes and total_bytes > self.max_bytes:
+            rows = self._conn.execute("SELECT id, cache_key, size FROM entries ORDER BY id LIMIT 256").fetchall()
+            if not rows:
+                break
+            excess = total_bytes - self.max_bytes
+            removed_ids = []
+            for row_id, cache_key, size in rows:
+                removed_ids.append((row_id,))
+                remove(cache_key, 1, size)
+                excess -= size
+                total_bytes -= size
+                if excess <= 0:
+                    break
+            self._conn.executemany("DELETE FROM entries WHERE id = ?", removed_ids)
+
+    def _apply_delta(self, delta):
+        """在事件循环中累加一次写入或读取的计数变化量"""
+        for cache_key, (count, size) in delta.items():
+            self.entries += count
+            self.bytes += size
+            remaining = self._key_counts.get(cache_key, 0) + count
+            if remaining > 0:
+                self._key_counts[cache_key] = remaining
+            else:
+                self._key_counts.pop(cache_key, None)
+
+    def add(self, items, now=None):
+        """
+        将缓存项降级到磁盘（在下一次批量写入时执行）。
+
+        Args:
+            items: 内存缓存中被淘汰或过期的缓存项，已超过磁盘有效期的会被忽略
+        """
+        if self._conn is None:
+            return
+        if now is None:
+            now = time.time()
+        added = False
+        for item in items:
+            if item['created_at'] + self.expiry_time <= now:
+                continue
+            self._pending.setdefault(item['key'], []).append((item['response'], item['created_at']))
+            added = True
+        if added:
+            self._schedule_write()
+
+    def _schedule_write(self):
+        if self._write_handle is not None or (self._write_task is not None and not self._write_task.done()):
+            return
+        self._write_handle = asyncio.get_running_loop().call_later(self.write_interval, self._start_write)
+
+    def _start_write(self):
+        self._write_handle = None
+        self._write_task = asyncio.create_task(self.write())
+        self._write_task.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, task):
+        # 写入期间又有新的缓存项降级时安排下一次写入
+        if self._conn is not None and self._pending:
+            self._schedule_write()
+
+    def _encode(self, response):
+        """转换为紧凑存储的字节串"""
+        if not isinstance(response, CompactResponse):
+            response = CompactResponse(response, self.codec, settings.CACHE_COMPRESS_THRESHOLD)
+        return response.payload, response.codec, response.model
+
+    def _write_sync(self, pending):
+        """
+        批量写入并清理磁盘缓存。
+
+        Returns:
+            每个缓存键的 [缓存项数, 字节数] 变化量，由调用方在事件循环中应用
+        """
+        rows = []
+        delta = {}
+        for cache_key, entries in pending.items():
+            for response, created_at in entries:
+                payload, codec, model = self._encode(response)
+                rows.append((cache_key, created_at, created_at + self.expiry_time,
+                             len(payload), codec, model, payload))
+                change = delta.setdefault(cache_key, [0, 0])
+                change[0] += 1
+                change[1] += len(payload)
+        with self._db_lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO entries (cache_key, created_at, expires_at, size, codec, model, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._prune(time.time(), delta)
+        return delta
+
+    async def write(self):
+        """在线程池中写入等待降级的缓存项，失败时放回等待队列"""
+        if not self._pending:
+            return
+        # 提交前这批缓存项保留在 _writing 中，pop() 遇到时等待写入完成
+        self._writing, self._pending = self._pending, {}
+        try:
+            delta = await asyncio.to_thread(self._write_sync, self._writing)
+        except Exception as e:
+            log('error', f"写入磁盘缓存失败，将在下次写入时重试: {str(e)}")
+            # 放回等待队列，排在写入期间新降级的缓存项之前
+            for cache_key, entries in self._writing.items():
+                self._pending[cache_key] = entries + self._pending.get(cache_key, [])
+        else:
+            self._apply_delta(delta)
+        finally:
+            self._writing = {}
+
+    def _pop_sync(self, cache_key, now):
+        with self._db_lock, self._conn:
+            row = self._conn.execute(
+                "SELECT id, size, codec, model, payload FROM entries "
+                "WHERE cache_key = ? AND expires_at > ? ORDER BY id LIMIT 1", (cache_key, now)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("DELETE FROM entries WHERE id = ?", (row[0],))
+        return row
+
+    def _pop_pending(self, cache_key, now):
+        """从等待写入的缓存项中取出最旧的有效项，没有时为 None"""
+        entries = self._pending.get(cache_key)
+        while entries:
+            response, created_at = entries.pop(0)
+            if not entries:
+                del self._pending[cache_key]
+            if created_at + self.expiry_time > now:
+                return response
+            entries = self._pending.get(cache_key)
+        return None
+
+    async def pop(self, cache_key):
+        """
+        取出并删除指定键最旧的有效缓存项。
+
+        Returns:
+            响应（尚未写入磁盘的为原对象，从磁盘读取的为 CompactResponse），没有时为 None
+        """
+        if self._conn is None:
+            return None
+        now = time.time()
+        response = self._pop_pending(cache_key, now)
+        if response is not None:
+            return response
+        if cache_key in self._writing:
+            # 写入完成后这些缓存项在磁盘上，失败时已放回等待队列
+            await asyncio.shield(self._write_task)
+            response = self._pop_pending(cache_key, now)
+            if response is not None:
+                return response
+        if self._conn is None or cache_key not in self._key_counts:
+            return None
+        try:
+            row = await asyncio.to_thread(self._pop_sync, cache_key, now)
+        except Exception as e:
+            log('error', f"读取磁盘缓存失败: {str(e)}")
+            return None
+        if row is None:
+            return None
+        self._apply_delta({cache_key: (-1, -row[1])})
+        return CompactResponse.from_parts(row[4], row[2], self.response_cls, row[3])
+
+    async def close(self):
+        """写入剩余的缓存项并关闭数据库"""
+        if self._conn is None:
+            return
+        if self._write_task is not None and not self._write_task.done():
+            await self._write_task
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            self._apply_delta(self._write_sync(pending))
+        self._conn.close()
+        self._conn = None
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import time
+from collections import deque
+import app.config.settings as settings
+from app.utils.logging import log
+
+
+class DashboardState:
+    """
+    带版本号的仪表盘状态快照。
+
+    builder 生成完整的状态字典（不含日志），快照最多每 max_age 秒重建一次，多个轮询共用同一份快照；
+    重建时按字段计算摘要，只要有字段变化就把版本号加一，并在有限长度的历史中记录各版本的字段摘要，
+    因此可以回答“某个版本之后哪些字段变了”，客户端只需要拉取变化的字段。
+    """
+
+    def __init__(self, builder, max_age=1.0, history=120):
+        self.builder = builder
+        self.max_age = max_age
+        self.version = 0
+        self.state = {}
+        self.built_at = 0.0
+        self._digests = {}
+        self._history = deque(maxlen=history)  # (版本号, 各字段摘要)
+
+    def refresh(self, now=None):
+        """快照过期时重建，返回当前版本号"""
+        if now is None:
+            now = time.monotonic()
+        if self.version and now - self.built_at < self.max_age:
+            return self.version
+        state = self.builder()
+        digests = {field: _digest(value) for field, value in state.items()}
+        if digests != self._digests:
+            self.version += 1
+            self._digests = digests
+            self._history.append((self.version, digests))
+        self.state = state
+        self.built_at = now
+        return self.version
+
+    def changes_since(self, version):
+        """
+        获取某个版本之后变化的字段。
+
+        Returns:
+            (是否为完整状态, 字段字典)。版本号未知或已滑出历史时返回完整状态。
+        """
+        if version == self.version:
+            return False, {}
+        for old_version, digests in self._history:
+            if old_version == version:
+                changed = {field: value for field, value in self.state.items()
+                           if digests.get(field) != self._digests[field]}
+                return False, changed
+        return True, dict(self.state)
+
+    def invalidate(self):
+        """使快照失效，下一次读取时立即重建（例如修改配置之后）"""
+        self.built_at = 0.0
+
+
+class DashboardFeed:
+    """
+    仪表盘数据推送（SSE）的共享生产者。
+
+    第一个订阅者连接时启动推送任务，最后一个断开时任务退出。任务每隔 DASHBOARD_STREAM_INTERVAL 秒
+    调用一次 producer(cursor) 取得自上次推送以来的变化，序列化一次后放入所有订阅者的队列，
+    因此无论有多少人在看仪表盘，生成与序列化的开销都只有一份。
+    队列满（客户端消费过慢）的订阅者会被断开，由浏览器重连后重新获取完整数据。
+    """
+
+    def __init__(self, producer, interval=None, queue_size=64):
+        self.producer = producer  # producer(cursor) -> (数据或 None, 新游标)
+        self.interval = interval
+        self.queue_size = queue_size
+        self._subscribers = set()
+        self._cursor = None
+        self._task = None
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def subscribe(self, cursor):
+        """
+        添加订阅者。
+
+        Args:
+            cursor: 订阅者已收到的完整数据对应的游标，推送任务未运行时以它为起点
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._cursor = cursor
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue):
+        self._subscribers.discard(queue)
+
+    async def _run(self):
+        while self._subscribers:
+            interval = self.interval if self.interval is not None else settings.DASHBOARD_STREAM_INTERVAL
+            await asyncio.sleep(interval)
+            if not self._subscribers:
+                break
+            try:
+                data, self._cursor = self.producer(self._cursor)
+            except Exception as e:
+                log('error', f"生成仪表盘推送数据失败: {str(e)}")
+                continue
+            if data is not None:
+                self.broadcast(format_sse(data))
+
+    def broadcast(self, message):
+        """将序列化好的消息放入所有订阅者的队列"""
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+
+def format_sse(data):
+    """序列化为一条 SSE 消息"""
+    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _digest(value):
+    return hash(json.dumps(value, sort_keys=True, ensure_ascii=False, default=str))
@@ -5,10 +5,61 @@ import asyncio
 from fastapi import HTTPException, status
 from app.utils.logging import format_log_message
 from app.utils.logging import log
+from app.utils.metrics import upstream_errors_total
 
 logger = logging.getLogger("my_logger")
 
-def handle_gemini_error(error, current_api_key) -> str:
+def _record_key_failure(key_manager, api_key, status_code=None, hard=False, retry_after=None):
+    """将失败结果反馈给密钥管理器的熔断器"""
+    if key_manager is not None:
+        key_manager.record_failure(api_key, status_code, hard=hard, retry_after=retry_after)
+
+def _parse_retry_after(response):
+    """从 429 响应中解析上游建议的重试等待秒数（Retry-After 响应头或 RetryInfo 中的 retryDelay）"""
+    value = response.headers.get("retry-after")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    try:
+        details = response.json().get("error", {}).get("details", [])
+    except Exception:
+        # 流式响应的响应体可能尚未读取
+        return None
+    for detail in details:
+        delay = detail.get("retryDelay") if isinstance(detail, dict) else None
+        if isinstance(delay, str) and delay.endswith("s"):
+            try:
+                return float(delay[:-1])
+            except ValueError:
+                pass
+    return None
+
+def _error_status_label(error) -> str:
+    """上游错误在指标中的状态标签"""
+    if isinstance(error, (requests.exceptions.HTTPError, httpx.HTTPStatusError)):
+        return str(error.response.status_code)
+    if isinstance(error, (requests.exceptions.ConnectionError, httpx.ConnectError)):
+        return "connect"
+    if isinstance(error, (requests.exceptions.Timeout, httpx.TimeoutException)):
+        return "timeout"
+    return "other"
+
+def is_upstream_failure(error) -> bool:
+    """
+    是否为上游（而非请求本身）的问题：429、5xx、连接错误与超时。
+
+    400 等客户端错误换一个密钥重试也不会成功，不应因此增加并发扇出。
+    """
+    if isinstance(error, (requests.exceptions.HTTPError, httpx.HTTPStatusError)):
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return isinstance(error, (requests.exceptions.ConnectionError, httpx.ConnectError,
+                              requests.exceptions.Timeout, httpx.TimeoutException))
+
+def handle_gemini_error(error, current_api_key, key_manager=None) -> str:
+    upstream_errors_total.labels(_error_status_label(error)).inc()
     # 同时检查 requests 和 httpx 的 HTTPError
     if isinstance(error, (requests.exceptions.HTTPError, httpx.HTTPStatusError)): 
         status_code = error.response.status_code
@@ -20,7 +71,7 @@ def handle_gemini_error(error, current_api_key) -> str:
                         error_message = "无效的 API 密钥"
                         log('ERROR', f"{current_api_key[:8]} ... {current_api_key[-3:]} → 无效，可能已过期或被删除", 
                             extra={'key': current_api_key[:8], 'status_code': status_code, 'error_message': error_message})
-                        # key_manager.blacklist_key(current_api_key)
+                        _record_key_failure(key_manager, current_api_key, status_code, hard=True)
                         
                         return error_message
                     error_message = error_data['error'].get('message', 'Bad Request')
@@ -38,7 +89,7 @@ def handle_gemini_error(error, current_api_key) -> str:
             error_message = f"权限被拒绝"
             log('ERROR', error_message, 
                 extra={'key': current_api_key[:8], 'status_code': status_code})
-            # key_manager.blacklist_key(current_api_key)
+            _record_key_failure(key_manager, current_api_key, status_code, hard=True)
             
             return error_message
         
@@ -46,7 +97,8 @@ def handle_gemini_error(error, current_api_key) -> str:
             error_message = f"API 密钥配额已用尽或其他原因"
             log('WARNING', error_message, 
                 extra={'key': current_api_key[:8], 'status_code': status_code})
-            # key_manager.blacklist_key(current_api_key)
+            _record_key_failure(key_manager, current_api_key, status_code,
+                                retry_after=_parse_retry_after(error.response))
              
             return error_message
         
@@ -54,29 +106,35 @@ def handle_gemini_error(error, current_api_key) -> str:
             error_message = f'Gemini API 内部错误' 
             log('WARNING', error_message, 
                 extra={'key': current_api_key[:8], 'status_code': status_code})
+            _record_key_failure(key_manager, current_api_key, status_code)
             return error_message
   
         if status_code == 503:
             error_message = f"Gemini API 服务繁忙"
             log('WARNING', error_message, 
                 extra={'key': current_api_key[:8], 'status_code': status_code})
+            _record_key_failure(key_manager, current_api_key, status_code)
             return error_message
         
         else:
             error_message = f"未知错误: {status_code}"
             log('WARNING', f"{status_code} 未知错误", 
                 extra={'key': current_api_key[:8], 'status_code': status_code, 'error_message': error_message})
+            if status_code >= 500:
+                _record_key_failure(key_manager, current_api_key, status_code)
             
             return f"未知错误/模型不可用: {status_code}"
 
-    elif isinstance(error, requests.exceptions.ConnectionError):
+    elif isinstance(error, (requests.exceptions.ConnectionError, httpx.ConnectError)):
         error_message = "连接错误"
         log('WARNING', error_message, extra={'error_message': error_message})
+        # 网络或上游整体故障与密钥无关，不计入密钥熔断（由自适应并发控制器统计）
         return error_message
 
-    elif isinstance(error, requests.exceptions.Timeout):
+    elif isinstance(error, (requests.exceptions.Timeout, httpx.TimeoutException)):
         error_message = "请求超时"
         log('WARNING', error_message, extra={'error_message': error_message})
+        # 网络或上游整体故障与密钥无关，不计入密钥熔断（由自适应并发控制器统计）
         return error_message
     else:
         error_message = f"发生未知错误: {error}"
@@ -116,12 +174,12 @@ async def handle_api_error(e: Exception, api_key: str, key_manager, request_type
             error_message = "API 密钥配额已用尽或其他原因"
             log('WARNING', f"429 官方资源耗尽或其他原因", 
                 extra={'key': api_key[:8], 'status_code': status_code, 'error_message': error_message})
-            # key_manager.blacklist_key(api_key)
+            _record_key_failure(key_manager, api_key, status_code, retry_after=_parse_retry_after(e.response))
                      
             return {'remove_cache': False,'error': error_message, 'should_switch_key': True}             
 
         else:
-            error_detail = handle_gemini_error(e, api_key)
+            error_detail = handle_gemini_error(e, api_key, key_manager)
             
             # # 重试次数用尽，在日志中输出错误状态码
             # log('error', f"Gemini 服务器错误({status_code})", 
@@ -132,5 +190,5 @@ async def handle_api_error(e: Exception, api_key: str, key_manager, request_type
                           detail=f"Gemini API 服务器错误({status_code})，请稍后重试")
     
     # 对于其他错误，返回切换密钥的信号，并输出错误信息到日志中
-    error_detail = handle_gemini_error(e, api_key)
+    error_detail = handle_gemini_error(e, api_key, key_manager)
     return {'should_switch_key': True, 'error': error_detail, 'remove_cache': True}
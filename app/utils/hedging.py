@@ -0,0 +1,177 @@
+import time
+import asyncio
+import weakref
+from collections import defaultdict, deque
+import app.config.settings as settings
+from app.utils.logging import log
+from app.utils.stats import api_stats_manager
+
+# 已交付成功响应的工作任务（胜者或写入缓存的落选者），这些任务不会再被取消
+_delivered_tasks = weakref.WeakSet()
+
+def cancel_pending_tasks(tasks, model, request_type, winner_key=None) -> int:
+    """
+    并发（对冲）请求已产生胜者后，取消仍在进行中的上游请求。
+
+    胜者以及已经拿到成功响应的任务不会被取消，它们剩余的统计与缓存写入照常完成。
+
+    Args:
+        tasks: (api_key, task) 列表
+        model: 请求的模型名称
+        request_type: 请求类型，用于日志
+        winner_key: 胜出请求使用的密钥
+
+    Returns:
+        int: 被取消的请求数量
+    """
+    cancelled = 0
+    for api_key, task in tasks:
+        if task.done() or api_key == winner_key or task in _delivered_tasks:
+            continue
+        task.cancel()
+        cancelled += 1
+
+    if cancelled:
+        api_stats_manager.record_hedge_cancellation(model, cancelled)
+        log('info', f"已选出成功响应，取消 {cancelled} 个进行中的并发请求",
+            extra={'request_type': request_type, 'model': model})
+    return cancelled
+
+async def deliver_response(result_future, api_key, response_content, response_cache_manager, cache_key) -> bool:
+    """
+    将成功响应交给协调者。
+
+    第一个成功的响应以 (密钥, 响应) 的形式通过 future 直接交付，不经过缓存；
+    之后到达的成功响应（并发请求中的落选者）再写入缓存，供相同请求复用。
+    调用前应已完成该请求的统计，交付之后任务不会再被 cancel_pending_tasks 取消。
+
+    Returns:
+        bool: 该响应是否为胜者
+    """
+    task = asyncio.current_task()
+    if task is not None:
+        _delivered_tasks.add(task)
+    if not result_future.done():
+        result_future.set_result((api_key, response_content))
+        return True
+
+    await response_cache_manager.store(cache_key, response_content)
+    return False
+
+class ConcurrencyController:
+    """
+    自适应并发（对冲扇出）控制器。
+
+    按模型记录最近的请求结果（成功 / 空响应 / 错误）与耗时，采用类 AIMD 策略调整扇出数：
+    - 出现失败或空响应时加性增加扇出，上游不稳定时多发请求以保证成功率；
+    - 成功且近期成功率、空响应率与 p95 耗时都健康时乘性减少扇出，避免浪费配额。
+    扇出数介于 CONCURRENT_REQUESTS 与 MAX_CONCURRENT_REQUESTS 之间，
+    并按剩余有配额的密钥比例进一步限制上限。
+    """
+
+    WINDOW_SIZE = 100          # 每个模型保留的最近结果数
+    WINDOW_SECONDS = 600       # 只统计最近 10 分钟内的结果
+    MIN_SAMPLES = 5            # 样本不足时不判定为健康
+    DECREASE_FACTOR = 0.75     # 健康时的乘性减少系数
+
+    def __init__(self):
+        self._outcomes = defaultdict(lambda: deque(maxlen=self.WINDOW_SIZE))
+        self._fanout = {}
+
+    def _bounds(self):
+        floor = max(1, settings.CONCURRENT_REQUESTS)
+        ceiling = max(floor, settings.MAX_CONCURRENT_REQUESTS)
+        return floor, ceiling
+
+    def _window(self, model, now):
+        outcomes = self._outcomes[model]
+        while outcomes and now - outcomes[0][0] > self.WINDOW_SECONDS:
+            outcomes.popleft()
+        return outcomes
+
+    def _signals(self, model, now):
+        """计算近期成功率、空响应率与成功请求的 p95 耗时"""
+        outcomes = self._window(model, now)
+        total = len(outcomes)
+        if not total:
+            return {"samples": 0, "success_rate": 1.0, "empty_rate": 0.0, "p95_latency": 0.0}
+        success = empty = 0
+        latencies = []
+        for _, outcome, latency in outcomes:
+            if outcome == "success":
+                success += 1
+                latencies.append(latency)
+            elif outcome == "empty":
+                empty += 1
+        p95 = 0.0
+        if latencies:
+            latencies.sort()
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        return {
+            "samples": total,
+            "success_rate": success / total,
+            "empty_rate": empty / total,
+            "p95_latency": p95,
+        }
+
+    def _is_healthy(self, signals) -> bool:
+        return (signals["samples"] >= self.MIN_SAMPLES
+                and signals["success_rate"] >= settings.ADAPTIVE_SUCCESS_TARGET
+                and signals["empty_rate"] <= 1 - settings.ADAPTIVE_SUCCESS_TARGET
+                and signals["p95_latency"] <= settings.ADAPTIVE_LATENCY_TARGET)
+
+    def record_outcome(self, model, outcome, latency=0.0):
+        """
+        记录一次上游请求结果并调整该模型的扇出数。
+
+        Args:
+            model: 模型名称
+            outcome: "success" / "empty" / "error" / "client_error"
+                （client_error 为 400 等请求本身的错误，不记录，也不调整扇出数）
+            latency: 请求耗时（秒）
+        """
+        if outcome == "client_error":
+            return
+        now = time.time()
+        self._outcomes[model].append((now, outcome, latency))
+        floor, ceiling = self._bounds()
+        fanout = min(max(self._fanout.get(model, float(floor)), floor), ceiling)
+
+        if outcome != "success":
+            # 加性增加：扇出越大增加越慢，一批请求全部失败时大约增加 1
+            fanout = min(ceiling, fanout + 1.0 / fanout)
+        elif self._is_healthy(self._signals(model, now)):
+            # 乘性减少：上游健康时迅速回落到最小并发
+            fanout = max(float(floor), fanout * self.DECREASE_FACTOR)
+        self._fanout[model] = fanout
+
+    def get_fanout(self, model, key_manager=None) -> int:
+        """获取模型当前的扇出数（每批并发请求数）"""
+        floor, ceiling = self._bounds()
+        fanout = min(max(self._fanout.get(model, float(floor)), floor), ceiling)
+        if key_manager is not None:
+            # 剩余配额越少，允许的扇出上限越低
+            fanout = min(fanout, max(1.0, ceiling * key_manager.quota_remaining_ratio()))
+        return max(1, int(fanout + 0.5))
+
+    def get_status(self, key_manager=None) -> dict:
+        """获取各模型的扇出数与信号，供仪表盘展示"""
+        now = time.time()
+        status = {}
+        for model in list(self._outcomes):
+            signals = self._signals(model, now)
+            status[model] = {
+                "fanout": self.get_fanout(model, key_manager),
+                "samples": signals["samples"],
+                "success_rate": round(signals["success_rate"], 4),
+                "empty_rate": round(signals["empty_rate"], 4),
+                "p95_latency": round(signals["p95_latency"], 2),
+            }
+        return status
+
+    def reset(self):
+        self._outcomes.clear()
+        self._fanout.clear()
+
+# 创建全局单例实例
+concurrency_controller = ConcurrencyController()
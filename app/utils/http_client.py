@@ -0,0 +1,149 @@
+import asyncio
+from contextlib import asynccontextmanager
+from collections import Counter
+import httpx
+import app.config.settings as settings
+from app.utils.logging import log
+
+class UpstreamClientManager:
+    """管理访问上游 API 的共享 httpx.AsyncClient，复用连接池与 HTTP/2 多路复用"""
+
+    def __init__(self):
+        self._client = None
+        self._loop = None  # 共享客户端所属的事件循环
+        self.http2 = False
+        # 连接池统计（按上游主机分组）
+        self.requests_total = Counter()      # 发出的请求数
+        self.connections_opened = Counter()  # 新建的 TCP 连接数
+
+    @staticmethod
+    def _http2_available() -> bool:
+        """HTTP/2 依赖 h2 库，未安装时回退到 HTTP/1.1"""
+        try:
+            import h2  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+    async def start(self):
+        """在应用启动时创建共享客户端"""
+        if self._client is not None and not self._client.is_closed:
+            return
+
+        http2 = settings.UPSTREAM_HTTP2 and self._http2_available()
+        if settings.UPSTREAM_HTTP2 and not http2:
+            log('warning', "未安装 h2 依赖，上游连接池将使用 HTTP/1.1")
+
+        limits = httpx.Limits(
+            max_connections=settings.UPSTREAM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.UPSTREAM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.UPSTREAM_KEEPALIVE_EXPIRY,
+        )
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            limits=limits,
+            event_hooks={'request': [self._on_request]},
+        )
+        self._loop = asyncio.get_running_loop()
+        self.http2 = http2
+        log('info', f"上游连接池已创建 (HTTP/2: {http2}, 最大连接数: {settings.UPSTREAM_MAX_CONNECTIONS}, "
+                    f"保活连接数: {settings.UPSTREAM_MAX_KEEPALIVE_CONNECTIONS})")
+
+    async def close(self):
+        """在应用关闭时释放连接池"""
+        if self._client is not None:
+            await self._client.aclose()
+            log('info', "上游连接池已关闭")
+        self._client = None
+        self._loop = None
+
+    async def _on_request(self, request: httpx.Request):
+        """请求钩子：计数并挂载 trace 回调以统计新建连接（保留调用方传入的 trace，两者都会被调用）"""
+        self.requests_total[request.url.host] += 1
+        inner = request.extensions.get("trace")
+        if inner is None:
+            request.extensions["trace"] = self._trace
+        else:
+            async def trace(event_name: str, info: dict):
+                await self._trace(event_name, info)
+                await inner(event_name, info)
+            request.extensions["trace"] = trace
+
+    async def _trace(self, event_name: str, info: dict):
+        if event_name == "connection.connect_tcp.started":
+            self.connections_opened[info.get("host", "")] += 1
+
+    @asynccontextmanager
+    async def client(self):
+        """
+        获取用于发起请求的客户端。
+
+        在共享客户端所属的事件循环中直接复用共享客户端（不会关闭它）；
+        未启动或在其他线程的事件循环中调用时（如后台密钥检测线程），创建临时客户端。
+        """
+        shared = self._client
+        if shared is not None and not shared.is_closed and self._loop is asyncio.get_running_loop():
+            yield shared
+        else:
+            async with httpx.AsyncClient() as temp_client:
+                yield temp_client
+
+    def _pool_connections(self) -> list:
+        """
+        读取 httpcore 连接池中的连接。
+
+        依赖 httpx / httpcore 的内部属性（_transport._pool.connections），
+        属性不存在（例如升级后内部结构变化）时返回空列表，只影响连接数统计。
+        """
+        transport = getattr(self._client, "_transport", None)
+        transport_pool = getattr(transport, "_pool", None)
+        connections = getattr(transport_pool, "connections", None)
+        try:
+            return list(connections or [])
+        except TypeError:
+            return []
+
+    @staticmethod
+    def _connection_host(conn) -> str:
+        host = getattr(getattr(conn, "_origin", None), "host", None)
+        if isinstance(host, bytes):
+            return host.decode("ascii", errors="replace")
+        return host or "unknown"
+
+    def get_pool_stats(self) -> dict:
+        """获取连接池指标：按上游主机统计打开的连接数与连接复用率"""
+        pools = {}
+        for host in set(self.requests_total) | set(self.connections_opened):
+            pools[host] = {"open": 0, "idle": 0, "active": 0}
+
+        for conn in self._pool_connections():
+            host = self._connection_host(conn)
+            pool = pools.setdefault(host, {"open": 0, "idle": 0, "active": 0})
+            pool["open"] += 1
+            is_idle = getattr(conn, "is_idle", None)
+            if callable(is_idle) and is_idle():
+                pool["idle"] += 1
+            else:
+                pool["active"] += 1
+
+        total_requests = sum(self.requests_total.values())
+        total_opened = sum(self.connections_opened.values())
+        for host, pool in pools.items():
+            requests = self.requests_total[host]
+            opened = self.connections_opened[host]
+            pool["requests"] = requests
+            pool["connections_opened"] = opened
+            pool["reuse_ratio"] = round(max(0.0, 1 - opened / requests), 4) if requests else 0.0
+
+        return {
+            "enabled": self._client is not None and not self._client.is_closed,
+            "http2": self.http2,
+            "open_connections": sum(pool["open"] for pool in pools.values()),
+            "requests": total_requests,
+            "connections_opened": total_opened,
+            "reuse_ratio": round(max(0.0, 1 - total_opened / total_requests), 4) if total_requests else 0.0,
+            "pools": pools,
+        }
+
+# 创建全局单例实例
+http_client_manager = UpstreamClientManager()
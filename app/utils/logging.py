@@ -29,14 +29,32 @@ class LogManager:
     def __init__(self, max_logs=100):
         self.logs = deque(maxlen=max_logs)  # 使用双端队列存储最近的日志
         self.lock = Lock()
+        self.last_seq = 0  # 最新一条日志的序号，前端据此只拉取新增的日志
     
     def add_log(self, log_entry):
         with self.lock:
+            self.last_seq += 1
+            log_entry['seq'] = self.last_seq
             self.logs.append(log_entry)
     
     def get_recent_logs(self, count=50):
         with self.lock:
             return list(self.logs)[-count:]
+    
+    def get_logs_since(self, seq, count=50):
+        """获取序号大于 seq 的日志（最多 count 条）"""
+        with self.lock:
+            return _logs_since(self.logs, seq, count)
+
+def _logs_since(logs, seq, count):
+    """从最新的日志向前查找，只遍历新增的部分"""
+    result = []
+    for entry in reversed(logs):
+        if entry['seq'] <= seq or len(result) >= count:
+            break
+        result.append(entry)
+    result.reverse()
+    return result
 
 # 创建日志管理器实例 (输出到前端)
 log_manager = LogManager()
@@ -46,14 +64,22 @@ class VertexLogManager:
     def __init__(self, max_logs=100):
         self.logs = deque(maxlen=max_logs)  # 使用双端队列存储最近的Vertex日志
         self.lock = Lock()
+        self.last_seq = 0  # 最新一条日志的序号
     
     def add_log(self, log_entry):
         with self.lock:
+            self.last_seq += 1
+            log_entry['seq'] = self.last_seq
             self.logs.append(log_entry)
     
     def get_recent_logs(self, count=50):
         with self.lock:
             return list(self.logs)[-count:]
+    
+    def get_logs_since(self, seq, count=50):
+        """获取序号大于 seq 的日志（最多 count 条）"""
+        with self.lock:
+            return _logs_since(self.logs, seq, count)
 
 # 创建Vertex日志管理器实例 (输出到前端)
 vertex_log_manager = VertexLogManager()
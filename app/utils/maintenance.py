@@ -38,43 +38,17 @@ def schedule_cache_cleanup(response_cache_manager, active_requests_manager):
     scheduler.add_job(active_requests_manager.clean_completed, 'interval', seconds=30)
     scheduler.add_job(active_requests_manager.clean_long_running, 'interval', minutes=5, args=[300])
     
-    # 使用同步包装器调用异步函数
-    def run_cleanup():
-        try:
-            # 创建新的事件循环而不是获取现有的
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # 在这个新循环中运行清理操作
-            loop.run_until_complete(api_stats_manager.cleanup())
-        except Exception as e:
-            log('error', f"清理统计数据时出错: {str(e)}")
-        finally:
-            # 确保关闭循环以释放资源
-            loop.close()
-    
-    # 添加同步的清理任务
-    scheduler.add_job(run_cleanup, 'interval', minutes=5)
-    
-    # 同样修改定时重置函数
-    def run_reset():
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(api_call_stats_clean())
-        except Exception as e:
-            log('error', f"重置统计数据时出错: {str(e)}")
-        finally:
-            loop.close()
+    # 统计数据只在事件循环中读写，清理任务直接以协程方式在事件循环中执行
+    scheduler.add_job(api_stats_manager.cleanup, 'interval', minutes=5)
     
+    # 密钥调用次数使用24小时滑动窗口统计，不再需要每天定时重置
     scheduler.add_job(check_version, 'interval', hours=4)
-    scheduler.add_job(run_reset, 'cron', hour=15, minute=0)
     scheduler.start()
     return scheduler
 
 async def api_call_stats_clean():
     """
-    每天定时重置API调用统计数据
+    重置API调用统计数据
     
     使用新的统计系统重置
     """
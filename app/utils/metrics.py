@@ -0,0 +1,232 @@
+from bisect import bisect_left
+
+# Prometheus 文本格式的内容类型
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# 上游耗时的默认分桶（秒），覆盖快速失败到长时间思考的请求
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def set(self, value):
+        self.value = value
+
+    def inc(self, amount=1):
+        self.value += amount
+
+    def dec(self, amount=1):
+        self.value -= amount
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum")
+
+    def __init__(self, upper_bounds):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)  # 最后一个为 +Inf 桶
+        self.sum = 0.0
+
+    def observe(self, value):
+        # 各桶只记录落入本桶的数量，导出时再累加，观测时只需一次二分查找
+        self.counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+
+
+class _Metric:
+    """
+    指标基类。
+
+    每组标签值对应一个只含计数字段的子对象（labels() 返回后可由调用方缓存复用），
+    更新时只做一次属性自增，没有锁与字符串拼接，可以在每个流式数据块上调用；
+    所有格式化工作都推迟到被抓取时进行。
+    """
+    type_name = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        if not self.labelnames:
+            self._default = self._children[()] = self._new_child()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """获取（必要时创建）指定标签值对应的子指标"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"指标 {self.name} 需要标签 {self.labelnames}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def clear(self):
+        self._children.clear()
+        if not self.labelnames:
+            self._default = self._children[()] = self._new_child()
+
+    def _label_str(self, values, extra=None):
+        pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def _samples(self, values, child):
+        yield self.name, self._label_str(values), child.value
+
+    def collect(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for values, child in list(self._children.items()):
+            for name, labels, value in self._samples(values, child):
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """只增不减的计数器"""
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    """可增可减的瞬时值，也可以通过 set_function 在抓取时计算"""
+    type_name = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._function = None
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value):
+        self._default.set(value)
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+    def dec(self, amount=1):
+        self._default.dec(amount)
+
+    def set_function(self, function):
+        """抓取时调用 function 获取当前值（仅适用于无标签的指标）"""
+        self._function = function
+
+    def collect(self):
+        if self._function is not None:
+            try:
+                self._default.set(self._function())
+            except Exception:
+                pass
+        return super().collect()
+
+
+class Histogram(_Metric):
+    """分桶直方图"""
+    type_name = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value):
+        self._default.observe(value)
+
+    def _samples(self, values, child):
+        cumulative = 0
+        for bound, count in zip(self.upper_bounds + (float("inf"),), child.counts):
+            cumulative += count
+            yield f"{self.name}_bucket", self._label_str(values, f'le="{_format_value(float(bound))}"'), cumulative
+        yield f"{self.name}_sum", self._label_str(values), child.sum
+        yield f"{self.name}_count", self._label_str(values), cumulative
+
+
+class MetricsRegistry:
+    """指标注册表，负责生成 Prometheus 文本格式的导出内容"""
+
+    def __init__(self):
+        self._metrics = {}
+
+    def register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"指标 {metric.name} 已注册")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.collect())
+        lines.append("")
+        return "\n".join(lines)
+
+
+# 创建全局单例实例
+metrics_registry = MetricsRegistry()
+
+requests_total = metrics_registry.counter(
+    "hajimi_requests_total", "成功的上游调用次数（按密钥前缀与模型）", ("key", "model"))
+tokens_total = metrics_registry.counter(
+    "hajimi_tokens_total", "上游调用消耗的 token 数（按密钥前缀与模型）", ("key", "model"))
+upstream_errors_total = metrics_registry.counter(
+    "hajimi_upstream_errors_total", "上游错误次数（按 HTTP 状态码，连接错误为 connect，超时为 timeout）", ("status",))
+cache_hits_total = metrics_registry.counter(
+    "hajimi_cache_hits_total", "响应缓存命中次数")
+cache_misses_total = metrics_registry.counter(
+    "hajimi_cache_misses_total", "响应缓存未命中次数")
+stream_chunks_total = metrics_registry.counter(
+    "hajimi_stream_chunks_total", "从上游收到的流式数据块数（按模型）", ("model",))
+active_requests = metrics_registry.gauge(
+    "hajimi_active_requests", "正在处理的客户端请求数（活跃请求池大小）")
+upstream_inflight = metrics_registry.gauge(
+    "hajimi_upstream_inflight_requests", "正在进行中的上游请求数")
+upstream_latency_seconds = metrics_registry.histogram(
+    "hajimi_upstream_latency_seconds", "上游请求的总耗时（秒）", ("model",))
+time_to_first_byte_seconds = metrics_registry.histogram(
+    "hajimi_time_to_first_byte_seconds", "上游请求的首字节耗时（秒）", ("model",))
@@ -0,0 +1,116 @@
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+# 单次剖析的时长上限（秒）
+MAX_SAMPLE_SECONDS = 120
+MAX_CPROFILE_SECONDS = 30
+
+
+class ProfilerBusyError(Exception):
+    """已有剖析任务在运行"""
+
+
+class ProcessProfiler:
+    """
+    进程内按需剖析器。
+
+    sample 模式在独立线程中按固定间隔读取 sys._current_frames()，统计所有线程（事件循环、
+    线程池中的阻塞任务、APScheduler 等）的调用栈，输出 collapsed 格式（每行 “栈;帧 次数”），
+    可直接交给 flamegraph.pl / speedscope 生成火焰图；开销与采样间隔成正比，对请求处理几乎没有影响。
+    cprofile 模式在事件循环线程上启用 cProfile 一小段时间，输出按累计耗时排序的函数统计，
+    确定性但开销较大，只适合短时间使用。同一时间只允许一个剖析任务运行。
+    """
+
+    def __init__(self):
+        self.running = False
+
+    def _acquire(self):
+        if self.running:
+            raise ProfilerBusyError("已有剖析任务在运行")
+        self.running = True
+
+    async def sample(self, seconds, interval=0.01, thread_filter=None):
+        """
+        采样所有线程的调用栈。
+
+        Args:
+            seconds: 采样时长（秒）
+            interval: 采样间隔（秒）
+            thread_filter: 只保留名称包含该字符串的线程
+
+        Returns:
+            (collapsed 格式的文本, 采样次数)
+        """
+        self._acquire()
+        try:
+            seconds = min(max(seconds, 0.1), MAX_SAMPLE_SECONDS)
+            stacks, samples = await asyncio.to_thread(_sample_stacks, seconds, interval, thread_filter)
+        finally:
+            self.running = False
+        lines = [f"{stack} {count}" for stack, count in stacks.most_common()]
+        return "\n".join(lines) + "\n", samples
+
+    async def cprofile(self, seconds, sort="cumulative", limit=100):
+        """
+        在事件循环线程上运行 cProfile。
+
+        Returns:
+            str: pstats 格式的文本报告
+        """
+        self._acquire()
+        try:
+            seconds = min(max(seconds, 0.1), MAX_CPROFILE_SECONDS)
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profiler.disable()
+        finally:
+            self.running = False
+        output = io.StringIO()
+        stats = pstats.Stats(profiler, stream=output)
+        stats.sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _sample_stacks(seconds, interval, thread_filter):
+    """在当前线程中采样其他所有线程的调用栈，返回 (Counter{collapsed 栈: 次数}, 采样次数)"""
+    own_ident = threading.get_ident()
+    stacks = Counter()
+    samples = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            name = names.get(ident, f"thread-{ident}")
+            if thread_filter and thread_filter not in name:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(name)
+            labels.reverse()
+            stacks[";".join(labels)] += 1
+        samples += 1
+        time.sleep(interval)
+    return stacks, samples
+
+
+# 创建全局单例实例
+process_profiler = ProcessProfiler()
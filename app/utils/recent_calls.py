@@ -0,0 +1,133 @@
+import time
+from collections import deque
+import app.config.settings as settings
+from app.utils.slow_requests import format_record_time
+
+
+class RecentCallsStore:
+    """
+    最近上游调用记录（每次对上游的尝试一条）。
+
+    记录保存在固定长度的数组中（按编号取模定位槽位），编号单调递增，
+    超出容量的旧记录被新记录直接覆盖；另外按密钥前缀、模型与结果各维护一份编号索引，
+    按条件查询时只遍历最小的那份索引，追加与淘汰都是常数时间（均摊）。
+    """
+
+    # 支持筛选的字段
+    INDEXED_FIELDS = ("key", "model", "outcome")
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity or settings.RECENT_CALLS_SIZE
+        self._slots = [None] * self.capacity
+        self._next_id = 0
+        self._indexes = {field: {} for field in self.INDEXED_FIELDS}  # 字段 -> {值: deque(编号)}
+
+    @property
+    def _oldest_id(self):
+        return max(0, self._next_id - self.capacity)
+
+    def __len__(self):
+        return self._next_id - self._oldest_id
+
+    def add(self, api_key, model, outcome, latency, tokens=0, error=None, stream=False):
+        """追加一条调用记录（结果为 success / empty / error）"""
+        record_id = self._next_id
+        self._next_id += 1
+        record = {
+            "id": record_id,
+            "time": format_record_time(time.time()),
+            "key": api_key[:8],
+            "model": model,
+            "outcome": outcome,
+            "latency_ms": round(latency * 1000, 1),
+            "tokens": tokens or 0,
+            "stream": stream,
+            "error": error,
+        }
+        self._slots[record_id % self.capacity] = record
+        oldest = self._oldest_id
+        for field, index in self._indexes.items():
+            ids = index.get(record[field])
+            if ids is None:
+                ids = index[record[field]] = deque()
+            ids.append(record_id)
+            while ids[0] < oldest:
+                ids.popleft()
+        # 每写满一轮清理一次不再被访问的索引，保证索引总大小有界
+        if record_id % self.capacity == self.capacity - 1:
+            self._prune_indexes()
+        return record
+
+    def _prune_indexes(self):
+        oldest = self._oldest_id
+        for index in self._indexes.values():
+            for value in list(index):
+                ids = index[value]
+                while ids and ids[0] < oldest:
+                    ids.popleft()
+                if not ids:
+                    del index[value]
+
+    def _candidate_ids(self, filters):
+        """选择最小的索引作为候选编号（没有可用索引时遍历全部记录）"""
+        best = None
+        for field, value in filters.items():
+            ids = self._indexes[field].get(value, ())
+            if best is None or len(ids) < len(best):
+                best = ids
+        if best is None:
+            return range(self._oldest_id, self._next_id)
+        return best
+
+    def query(self, key=None, model=None, outcome=None, limit=50, before=None):
+        """
+        按条件查询调用记录（从新到旧）。
+
+        Args:
+            key: 密钥前缀（8位及以上时使用索引，更短时按前缀匹配）
+            before: 只返回编号小于该值的记录，用于翻页
+
+        Returns:
+            (记录列表, 符合条件的记录总数, 下一页的 before；没有更多时为 None)
+        """
+        filters = {}
+        key_prefix = None
+        if key:
+            if len(key) >= 8:
+                filters["key"] = key[:8]
+            else:
+                key_prefix = key
+        if model:
+            filters["model"] = model
+        if outcome:
+            filters["outcome"] = outcome
+
+        oldest = self._oldest_id
+        records = []
+        total = 0
+        next_before = None
+        for record_id in reversed(self._candidate_ids(filters)):
+            if record_id < oldest:
+                break
+            record = self._slots[record_id % self.capacity]
+            if any(record[field] != value for field, value in filters.items()):
+                continue
+            if key_prefix and not record["key"].startswith(key_prefix):
+                continue
+            total += 1
+            if before is not None and record_id >= before:
+                continue
+            if len(records) < limit:
+                records.append(record)
+            elif next_before is None:
+                next_before = records[-1]["id"]
+        return records, total, next_before
+
+    def clear(self):
+        self._slots = [None] * self.capacity
+        self._next_id = 0
+        self._indexes = {field: {} for field in self.INDEXED_FIELDS}
+
+
+# 创建全局单例实例
+recent_calls_store = RecentCallsStore()
@@ -0,0 +1,181 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+import app.config.settings as settings
+from app.utils.metrics import metrics_registry
+from app.utils.slow_requests import slow_request_recorder, format_record_time
+from app.utils.recent_calls import recent_calls_store
+
+# 各阶段在 Server-Timing 与指标中的名称（按请求处理顺序）
+PHASE_DEDUP_WAIT = "dedup_wait"      # 等待相同请求的进行中任务
+PHASE_KEY_SELECT = "key_select"      # 选择可用密钥
+PHASE_CONVERT = "convert"            # 转换消息格式
+PHASE_CONNECT = "connect"            # 建立上游连接（复用连接池中的连接时为 0）
+PHASE_TTFB = "ttfb"                  # 从请求开始到上游返回首字节
+PHASE_FIRST_TOKEN = "first_token"    # 从请求开始到第一段内容交给客户端
+PHASE_TOTAL = "total"                # 请求总耗时（流式请求包含整个流的传输时间）
+
+request_phase_seconds = metrics_registry.histogram(
+    "hajimi_request_phase_seconds", "聊天请求各阶段耗时（秒，按模型与阶段）", ("model", "phase"),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0))
+
+_current_timing: ContextVar[Optional["RequestTiming"]] = ContextVar("request_timing", default=None)
+
+
+class RequestTiming:
+    """
+    单个请求的耗时与处理记录。
+
+    通过 contextvar 在路由、协调者与上游请求之间共享（asyncio.create_task 会复制上下文，
+    并发的工作任务拿到的是同一个记录对象）。顺序执行的阶段累加耗时；
+    ttfb / first_token / connect 在并发请求中只记录最先发生的一次。
+    同时记录每批并发数与每次上游尝试的结果，供慢请求记录使用（不保存提示词内容）。
+    """
+    __slots__ = ("model", "start", "wall_start", "phases", "finished", "path", "stream",
+                 "payload_bytes", "message_count", "key", "fanouts", "attempts", "status_code")
+
+    def __init__(self, model=None, path=None):
+        self.model = model
+        self.start = time.perf_counter()
+        self.wall_start = time.time()
+        self.phases = {}
+        self.finished = False
+        self.path = path
+        self.stream = False
+        self.payload_bytes = 0
+        self.message_count = 0
+        self.key = None          # 胜出（返回给客户端）的密钥
+        self.fanouts = []        # 每批并发请求数
+        self.attempts = []       # (密钥, 结果, 耗时, 错误信息)
+        self.status_code = None
+
+    def add(self, phase, seconds):
+        """累加某个阶段的耗时"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def add_since(self, phase, started):
+        """累加从 started（perf_counter）到现在的耗时"""
+        self.add(phase, time.perf_counter() - started)
+
+    def set_once(self, phase, seconds):
+        """记录阶段耗时，已有记录时保持不变"""
+        if phase not in self.phases:
+            self.phases[phase] = seconds
+
+    def mark(self, phase):
+        """记录从请求开始到现在的耗时（只记录第一次）"""
+        if phase not in self.phases:
+            self.phases[phase] = time.perf_counter() - self.start
+
+    def record_attempt(self, api_key, outcome, latency, error=None, tokens=0):
+        """记录一次上游尝试的结果（success / empty / error），同时写入最近调用记录"""
+        self.attempts.append((api_key[:8], outcome, latency, error))
+        recent_calls_store.add(api_key, self.model, outcome, latency, tokens, error, self.stream)
+
+    def upstream_trace(self):
+        """
+        生成 httpx 的 trace 回调，记录新建上游连接（TCP + TLS）的耗时。
+        复用连接池中的连接时不会触发连接事件。
+        """
+        connect_started = None
+
+        async def trace(event_name, info):
+            nonlocal connect_started
+            if event_name == "connection.connect_tcp.started":
+                connect_started = time.perf_counter()
+            elif connect_started is not None and event_name in (
+                    "connection.start_tls.complete", "connection.start_tls.failed",
+                    "connection.connect_tcp.failed"):
+                self.set_once(PHASE_CONNECT, time.perf_counter() - connect_started)
+                connect_started = None
+
+        return trace
+
+    def finish(self):
+        """结束计时并写入各模型的阶段耗时直方图"""
+        if self.finished:
+            return
+        self.finished = True
+        self.phases[PHASE_TOTAL] = time.perf_counter() - self.start
+        if not self.model:
+            return
+        for phase, seconds in self.phases.items():
+            request_phase_seconds.labels(self.model, phase).observe(seconds)
+        slow_request_recorder.maybe_record(self)
+
+    def to_record(self) -> dict:
+        """转换为慢请求记录（耗时单位为毫秒）"""
+        return {
+            "time": format_record_time(self.wall_start),
+            "model": self.model,
+            "path": self.path,
+            "stream": self.stream,
+            "status_code": self.status_code,
+            "key": self.key[:8] if self.key else None,
+            "payload_bytes": self.payload_bytes,
+            "message_count": self.message_count,
+            "fanouts": list(self.fanouts),
+            "attempts": [
+                {"key": key, "outcome": outcome, "latency_ms": round(latency * 1000, 1), "error": error}
+                for key, outcome, latency, error in self.attempts
+            ],
+            "phases_ms": {phase: round(seconds * 1000, 1) for phase, seconds in self.phases.items()},
+        }
+
+    def server_timing(self) -> str:
+        """生成 Server-Timing 响应头的值（单位为毫秒）"""
+        phases = dict(self.phases)
+        if PHASE_TOTAL not in phases:
+            phases[PHASE_TOTAL] = time.perf_counter() - self.start
+        return ", ".join(f"{phase};dur={seconds * 1000:.1f}" for phase, seconds in phases.items())
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """获取当前请求的耗时记录（不在聊天请求中时为 None）"""
+    return _current_timing.get()
+
+
+class RequestTimingMiddleware:
+    """
+    为聊天请求创建耗时记录的 ASGI 中间件。
+
+    在调用应用之前设置 contextvar，路由与处理函数在同一上下文中执行，因此可以直接取到记录；
+    响应头发送时按需附加 Server-Timing（流式请求此时只包含已完成的阶段），
+    整个响应发送完毕后写入直方图。
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not _is_chat_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming(path=scope["path"])
+        token = _current_timing.set(timing)
+
+        async def receive_with_size():
+            message = await receive()
+            if message["type"] == "http.request":
+                timing.payload_bytes += len(message.get("body", b""))
+            return message
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                timing.status_code = message["status"]
+                if settings.ENABLE_SERVER_TIMING:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timing.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive_with_size, send_with_timing)
+        finally:
+            timing.finish()
+            _current_timing.reset(token)
+
+
+def _is_chat_path(path) -> bool:
+    return path.endswith("/chat/completions") or (path.startswith("/gemini/") and ":" in path)
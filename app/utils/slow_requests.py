@@ -0,0 +1,47 @@
+import time
+from collections import deque
+import app.config.settings as settings
+
+
+class SlowRequestRecorder:
+    """
+    慢请求记录器（飞行记录仪）。
+
+    聊天请求结束时，总耗时超过 SLOW_REQUEST_THRESHOLD 秒的请求会被记录到固定长度的环形缓冲区中，
+    包含模型、密钥前缀、请求大小、消息数、每批并发数、每次尝试的结果与错误以及各阶段耗时，
+    不包含提示词内容，便于事后排查长尾延迟而无需开启 DEBUG 日志。
+    """
+
+    def __init__(self, max_records=None):
+        self.records = deque(maxlen=max_records or settings.SLOW_REQUEST_LOG_SIZE)
+
+    def maybe_record(self, timing):
+        """请求耗时超过阈值时记录"""
+        threshold = settings.SLOW_REQUEST_THRESHOLD
+        total = timing.phases.get("total", 0.0)
+        if threshold <= 0 or total < threshold:
+            return False
+        self.records.append(timing.to_record())
+        return True
+
+    def get_records(self, limit=50, model=None):
+        """获取最近的慢请求记录（从新到旧）"""
+        result = []
+        for record in reversed(self.records):
+            if model and record["model"] != model:
+                continue
+            result.append(record)
+            if len(result) >= limit:
+                break
+        return result
+
+    def clear(self):
+        self.records.clear()
+
+
+def format_record_time(wall_time):
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(wall_time))
+
+
+# 创建全局单例实例
+slow_request_recorder = SlowRequestRecorder()
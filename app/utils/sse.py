@@ -0,0 +1,86 @@
+import json
+from typing import Any, AsyncIterator, List
+
+# 上游在流结束时可能发送的结束标志
+SSE_DONE = b"[DONE]"
+
+class SSEDecoder:
+    """
+    增量式 SSE 事件解析器，直接处理上游返回的原始字节流。
+
+    每个字节只扫描一次（未完成的行记录已扫描到的位置，下一块到达时从该位置继续查找换行符）：
+    按行切分后收集 data 字段，遇到空行（事件边界）时
+    将该事件的 data 拼接为一个完整的字节串交给调用方，调用方对每个事件只需解码一次。
+    支持 \\n 与 \\r\\n 两种换行符。
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._scan_pos = 0  # 缓冲区中已扫描过（不含换行符）的字节数
+        self._data_lines: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """输入一段字节，返回其中已完整的事件 data 列表"""
+        self._buffer += chunk
+        events = []
+        start = 0
+        buffer = self._buffer
+        end = buffer.find(b"\n", self._scan_pos)
+        while end != -1:
+            line_end = end - 1 if end > start and buffer[end - 1] == 0x0D else end  # 去除 \r
+            self._process_line(bytes(buffer[start:line_end]), events)
+            start = end + 1
+            end = buffer.find(b"\n", start)
+        if start:
+            del buffer[:start]
+        self._scan_pos = len(buffer)
+        return events
+
+    def flush(self) -> List[bytes]:
+        """流结束时处理残留的不完整行与未以空行结尾的事件"""
+        events = []
+        if self._buffer:
+            line = bytes(self._buffer).rstrip(b"\r")
+            self._buffer.clear()
+            self._scan_pos = 0
+            self._process_line(line, events)
+        self._dispatch(events)
+        return events
+
+    def _process_line(self, line: bytes, events: List[bytes]):
+        if not line:
+            # 空行表示事件结束
+            self._dispatch(events)
+            return
+        if line[0] == 0x3A:  # 以 ':' 开头的注释行
+            return
+        field, sep, value = line.partition(b":")
+        if field != b"data":
+            # 只关心 data 字段，event / id / retry 等字段忽略
+            return
+        if sep and value[:1] == b" ":
+            value = value[1:]
+        self._data_lines.append(value)
+
+    def _dispatch(self, events: List[bytes]):
+        if not self._data_lines:
+            return
+        if len(self._data_lines) == 1:
+            events.append(self._data_lines[0])
+        else:
+            events.append(b"\n".join(self._data_lines))
+        self._data_lines = []
+
+
+async def aiter_sse_json(byte_iterator: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """从原始字节流中逐个产出已解析的 JSON 事件，遇到 [DONE] 时结束"""
+    decoder = SSEDecoder()
+    async for chunk in byte_iterator:
+        for data in decoder.feed(chunk):
+            if data.strip() == SSE_DONE:
+                return
+            yield json.loads(data)
+    for data in decoder.flush():
+        if data.strip() == SSE_DONE:
+            return
+        yield json.loads(data)
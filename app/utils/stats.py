@@ -1,161 +1,245 @@
 import asyncio 
-from datetime import datetime, timedelta
 from app.utils.logging import log
 import app.config.settings as settings
 from collections import defaultdict, Counter
 import time
-import threading
-import queue
-import functools
+from app.utils.timeseries import RollingCounter
+from app.utils.metrics import requests_total, tokens_total
+
+# 每个密钥的24小时滑动窗口：5分钟一个桶，共288个桶
+KEY_BUCKET_SECONDS = 300
+KEY_BUCKETS = 288
+# 每个密钥每个模型的24小时滑动窗口：1小时一个桶，共24个桶
+KEY_MODEL_BUCKET_SECONDS = 3600
+KEY_MODEL_BUCKETS = 24
+# 全局时间序列的多种分辨率：(桶长度秒数, 桶数)
+# 1分钟×1440（24小时）、1小时×720（30天）、1天×90（90天）
+SERIES_RESOLUTIONS = {
+    "minute": (60, 1440),
+    "hour": (3600, 720),
+    "day": (86400, 90),
+}
+# 仪表盘历史图表可选的范围：(分辨率, 桶数)
+HISTORY_RANGES = {
+    "24h": ("hour", 24),
+    "7d": ("hour", 168),
+    "30d": ("day", 30),
+}
+
+def _local_offset(ts):
+    """本地时区相对 UTC 的偏移秒数（时间序列按本地时间分桶，使日桶与本地日期对齐）"""
+    return time.localtime(ts).tm_gmtoff
 
 class ApiStatsManager:
-    """API调用统计管理器，优化性能的新实现"""
+    """
+    API调用统计管理器。
+
+    所有统计数据只在事件循环线程中读写，因此不需要加锁：
+    update_stats 只把调用记录追加到待处理列表，并通过 loop.call_later 安排一次批量合并；
+    读取统计前会先同步合并待处理的记录，保证读到的数据是最新的。
+    """
     
     def __init__(self, enable_background=True, batch_interval=1.0):
-        # 使用Counter记录API密钥和模型的调用次数
-        self.api_key_counts = Counter()  # 记录每个API密钥的调用次数
-        self.model_counts = Counter()    # 记录每个模型的调用次数
-        self.api_model_counts = defaultdict(Counter)  # 记录每个API密钥对每个模型的调用次数
+        # 使用滑动窗口计数器记录API密钥最近24小时的调用次数（{key: RollingCounter}）
+        self.api_key_counts = {}  # 记录每个API密钥的调用次数
+        self.model_counts = Counter()    # 记录每个模型的调用次数（累计，用于估算平均token用量）
+        self.api_model_counts = defaultdict(dict)  # 记录每个API密钥对每个模型的调用次数
         
         # 记录token使用量
-        self.api_key_tokens = Counter()  # 记录每个API密钥的token使用量
-        self.model_tokens = Counter()    # 记录每个模型的token使用量
-        self.api_model_tokens = defaultdict(Counter)  # 记录每个API密钥对每个模型的token使用量
-        
-        # 用于时间序列分析的数据结构（最近24小时，按分钟分组）
-        self.time_buckets = {}  # 格式: {timestamp_minute: {"calls": count, "tokens": count}}
+        self.api_key_tokens = {}  # 记录每个API密钥的token使用量
+        self.model_tokens = Counter()    # 记录每个模型的token使用量（累计）
+        self.api_model_tokens = defaultdict(dict)  # 记录每个API密钥对每个模型的token使用量
         
-        # 保存与兼容格式相关的调用日志（最小化存储）
-        self.recent_calls = []  # 仅保存最近的少量调用，用于前端展示
-        self.max_recent_calls = 100  # 最大保存的最近调用记录数
+        # 记录并发（对冲）请求被取消的情况
+        self.hedge_cancelled_counts = Counter()  # 每个模型被取消的上游请求数
+        self.hedge_saved_tokens = Counter()      # 每个模型因取消而节省的预估token数
         
-        # 当前时间分钟桶的时间戳（分钟级别）
-        self.current_minute = self._get_minute_timestamp(datetime.now())
+        # 用于时间序列分析的多分辨率环形缓冲区（按本地时间分桶，内存占用固定）
+        self.calls_series = {name: RollingCounter(*spec) for name, spec in SERIES_RESOLUTIONS.items()}
+        self.tokens_series = {name: RollingCounter(*spec) for name, spec in SERIES_RESOLUTIONS.items()}
         
         # 清理间隔（小时）
         self.cleanup_interval = 1
         self.last_cleanup = time.time()
         
-        # 使用线程锁而不是asyncio锁
-        self._counters_lock = threading.Lock()
-        self._time_series_lock = threading.Lock()
-        self._recent_calls_lock = threading.Lock()
+        # 用量变化与重置的监听者（密钥管理器据此维护配额索引）
+        self._usage_listeners = []
+        self._reset_listeners = []
         
-        # 后台处理相关
+        # 批量合并相关：enable_background 为 False 时每次调用立即合并
         self.enable_background = enable_background
         self.batch_interval = batch_interval
-        self._update_queue = queue.Queue()
-        self._worker_thread = None
-        self._stop_event = threading.Event()
+        self._pending = []         # 待合并的调用记录 (api_key, model, tokens, timestamp)
+        self._flush_handle = None  # 已安排的合并回调
         
-        if enable_background:
-            self._start_worker()
+        # 持久化存储（启用 ENABLE_STORAGE 时由 enable_persistence 设置）
+        self._store = None
     
-    def _start_worker(self):
-        """启动后台工作线程"""
-        if self._worker_thread is None or not self._worker_thread.is_alive():
-            self._stop_event.clear()
-            self._worker_thread = threading.Thread(
-                target=self._worker_loop,
-                daemon=True
-            )
-            self._worker_thread.start()
+    def add_listener(self, on_usage=None, on_reset=None):
+        """
+        注册统计变化的监听回调。
+
+        Args:
+            on_usage: on_usage(api_key, calls)，密钥调用次数变化后调用
+            on_reset: on_reset()，统计数据重置后调用
+        """
+        if on_usage:
+            self._usage_listeners.append(on_usage)
+        if on_reset:
+            self._reset_listeners.append(on_reset)
     
-    def _worker_loop(self):
-        """后台工作线程的主循环"""
-        batch = []
-        last_process = time.time()
-        
-        while not self._stop_event.is_set():
-            try:
-                # 非阻塞获取更新
+    def _notify_usage(self, api_keys):
+        if not self._usage_listeners:
+            return
+        now = time.time()
+        for api_key in api_keys:
+            calls = self.api_key_counts[api_key].total(now)
+            for listener in self._usage_listeners:
                 try:
-                    update = self._update_queue.get_nowait()
-                    batch.append(update)
-                except queue.Empty:
-                    pass
-                
-                # 处理批次或超时
-                current_time = time.time()
-                if batch and (current_time - last_process >= self.batch_interval):
-                    self._process_batch(batch)
-                    batch = []
-                    last_process = current_time
-                
-                # 短暂休眠以避免CPU占用过高
-                time.sleep(0.01)
-                
-            except Exception as e:
-                log('error', f"后台处理线程错误: {str(e)}")
-                time.sleep(1)  # 发生错误时短暂休眠
+                    listener(api_key, calls)
+                except Exception as e:
+                    log('error', f"统计监听回调出错: {str(e)}")
     
-    def _process_batch(self, batch):
-        """处理一批更新"""
-        with self._counters_lock:
-            for api_key, model, tokens in batch:
-                self.api_key_counts[api_key] += 1
-                self.model_counts[model] += 1
-                self.api_model_counts[api_key][model] += 1
-                self.api_key_tokens[api_key] += tokens
-                self.model_tokens[model] += tokens
-                self.api_model_tokens[api_key][model] += tokens
+    @staticmethod
+    def _rolling(counters, key, bucket_seconds, num_buckets):
+        counter = counters.get(key)
+        if counter is None:
+            counter = counters[key] = RollingCounter(bucket_seconds, num_buckets)
+        return counter
     
-    async def update_stats(self, api_key, model, tokens=0):
-        """更新API调用统计"""
-        if self.enable_background:
-            # 将更新放入队列
-            self._update_queue.put((api_key, model, tokens))
-        else:
-            # 同步更新
-            with self._counters_lock:
-                self.api_key_counts[api_key] += 1
-                self.model_counts[model] += 1
-                self.api_model_counts[api_key][model] += 1
-                self.api_key_tokens[api_key] += tokens
-                self.model_tokens[model] += tokens
-                self.api_model_tokens[api_key][model] += tokens
+    def _record(self, api_key, model, tokens, ts, local_ts):
+        """将一次调用合并到各项统计中"""
+        self._rolling(self.api_key_counts, api_key, KEY_BUCKET_SECONDS, KEY_BUCKETS).add(ts)
+        self._rolling(self.api_key_tokens, api_key, KEY_BUCKET_SECONDS, KEY_BUCKETS).add(ts, tokens)
+        self._rolling(self.api_model_counts[api_key], model, KEY_MODEL_BUCKET_SECONDS, KEY_MODEL_BUCKETS).add(ts)
+        self._rolling(self.api_model_tokens[api_key], model, KEY_MODEL_BUCKET_SECONDS, KEY_MODEL_BUCKETS).add(ts, tokens)
+        self.model_counts[model] += 1
+        self.model_tokens[model] += tokens
         
         # 更新时间序列数据
-        now = datetime.now()
-        minute_ts = self._get_minute_timestamp(now)
-        
-        with self._time_series_lock:
-            if minute_ts not in self.time_buckets:
-                self.time_buckets[minute_ts] = {"calls": 0, "tokens": 0}
-            
-            self.time_buckets[minute_ts]["calls"] += 1
-            self.time_buckets[minute_ts]["tokens"] += tokens
-            self.current_minute = minute_ts
-        
-        # 更新最近调用记录
-        with self._recent_calls_lock:
-            compact_call = {
-                'api_key': api_key,
-                'model': model,
-                'timestamp': now,
-                'tokens': tokens
+        for counter in self.calls_series.values():
+            counter.add(local_ts)
+        if tokens:
+            for counter in self.tokens_series.values():
+                counter.add(local_ts, tokens)
+    
+    def flush(self):
+        """合并所有待处理的调用记录"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        offset = _local_offset(batch[-1][3])
+        for api_key, model, tokens, ts in batch:
+            self._record(api_key, model, tokens, ts, ts + offset)
+        if self._store is not None:
+            self._store.add_batch(batch, offset)
+        self._notify_usage({api_key for api_key, _, _, _ in batch})
+        self._log_batch(batch)
+    
+    @staticmethod
+    def _log_batch(batch):
+        """每批记录一条日志（单次调用保持原来的格式），逐次调用的明细见最近调用记录"""
+        if len(batch) == 1:
+            api_key, model, tokens, _ = batch[0]
+            log('info', f"API调用已记录: 秘钥 '{api_key[:8]}', 模型 '{model}', 令牌: {tokens or 0}")
+            return
+        keys = {api_key for api_key, _, _, _ in batch}
+        models = {model for _, model, _, _ in batch}
+        total_tokens = sum(tokens or 0 for _, _, tokens, _ in batch)
+        log('info', f"API调用已记录: {len(batch)} 次调用, {len(keys)} 个秘钥, {len(models)} 个模型, 令牌: {total_tokens}")
+    
+    async def enable_persistence(self, store):
+        """打开持久化存储，恢复上次保存的统计数据，之后的调用统计会批量写入该存储"""
+        start = time.perf_counter()
+        await asyncio.to_thread(store.open)
+        snapshot = await asyncio.to_thread(store.load)
+        self.flush()
+        self._restore(snapshot)
+        self._store = store
+        log('info', f"已从 {store.path} 恢复调用统计: {len(snapshot['key_usage'])} 个密钥用量桶, "
+                    f"{len(snapshot['series'])} 个时间序列桶, 耗时 {(time.perf_counter() - start) * 1000:.0f} ms")
+        # 让密钥管理器据恢复的用量重建配额索引
+        self._notify_usage(list(self.api_key_counts))
+    
+    def _restore(self, snapshot):
+        """将持久化的桶数据恢复到内存中的各个滑动窗口"""
+        for bucket, api_key, model, calls, tokens in snapshot["key_usage"]:
+            ts = bucket * KEY_BUCKET_SECONDS
+            self._rolling(self.api_key_counts, api_key, KEY_BUCKET_SECONDS, KEY_BUCKETS).add(ts, calls)
+            self._rolling(self.api_key_tokens, api_key, KEY_BUCKET_SECONDS, KEY_BUCKETS).add(ts, tokens)
+            self._rolling(self.api_model_counts[api_key], model, KEY_MODEL_BUCKET_SECONDS, KEY_MODEL_BUCKETS).add(ts, calls)
+            self._rolling(self.api_model_tokens[api_key], model, KEY_MODEL_BUCKET_SECONDS, KEY_MODEL_BUCKETS).add(ts, tokens)
+        for resolution, bucket, calls, tokens in snapshot["series"]:
+            if resolution not in SERIES_RESOLUTIONS:
+                continue
+            ts = bucket * SERIES_RESOLUTIONS[resolution][0]
+            self.calls_series[resolution].add(ts, calls)
+            self.tokens_series[resolution].add(ts, tokens)
+        for model, calls, tokens in snapshot["model_totals"]:
+            self.model_counts[model] += calls
+            self.model_tokens[model] += tokens
+    
+    async def close(self):
+        """合并待处理的记录并关闭持久化存储"""
+        self.flush()
+        if self._store is not None:
+            await self._store.close()
+            self._store = None
+    
+    def _scheduled_flush(self):
+        self._flush_handle = None
+        try:
+            self.flush()
+        except Exception as e:
+            log('error', f"合并统计数据时出错: {str(e)}")
+    
+    async def update_stats(self, api_key, model, tokens=0):
+        """更新API调用统计（只追加记录，批量合并在事件循环中延后执行）"""
+        self._pending.append((api_key, model, tokens, time.time()))
+        requests_total.labels(api_key[:8], model).inc()
+        if tokens:
+            tokens_total.labels(api_key[:8], model).inc(tokens)
+        if not self.enable_background:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_interval, self._scheduled_flush)
+    
+    def record_hedge_cancellation(self, model, cancelled):
+        """记录被取消的并发请求，按该模型的平均token用量估算节省的配额"""
+        self.flush()
+        calls = self.model_counts[model]
+        avg_tokens = self.model_tokens[model] / calls if calls else 0
+        self.hedge_cancelled_counts[model] += cancelled
+        self.hedge_saved_tokens[model] += int(avg_tokens * cancelled)
+    
+    def get_hedge_stats(self):
+        """获取并发请求取消统计（节省的请求次数与预估token数）"""
+        return {
+            'cancelled_requests': sum(self.hedge_cancelled_counts.values()),
+            'saved_tokens': sum(self.hedge_saved_tokens.values()),
+            'models': {
+                model: {
+                    'cancelled_requests': count,
+                    'saved_tokens': self.hedge_saved_tokens[model]
+                }
+                for model, count in self.hedge_cancelled_counts.items()
             }
-            
-            self.recent_calls.append(compact_call)
-            if len(self.recent_calls) > self.max_recent_calls:
-                self.recent_calls.pop(0)
-        
-        # 记录日志
-        log_message = f"API调用已记录: 秘钥 '{api_key[:8]}', 模型 '{model}', 令牌: {tokens if tokens is not None else 0}"
-        log('info', log_message)
+        }
     
     async def cleanup(self):
-        """清理超过24小时的时间桶数据"""
-        now = datetime.now()
-        day_ago_ts = self._get_minute_timestamp(now - timedelta(days=1))
-        
-        with self._time_series_lock:
-            # 直接删除旧的时间桶
-            for ts in list(self.time_buckets.keys()):
-                if ts < day_ago_ts:
-                    del self.time_buckets[ts]
+        """清理最近24小时内没有调用的密钥计数器（时间序列为固定大小的环形缓冲区，无需清理）"""
+        self.flush()
+        now = time.time()
+        for api_key in [key for key, counter in self.api_key_counts.items() if not counter.total(now)]:
+            del self.api_key_counts[api_key]
+            self.api_key_tokens.pop(api_key, None)
+            self.api_model_counts.pop(api_key, None)
+            self.api_model_tokens.pop(api_key, None)
         
-        self.last_cleanup = time.time()
+        self.last_cleanup = now
     
     async def maybe_cleanup(self, force=False):
         """根据需要清理旧数据"""
@@ -166,120 +250,155 @@ class ApiStatsManager:
     
     async def get_api_key_usage(self, api_key, model=None):
         """获取API密钥的使用统计"""
-        with self._counters_lock:
-            if model:
-                return self.api_model_counts[api_key][model]
-            else:
-                return self.api_key_counts[api_key]
+        self.flush()
+        if model:
+            counter = self.api_model_counts.get(api_key, {}).get(model)
+        else:
+            counter = self.api_key_counts.get(api_key)
+        return counter.total(time.time()) if counter else 0
     
     def get_calls_last_24h(self):
         """获取过去24小时的总调用次数"""
-        with self._counters_lock:
-            return sum(self.api_key_counts.values())
+        self.flush()
+        now = time.time()
+        return sum(counter.total(now) for counter in self.api_key_counts.values())
+    
+    def _local_now(self, now=None):
+        if now is None:
+            now = time.time()
+        return now + _local_offset(now)
     
     def get_calls_last_hour(self, now=None):
         """获取过去一小时的总调用次数"""
-        if now is None:
-            now = datetime.now()
-        
-        hour_ago_ts = self._get_minute_timestamp(now - timedelta(hours=1))
-        
-        with self._time_series_lock:
-            return sum(data["calls"] for ts, data in self.time_buckets.items() 
-                      if ts >= hour_ago_ts)
+        self.flush()
+        return self.calls_series["minute"].sum_last(3600, self._local_now(now))
     
     def get_calls_last_minute(self, now=None):
         """获取过去一分钟的总调用次数"""
-        if now is None:
-            now = datetime.now()
-        
-        minute_ago_ts = self._get_minute_timestamp(now - timedelta(minutes=1))
-        
-        with self._time_series_lock:
-            return sum(data["calls"] for ts, data in self.time_buckets.items() 
-                      if ts >= minute_ago_ts)
+        self.flush()
+        return self.calls_series["minute"].sum_last(60, self._local_now(now))
+    
+    @staticmethod
+    def _format_points(start, step, values, label):
+        points = []
+        ts = start
+        for value in values:
+            points.append({'time': label(ts), 'value': value})
+            ts += step
+        return points
+    
+    @staticmethod
+    def _minute_label(local_ts):
+        minute_of_day = int(local_ts // 60) % 1440
+        return f"{minute_of_day // 60:02d}:{minute_of_day % 60:02d}"
+    
+    @staticmethod
+    def _hour_label(local_ts):
+        t = time.gmtime(local_ts)
+        return f"{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:00"
+    
+    @staticmethod
+    def _day_label(local_ts):
+        t = time.gmtime(local_ts)
+        return f"{t.tm_mon:02d}-{t.tm_mday:02d}"
     
     def get_time_series_data(self, minutes=30, now=None):
-        """获取过去N分钟的时间序列数据"""
-        if now is None:
-            now = datetime.now()
-        
-        calls_series = []
-        tokens_series = []
-        
-        with self._time_series_lock:
-            for i in range(minutes, -1, -1):
-                minute_dt = now - timedelta(minutes=i)
-                minute_ts = self._get_minute_timestamp(minute_dt)
-                
-                bucket = self.time_buckets.get(minute_ts, {"calls": 0, "tokens": 0})
-                
-                calls_series.append({
-                    'time': minute_dt.strftime('%H:%M'),
-                    'value': bucket["calls"]
-                })
-                
-                tokens_series.append({
-                    'time': minute_dt.strftime('%H:%M'),
-                    'value': bucket["tokens"]
-                })
-        
-        return calls_series, tokens_series
+        """获取过去N分钟的时间序列数据（按分钟）"""
+        self.flush()
+        local_now = self._local_now(now)
+        start, calls = self.calls_series["minute"].series(minutes + 1, local_now)
+        _, tokens = self.tokens_series["minute"].series(minutes + 1, local_now)
+        return (self._format_points(start, 60, calls, self._minute_label),
+                self._format_points(start, 60, tokens, self._minute_label))
+    
+    def get_history(self, range_name="7d", now=None):
+        """
+        获取较长时间范围的历史时间序列。
+
+        Args:
+            range_name: "24h" / "7d"（按小时）或 "30d"（按天）
+
+        Returns:
+            (调用次数序列, token 使用量序列)
+        """
+        resolution, buckets = HISTORY_RANGES[range_name]
+        self.flush()
+        local_now = self._local_now(now)
+        step = SERIES_RESOLUTIONS[resolution][0]
+        label = self._day_label if resolution == "day" else self._hour_label
+        start, calls = self.calls_series[resolution].series(buckets, local_now)
+        _, tokens = self.tokens_series[resolution].series(buckets, local_now)
+        return (self._format_points(start, step, calls, label),
+                self._format_points(start, step, tokens, label))
     
     def get_api_key_stats(self, api_keys):
         """获取API密钥的详细统计信息"""
         stats = []
         
-        with self._counters_lock:
-            for api_key in api_keys:
-                api_key_id = api_key[:8]
-                calls_24h = self.api_key_counts[api_key]
-                total_tokens = self.api_key_tokens[api_key]
-                
-                model_stats = {}
-                for model, count in self.api_model_counts[api_key].items():
-                    tokens = self.api_model_tokens[api_key][model]
-                    model_stats[model] = {
-                        'calls': count,
-                        'tokens': tokens
-                    }
-                
-                usage_percent = (calls_24h / settings.API_KEY_DAILY_LIMIT) * 100 if settings.API_KEY_DAILY_LIMIT > 0 else 0
-                
-                stats.append({
-                    'api_key': api_key_id,
-                    'calls_24h': calls_24h,
-                    'total_tokens': total_tokens,
-                    'limit': settings.API_KEY_DAILY_LIMIT,
-                    'usage_percent': round(usage_percent, 2),
-                    'model_stats': model_stats
-                })
+        self.flush()
+        now = time.time()
+        for api_key in api_keys:
+            api_key_id = api_key[:8]
+            calls_counter = self.api_key_counts.get(api_key)
+            tokens_counter = self.api_key_tokens.get(api_key)
+            calls_24h = calls_counter.total(now) if calls_counter else 0
+            total_tokens = tokens_counter.total(now) if tokens_counter else 0
+            
+            model_stats = {}
+            model_tokens = self.api_model_tokens.get(api_key, {})
+            for model, counter in self.api_model_counts.get(api_key, {}).items():
+                count = counter.total(now)
+                if not count:
+                    continue
+                model_stats[model] = {
+                    'calls': count,
+                    'tokens': model_tokens[model].total(now) if model in model_tokens else 0
+                }
+            
+            usage_percent = (calls_24h / settings.API_KEY_DAILY_LIMIT) * 100 if settings.API_KEY_DAILY_LIMIT > 0 else 0
+            
+            stats.append({
+                'api_key': api_key_id,
+                'calls_24h': calls_24h,
+                'total_tokens': total_tokens,
+                'limit': settings.API_KEY_DAILY_LIMIT,
+                'usage_percent': round(usage_percent, 2),
+                'model_stats': model_stats
+            })
         
         stats.sort(key=lambda x: x['usage_percent'], reverse=True)
         return stats
     
     async def reset(self):
         """重置所有统计数据"""
-        with self._counters_lock:
-            self.api_key_counts.clear()
-            self.model_counts.clear()
-            self.api_model_counts.clear()
-            self.api_key_tokens.clear()
-            self.model_tokens.clear()
-            self.api_model_tokens.clear()
-        
-        with self._time_series_lock:
-            self.time_buckets.clear()
+        self.flush()
+        self.api_key_counts.clear()
+        self.model_counts.clear()
+        self.api_model_counts.clear()
+        self.api_key_tokens.clear()
+        self.model_tokens.clear()
+        self.api_model_tokens.clear()
+        self.hedge_cancelled_counts.clear()
+        self.hedge_saved_tokens.clear()
+        for counter in self.calls_series.values():
+            counter.clear()
+        for counter in self.tokens_series.values():
+            counter.clear()
+        if self._store is not None:
+            self._store.clear()
         
-        with self._recent_calls_lock:
-            self.recent_calls.clear()
-        
-        self.current_minute = self._get_minute_timestamp(datetime.now())
         self.last_cleanup = time.time()
-
-    def _get_minute_timestamp(self, dt):
-        """将时间戳转换为分钟级别的时间戳（按分钟取整）"""
-        return int(dt.timestamp() // 60 * 60)
+        
+        for listener in self._reset_listeners:
+            listener()
+    
+    def get_key_recovery_time(self, api_key):
+        """密钥最近24小时的调用次数回落到每日限制以下的时间（旧的调用滑出窗口后逐步恢复）"""
+        now = time.time()
+        counter = self.api_key_counts.get(api_key)
+        if counter is None:
+            return now
+        return counter.time_below(settings.API_KEY_DAILY_LIMIT, now)
 
 # 创建全局单例实例
 api_stats_manager = ApiStatsManager()
@@ -0,0 +1,231 @@
+import asyncio
+import os
+import sqlite3
+import time
+from collections import defaultdict
+import app.config.settings as settings
+from app.utils.logging import log
+from app.utils.stats import KEY_BUCKET_SECONDS, KEY_BUCKETS, SERIES_RESOLUTIONS
+
+_SCHEMA = (
+    # 每个密钥每个模型的调用量，按 5 分钟分桶（与密钥的24小时滑动窗口一致）
+    """CREATE TABLE IF NOT EXISTS key_usage (
+        bucket INTEGER NOT NULL,
+        api_key TEXT NOT NULL,
+        model TEXT NOT NULL,
+        calls INTEGER NOT NULL,
+        tokens INTEGER NOT NULL,
+        PRIMARY KEY (bucket, api_key, model)
+    ) WITHOUT ROWID""",
+    # 全局时间序列（按本地时间分桶），resolution 为 minute / hour / day
+    """CREATE TABLE IF NOT EXISTS series (
+        resolution TEXT NOT NULL,
+        bucket INTEGER NOT NULL,
+        calls INTEGER NOT NULL,
+        tokens INTEGER NOT NULL,
+        PRIMARY KEY (resolution, bucket)
+    ) WITHOUT ROWID""",
+    # 每个模型的累计调用量
+    """CREATE TABLE IF NOT EXISTS model_totals (
+        model TEXT PRIMARY KEY,
+        calls INTEGER NOT NULL,
+        tokens INTEGER NOT NULL
+    )""",
+)
+
+_UPSERT_KEY_USAGE = """INSERT INTO key_usage (bucket, api_key, model, calls, tokens) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (bucket, api_key, model) DO UPDATE SET
+        calls = calls + excluded.calls, tokens = tokens + excluded.tokens"""
+_UPSERT_SERIES = """INSERT INTO series (resolution, bucket, calls, tokens) VALUES (?, ?, ?, ?)
+    ON CONFLICT (resolution, bucket) DO UPDATE SET
+        calls = calls + excluded.calls, tokens = tokens + excluded.tokens"""
+_UPSERT_MODEL_TOTALS = """INSERT INTO model_totals (model, calls, tokens) VALUES (?, ?, ?)
+    ON CONFLICT (model) DO UPDATE SET
+        calls = calls + excluded.calls, tokens = tokens + excluded.tokens"""
+
+
+class StatsStore:
+    """
+    调用统计的 SQLite 持久化存储（WAL 模式）。
+
+    只保存聚合后的桶而不是逐条调用记录：合并统计时把调用按桶累加到内存中的增量里，
+    每隔 STATS_PERSIST_INTERVAL 秒在线程池中用一次事务批量 upsert，并删除滑出窗口的旧桶，
+    因此数据库大小固定，启动时只需读取几千行即可恢复各个环形缓冲区。
+    写入串行执行，重置统计也作为一次写入排队，保证与之前的写入顺序一致。
+    """
+
+    def __init__(self, path, write_interval=None):
+        self.path = path
+        self.write_interval = settings.STATS_PERSIST_INTERVAL if write_interval is None else write_interval
+        self._conn = None
+        self._key_deltas = defaultdict(lambda: [0, 0])     # (bucket, api_key, model) -> [calls, tokens]
+        self._series_deltas = defaultdict(lambda: [0, 0])  # (resolution, bucket) -> [calls, tokens]
+        self._model_deltas = defaultdict(lambda: [0, 0])   # model -> [calls, tokens]
+        self._clear_pending = False
+        self._clear_count = 0  # clear() 的调用次数，用于判断写入失败期间是否重置过统计
+        self._write_handle = None
+        self._write_task = None
+
+    def open(self):
+        """打开（必要时创建）数据库"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # 写入在线程池中执行，但同一时间只有一个写入，因此可以跨线程共用一个连接
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def load(self, now=None):
+        """
+        删除过期的桶并读取剩余数据。
+
+        Returns:
+            dict: key_usage / series / model_totals 三张表的数据行（按桶升序）
+        """
+        if now is None:
+            now = time.time()
+        with self._conn:
+            self._prune(now)
+        return {
+            "key_usage": self._conn.execute(
+                "SELECT bucket, api_key, model, calls, tokens FROM key_usage ORDER BY bucket").fetchall(),
+            "series": self._conn.execute(
+                "SELECT resolution, bucket, calls, tokens FROM series ORDER BY bucket").fetchall(),
+            "model_totals": self._conn.execute(
+                "SELECT model, calls, tokens FROM model_totals").fetchall(),
+        }
+
+    def _prune(self, now):
+        """删除已滑出内存窗口的桶（时间序列按本地时间分桶，多保留一天的余量）"""
+        self._conn.execute("DELETE FROM key_usage WHERE bucket < ?",
+                           (int(now // KEY_BUCKET_SECONDS) - KEY_BUCKETS,))
+        for resolution, (bucket_seconds, num_buckets) in SERIES_RESOLUTIONS.items():
+            self._conn.execute("DELETE FROM series WHERE resolution = ? AND bucket < ?",
+                               (resolution, int((now - 86400) // bucket_seconds) - num_buckets))
+
+    def add_batch(self, batch, offset):
+        """
+        将一批调用记录累加到待写入的增量中。
+
+        Args:
+            batch: [(api_key, model, tokens, timestamp), ...]
+            offset: 本地时区偏移秒数（与时间序列的分桶方式一致）
+        """
+        if self._conn is None:
+            return
+        resolutions = list(SERIES_RESOLUTIONS.items())
+        for api_key, model, tokens, ts in batch:
+            delta = self._key_deltas[(int(ts // KEY_BUCKET_SECONDS), api_key, model)]
+            delta[0] += 1
+            delta[1] += tokens
+            local_ts = ts + offset
+            for resolution, (bucket_seconds, _) in resolutions:
+                delta = self._series_deltas[(resolution, int(local_ts // bucket_seconds))]
+                delta[0] += 1
+                delta[1] += tokens
+            delta = self._model_deltas[model]
+            delta[0] += 1
+            delta[1] += tokens
+        self._schedule_write()
+
+    def clear(self):
+        """清空所有持久化的统计（在下一次写入时执行）"""
+        if self._conn is None:
+            return
+        self._key_deltas.clear()
+        self._series_deltas.clear()
+        self._model_deltas.clear()
+        self._clear_pending = True
+        self._clear_count += 1
+        self._schedule_write()
+
+    def _schedule_write(self):
+        if self._write_handle is not None or (self._write_task is not None and not self._write_task.done()):
+            return
+        self._write_handle = asyncio.get_running_loop().call_later(self.write_interval, self._start_write)
+
+    def _start_write(self):
+        self._write_handle = None
+        self._write_task = asyncio.create_task(self.write())
+        self._write_task.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, task):
+        # 写入期间又产生了新的增量时安排下一次写入
+        if self._conn is not None and self._has_pending():
+            self._schedule_write()
+
+    def _take_pending(self):
+        pending = (
+            self._clear_pending,
+            [(bucket, api_key, model, calls, tokens)
+             for (bucket, api_key, model), (calls, tokens) in self._key_deltas.items()],
+            [(resolution, bucket, calls, tokens)
+             for (resolution, bucket), (calls, tokens) in self._series_deltas.items()],
+            [(model, calls, tokens) for model, (calls, tokens) in self._model_deltas.items()],
+        )
+        self._clear_pending = False
+        self._key_deltas.clear()
+        self._series_deltas.clear()
+        self._model_deltas.clear()
+        return pending
+
+    def _restore_pending(self, pending):
+        """写入失败时把取出的增量合并回待写入的增量，下一次写入时重试"""
+        clear, key_rows, series_rows, model_rows = pending
+        self._clear_pending = self._clear_pending or clear
+        for bucket, api_key, model, calls, tokens in key_rows:
+            delta = self._key_deltas[(bucket, api_key, model)]
+            delta[0] += calls
+            delta[1] += tokens
+        for resolution, bucket, calls, tokens in series_rows:
+            delta = self._series_deltas[(resolution, bucket)]
+            delta[0] += calls
+            delta[1] += tokens
+        for model, calls, tokens in model_rows:
+            delta = self._model_deltas[model]
+            delta[0] += calls
+            delta[1] += tokens
+
+    def _has_pending(self):
+        return bool(self._clear_pending or self._key_deltas or self._series_deltas or self._model_deltas)
+
+    def _write_sync(self, pending):
+        clear, key_rows, series_rows, model_rows = pending
+        with self._conn:
+            if clear:
+                for table in ("key_usage", "series", "model_totals"):
+                    self._conn.execute(f"DELETE FROM {table}")
+            self._conn.executemany(_UPSERT_KEY_USAGE, key_rows)
+            self._conn.executemany(_UPSERT_SERIES, series_rows)
+            self._conn.executemany(_UPSERT_MODEL_TOTALS, model_rows)
+            self._prune(time.time())
+
+    async def write(self):
+        """在线程池中写入累积的增量"""
+        if not self._has_pending():
+            return
+        clear_count = self._clear_count
+        pending = self._take_pending()
+        try:
+            await asyncio.to_thread(self._write_sync, pending)
+        except Exception as e:
+            log('error', f"写入调用统计数据库失败，将在下次写入时重试: {str(e)}")
+            # 写入期间统计被重置时，取出的增量已经作废
+            if clear_count == self._clear_count:
+                self._restore_pending(pending)
+
+    async def close(self):
+        """写入剩余的增量并关闭数据库"""
+        if self._conn is None:
+            return
+        if self._write_task is not None and not self._write_task.done():
+            await self._write_task
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+        if self._has_pending():
+            self._write_sync(self._take_pending())
+        self._conn.close()
+        self._conn = None
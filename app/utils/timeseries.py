@@ -0,0 +1,114 @@
+class RollingCounter:
+    """
+    基于环形缓冲区的滑动窗口计数器。
+
+    窗口被划分为 num_buckets 个长度为 bucket_seconds 的桶，每个槽位记录所属桶的编号，
+    写入或读取时只清理已滑出窗口的槽位，因此窗口总量的读取与更新都是常数时间（均摊），
+    内存占用固定，不需要定时重置。
+    """
+    __slots__ = ("bucket_seconds", "num_buckets", "_counts", "_bucket_ids", "_head", "_total")
+
+    def __init__(self, bucket_seconds, num_buckets):
+        self.bucket_seconds = bucket_seconds
+        self.num_buckets = num_buckets
+        self._counts = [0] * num_buckets
+        self._bucket_ids = [-1] * num_buckets  # 每个槽位当前保存的桶编号
+        self._head = -1                         # 最新的桶编号
+        self._total = 0                         # 窗口内的总量
+
+    def _advance(self, bucket_id):
+        """滑动窗口到 bucket_id，清理滑出窗口的槽位"""
+        head = self._head
+        if bucket_id <= head:
+            return
+        start = max(head + 1, bucket_id - self.num_buckets + 1)
+        counts = self._counts
+        bucket_ids = self._bucket_ids
+        n = self.num_buckets
+        for b in range(start, bucket_id + 1):
+            slot = b % n
+            if counts[slot]:
+                self._total -= counts[slot]
+                counts[slot] = 0
+            bucket_ids[slot] = b
+        self._head = bucket_id
+
+    def add(self, now, value=1):
+        """在时间 now（Unix 时间戳）所在的桶中累加 value"""
+        bucket_id = int(now // self.bucket_seconds)
+        self._advance(bucket_id)
+        if bucket_id <= self._head - self.num_buckets:
+            return  # 已滑出窗口的旧数据
+        slot = bucket_id % self.num_buckets
+        self._counts[slot] += value
+        self._total += value
+
+    def total(self, now):
+        """窗口内的总量"""
+        self._advance(int(now // self.bucket_seconds))
+        return self._total
+
+    def sum_last(self, seconds, now):
+        """最近 seconds 秒（按桶取整）内的总量"""
+        bucket_id = int(now // self.bucket_seconds)
+        self._advance(bucket_id)
+        buckets = min(self.num_buckets, max(1, -(-int(seconds) // self.bucket_seconds)))
+        counts = self._counts
+        bucket_ids = self._bucket_ids
+        n = self.num_buckets
+        result = 0
+        for b in range(bucket_id - buckets + 1, bucket_id + 1):
+            slot = b % n
+            if bucket_ids[slot] == b:
+                result += counts[slot]
+        return result
+
+    def series(self, buckets, now):
+        """
+        最近 buckets 个桶的值（从旧到新）。
+
+        Returns:
+            (第一个桶的起始时间, 各桶的值列表)
+        """
+        bucket_id = int(now // self.bucket_seconds)
+        self._advance(bucket_id)
+        buckets = min(self.num_buckets, max(1, int(buckets)))
+        counts = self._counts
+        bucket_ids = self._bucket_ids
+        n = self.num_buckets
+        first = bucket_id - buckets + 1
+        values = []
+        for b in range(first, bucket_id + 1):
+            slot = b % n
+            values.append(counts[slot] if bucket_ids[slot] == b else 0)
+        return first * self.bucket_seconds, values
+
+    def time_below(self, limit, now):
+        """
+        窗口总量回落到 limit 以下的时间。
+
+        从最旧的桶开始计算滑出窗口后减少的量，返回满足条件的最早时间；已低于 limit 时返回 now。
+        """
+        bucket_id = int(now // self.bucket_seconds)
+        self._advance(bucket_id)
+        remaining = self._total
+        if remaining < limit:
+            return now
+        counts = self._counts
+        bucket_ids = self._bucket_ids
+        n = self.num_buckets
+        for b in range(bucket_id - n + 1, bucket_id + 1):
+            slot = b % n
+            if bucket_ids[slot] != b or not counts[slot]:
+                continue
+            remaining -= counts[slot]
+            if remaining < limit:
+                # 桶 b 在桶 b + n 开始时滑出窗口
+                return (b + n) * self.bucket_seconds
+        return (bucket_id + n) * self.bucket_seconds
+
+    def clear(self):
+        self._counts = [0] * self.num_buckets
+        self._bucket_ids = [-1] * self.num_buckets
+        self._head = -1
+        self._total = 0
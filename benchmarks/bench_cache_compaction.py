@@ -0,0 +1,127 @@
+"""
+响应缓存紧凑存储基准：对比直接缓存 GeminiResponseWrapper 与序列化 + 压缩后缓存。
+
+用一组模拟的响应（中文 / 英文文本，长度 256B ~ 32KB）统计：
+    - 每条缓存项的平均内存占用（逐个对象遍历实测，不含所有缓存项共享的类对象）
+      与同样内存下可缓存的条目数倍数，以及按文本长度的明细；括号中为缓存按 estimate_size 统计的估算值
+    - store 与 get_and_remove 命中的平均耗时（紧凑存储在命中时需要解压并重新解析）
+
+用法（在仓库根目录下运行）:
+    python -m benchmarks.bench_cache_compaction
+"""
+import asyncio
+import json
+import random
+import sys
+import time
+
+import app.utils.cache as cache_module
+from app.services.gemini import GeminiResponseWrapper
+from app.utils.cache import ResponseCacheManager, _CODECS, _ENTRY_OVERHEAD
+
+SAMPLES = 2000
+LENGTHS = (256, 1024, 4096, 16384, 32768)
+WORDS_EN = "the model returns a detailed answer with code examples and explanations for each step".split()
+WORDS_ZH = list("模型返回了详细的回答其中包含代码示例以及每一步的解释说明我们可以继续讨论这个问题")
+
+
+def deep_size(obj):
+    """遍历对象引用的所有对象累加 sys.getsizeof（跳过类对象与 object() 哨兵）"""
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, type) or type(current) is object:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+        elif hasattr(current, '__slots__'):
+            for name in current.__slots__:
+                value = getattr(current, name, None)
+                if value is not None:
+                    stack.append(value)
+    return size
+
+
+def make_response(rng, length):
+    words = WORDS_ZH if rng.random() < 0.5 else WORDS_EN
+    parts = []
+    size = 0
+    while size < length:
+        word = rng.choice(words)
+        parts.append(word)
+        size += len(word.encode("utf-8")) + 1
+    text = " ".join(parts) if words is WORDS_EN else "".join(parts)
+    data = {
+        "candidates": [{
+            "content": {"parts": [{"text": text}], "role": "model"},
+            "finishReason": "STOP",
+            "index": 0,
+            "safetyRatings": [{"category": "HARM_CATEGORY_HARASSMENT", "probability": "NEGLIGIBLE"}],
+        }],
+        "usageMetadata": {"promptTokenCount": 120, "candidatesTokenCount": length // 4,
+                          "totalTokenCount": 120 + length // 4},
+        "modelVersion": "gemini-2.5-pro",
+    }
+    # 与 complete_chat 一致：记录上游响应体的字节数
+    response = GeminiResponseWrapper(data, len(json.dumps(data, ensure_ascii=False).encode("utf-8")))
+    response.set_model("gemini-2.5-pro")
+    response.text  # 与实际情况一致：写入缓存前已经读取过文本
+    return response
+
+
+async def run(name, compact, codec, responses):
+    manager = ResponseCacheManager(3600, SAMPLES * 2, num_shards=16, max_bytes=0, compact=compact)
+    if codec:
+        manager.codec = codec
+    start = time.perf_counter()
+    for i, response in enumerate(responses):
+        await manager.store(f"key-{i}", response)
+    store_time = (time.perf_counter() - start) / len(responses)
+    estimated = manager.cur_cache_bytes / manager.cur_cache_num
+    by_length = {length: [] for length in LENGTHS}
+    for cache_key, cache_deque in manager.cache.items():
+        index = int(cache_key.split("-")[1])
+        by_length[LENGTHS[index % len(LENGTHS)]].extend(
+            deep_size(item['response']) + _ENTRY_OVERHEAD for item in cache_deque)
+    per_length = {length: sum(sizes) / len(sizes) for length, sizes in by_length.items()}
+    per_entry = sum(sum(sizes) for sizes in by_length.values()) / manager.cur_cache_num
+
+    start = time.perf_counter()
+    for i in range(len(responses)):
+        restored, hit = await manager.get_and_remove(f"key-{i}")
+        assert hit and restored.text == responses[i].text
+    hit_time = (time.perf_counter() - start) / len(responses)
+    return name, per_entry, estimated, per_length, store_time, hit_time
+
+
+async def main():
+    cache_module.log = lambda *args, **kwargs: None
+    rng = random.Random(42)
+    responses = [make_response(rng, LENGTHS[i % len(LENGTHS)]) for i in range(SAMPLES)]
+
+    results = [await run("直接缓存对象", False, None, responses)]
+    for codec in ("zlib", "zstd"):
+        if codec in _CODECS:
+            results.append(await run(f"紧凑存储 ({codec})", True, codec, responses))
+        else:
+            print(f"[跳过 {codec}：未安装 zstandard]")
+
+    baseline, baseline_by_length = results[0][1], results[0][3]
+    for name, per_entry, estimated, per_length, store_time, hit_time in results:
+        print(f"[{name}]")
+        print(f"    每条占用 {per_entry / 1024:7.1f} KB（估算 {estimated / 1024:.1f} KB，"
+              f"同样内存下可缓存 {baseline / per_entry:4.1f} 倍条目）")
+        for length, size in per_length.items():
+            print(f"        文本 {length:>6} B: 每条 {size:8.0f} B（{baseline_by_length[length] / size:4.1f} 倍）")
+        print(f"    store {store_time * 1e6:8.1f} us/次, 命中 {hit_time * 1e6:8.1f} us/次")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
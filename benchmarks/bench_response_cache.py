@@ -0,0 +1,169 @@
+"""
+ResponseCacheManager 基准：对比旧的「单锁 + 全量扫描 + heapq.nsmallest」实现与分片、按写入顺序 O(1) 淘汰的实现。
+
+缓存容量为 100k 条，先写满，再统计：
+    - 缓存已满时 store 的平均耗时（每次写入都会触发淘汰）
+    - get_and_remove 命中与未命中的平均耗时
+    - 没有过期项时 clean_expired 的耗时（定时任务每分钟执行一次）
+    - 一半缓存项过期时 clean_expired 的耗时，以及清理期间并发查找的最长等待时间
+
+用法（在仓库根目录下运行）:
+    python -m benchmarks.bench_response_cache
+"""
+import asyncio
+import heapq
+import time
+from collections import deque
+
+import app.utils.cache as cache_module
+from app.utils.cache import ResponseCacheManager
+
+ENTRIES = 100_000
+STORES = 2_000   # 缓存已满后的写入次数（旧实现每次写入都要扫描整个缓存，次数不宜过多）
+LOOKUPS = 20_000
+
+
+class LegacyResponseCacheManager:
+    """旧实现（去掉了日志）：超出容量时收集所有缓存项并用 heapq.nsmallest 找出最旧的项"""
+
+    def __init__(self, expiry_time, max_entries):
+        self.cache = {}
+        self.expiry_time = expiry_time
+        self.max_entries = max_entries
+        self.cur_cache_num = 0
+        self.lock = asyncio.Lock()
+
+    async def get_and_remove(self, cache_key):
+        now = time.time()
+        async with self.lock:
+            if cache_key in self.cache:
+                valid_item = None
+                new_deque = deque()
+                removed = 0
+                for item in self.cache[cache_key]:
+                    if now < item['expiry_time']:
+                        if valid_item is None:
+                            valid_item = item
+                            removed += 1
+                        else:
+                            new_deque.append(item)
+                    else:
+                        removed += 1
+                if removed:
+                    self.cur_cache_num -= removed
+                    if not new_deque:
+                        del self.cache[cache_key]
+                    else:
+                        self.cache[cache_key] = new_deque
+                if valid_item:
+                    return valid_item['response'], True
+            return None, False
+
+    async def store(self, cache_key, response):
+        now = time.time()
+        async with self.lock:
+            self.cache.setdefault(cache_key, deque()).append(
+                {'response': response, 'expiry_time': now + self.expiry_time, 'created_at': now})
+            self.cur_cache_num += 1
+            needs_cleaning = self.cur_cache_num > self.max_entries
+        if needs_cleaning:
+            await self.clean_if_needed()
+
+    async def clean_expired(self):
+        now = time.time()
+        async with self.lock:
+            total = 0
+            for key, cache_deque in list(self.cache.items()):
+                valid = deque(item for item in cache_deque if now < item['expiry_time'])
+                total += len(cache_deque) - len(valid)
+                if not valid:
+                    del self.cache[key]
+                elif len(valid) != len(cache_deque):
+                    self.cache[key] = valid
+            self.cur_cache_num -= total
+
+    async def clean_if_needed(self):
+        async with self.lock:
+            target_size = max(self.max_entries - 10, 10)
+            if self.cur_cache_num <= target_size:
+                return
+            all_items = [{'key': key, 'created_at': item['created_at'], 'item': item}
+                         for key, cache_deque in self.cache.items() for item in cache_deque]
+            oldest = heapq.nsmallest(self.cur_cache_num - target_size, all_items, key=lambda x: x['created_at'])
+            for meta in oldest:
+                self.cache[meta['key']].remove(meta['item'])
+                if not self.cache[meta['key']]:
+                    del self.cache[meta['key']]
+                self.cur_cache_num -= 1
+
+
+async def timed(n, func):
+    start = time.perf_counter()
+    for i in range(n):
+        await func(i)
+    return (time.perf_counter() - start) / n
+
+
+async def run(name, factory):
+    manager = factory(3600, ENTRIES)
+    print(f"[{name}]")
+    start = time.perf_counter()
+    for i in range(ENTRIES):
+        await manager.store(f"key-{i}", i)
+    print(f"    写满 {ENTRIES} 条: {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    per_store = await timed(STORES, lambda i: manager.store(f"new-{i}", i))
+    print(f"    缓存已满时 store: {per_store * 1e6:10.1f} us/次")
+
+    offset = ENTRIES // 2
+    hit = await timed(LOOKUPS, lambda i: manager.get_and_remove(f"key-{offset + i}"))
+    miss = await timed(LOOKUPS, lambda i: manager.get_and_remove(f"missing-{i}"))
+    print(f"    get_and_remove 命中: {hit * 1e6:7.2f} us/次, 未命中: {miss * 1e6:7.2f} us/次")
+
+    start = time.perf_counter()
+    await manager.clean_expired()
+    print(f"    clean_expired（无过期项）: {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+    # 让最旧的一半缓存项过期，同时在清理期间不断查找，记录查找的最大等待时间
+    created = sorted(item['created_at'] for cache_deque in manager.cache.values() for item in cache_deque)
+    cutoff = created[len(created) // 2]
+    count = 0
+    for cache_deque in manager.cache.values():
+        for item in cache_deque:
+            if item['created_at'] < cutoff:
+                item['expiry_time'] = 0
+                count += 1
+    stop = False
+    max_wait = 0.0
+
+    async def lookups():
+        # 清理在事件循环中执行，查找被阻塞的时间即两次查找之间的间隔
+        nonlocal max_wait
+        last = time.perf_counter()
+        while not stop:
+            await manager.get_and_remove("missing")
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            max_wait = max(max_wait, now - last)
+            last = now
+
+    lookup_task = asyncio.create_task(lookups())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await manager.clean_expired()
+    elapsed = time.perf_counter() - start
+    stop = True
+    await lookup_task
+    print(f"    clean_expired（清理 {count} 个过期项）: {elapsed * 1000:8.2f} ms, 剩余 {manager.cur_cache_num} 条, "
+          f"期间查找最长等待 {max_wait * 1000:.2f} ms")
+
+
+async def main():
+    # 不计入日志格式化与输出的开销
+    cache_module.log = lambda *args, **kwargs: None
+    await run("旧实现: 全量扫描淘汰", LegacyResponseCacheManager)
+    await run("新实现: 分片 + 按写入顺序淘汰", ResponseCacheManager)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
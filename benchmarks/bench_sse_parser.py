@@ -0,0 +1,144 @@
+"""
+SSE 流解析微基准：对比旧的「逐行累积 + 整体 json.loads」循环与增量式 SSEDecoder。
+
+另外统计单个数 MB 的事件（一行 data）以小块到达时 SSEDecoder.feed 的总耗时，
+耗时应随事件大小线性增长（未完成的行不会在每个小块到达时从头重新扫描）。
+
+用法（在仓库根目录下运行）:
+    python -m benchmarks.bench_sse_parser
+"""
+import codecs
+import json
+import time
+from app.utils.sse import SSEDecoder, SSE_DONE
+
+CHUNK_SIZE = 4096   # 模拟 aiter_bytes 每次返回的字节数
+ROUNDS = 5
+LARGE_EVENT_SIZES = (1 << 20, 4 << 20, 16 << 20)  # 单个大事件的字节数
+LARGE_EVENT_CHUNK = 1024  # 大事件以更小的块到达
+
+
+def build_events():
+    """构造包含大型函数调用参数与长思考内容的响应块"""
+    function_call = {
+        "candidates": [{"content": {"role": "model", "parts": [{
+            "functionCall": {
+                "name": "write_file",
+                "args": {"path": "/tmp/out.txt",
+                         "content": "\n".join(f"第 {i} 行：函数调用参数内容" for i in range(4000))},
+            }
+        }]}}],
+        "usageMetadata": {"promptTokenCount": 1200, "candidatesTokenCount": 9000, "totalTokenCount": 10200},
+    }
+    thinking = {
+        "candidates": [{"content": {"role": "model", "parts": [
+            {"thought": True, "text": "思考过程。" * 20000},
+            {"text": "最终答案。" * 2000},
+        ]}}],
+    }
+    small = {"candidates": [{"content": {"role": "model", "parts": [{"text": "你好"}]}}]}
+    return [function_call, thinking] + [small] * 200
+
+
+def encode_stream(events, pretty: bool) -> bytes:
+    """序列化为 SSE 字节流；pretty=True 时每个 JSON 被拆成多行 data 字段"""
+    out = []
+    for event in events:
+        if pretty:
+            for line in json.dumps(event, ensure_ascii=False, indent=2).split("\n"):
+                out.append(f"data: {line}\r\n")
+        else:
+            out.append(f"data: {json.dumps(event, ensure_ascii=False)}\r\n")
+        out.append("\r\n")
+    out.append("data: [DONE]\r\n\r\n")
+    return "".join(out).encode("utf-8")
+
+
+def chunked(payload: bytes):
+    for i in range(0, len(payload), CHUNK_SIZE):
+        yield payload[i:i + CHUNK_SIZE]
+
+
+def legacy_parse(payload: bytes) -> int:
+    """旧实现：aiter_lines 解码为文本后逐行累积，每行都尝试解析整个缓冲区"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    count = 0
+    buffer = b""
+    for chunk in chunked(payload):
+        text = pending + decoder.decode(chunk)
+        lines = text.splitlines(keepends=True)
+        pending = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            if line.startswith("data: "):
+                line = line[len("data: "):].strip()
+            if line == "[DONE]":
+                return count
+            buffer += line.encode('utf-8')
+            try:
+                json.loads(buffer.decode('utf-8'))
+                buffer = b""
+                count += 1
+            except json.JSONDecodeError:
+                continue
+    return count
+
+
+def incremental_parse(payload: bytes) -> int:
+    """新实现：在原始字节上按事件边界切分，每个事件解码一次"""
+    decoder = SSEDecoder()
+    count = 0
+    for chunk in chunked(payload):
+        for data in decoder.feed(chunk):
+            if data.strip() == SSE_DONE:
+                return count
+            json.loads(data)
+            count += 1
+    return count
+
+
+def bench(func, payload):
+    best = float("inf")
+    result = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = func(payload)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def feed_large_event(size: int) -> float:
+    """把一个约 size 字节的单行事件按 LARGE_EVENT_CHUNK 字节切块输入，返回总耗时"""
+    payload = b"data: " + b"x" * size + b"\r\n\r\n"
+    chunks = [payload[i:i + LARGE_EVENT_CHUNK] for i in range(0, len(payload), LARGE_EVENT_CHUNK)]
+    decoder = SSEDecoder()
+    events = []
+    start = time.perf_counter()
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    elapsed = time.perf_counter() - start
+    assert len(events) == 1 and len(events[0]) == size, [len(event) for event in events]
+    return elapsed
+
+
+def main():
+    events = build_events()
+    for pretty in (False, True):
+        payload = encode_stream(events, pretty)
+        label = "多行 data 事件" if pretty else "单行 data 事件"
+        legacy_time, legacy_count = bench(legacy_parse, payload)
+        new_time, new_count = bench(incremental_parse, payload)
+        assert legacy_count == new_count == len(events), (legacy_count, new_count)
+        print(f"[{label}] 数据量 {len(payload) / 1024:.0f} KiB, 事件数 {new_count}")
+        print(f"    旧循环:      {legacy_time * 1000:9.2f} ms")
+        print(f"    SSEDecoder: {new_time * 1000:9.2f} ms  (加速 {legacy_time / new_time:.1f}x)")
+    print(f"[单个大事件，每块 {LARGE_EVENT_CHUNK} 字节]")
+    for size in LARGE_EVENT_SIZES:
+        print(f"    {size >> 20:3d} MiB: {feed_large_event(size) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
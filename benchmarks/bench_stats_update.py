@@ -0,0 +1,151 @@
+"""
+update_stats 开销基准：对比旧的「后台轮询线程 + 队列 + 线程锁」实现与事件循环内批量合并的实现。
+
+在事件循环中按固定速率（每秒 1k / 10k 次）调用 update_stats，统计：
+    - 单次 update_stats 调用在请求路径上的平均耗时
+    - 运行期间进程消耗的 CPU 时间（包含后台线程）
+    - 空闲 1 秒内进程消耗的 CPU 时间（轮询线程即使没有数据也会不断唤醒）
+
+日志照常格式化并写入仪表盘日志，只是控制台输出重定向到 /dev/null（旧实现每次调用一条日志，新实现每批一条）。
+
+用法（在仓库根目录下运行）:
+    python -m benchmarks.bench_stats_update
+"""
+import asyncio
+import os
+import queue
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+
+import app.utils.logging as logging_module
+from app.utils.logging import log
+from app.utils.stats import ApiStatsManager
+
+RATES = (1000, 10000)  # 每秒调用次数
+DURATION = 2.0         # 每个速率的运行时长（秒）
+TICK = 0.001           # 每个时间片的长度（秒）
+KEYS = [f"AIzaSy{i:033d}" for i in range(200)]
+MODELS = ["gemini-2.5-pro", "gemini-2.5-flash", "gemini-2.0-flash"]
+
+
+class LegacyStatsManager:
+    """旧实现：后台线程每 10ms 轮询一次队列，请求路径上获取两个线程锁更新时间桶与最近调用"""
+
+    def __init__(self, batch_interval=1.0):
+        self.api_key_counts = Counter()
+        self.model_counts = Counter()
+        self.api_model_counts = defaultdict(Counter)
+        self.api_key_tokens = Counter()
+        self.model_tokens = Counter()
+        self.api_model_tokens = defaultdict(Counter)
+        self.time_buckets = {}
+        self.recent_calls = []
+        self.max_recent_calls = 100
+        self._counters_lock = threading.Lock()
+        self._time_series_lock = threading.Lock()
+        self._recent_calls_lock = threading.Lock()
+        self.batch_interval = batch_interval
+        self._update_queue = queue.Queue()
+        self._stop_event = threading.Event()
+        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker_thread.start()
+
+    def _worker_loop(self):
+        batch = []
+        last_process = time.time()
+        while not self._stop_event.is_set():
+            try:
+                batch.append(self._update_queue.get_nowait())
+            except queue.Empty:
+                pass
+            current_time = time.time()
+            if batch and (current_time - last_process >= self.batch_interval):
+                self._process_batch(batch)
+                batch = []
+                last_process = current_time
+            time.sleep(0.01)
+
+    def _process_batch(self, batch):
+        with self._counters_lock:
+            for api_key, model, tokens in batch:
+                self.api_key_counts[api_key] += 1
+                self.model_counts[model] += 1
+                self.api_model_counts[api_key][model] += 1
+                self.api_key_tokens[api_key] += tokens
+                self.model_tokens[model] += tokens
+                self.api_model_tokens[api_key][model] += tokens
+
+    async def update_stats(self, api_key, model, tokens=0):
+        self._update_queue.put((api_key, model, tokens))
+        now = datetime.now()
+        minute_ts = int(now.timestamp() // 60 * 60)
+        with self._time_series_lock:
+            if minute_ts not in self.time_buckets:
+                self.time_buckets[minute_ts] = {"calls": 0, "tokens": 0}
+            self.time_buckets[minute_ts]["calls"] += 1
+            self.time_buckets[minute_ts]["tokens"] += tokens
+        with self._recent_calls_lock:
+            self.recent_calls.append({'api_key': api_key, 'model': model, 'timestamp': now, 'tokens': tokens})
+            if len(self.recent_calls) > self.max_recent_calls:
+                self.recent_calls.pop(0)
+        log('info', f"API调用已记录: 秘钥 '{api_key[:8]}', 模型 '{model}', 令牌: {tokens if tokens is not None else 0}")
+
+    def stop(self):
+        self._stop_event.set()
+        self._worker_thread.join()
+
+
+async def drive(manager, rate):
+    """按固定速率调用 update_stats，返回 (调用次数, 请求路径总耗时, 进程 CPU 时间)"""
+    per_tick = max(1, int(rate * TICK))
+    calls = 0
+    in_call = 0.0
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    next_tick = start
+    i = 0
+    while time.perf_counter() - start < DURATION:
+        t0 = time.perf_counter()
+        for _ in range(per_tick):
+            await manager.update_stats(KEYS[i % len(KEYS)], MODELS[i % len(MODELS)], 1000)
+            i += 1
+        in_call += time.perf_counter() - t0
+        calls += per_tick
+        next_tick += TICK
+        await asyncio.sleep(max(0.0, next_tick - time.perf_counter()))
+    return calls, in_call, time.process_time() - cpu_start
+
+
+async def idle_cpu():
+    """空闲 1 秒内的进程 CPU 时间（先等待尚未处理的批次合并完成）"""
+    await asyncio.sleep(1.5)
+    cpu_start = time.process_time()
+    await asyncio.sleep(1.0)
+    return time.process_time() - cpu_start
+
+
+async def run(name, factory, stop):
+    manager = factory()
+    print(f"[{name}]")
+    try:
+        for rate in RATES:
+            calls, in_call, cpu = await drive(manager, rate)
+            print(f"    {rate:>6}/s: 单次调用 {in_call / calls * 1e6:7.2f} us, "
+                  f"运行期间 CPU {cpu * 1000:7.1f} ms / {DURATION:.0f} s")
+        idle = await idle_cpu()
+        print(f"    空闲 1 s: CPU {idle * 1000:.1f} ms")
+    finally:
+        stop(manager)
+
+
+async def main():
+    # 日志的格式化开销计入结果，但不输出到终端
+    logging_module.console_handler.setStream(open(os.devnull, "w"))
+    await run("旧实现: 轮询线程 + 线程锁", LegacyStatsManager, lambda m: m.stop())
+    await run("新实现: 事件循环批量合并", ApiStatsManager, lambda m: m.flush())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
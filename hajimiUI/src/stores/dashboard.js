@@ -9,7 +9,14 @@ export const useDashboardStore = defineStore('dashboard', () => {
     retryCount: 0,
     last24hCalls: 0,
     hourlyCalls: 0,
-    minuteCalls: 0
+    minuteCalls: 0,
+    upstreamOpenConnections: 0,
+    upstreamReuseRatio: 0,
+    upstreamHttp2: false,
+    cacheEntries: 0,
+    maxCacheEntries: 0,
+    cacheBytes: 0,
+    maxCacheBytes: 0
   })
 
   // 添加图表相关的时间序列数据
@@ -31,6 +38,8 @@ export const useDashboardStore = defineStore('dashboard', () => {
     concurrentRequests: 0,
     increaseConcurrentOnFailure: 0,
     maxConcurrentRequests: 0,
+    adaptiveConcurrency: false,
+    concurrencyFanout: {},
     maxRetryNum: 0,
     searchPrompt: '',
     maxEmptyResponses: 0
@@ -66,18 +75,31 @@ export const useDashboardStore = defineStore('dashboard', () => {
   // 初始应用夜间模式
   applyDarkMode(isDarkMode.value)
 
+  // 增量刷新：记录上次响应的游标与 ETag，以及合并后的完整数据
+  let dashboardCursor = null
+  let dashboardEtag = null
+  let dashboardSnapshot = {}
+
   // 获取仪表盘数据
   async function fetchDashboardData() {
     if (isRefreshing.value) return // 防止重复请求
     
     isRefreshing.value = true
     try {
-      const response = await fetch('/api/dashboard-data')
+      const url = dashboardCursor
+        ? `/api/dashboard-data?since=${encodeURIComponent(dashboardCursor)}`
+        : '/api/dashboard-data'
+      const headers = dashboardEtag ? { 'If-None-Match': dashboardEtag } : {}
+      const response = await fetch(url, { headers })
+      if (response.status === 304) {
+        return // 数据没有变化
+      }
       if (!response.ok) {
         throw new Error(`HTTP error! status: ${response.status}`)
       }
       const data = await response.json()
-      updateDashboardData(data)
+      dashboardEtag = response.headers.get('ETag')
+      applyDashboardPayload(data)
     } catch (error) {
       console.error('获取数据失败:', error)
     } finally {
@@ -85,17 +107,90 @@ export const useDashboardStore = defineStore('dashboard', () => {
     }
   }
 
+  // 应用完整或增量的仪表盘数据（轮询与推送共用）
+  function applyDashboardPayload(data) {
+    dashboardCursor = data.cursor
+    
+    // 只返回了变化的字段时合并到上一次的完整数据中
+    const { logs: newLogs, logs_full: logsFull, full, ...fields } = data
+    dashboardSnapshot = full ? fields : { ...dashboardSnapshot, ...fields }
+    const merged = { ...dashboardSnapshot }
+    if (logsFull) {
+      merged.logs = newLogs
+    } else {
+      // 按序号去重，推送与手动刷新可能返回同一条日志
+      const lastSeq = logs.value.length ? logs.value[logs.value.length - 1].seq : 0
+      const appended = newLogs.filter(entry => entry.seq > lastSeq)
+      if (appended.length) {
+        merged.logs = logs.value.concat(appended).slice(-500)
+      }
+    }
+    updateDashboardData(merged)
+  }
+
+  // 仪表盘数据推送（SSE），连接断开时浏览器会自动重连
+  let dashboardStream = null
+
+  function connectDashboardStream() {
+    if (dashboardStream || typeof EventSource === 'undefined') return false
+    dashboardStream = new EventSource('/api/dashboard-stream')
+    dashboardStream.onmessage = (event) => {
+      try {
+        applyDashboardPayload(JSON.parse(event.data))
+      } catch (error) {
+        console.error('处理推送数据失败:', error)
+      }
+    }
+    return true
+  }
+
+  function disconnectDashboardStream() {
+    if (dashboardStream) {
+      dashboardStream.close()
+      dashboardStream = null
+    }
+  }
+
+  // 获取较长时间范围的调用历史（24h / 7d / 30d）
+  async function fetchStatsHistory(range) {
+    try {
+      const response = await fetch(`/api/stats-history?range=${range}`)
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`)
+      }
+      const data = await response.json()
+      return {
+        calls: data.calls_time_series || [],
+        tokens: data.tokens_time_series || []
+      }
+    } catch (error) {
+      console.error('获取历史数据失败:', error)
+      return { calls: [], tokens: [] }
+    }
+  }
+
   // 更新仪表盘数据
   function updateDashboardData(data) {
     // 更新状态数据
     status.value = {
       keyCount: data.key_count || 0,
+      keyHealth: data.key_health || {},
       modelCount: data.model_count || 0,
       retryCount: data.retry_count || 0,
       last24hCalls: data.last_24h_calls || 0,
       hourlyCalls: data.hourly_calls || 0,
       minuteCalls: data.minute_calls || 0,
-      enableVertex: data.enable_vertex || false
+      enableVertex: data.enable_vertex || false,
+      upstreamOpenConnections: data.upstream_pool?.open_connections || 0,
+      upstreamReuseRatio: data.upstream_pool?.reuse_ratio || 0,
+      upstreamHttp2: data.upstream_pool?.http2 || false,
+      cacheEntries: data.cache_entries || 0,
+      maxCacheEntries: data.max_cache_entries || 0,
+      cacheBytes: data.cache_bytes || 0,
+      maxCacheBytes: data.max_cache_bytes || 0,
+      diskCacheEnabled: data.disk_cache_enabled || false,
+      diskCacheEntries: data.disk_cache_entries || 0,
+      diskCacheBytes: data.disk_cache_bytes || 0
     }
 
     // 更新时间序列数据
@@ -124,6 +219,8 @@ export const useDashboardStore = defineStore('dashboard', () => {
       concurrentRequests: data.concurrent_requests || 0,
       increaseConcurrentOnFailure: data.increase_concurrent_on_failure || 0,
       maxConcurrentRequests: data.max_concurrent_requests || 0,
+      adaptiveConcurrency: data.adaptive_concurrency || false,
+      concurrencyFanout: data.concurrency_fanout || {},
       enableVertex: data.enable_vertex || false,
       enableVertexExpress: data.enable_vertex_express || false,
       vertexExpressApiKey: data.vertex_express_api_key || false,
@@ -231,6 +328,9 @@ export const useDashboardStore = defineStore('dashboard', () => {
     isRefreshing,
     timeSeriesData,  // 导出时间序列数据
     fetchDashboardData,
+    connectDashboardStream,
+    disconnectDashboardStream,
+    fetchStatsHistory,
     selectedModel,
     availableModels,
     setSelectedModel,
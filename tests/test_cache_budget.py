@@ -0,0 +1,64 @@
+"""
+响应缓存的字节数限制：函数调用参数等非文本数据也必须计入缓存项大小。
+
+用法（在仓库根目录下运行）:
+    python -m unittest tests.test_cache_budget
+"""
+import asyncio
+import json
+import unittest
+
+from app.services.gemini import GeminiResponseWrapper
+from app.utils.cache import ResponseCacheManager
+
+MAX_BYTES = 1_000_000
+
+
+def make_function_call_response(args_size, with_raw_size=True):
+    data = {
+        "candidates": [{
+            "content": {"role": "model", "parts": [
+                {"functionCall": {"name": "write_file", "args": {"content": "x" * args_size}}},
+            ]},
+            "finishReason": "STOP",
+        }],
+        "usageMetadata": {"promptTokenCount": 10, "candidatesTokenCount": 10, "totalTokenCount": 20},
+    }
+    raw_size = len(json.dumps(data).encode("utf-8")) if with_raw_size else None
+    return GeminiResponseWrapper(data, raw_size)
+
+
+class CacheByteBudgetTest(unittest.TestCase):
+
+    def _fill(self, args_size, count, with_raw_size=True):
+        manager = ResponseCacheManager(expiry_time=600, max_entries=1000, num_shards=1,
+                                       max_bytes=MAX_BYTES, compact=False)
+
+        async def fill():
+            for index in range(count):
+                await manager.store(f"key-{index}", make_function_call_response(args_size, with_raw_size))
+        asyncio.run(fill())
+        return manager
+
+    def test_oversized_function_call_is_not_kept(self):
+        # 每个响应约 5 MB 的函数调用参数，超过整个缓存的字节数限制
+        manager = self._fill(5_000_000, 10)
+        self.assertEqual(manager.cur_cache_num, 0)
+        self.assertEqual(manager.cur_cache_bytes, 0)
+
+    def test_budget_evicts_large_function_calls(self):
+        manager = self._fill(200_000, 20)
+        self.assertLessEqual(manager.cur_cache_bytes, MAX_BYTES)
+        self.assertLessEqual(manager.cur_cache_num, MAX_BYTES // 200_000)
+        self.assertGreater(manager.cur_cache_num, 0)
+        # 留下的是最新写入的缓存项
+        self.assertIn("key-19", manager.cache)
+
+    def test_size_without_raw_size(self):
+        manager = self._fill(200_000, 20, with_raw_size=False)
+        self.assertLessEqual(manager.cur_cache_bytes, MAX_BYTES)
+        self.assertLessEqual(manager.cur_cache_num, MAX_BYTES // 200_000)
+
+
+if __name__ == "__main__":
+    unittest.main()